@@ -0,0 +1,27 @@
+import time
+
+from core.metrics import RequestMetrics
+
+
+class MetricsMiddleware:
+    """
+    URL 이름, 응답 상태별 요청 개수와 응답 시간을 RequestMetrics에 기록하는 middleware
+    URL pattern에 맞지 않는 요청은 "unmatched"로 합산합니다. (경로별 series가 무한히 늘어나지 않도록)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started: float = time.perf_counter()
+        response = self.get_response(request)
+        duration: float = time.perf_counter() - started
+
+        resolver_match = getattr(request, "resolver_match", None)
+        route: str = (
+            resolver_match.url_name or resolver_match.route
+            if resolver_match
+            else "unmatched"
+        )
+        RequestMetrics.observe(route, response.status_code, duration)
+        return response
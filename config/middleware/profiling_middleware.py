@@ -0,0 +1,102 @@
+import cProfile
+import logging
+import random
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+from config.middleware.query_timing_middleware import QueryRecorder, record_queries
+from core.profiling import ProfileUploadPool, RequestProfileService
+
+logger = logging.getLogger(__name__)
+
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+class ProfilingMiddleware:
+    """
+    요청 1개를 cProfile로 profiling하고, 실행한 SQL 기록과 함께 storage에 저장하는 middleware
+    - X-Profile-Token 헤더에 유효한 토큰(python manage.py create_profile_token)이 있는 요청은 항상 profiling하고,
+      응답의 X-Profile-Id 헤더로 결과 id를 반환합니다. (/api/core/profiles/<id>에서 다운로드)
+    - PROFILE_SAMPLE_RATE 비율로 요청을 샘플링해서 profiling하고, 결과 id를 로그로 남깁니다.
+      샘플링된 요청의 결과는 응답 이후에 ProfileUploadPool thread에서 저장합니다.
+    - 다른 profiler가 이미 실행 중이면 profiling하지 않습니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate: float = settings.PROFILE_SAMPLE_RATE
+        self.trace_size: int = settings.PROFILE_SQL_TRACE_SIZE
+
+    def __call__(self, request):
+        token: Optional[str] = request.headers.get(PROFILE_TOKEN_HEADER)
+        requested: bool = bool(token) and RequestProfileService.is_valid_token(token)
+        if not requested and not (
+            self.sample_rate > 0 and random.random() < self.sample_rate
+        ):
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            return self.get_response(request)
+
+        recorder = QueryRecorder(top_n=0, trace_size=self.trace_size)
+        started: float = time.perf_counter()
+        try:
+            with record_queries(recorder):
+                response = self.get_response(request)
+        finally:
+            profiler.disable()
+        duration: float = time.perf_counter() - started
+
+        profile_id: str = uuid.uuid4().hex
+        request_data: Dict[str, Any] = self.get_request_data(
+            request, response, recorder, duration
+        )
+        if not requested:
+            # 샘플링된 요청은 storage 업로드를 기다리지 않고 응답
+            if (
+                ProfileUploadPool.submit(self.save, profile_id, profiler, request_data)
+                is None
+            ):
+                logger.warning(f"Request profile dropped: {request.path}")
+            return response
+
+        # 토큰으로 요청한 경우에는 X-Profile-Id 헤더로 결과 id를 반환하므로 저장 후 응답
+        if self.save(profile_id, profiler, request_data):
+            response.headers[PROFILE_ID_HEADER] = profile_id
+        return response
+
+    @staticmethod
+    def save(
+        profile_id: str, profiler: cProfile.Profile, request_data: Dict[str, Any]
+    ) -> bool:
+        try:
+            RequestProfileService.save(profile_id, profiler, request_data)
+        except Exception as e:
+            logger.warning(f"Request profile save failed: {e}")
+            return False
+        logger.info(f"Request profiled: {request_data['path']} ({profile_id})")
+        return True
+
+    def get_request_data(
+        self, request, response, recorder: QueryRecorder, duration: float
+    ) -> Dict[str, Any]:
+        resolver_match = getattr(request, "resolver_match", None)
+        return {
+            "method": request.method,
+            "path": request.get_full_path(),
+            "route": resolver_match.url_name if resolver_match else None,
+            "status_code": response.status_code,
+            "duration_ms": round(duration * 1000, 3),
+            "queries": {
+                "count": recorder.count,
+                "duration_ms": round(recorder.duration * 1000, 3),
+                "statements": recorder.get_trace(settings.QUERY_TIMING_SQL_SIZE),
+            },
+        }
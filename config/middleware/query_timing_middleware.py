@@ -0,0 +1,126 @@
+import heapq
+import itertools
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, List, Tuple
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+class QueryRecorder:
+    """
+    connection.execute_wrapper로 등록해서 요청 1개가 실행한 SQL의 개수, 시간 합계, 가장 느린 SQL top_n개를 기록하는 클래스
+    SQL 문자열은 참조만 보관하고, top_n개에 들어가지 못한 SQL은 바로 버립니다.
+    trace_size를 지정하면 실행한 SQL을 순서대로 trace_size개까지 기록합니다. (profiling용)
+    """
+
+    def __init__(self, top_n: int, trace_size: int = 0):
+        self.top_n: int = top_n
+        self.trace_size: int = trace_size
+        self.count: int = 0
+        self.duration: float = 0.0
+        self.created: float = time.perf_counter()
+        # (실행 시간, 순서, sql) min heap
+        self.slowest: List[Tuple[float, int, str]] = []
+        # (시작 시간, 실행 시간, sql)
+        self.trace: List[Tuple[float, float, str]] = []
+        self._sequence = itertools.count()
+
+    def __call__(self, execute, sql, params, many, context):
+        started: float = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration: float = time.perf_counter() - started
+            self.count += 1
+            self.duration += duration
+            if len(self.trace) < self.trace_size:
+                self.trace.append((started, duration, sql))
+            if self.top_n > 0:
+                item = (duration, next(self._sequence), sql)
+                if len(self.slowest) < self.top_n:
+                    heapq.heappush(self.slowest, item)
+                elif duration > self.slowest[0][0]:
+                    heapq.heapreplace(self.slowest, item)
+
+    def get_slowest(self, sql_size: int) -> List[Dict[str, Any]]:
+        return [
+            {"duration_ms": round(duration * 1000, 3), "sql": sql[:sql_size]}
+            for duration, _, sql in sorted(self.slowest, reverse=True)
+        ]
+
+    def get_trace(self, sql_size: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "started_ms": round((started - self.created) * 1000, 3),
+                "duration_ms": round(duration * 1000, 3),
+                "sql": sql[:sql_size],
+            }
+            for started, duration, sql in self.trace
+        ]
+
+
+@contextmanager
+def record_queries(recorder: QueryRecorder):
+    # 모든 DB connection에 recorder 등록
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(recorder))
+        yield recorder
+
+
+class QueryTimingMiddleware:
+    """
+    요청마다 SQL 개수와 시간을 측정하는 middleware (DEBUG 설정과 관계없이 동작)
+    - Server-Timing 응답 헤더로 db(SQL 시간 합계, 개수)와 app(전체 처리 시간)을 반환합니다.
+    - 측정 결과는 request.query_stats에 저장하며, RequestLoggingMiddleware가 요청 로그에 함께 기록합니다.
+    - SQL 개수가 QUERY_TIMING_MAX_QUERIES를 넘거나 SQL 시간 합계가 QUERY_TIMING_MAX_DURATION_MS를 넘으면
+      가장 느린 SQL QUERY_TIMING_TOP_N개와 함께 경고 로그를 남깁니다.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.top_n: int = settings.QUERY_TIMING_TOP_N
+        self.sql_size: int = settings.QUERY_TIMING_SQL_SIZE
+        self.max_queries: int = settings.QUERY_TIMING_MAX_QUERIES
+        self.max_duration: float = settings.QUERY_TIMING_MAX_DURATION_MS / 1000
+        self.server_timing: bool = settings.QUERY_TIMING_SERVER_TIMING
+
+    def __call__(self, request):
+        recorder = QueryRecorder(self.top_n)
+        started: float = time.perf_counter()
+        with record_queries(recorder):
+            response = self.get_response(request)
+        duration: float = time.perf_counter() - started
+
+        request.query_stats = {
+            "count": recorder.count,
+            "duration_ms": round(recorder.duration * 1000, 3),
+        }
+        if self.server_timing:
+            response.headers["Server-Timing"] = (
+                f'db;dur={recorder.duration * 1000:.3f};desc="{recorder.count} queries", '
+                f"app;dur={duration * 1000:.3f}"
+            )
+        if recorder.count > self.max_queries or recorder.duration > self.max_duration:
+            self.log(request, response, recorder, duration)
+        return response
+
+    def log(self, request, response, recorder: QueryRecorder, duration: float):
+        resolver_match = getattr(request, "resolver_match", None)
+        log_data: Dict[str, Any] = {
+            "method": request.method,
+            "path": request.path,
+            "route": resolver_match.route if resolver_match else None,
+            "status_code": response.status_code,
+            "duration_ms": round(duration * 1000, 3),
+            "queries": {
+                **request.query_stats,
+                "slowest": recorder.get_slowest(self.sql_size),
+            },
+        }
+        logger.warning("slow request", extra={"log_data": log_data})
@@ -1,74 +1,160 @@
-import datetime
-import json
 import logging
+import random
+import threading
 import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
-MAX_BODY_SIZE = 1000  # 최대 로그 출력 크기
+# 로그에 값을 남기지 않는 헤더 (소문자)
+REDACTED_HEADERS = {
+    "authorization",
+    "proxy-authorization",
+    "cookie",
+    "set-cookie",
+    "x-profile-token",
+}
+
+
+def redact_headers(headers) -> Dict[str, str]:
+    return {
+        name: "[REDACTED]" if name.lower() in REDACTED_HEADERS else value
+        for name, value in headers.items()
+    }
+
+
+def get_body_prefix(body: Optional[bytes], size: int) -> Optional[str]:
+    # 본문은 파싱하지 않고 앞부분만 기록
+    if body is None:
+        return None
+    prefix: str = body[:size].decode("utf-8", errors="replace")
+    if len(body) > size:
+        prefix += "... [Truncated]"
+    return prefix
+
+
+class RequestLogStats:
+    """
+    요청 로그 middleware 통계 (프로세스별)
+    overhead_seconds는 middleware가 로그를 남기기 위해 사용한 시간의 합계입니다.
+    """
+
+    _lock = threading.Lock()
+    requests: int = 0
+    logged: int = 0
+    overhead_seconds: float = 0.0
+
+    @classmethod
+    def add(cls, logged: bool, overhead: float) -> None:
+        with cls._lock:
+            cls.requests += 1
+            cls.logged += int(logged)
+            cls.overhead_seconds += overhead
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        with cls._lock:
+            return {
+                "requests": cls.requests,
+                "logged": cls.logged,
+                "overhead_seconds": round(cls.overhead_seconds, 6),
+                "overhead_per_request_us": (
+                    round(cls.overhead_seconds / cls.requests * 1_000_000, 2)
+                    if cls.requests
+                    else 0.0
+                ),
+            }
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls.requests = cls.logged = 0
+            cls.overhead_seconds = 0.0
 
 
 class RequestLoggingMiddleware:
+    """
+    요청 / 응답 로그 middleware
+    - 요청, 응답 본문은 파싱하지 않고 앞부분 REQUEST_LOG_BODY_SIZE byte만 기록합니다.
+      요청 본문은 REQUEST_LOG_BODY_BUFFER_SIZE 이하의 multipart가 아닌 요청만 읽습니다.
+    - REQUEST_LOG_ROUTE_SAMPLE_RATES(경로 prefix : 비율)와 REQUEST_LOG_SAMPLE_RATE 비율로 샘플링하며,
+      400 이상 응답은 항상 기록합니다.
+    - Authorization, Cookie, X-Profile-Token 헤더 값은 기록하지 않습니다.
+    - 로그 JSON 변환과 출력은 BackgroundQueueHandler의 writer thread가 처리합니다.
+    """
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.body_size: int = settings.REQUEST_LOG_BODY_SIZE
+        self.body_buffer_size: int = settings.REQUEST_LOG_BODY_BUFFER_SIZE
+        self.sample_rate: float = settings.REQUEST_LOG_SAMPLE_RATE
+        # 긴 prefix부터 비교
+        self.route_sample_rates: List[Tuple[str, float]] = sorted(
+            settings.REQUEST_LOG_ROUTE_SAMPLE_RATES.items(),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+
+    def get_sample_rate(self, path: str) -> float:
+        for prefix, rate in self.route_sample_rates:
+            if path.startswith(prefix):
+                return rate
+        return self.sample_rate
+
+    def read_request_body(self, request) -> Optional[bytes]:
+        # 작은 요청 본문만 미리 읽음 (view가 다시 읽을 수 있도록 request.body에 저장됨)
+        if "multipart/form-data" in request.META.get("CONTENT_TYPE", ""):
+            return None
+        try:
+            content_length: int = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            return None
+        if not 0 < content_length <= self.body_buffer_size:
+            return None
+        return request.body
 
     def __call__(self, request):
-        start_time = time.time()
-
-        # 요청 본문 크기 확인 및 제한
-        request_body: str = ""
-        content_length: int = int(request.headers.get("Content-Length", "0"))
-        content_type: str = request.headers.get("Content-Type", "").lower()
-
-        if "multipart/form-data" in content_type:
-            request_body = "{'multipart': '[multipart/form-data] (truncated)'}"
-        else:
-            raw_request_body = request.body.decode("utf-8", errors="replace")
-            if content_length > MAX_BODY_SIZE:
-                request_body = raw_request_body[:MAX_BODY_SIZE] + "... [Truncated]"
-            else:
-                request_body = raw_request_body
-
-        # 응답 처리
+        started: float = time.perf_counter()
+        request_body: Optional[bytes] = self.read_request_body(request)
+        view_started: float = time.perf_counter()
+
         response = self.get_response(request)
-        duration = time.time() - start_time
 
-        # 응답 본문 크기 확인 및 제한
-        try:
-            response_body = json.loads(response.content.decode("utf-8"))
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            response_body = response.content.decode("utf-8", errors="replace")
-
-        response_body = json.dumps(response_body)
-
-        # 문자열화된 응답 본문 크기 제한 적용
-        if len(response_body) > MAX_BODY_SIZE:
-            response_body = response_body[:MAX_BODY_SIZE] + "... [Truncated]"
-
-        # 응답 로그 기록
-        logger.info(
-            json.dumps(
-                {
-                    "timestamp": datetime.datetime.now().isoformat(),
-                    "request": {
-                        "headers": dict(request.headers),
-                        "user_agent": request.META.get("HTTP_USER_AGENT", ""),
-                        "client_ip": request.META.get("REMOTE_ADDR", ""),
-                        "path": request.get_full_path(),
-                        "method": request.method,
-                        "body": json.dumps(request_body),
-                    },
-                    "response": {
-                        "status_code": response.status_code,
-                        "headers": dict(response.headers),
-                        "body": response_body,
-                        "duration": f"{duration:.3f}s",
-                        "response_size": len(response.content),
-                    },
-                },
-                indent=2,
-            )
-            + "\n"
+        finished: float = time.perf_counter()
+        logged: bool = response.status_code >= 400 or (
+            random.random() < self.get_sample_rate(request.path)
+        )
+        if logged:
+            self.log(request, request_body, response, finished - view_started)
+        RequestLogStats.add(
+            logged, (view_started - started) + (time.perf_counter() - finished)
         )
-
         return response
+
+    def log(self, request, request_body: Optional[bytes], response, duration: float):
+        resolver_match = getattr(request, "resolver_match", None)
+        response_body: Optional[bytes] = (
+            None if response.streaming else response.content
+        )
+        log_data: Dict[str, Any] = {
+            "method": request.method,
+            "path": request.get_full_path(),
+            "route": resolver_match.route if resolver_match else None,
+            "status_code": response.status_code,
+            "duration_ms": round(duration * 1000, 3),
+            "client_ip": request.META.get("REMOTE_ADDR", ""),
+            "queries": getattr(request, "query_stats", None),
+            "request": {
+                "headers": redact_headers(request.headers),
+                "body": get_body_prefix(request_body, self.body_size),
+            },
+            "response": {
+                "headers": redact_headers(response.headers),
+                "body": get_body_prefix(response_body, self.body_size),
+                "size": len(response_body) if response_body is not None else None,
+            },
+        }
+        level: int = logging.WARNING if response.status_code >= 500 else logging.INFO
+        logger.log(level, "request", extra={"log_data": log_data})
@@ -40,6 +40,7 @@ LIBS = [
 INSTALLED_APPS = DJANGO_APPS + PROJECT_APPS + LIBS
 
 MIDDLEWARE = [
+    "config.middleware.metrics_middleware.MetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -49,6 +50,8 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "config.middleware.request_logging_middleware.RequestLoggingMiddleware",
+    "config.middleware.query_timing_middleware.QueryTimingMiddleware",
+    "config.middleware.profiling_middleware.ProfilingMiddleware",
 ]
 
 # CORS / CSRF 설정
@@ -140,6 +143,29 @@ else:
         }
     }
 
+# 캐시 설정
+# 기본값은 프로세스별 로컬 메모리 캐시 (MAX_ENTRIES를 넘으면 가장 오래전에 사용된 항목부터 삭제, LRU)
+# 여러 서버 / 워커가 캐시를 공유해야 하는 경우 DJANGO_CACHE_BACKEND, DJANGO_CACHE_LOCATION 환경 변수로 변경
+# ex) DJANGO_CACHE_BACKEND=django.core.cache.backends.redis.RedisCache, DJANGO_CACHE_LOCATION=redis://127.0.0.1:6379
+CACHE_BACKEND = os.getenv(
+    "DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+)
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKEND,
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", "upcy-default-cache"),
+        "TIMEOUT": 300,
+    }
+}
+if CACHE_BACKEND.endswith("LocMemCache"):
+    CACHES["default"]["OPTIONS"] = {
+        "MAX_ENTRIES": int(os.getenv("DJANGO_CACHE_MAX_ENTRIES", "1000")),
+    }
+
+# 서비스 조회 API 응답 캐시 유지 시간 (초)
+# 응답에 포함된 S3 presigned URL(기본 1시간)이 만료되기 전에 캐시가 만료되어야 함
+SERVICE_RESPONSE_CACHE_TIMEOUT = int(os.getenv("SERVICE_RESPONSE_CACHE_TIMEOUT", "300"))
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -172,6 +198,11 @@ AWS_STORAGE_BUCKET_NAME = os.getenv("AWS_STORAGE_BUCKET_NAME")
 AWS_S3_REGION_NAME = os.getenv("AWS_S3_REGION_NAME")
 AWS_S3_SIGNATURE_VERSION = os.getenv("AWS_S3_SIGNATURE_VERSION")
 AWS_DEFAULT_ACL = os.getenv("AWS_S3_DEFAULT_ACL", None)
+# MinIO 등 S3 호환 storage를 사용하는 경우 지정 (지정하지 않으면 AWS S3 사용)
+AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL", None)
+AWS_QUERYSTRING_EXPIRE = int(
+    os.getenv("AWS_QUERYSTRING_EXPIRE", "3600")
+)  # presigned URL 만료 시간 (초)
 
 # 업로드 파일 저장 위치 설정
 MEDIA_URL = f"https://{AWS_STORAGE_BUCKET_NAME}.s3.{AWS_S3_REGION_NAME}.amazonaws.com/"
@@ -182,6 +213,7 @@ STORAGES = {
             "access_key": AWS_ACCESS_KEY_ID,
             "secret_key": AWS_SECRET_ACCESS_KEY,
             "region_name": AWS_S3_REGION_NAME,
+            "endpoint_url": AWS_S3_ENDPOINT_URL,
         },
     },
     "staticfiles": {
@@ -195,6 +227,115 @@ STORAGES = {
 }
 FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 최대 파일 업로드 크기 10MB 제한
 
+# 이미지 업로드 설정
+# 요청 처리 중에는 파일을 UPLOAD_SPOOL_DIR에 저장하고, worker thread가 storage(S3)로 업로드
+# UPLOAD_WORKER_THREADS가 0이면 thread를 사용하지 않음 (python manage.py process_uploads로 처리)
+UPLOAD_SPOOL_DIR = os.getenv("UPLOAD_SPOOL_DIR", str(BASE_DIR / "spool" / "uploads"))
+UPLOAD_WORKER_THREADS = int(os.getenv("UPLOAD_WORKER_THREADS", "4"))
+UPLOAD_MAX_ATTEMPTS = int(
+    os.getenv("UPLOAD_MAX_ATTEMPTS", "5")
+)  # 최대 업로드 시도 횟수
+UPLOAD_RETRY_DELAY = int(
+    os.getenv("UPLOAD_RETRY_DELAY", "5")
+)  # 첫 재시도 대기 시간 (초)
+UPLOAD_TASK_TIMEOUT = int(
+    os.getenv("UPLOAD_TASK_TIMEOUT", "300")
+)  # 처리중 상태로 이 시간(초)이 지난 작업은 다시 처리
+
+# storage gateway 설정 (여러 파일 삭제, 조회, 복사 및 presigned 업로드에 사용)
+# 테스트, 로컬 개발 환경에서는 core.storage.LocalStorageGateway 사용 가능 (STORAGE_GATEWAY_LOCAL_ROOT에 저장)
+STORAGE_GATEWAY_BACKEND = os.getenv(
+    "STORAGE_GATEWAY_BACKEND", "core.storage.S3StorageGateway"
+)
+STORAGE_GATEWAY_LOCAL_ROOT = os.getenv(
+    "STORAGE_GATEWAY_LOCAL_ROOT", str(BASE_DIR / "spool" / "storage")
+)
+STORAGE_MAX_POOL_CONNECTIONS = int(
+    os.getenv("STORAGE_MAX_POOL_CONNECTIONS", "20")
+)  # S3 client가 유지하는 최대 HTTP connection 개수
+
+# 파일 URL 캐시 설정 (core.file_urls.FileUrlResolver)
+# presigned URL은 프로세스 메모리에 캐시하며, 캐시 유지 시간은 AWS_QUERYSTRING_EXPIRE의 절반을 넘지 않음
+STORAGE_URL_CACHE_TTL = int(os.getenv("STORAGE_URL_CACHE_TTL", "1800"))  # 초
+STORAGE_URL_CACHE_MAX_SIZE = int(os.getenv("STORAGE_URL_CACHE_MAX_SIZE", "50000"))
+# CDN(CloudFront 등)을 사용하는 경우 지정하면 storage URL 대신 CDN 주소 + key 반환 ex) https://cdn.example.com/
+STORAGE_CDN_URL = os.getenv("STORAGE_CDN_URL", None)
+
+# 고아 파일 정리 대상 key prefix (python manage.py collect_orphan_files)
+# static 파일 등 모델이 관리하지 않는 파일이 같은 bucket에 있으므로, 업로드 파일 경로만 지정
+STORAGE_ORPHAN_PREFIXES = ["users/", "orders/", "images/"]
+
+# storage 파일 삭제 설정
+# 삭제할 key는 outbox 테이블(core_storage_deletion)에 기록하고, 커밋 이후 worker thread가 모아서 삭제
+# STORAGE_DELETION_WORKER_THREADS가 0이면 thread를 사용하지 않음 (python manage.py process_storage_deletions로 처리)
+STORAGE_DELETION_WORKER_THREADS = int(os.getenv("STORAGE_DELETION_WORKER_THREADS", "1"))
+STORAGE_DELETION_RETRY_DELAY = int(
+    os.getenv("STORAGE_DELETION_RETRY_DELAY", "30")
+)  # 첫 재시도 대기 시간 (초)
+STORAGE_DELETION_TIMEOUT = int(
+    os.getenv("STORAGE_DELETION_TIMEOUT", "300")
+)  # worker가 가져간 작업을 이 시간(초) 동안 다른 worker가 처리하지 않음
+
+# 이미지 업로드 설정 (서버 업로드는 core.upload_handlers.ImageUploadHandler가 검사)
+# presigned URL 업로드는 클라이언트가 storage에 직접 업로드
+IMAGE_UPLOAD_MAX_SIZE = 10 * 1024 * 1024  # 이미지 1개의 최대 크기 10MB
+IMAGE_UPLOAD_MAX_FILES = 10  # 한번에 업로드할 수 있는 최대 이미지 개수
+IMAGE_UPLOAD_MAX_PIXELS = 40_000_000  # 이미지 1개의 최대 픽셀 수 (width * height)
+PRESIGNED_UPLOAD_EXPIRES = int(
+    os.getenv("PRESIGNED_UPLOAD_EXPIRES", "600")
+)  # 업로드 URL 유효 시간 (초)
+PRESIGNED_UPLOAD_MAX_FILES = IMAGE_UPLOAD_MAX_FILES
+
+# 파생 이미지(썸네일, WebP) 설정
+# 크기 이름 : 긴 변의 최대 길이(px), 각 크기마다 IMAGE_DERIVATIVE_FORMATS의 모든 format으로 저장
+IMAGE_DERIVATIVE_SIZES = {"small": 320, "medium": 960}
+IMAGE_DERIVATIVE_FORMATS = ("webp", "jpeg")
+# 파생 이미지를 만드는 process 개수, 0이면 python manage.py generate_image_derivatives로만 처리
+IMAGE_DERIVATIVE_WORKERS = int(os.getenv("IMAGE_DERIVATIVE_WORKERS", "2"))
+
+# 요청 로그 설정 (config.middleware.request_logging_middleware.RequestLoggingMiddleware)
+REQUEST_LOG_BODY_SIZE = 1000  # 요청, 응답 본문은 앞부분만 기록 (byte)
+REQUEST_LOG_BODY_BUFFER_SIZE = 64 * 1024  # 이 크기 이하의 요청 본문만 읽어서 기록
+REQUEST_LOG_SAMPLE_RATE = float(
+    os.getenv("REQUEST_LOG_SAMPLE_RATE", "1.0")
+)  # 기록할 요청 비율 (400 이상 응답은 항상 기록)
+REQUEST_LOG_ROUTE_SAMPLE_RATES = {
+    # 경로 prefix : 기록할 요청 비율 (긴 prefix 우선)
+    "/api/core/health-check": 0.0,
+    "/api/core/metrics": 0.0,
+    "/api/market/services": 0.1,
+}
+REQUEST_LOG_QUEUE_SIZE = (
+    10000  # writer thread가 출력하지 못한 로그가 이 개수를 넘으면 버림
+)
+
+# SQL 측정 설정 (config.middleware.query_timing_middleware.QueryTimingMiddleware)
+QUERY_TIMING_SERVER_TIMING = True  # Server-Timing 응답 헤더 반환 여부
+QUERY_TIMING_TOP_N = 5  # 경고 로그에 기록할 가장 느린 SQL 개수
+QUERY_TIMING_SQL_SIZE = 500  # 경고 로그에 기록할 SQL 길이
+QUERY_TIMING_MAX_QUERIES = int(
+    os.getenv("QUERY_TIMING_MAX_QUERIES", "30")
+)  # 요청 1개의 SQL 개수가 이 값을 넘으면 경고 로그
+QUERY_TIMING_MAX_DURATION_MS = int(
+    os.getenv("QUERY_TIMING_MAX_DURATION_MS", "300")
+)  # 요청 1개의 SQL 시간 합계(ms)가 이 값을 넘으면 경고 로그
+
+# 요청 profiling 설정 (config.middleware.profiling_middleware.ProfilingMiddleware)
+# X-Profile-Token 헤더(python manage.py create_profile_token)가 있는 요청은 항상 profiling
+PROFILE_SAMPLE_RATE = float(
+    os.getenv("PROFILE_SAMPLE_RATE", "0.0")
+)  # 토큰 없이 profiling할 요청 비율
+PROFILE_TOKEN_MAX_AGE = 60 * 60  # profiling 토큰 유효 시간 (초)
+PROFILE_STATS_LIMIT = 50  # 결과 json에 기록할 함수 개수 (누적 시간 순)
+PROFILE_SQL_TRACE_SIZE = 1000  # 결과 json에 기록할 SQL 개수
+
+# 요청 metrics 설정 (core.metrics.RequestMetrics, /api/core/metrics)
+# gunicorn worker 프로세스마다 METRICS_DIR에 파일을 만들어 기록하고, 조회할 때 합산
+# METRICS_DIR이 없으면 요청을 처리한 프로세스의 값만 조회 (개발 서버용)
+METRICS_DIR = os.getenv("METRICS_DIR", None)
+# 조회할 때 필요한 Bearer 토큰, 지정하지 않으면 DEBUG 환경에서만 토큰 없이 조회 가능 (운영 환경에서는 조회 불가)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", None)
+
 # 로깅 설정
 if not DEBUG:
     LOGGING = {
@@ -207,8 +348,22 @@ if not DEBUG:
             "null": {
                 "class": "logging.NullHandler",
             },
+            "request_log": {
+                "()": "core.log_handlers.BackgroundQueueHandler",
+                "maxsize": REQUEST_LOG_QUEUE_SIZE,
+            },
         },
         "loggers": {
+            "config.middleware.request_logging_middleware": {
+                "handlers": ["request_log"],
+                "level": "INFO",
+                "propagate": False,
+            },
+            "config.middleware.query_timing_middleware": {
+                "handlers": ["request_log"],
+                "level": "WARNING",
+                "propagate": False,
+            },
             "boto3": {
                 "handlers": ["console"],
                 "level": "INFO",
@@ -263,8 +418,22 @@ else:
             "null": {
                 "class": "logging.NullHandler",
             },
+            "request_log": {
+                "()": "core.log_handlers.BackgroundQueueHandler",
+                "maxsize": REQUEST_LOG_QUEUE_SIZE,
+            },
         },
         "loggers": {
+            "config.middleware.request_logging_middleware": {
+                "handlers": ["request_log"],
+                "level": "INFO",
+                "propagate": False,
+            },
+            "config.middleware.query_timing_middleware": {
+                "handlers": ["request_log"],
+                "level": "WARNING",
+                "propagate": False,
+            },
             "django": {
                 "handlers": ["console"],
                 "level": "DEBUG",
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self):
+        # 이미지 업로드 완료 후 파생 이미지 생성용 signal 등록
+        from core import signals  # noqa: F401
@@ -0,0 +1,373 @@
+import json
+import math
+import random
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from config.middleware.query_timing_middleware import QueryRecorder, record_queries
+from core.seeding import SEED_PASSWORD
+from market.models import Service
+from order.models import Order, _OrderStatus
+from users.models.user import User
+
+
+class BenchmarkRequest(NamedTuple):
+    path: str
+    data: Optional[Dict[str, Any]] = None
+    user: Optional[User] = None  # 없으면 인증하지 않은 요청
+
+
+class BenchmarkScenario(NamedTuple):
+    name: str
+    method: str
+    expected_status: int
+    # 반복 번호 -> 요청
+    build: Callable[[int], BenchmarkRequest]
+    # DB를 변경하는 요청은 트랜잭션 안에서 실행 후 rollback (--keepdb로 다시 실행해도 같은 데이터로 측정)
+    mutating: bool = False
+
+
+def get_percentile(values: Sequence[float], percentile: float) -> float:
+    # nearest-rank 방식 (values는 정렬된 상태)
+    return values[max(math.ceil(len(values) * percentile) - 1, 0)]
+
+
+class EndpointBenchmark:
+    """
+    seed 데이터(core.seeding.MarketplaceSeeder)가 있는 DB에서 주요 API를 test client로 반복 호출해서 측정하는 클래스
+    - middleware를 포함한 전체 요청 처리 시간의 p50, p95, p99 (ms)
+    - 요청당 SQL 개수 (QueryRecorder)
+    - 요청당 최대 메모리 할당량 (tracemalloc, 응답 시간이 느려지므로 별도로 allocation_iterations번 측정)
+    마켓, 서비스, 주문 등 요청 대상은 seed로 정한 순서대로 돌아가며 사용합니다.
+    주문 생성, 상태 변경처럼 DB를 변경하는 요청은 요청마다 rollback해서 seed 데이터를 그대로 유지합니다.
+    """
+
+    def __init__(
+        self,
+        iterations: int = 50,
+        warmup: int = 5,
+        allocation_iterations: int = 5,
+        seed: int = 0,
+    ):
+        self.iterations: int = iterations
+        self.warmup: int = warmup
+        self.allocation_iterations: int = allocation_iterations
+        self.random = random.Random(seed)
+        self.client = APIClient()
+        self.tokens: Dict[int, str] = {}
+
+    def sample(self, queryset, size: int = 50) -> List[Any]:
+        # 요청 대상 후보를 일부만 가져와서 섞음
+        items: List[Any] = list(queryset[: size * 4])
+        self.random.shuffle(items)
+        return items[:size]
+
+    def get_scenarios(self) -> List[BenchmarkScenario]:
+        requests_needed: int = (
+            self.warmup + self.iterations + self.allocation_iterations
+        )
+        services: List[Service] = self.sample(
+            Service.objects.filter(temporary=False, service_option__isnull=False)
+            .select_related("market")
+            .prefetch_related("service_material", "service_option")
+            .distinct()
+            .order_by("id")
+        )
+        if not services:
+            raise ValueError("Seed data is required to run benchmarks")
+
+        # 주문이 가장 많은 주문자, 대기 중인 주문이 가장 많은 리포머
+        customer: User = User.objects.get(
+            pk=Order.objects.values("orderer")
+            .annotate(count=Count("pk"))
+            .order_by("-count")
+            .values_list("orderer", flat=True)[0]
+        )
+        reformer: User = User.objects.get(
+            reformer_profile__pk=Order.objects.filter(
+                current_status=_OrderStatus.PENDING
+            )
+            .values("service__market__reformer")
+            .annotate(count=Count("pk"))
+            .order_by("-count")
+            .values_list("service__market__reformer", flat=True)[0]
+        )
+        # 상태 변경 요청마다 대기 중인 주문 1개를 수락 (요청마다 rollback하므로 주문 수가 적으면 반복해서 사용)
+        pending_orders: List[str] = [
+            str(order_uuid)
+            for order_uuid in Order.objects.filter(
+                current_status=_OrderStatus.PENDING,
+                service__market__reformer__user=reformer,
+            ).values_list("order_uuid", flat=True)[:requests_needed]
+        ]
+
+        def order_create_data(index: int) -> Dict[str, Any]:
+            service: Service = services[index % len(services)]
+            options = list(service.service_option.all())
+            option_price: int = sum(option.option_price for option in options)
+            return {
+                "transaction_option": "pickup",
+                "service_uuid": str(service.service_uuid),
+                "service_price": service.basic_price,
+                "option_price": option_price,
+                "total_price": service.basic_price + option_price,
+                "materials": [
+                    str(material.material_uuid)
+                    for material in service.service_material.all()
+                ],
+                "options": [str(option.option_uuid) for option in options],
+            }
+
+        def service_path(index: int) -> str:
+            service: Service = services[index % len(services)]
+            return f"/api/market/{service.market.market_uuid}/service"
+
+        return [
+            BenchmarkScenario(
+                "catalog",
+                "GET",
+                200,
+                lambda i: BenchmarkRequest(f"/api/market/services?offset={i % 5 * 20}"),
+            ),
+            BenchmarkScenario(
+                "market_services",
+                "GET",
+                200,
+                lambda i: BenchmarkRequest(service_path(i)),
+            ),
+            BenchmarkScenario(
+                "service_detail",
+                "GET",
+                200,
+                lambda i: BenchmarkRequest(
+                    f"{service_path(i)}/{services[i % len(services)].service_uuid}"
+                ),
+            ),
+            BenchmarkScenario(
+                "orders_customer",
+                "GET",
+                200,
+                lambda i: BenchmarkRequest("/api/orders?type=customer", user=customer),
+            ),
+            BenchmarkScenario(
+                "orders_reformer",
+                "GET",
+                200,
+                lambda i: BenchmarkRequest("/api/orders?type=reformer", user=reformer),
+            ),
+            BenchmarkScenario(
+                "order_create",
+                "POST",
+                201,
+                lambda i: BenchmarkRequest(
+                    "/api/orders", order_create_data(i), user=customer
+                ),
+                mutating=True,
+            ),
+            BenchmarkScenario(
+                "order_status",
+                "PATCH",
+                200,
+                lambda i: BenchmarkRequest(
+                    f"/api/orders/{pending_orders[i % len(pending_orders)]}/status",
+                    {"status": "accepted"},
+                    user=reformer,
+                ),
+                mutating=True,
+            ),
+            BenchmarkScenario(
+                "login",
+                "POST",
+                200,
+                lambda i: BenchmarkRequest(
+                    "/api/user/login",
+                    {"email": customer.email, "password": SEED_PASSWORD},
+                ),
+            ),
+        ]
+
+    def request(self, scenario: BenchmarkScenario, request: BenchmarkRequest):
+        headers: Dict[str, str] = {}
+        if request.user is not None:
+            if request.user.pk not in self.tokens:
+                self.tokens[request.user.pk] = str(AccessToken.for_user(request.user))
+            headers["HTTP_AUTHORIZATION"] = f"Bearer {self.tokens[request.user.pk]}"
+        return self.client.generic(
+            scenario.method,
+            request.path,
+            data=json.dumps(request.data) if request.data is not None else "",
+            content_type="application/json",
+            **headers,
+        )
+
+    @staticmethod
+    @contextmanager
+    def isolate(scenario: BenchmarkScenario) -> Iterator[None]:
+        # DB를 변경하는 시나리오는 요청이 끝난 후 변경 내용을 rollback (on_commit 콜백도 실행되지 않음)
+        if not scenario.mutating:
+            yield
+            return
+        with transaction.atomic():
+            yield
+            transaction.set_rollback(True)
+
+    def run_scenario(self, scenario: BenchmarkScenario) -> Dict[str, Any]:
+        index: int = 0
+        for _ in range(self.warmup):
+            with self.isolate(scenario):
+                self.request(scenario, scenario.build(index))
+            index += 1
+
+        latencies: List[float] = []
+        query_counts: List[int] = []
+        errors: int = 0
+        for _ in range(self.iterations):
+            request: BenchmarkRequest = scenario.build(index)
+            index += 1
+            recorder = QueryRecorder(top_n=0)
+            with self.isolate(scenario), record_queries(recorder):
+                started: float = time.perf_counter()
+                response = self.request(scenario, request)
+                latencies.append((time.perf_counter() - started) * 1000)
+            query_counts.append(recorder.count)
+            errors += int(response.status_code != scenario.expected_status)
+
+        allocations: List[float] = []
+        tracemalloc.start()
+        try:
+            for _ in range(self.allocation_iterations):
+                request = scenario.build(index)
+                index += 1
+                with self.isolate(scenario):
+                    tracemalloc.reset_peak()
+                    before, _ = tracemalloc.get_traced_memory()
+                    self.request(scenario, request)
+                    _, peak = tracemalloc.get_traced_memory()
+                allocations.append((peak - before) / 1024)
+        finally:
+            tracemalloc.stop()
+
+        latencies.sort()
+        return {
+            "requests": len(latencies),
+            "errors": errors,
+            "mean_ms": round(statistics.mean(latencies), 3),
+            "p50_ms": round(get_percentile(latencies, 0.5), 3),
+            "p95_ms": round(get_percentile(latencies, 0.95), 3),
+            "p99_ms": round(get_percentile(latencies, 0.99), 3),
+            "queries": max(query_counts),
+            "alloc_peak_kb": (
+                round(statistics.median(allocations), 1) if allocations else None
+            ),
+        }
+
+    def run(
+        self,
+        names: Optional[Sequence[str]] = None,
+        on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        names : 실행할 시나리오 이름 (없으면 전체)
+        반환값 : {시나리오 이름: 측정 결과}
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        for scenario in self.get_scenarios():
+            if names and scenario.name not in names:
+                continue
+            results[scenario.name] = self.run_scenario(scenario)
+            if on_result is not None:
+                on_result(scenario.name, results[scenario.name])
+        return results
+
+
+class BenchmarkBaseline:
+    """
+    벤치마크 결과를 JSON 파일로 저장하고, 저장된 결과(baseline)와 비교하는 클래스
+    측정값의 흔들림으로 실패하지 않도록, 시간과 메모리는 tolerance 비율과 최소 차이를 모두 넘어야 성능 저하로 판단합니다.
+    SQL 개수와 실패한 요청 수는 baseline보다 많아지면 바로 성능 저하로 판단합니다.
+    """
+
+    MIN_LATENCY_DELTA_MS: float = 2.0
+    MIN_ALLOCATION_DELTA_KB: float = 64.0
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def save(path: str, results: Dict[str, Dict[str, Any]], **info: Any) -> None:
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "created_at": timezone.now().isoformat(),
+                    **info,
+                    "results": results,
+                },
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+
+    @staticmethod
+    def load(path: str) -> Dict[str, Any]:
+        # 반환값 : save에 전달한 정보와 results
+        with open(path) as f:
+            return json.load(f)
+
+    @staticmethod
+    def compare(
+        results: Dict[str, Dict[str, Any]],
+        baseline: Dict[str, Dict[str, Any]],
+        tolerance: float = 0.2,
+    ) -> List[str]:
+        """
+        반환값 : 성능이 저하된 항목 설명 리스트 (없으면 빈 리스트)
+        """
+        regressions: List[str] = []
+        checks: Tuple[Tuple[str, float], ...] = (
+            ("p50_ms", BenchmarkBaseline.MIN_LATENCY_DELTA_MS),
+            ("p95_ms", BenchmarkBaseline.MIN_LATENCY_DELTA_MS),
+            ("p99_ms", BenchmarkBaseline.MIN_LATENCY_DELTA_MS),
+            ("alloc_peak_kb", BenchmarkBaseline.MIN_ALLOCATION_DELTA_KB),
+        )
+        for name, result in results.items():
+            expected: Optional[Dict[str, Any]] = baseline.get(name)
+            if expected is None:
+                continue
+            if result["errors"] > expected["errors"]:
+                regressions.append(
+                    f"{name}: errors {expected['errors']} -> {result['errors']}"
+                )
+            if result["queries"] > expected["queries"]:
+                regressions.append(
+                    f"{name}: queries {expected['queries']} -> {result['queries']}"
+                )
+            for key, min_delta in checks:
+                if result.get(key) is None or expected.get(key) is None:
+                    continue
+                if (
+                    result[key] > expected[key] * (1 + tolerance)
+                    and result[key] - expected[key] > min_delta
+                ):
+                    regressions.append(
+                        f"{name}: {key} {expected[key]} -> {result[key]}"
+                    )
+        return regressions
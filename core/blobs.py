@@ -0,0 +1,156 @@
+import hashlib
+import logging
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import F, ProtectedError
+
+from core.deletions import StorageDeletionService
+from core.models import ImageBlob, UploadStatus, UploadTask
+
+logger = logging.getLogger(__name__)
+
+# 중복 제거된 이미지 파일(ImageBlob)을 image_blob 필드로 참조하는 이미지 모델
+IMAGE_BLOB_TARGETS: Tuple[str, ...] = (
+    "market.ServiceImage",
+    "market.ServiceOptionImage",
+    "order.OrderImage",
+)
+
+
+def get_content_hash(uploaded_file) -> str:
+    """
+    업로드 파일 내용의 sha256 hex
+    ImageUploadHandler가 업로드 받으면서 계산한 해시가 있으면 파일을 다시 읽지 않음
+    """
+    content_hash: Optional[str] = getattr(uploaded_file, "content_hash", None)
+    if content_hash:
+        return content_hash
+
+    digest = hashlib.sha256()
+    for chunk in uploaded_file.chunks():
+        digest.update(chunk)
+    uploaded_file.seek(0)
+    return digest.hexdigest()
+
+
+def uses_image_blob(model: type[models.Model]) -> bool:
+    return model._meta.label in IMAGE_BLOB_TARGETS
+
+
+class ImageBlobService:
+    """
+    내용이 같은 이미지를 storage에 1번만 저장하는 서비스
+    - acquire : 업로드 파일마다 blob을 찾거나 만들고, 참조 개수를 늘림
+    - release : 이미지 row가 삭제되면 참조 개수를 줄이고, 참조가 없어진 blob과 파일을 삭제
+    """
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def acquire(
+        uploaded_files: Sequence,
+    ) -> Tuple[List[ImageBlob], List[Tuple[ImageBlob, object]]]:
+        """
+        트랜잭션 안에서 호출해주세요.
+        반환값 : (uploaded_files와 같은 순서의 blob 리스트, storage 업로드가 필요한 (blob, 업로드 파일) 리스트)
+        이미 업로드되었거나 업로드 중인 blob은 파일을 다시 업로드하지 않습니다.
+        """
+        hashes: List[str] = [get_content_hash(file) for file in uploaded_files]
+        files: Dict[str, object] = {}
+        for content_hash, uploaded_file in zip(hashes, uploaded_files):
+            files.setdefault(content_hash, uploaded_file)
+
+        field = ImageBlob._meta.get_field("image")
+        blobs: Dict[str, ImageBlob] = {}
+        while True:
+            # 다른 요청이 참조 개수를 바꾸거나 blob을 삭제하지 못하도록 잠금
+            blobs = {
+                blob.content_hash: blob
+                for blob in ImageBlob.objects.select_for_update()
+                .filter(content_hash__in=files)
+                .order_by("pk")
+            }
+            missing: List[str] = [h for h in files if h not in blobs]
+            if not missing:
+                break
+            # 같은 이미지를 동시에 업로드해도 unique 제약으로 blob은 1개만 생성됨
+            new_blobs: List[ImageBlob] = []
+            for content_hash in missing:
+                blob = ImageBlob(
+                    content_hash=content_hash, size=files[content_hash].size
+                )
+                blob.image = field.generate_filename(blob, files[content_hash].name)
+                new_blobs.append(blob)
+            ImageBlob.objects.bulk_create(new_blobs, ignore_conflicts=True)
+
+        # 참조 개수는 늘어나는 개수가 같은 blob끼리 한번에 갱신
+        counts: Counter = Counter(hashes)
+        for count in set(counts.values()):
+            ImageBlob.objects.filter(
+                pk__in=[blobs[h].pk for h, c in counts.items() if c == count]
+            ).update(ref_count=F("ref_count") + count)
+
+        # 업로드가 끝나지 않았고 진행 중인 업로드 작업도 없는 blob만 업로드
+        uploading = set(
+            UploadTask.objects.filter(
+                model_label=ImageBlob._meta.label,
+                object_id__in=[blob.pk for blob in blobs.values()],
+                status__in=[UploadTask.Status.PENDING, UploadTask.Status.PROCESSING],
+            ).values_list("object_id", flat=True)
+        )
+        uploads: List[Tuple[ImageBlob, object]] = [
+            (blob, files[content_hash])
+            for content_hash, blob in blobs.items()
+            if blob.upload_status != UploadStatus.READY and blob.pk not in uploading
+        ]
+        return [blobs[h] for h in hashes], uploads
+
+    @staticmethod
+    def update_references(blob_id: int, **fields) -> Dict[type, List]:
+        """
+        blob을 참조하는 이미지 row를 갱신하고, {모델 : 갱신한 row pk 리스트} 반환
+        """
+        updated: Dict[type, List] = {}
+        for model_label in IMAGE_BLOB_TARGETS:
+            model: type[models.Model] = apps.get_model(model_label)
+            object_ids: List = list(
+                model.objects.filter(image_blob=blob_id).values_list("pk", flat=True)
+            )
+            if object_ids:
+                model.objects.filter(pk__in=object_ids).update(**fields)
+                updated[model] = object_ids
+        return updated
+
+    @staticmethod
+    def release(blob_id: int) -> bool:
+        """
+        blob 참조 개수를 1 줄이고, 참조가 없어지면 blob row와 파일(파생 이미지 포함) 삭제
+        반환값 : blob 삭제 여부
+        """
+        ImageBlob.objects.filter(pk=blob_id, ref_count__gt=0).update(
+            ref_count=F("ref_count") - 1
+        )
+        blob: Optional[Dict] = (
+            ImageBlob.objects.filter(pk=blob_id, ref_count=0)
+            .values("image", "image_derivatives")
+            .first()
+        )
+        if blob is None:
+            return False
+
+        try:
+            with transaction.atomic():
+                ImageBlob.objects.filter(pk=blob_id, ref_count=0).delete()
+        except ProtectedError:
+            # 참조 개수가 실제 참조와 다른 경우, 파일은 삭제하지 않음
+            logger.error(f"Image blob is still referenced (blob id: {blob_id})")
+            return False
+
+        StorageDeletionService.enqueue(
+            [blob["image"], *(blob["image_derivatives"] or {}).values()]
+        )
+        return True
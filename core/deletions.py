@@ -0,0 +1,227 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F, QuerySet
+from django.utils import timezone
+
+from core.derivatives import get_derivatives_field_name
+from core.models import StorageDeletion
+from core.storage import DELETE_OBJECTS_MAX_KEYS, StorageGateway, get_storage_gateway
+
+logger = logging.getLogger(__name__)
+
+
+class StorageDeletionService:
+    """
+    storage(S3) 파일 삭제 요청 서비스
+    요청 처리 중에는 삭제할 key를 outbox 테이블에만 기록하고, 실제 삭제는 트랜잭션이 커밋된 후 worker가 처리합니다.
+    """
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def enqueue(keys: Iterable[Optional[str]]) -> int:
+        """
+        삭제할 key를 현재 트랜잭션에 기록하고, 기록한 key 개수를 반환
+        빈 key(파일이 없는 FileField)는 무시합니다.
+        """
+        unique_keys: List[str] = list(dict.fromkeys(key for key in keys if key))
+        if not unique_keys:
+            return 0
+
+        now = timezone.now()
+        StorageDeletion.objects.bulk_create(
+            [StorageDeletion(key=key, next_attempt_at=now) for key in unique_keys]
+        )
+        transaction.on_commit(StorageDeletionWorkerPool.submit)
+        return len(unique_keys)
+
+    @staticmethod
+    def enqueue_files(queryset: QuerySet, field_name: str) -> int:
+        """
+        queryset row들의 파일과 파생 이미지 key를 삭제 대기열에 기록
+        row를 삭제하기 전에 호출해주세요.
+        """
+        derivatives_field_name: str = get_derivatives_field_name(field_name)
+        field_names = {field.name for field in queryset.model._meta.get_fields()}
+        has_derivatives: bool = derivatives_field_name in field_names
+        if "image_blob" in field_names:
+            # ImageBlob 파일은 다른 row와 함께 사용하므로, 참조가 없어질 때 삭제 (ImageBlobService.release)
+            queryset = queryset.filter(image_blob__isnull=True)
+        keys: List[str] = []
+        if has_derivatives:
+            for key, derivatives in queryset.values_list(
+                field_name, derivatives_field_name
+            ):
+                keys.append(key)
+                keys += (derivatives or {}).values()
+        else:
+            keys += queryset.values_list(field_name, flat=True)
+        return StorageDeletionService.enqueue(keys)
+
+    @staticmethod
+    def cancel(keys: Iterable[Optional[str]]) -> None:
+        """
+        같은 key로 파일을 다시 저장한 경우, 아직 처리되지 않은 삭제 요청 취소
+        worker가 삭제 중인 row는 lock이 풀릴 때까지(storage 삭제가 끝날 때까지) 기다린 후 취소합니다.
+        """
+        keys = [key for key in keys if key]
+        if not keys:
+            return
+        with transaction.atomic():
+            deletion_ids: List[int] = list(
+                StorageDeletion.objects.select_for_update()
+                .filter(key__in=keys)
+                .values_list("pk", flat=True)
+            )
+            StorageDeletion.objects.filter(pk__in=deletion_ids).delete()
+
+
+class StorageDeletionWorker:
+    """
+    storage 파일 삭제 작업 처리 클래스
+    gateway 인자로 LocalStorageGateway 등을 넘겨서 테스트할 수 있습니다.
+    """
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def claim(limit: int) -> Dict[int, str]:
+        """
+        삭제할 시각이 지난 row를 가져오고, 다른 worker가 중복 처리하지 않도록 다음 시도 시각을 미룸
+        반환값 : row pk : key
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            rows = list(
+                StorageDeletion.objects.select_for_update(skip_locked=True)
+                .filter(next_attempt_at__lte=now)
+                .order_by("next_attempt_at", "id")
+                .values_list("id", "key")[:limit]
+            )
+            StorageDeletion.objects.filter(pk__in=[pk for pk, _ in rows]).update(
+                next_attempt_at=now
+                + timedelta(seconds=settings.STORAGE_DELETION_TIMEOUT),
+                attempts=F("attempts") + 1,
+            )
+        return dict(rows)
+
+    @staticmethod
+    def process_batch(
+        limit: int = DELETE_OBJECTS_MAX_KEYS, gateway: Optional[StorageGateway] = None
+    ) -> int:
+        """
+        삭제 작업을 최대 limit(1000)개 처리하고, 처리를 시도한 작업 개수를 반환
+        """
+        limit = min(limit, DELETE_OBJECTS_MAX_KEYS)
+        claimed: Dict[int, str] = StorageDeletionWorker.claim(limit)
+        if not claimed:
+            return 0
+
+        gateway = gateway or get_storage_gateway()
+        with transaction.atomic():
+            # claim 이후 취소(cancel)된 row는 제외하고, storage 삭제가 끝날 때까지 row lock 유지
+            # (취소 후 같은 key로 다시 저장된 파일을 삭제하지 않도록 함)
+            rows: Dict[int, str] = dict(
+                StorageDeletion.objects.select_for_update()
+                .filter(pk__in=claimed)
+                .values_list("id", "key")
+            )
+            if not rows:
+                return len(claimed)
+
+            # DeleteObjects 요청 1번으로 삭제
+            failed: Dict[str, str] = gateway.delete_many(list(rows.values()))
+
+            errors: Dict[int, str] = {
+                pk: failed[key] for pk, key in rows.items() if key in failed
+            }
+            if errors:
+                StorageDeletionWorker.handle_failure(errors)
+            StorageDeletion.objects.filter(pk__in=rows).exclude(pk__in=errors).delete()
+        return len(claimed)
+
+    @staticmethod
+    def handle_failure(errors: Dict[int, str]) -> None:
+        """
+        실패한 삭제 작업은 시도 횟수마다 2배씩 늘어나는 대기 시간 이후 다시 처리 (최대 1시간)
+        errors : {삭제 작업 pk: 해당 key의 에러 메시지}
+        """
+        now = timezone.now()
+        logger.warning(
+            f"Storage deletion failed ({len(errors)} keys): "
+            f"{next(iter(errors.values()))}"
+        )
+        deletions: List[StorageDeletion] = list(
+            StorageDeletion.objects.filter(pk__in=errors).only("pk", "attempts")
+        )
+        for deletion in deletions:
+            delay: float = min(
+                settings.STORAGE_DELETION_RETRY_DELAY * 2 ** (deletion.attempts - 1),
+                3600,
+            )
+            deletion.next_attempt_at = now + timedelta(seconds=delay)
+            deletion.last_error = errors[deletion.pk]
+        StorageDeletion.objects.bulk_update(
+            deletions, ["next_attempt_at", "last_error"]
+        )
+
+    @staticmethod
+    def process_pending(gateway: Optional[StorageGateway] = None) -> int:
+        """
+        처리할 수 있는 삭제 작업이 없을 때까지 처리하고, 처리를 시도한 작업 개수를 반환
+        """
+        processed: int = 0
+        while True:
+            count: int = StorageDeletionWorker.process_batch(gateway=gateway)
+            processed += count
+            if count < DELETE_OBJECTS_MAX_KEYS:
+                return processed
+
+
+class StorageDeletionWorkerPool:
+    """
+    프로세스별 삭제 worker thread
+    여러 요청이 동시에 커밋되어도 대기 중인 작업은 1개만 두고, 한번에 모아서 삭제합니다.
+    실패한 작업의 재시도는 다음 삭제 요청이나 process_storage_deletions 명령어에서 처리합니다.
+    STORAGE_DELETION_WORKER_THREADS가 0이면 thread를 사용하지 않고 process_storage_deletions 명령어로만 처리합니다.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _scheduled: bool = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def submit(cls) -> None:
+        if settings.STORAGE_DELETION_WORKER_THREADS <= 0:
+            return
+        with cls._lock:
+            if cls._scheduled:
+                return
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=settings.STORAGE_DELETION_WORKER_THREADS,
+                    thread_name_prefix="storage-deletion-worker",
+                )
+            cls._scheduled = True
+            cls._executor.submit(cls.run)
+
+    @classmethod
+    def run(cls) -> None:
+        with cls._lock:
+            # 처리 도중 커밋된 삭제 요청은 다음 작업에서 처리
+            cls._scheduled = False
+        try:
+            StorageDeletionWorker.process_pending()
+        except Exception:
+            logger.exception("Storage deletion worker error")
+        finally:
+            # worker thread에서 사용한 DB connection 정리
+            connections.close_all()
@@ -0,0 +1,200 @@
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage, default_storage
+from django.db import connections, models
+from django.db.models import Q
+from django.dispatch import Signal
+from PIL import UnidentifiedImageError
+
+from core.imaging import get_derivative_extension, process_image
+
+logger = logging.getLogger(__name__)
+
+# 파생 이미지를 만드는 (모델, 파일 필드) 목록
+# 파생 이미지 key는 "{파일 필드 이름}_derivatives", 이미지 정보는 "{파일 필드 이름}_metadata" JSONField에 저장됨
+DERIVATIVE_TARGETS: Tuple[Tuple[str, str], ...] = (
+    ("market.ServiceImage", "image"),
+    ("market.ServiceOptionImage", "image"),
+    ("order.OrderImage", "image"),
+    ("market.Market", "market_thumbnail"),
+    ("users.User", "profile_image"),
+    ("core.ImageBlob", "image"),
+)
+
+# 파생 이미지 key와 이미지 정보가 저장된 row가 있을 때 발생하는 signal
+# sender : 모델 클래스, object_ids : row pk 리스트
+derivatives_generated = Signal()
+
+
+def get_derivatives_field_name(field_name: str) -> str:
+    return f"{field_name}_derivatives"
+
+
+def get_metadata_field_name(field_name: str) -> str:
+    return f"{field_name}_metadata"
+
+
+def get_derivative_key(source_key: str, name: str) -> str:
+    """
+    원본 key 옆의 derivatives 디렉토리에 저장
+    ex) users/a/market/b/service/c/photo.jpg -> users/a/market/b/service/c/derivatives/photo_small.webp
+    """
+    directory, filename = os.path.split(source_key)
+    stem: str = os.path.splitext(filename)[0]
+    size_name, derivative_format = name.rsplit("_", 1)
+    extension: str = get_derivative_extension(derivative_format)
+    return os.path.join(directory, "derivatives", f"{stem}_{size_name}.{extension}")
+
+
+class ImageDerivativeService:
+    """
+    원본 이미지로 썸네일, WebP 등 파생 이미지를 만들어서 storage에 저장하는 서비스
+    파생 이미지를 만들면서 width, height, 파일 크기, 대표 색상, blurhash도 함께 계산해서 저장합니다.
+    이미지 처리는 CPU 작업이므로 process pool에서 실행합니다.
+    """
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def generate(
+        model_label: str,
+        object_id,
+        field_name: str,
+        storage: Optional[Storage] = None,
+        executor: Optional[ProcessPoolExecutor] = None,
+    ) -> Dict[str, str]:
+        """
+        row 1개의 파생 이미지를 만들고, 저장된 key 목록을 반환
+        executor가 없으면 현재 프로세스에서 이미지를 처리합니다.
+        """
+        storage = storage or default_storage
+        model: type[models.Model] = apps.get_model(model_label)
+        source_key: Optional[str] = (
+            model.objects.filter(pk=object_id)
+            .values_list(field_name, flat=True)
+            .first()
+        )
+        if not source_key:
+            return {}
+
+        with storage.open(source_key, "rb") as source:
+            data: bytes = source.read()
+
+        sizes: Dict[str, int] = settings.IMAGE_DERIVATIVE_SIZES
+        formats: List[str] = list(settings.IMAGE_DERIVATIVE_FORMATS)
+        try:
+            if executor is None:
+                outputs, metadata = process_image(data, sizes, formats)
+            else:
+                outputs, metadata = executor.submit(
+                    process_image, data, sizes, formats
+                ).result()
+        except (UnidentifiedImageError, OSError) as e:
+            # 이미지가 아닌 파일은 파생 이미지를 만들지 않음
+            logger.warning(f"Cannot generate image derivatives: {source_key} ({e})")
+            return {}
+
+        keys: Dict[str, str] = {
+            name: storage.save(
+                get_derivative_key(source_key, name), ContentFile(content)
+            )
+            for name, content in outputs.items()
+        }
+
+        # 처리 도중 원본 이미지가 바뀌었다면 저장하지 않음
+        updated: int = model.objects.filter(
+            pk=object_id, **{field_name: source_key}
+        ).update(
+            **{
+                get_derivatives_field_name(field_name): keys,
+                get_metadata_field_name(field_name): metadata,
+            }
+        )
+        if not updated:
+            for key in keys.values():
+                storage.delete(key)
+            return {}
+
+        derivatives_generated.send(sender=model, object_ids=[object_id])
+        return keys
+
+    @staticmethod
+    def get_missing(model_label: str, field_name: str) -> List:
+        """
+        원본 이미지는 있지만 파생 이미지나 이미지 정보가 없는 row pk 목록
+        """
+        model: type[models.Model] = apps.get_model(model_label)
+        queryset = (
+            model.objects.filter(
+                Q(**{get_derivatives_field_name(field_name): {}})
+                | Q(**{get_metadata_field_name(field_name): {}})
+            )
+            .exclude(**{f"{field_name}__isnull": True})
+            .exclude(**{field_name: ""})
+        )
+        field_names = {field.name for field in model._meta.get_fields()}
+        if "upload_status" in field_names:
+            queryset = queryset.filter(upload_status="ready")
+        if "image_blob" in field_names:
+            # ImageBlob을 참조하는 row는 blob의 파생 이미지를 복사해서 사용
+            queryset = queryset.filter(image_blob__isnull=True)
+        return list(queryset.values_list("pk", flat=True))
+
+
+class ImageDerivativePool:
+    """
+    프로세스별 파생 이미지 worker pool
+    작업 thread가 storage 입출력을 처리하고, 이미지 변환은 process pool에서 실행합니다.
+    IMAGE_DERIVATIVE_WORKERS가 0이면 pool을 사용하지 않고 generate_image_derivatives 명령어로만 처리합니다.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _process_executor: Optional[ProcessPoolExecutor] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_executors(cls) -> Tuple[ThreadPoolExecutor, ProcessPoolExecutor]:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=settings.IMAGE_DERIVATIVE_WORKERS,
+                    thread_name_prefix="derivative-worker",
+                )
+                # 요청을 처리하는 worker thread가 있는 프로세스이므로 fork 대신 spawn 사용
+                cls._process_executor = ProcessPoolExecutor(
+                    max_workers=settings.IMAGE_DERIVATIVE_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return cls._executor, cls._process_executor
+
+    @classmethod
+    def submit(cls, model_label: str, object_ids: List, field_name: str) -> None:
+        if settings.IMAGE_DERIVATIVE_WORKERS <= 0:
+            return
+        executor, _ = cls.get_executors()
+        for object_id in object_ids:
+            executor.submit(cls.run, model_label, object_id, field_name)
+
+    @classmethod
+    def run(cls, model_label: str, object_id, field_name: str) -> None:
+        try:
+            _, process_executor = cls.get_executors()
+            ImageDerivativeService.generate(
+                model_label, object_id, field_name, executor=process_executor
+            )
+        except Exception:
+            logger.exception(
+                f"Image derivative worker error ({model_label}, {object_id})"
+            )
+        finally:
+            # worker thread에서 사용한 DB connection 정리
+            connections.close_all()
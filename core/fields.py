@@ -0,0 +1,41 @@
+from rest_framework import serializers
+
+from core.file_urls import FileUrlResolver
+
+
+class StorageFileField(serializers.FileField):
+    """
+    기본적으로는 FileField와 동일하게 파일 URL을 반환하지만 (URL은 FileUrlResolver로 캐시),
+    serializer context에 raw_file_keys=True가 넘어온 경우 URL 대신 storage key를 반환합니다.
+    S3 presigned URL은 만료 시간이 있으므로, 미리 직렬화해서 저장하는 데이터에는 key만 저장해야 합니다.
+    """
+
+    def to_representation(self, value):
+        if not value:
+            return None
+        if self.context.get("raw_file_keys"):
+            return value.name
+
+        url: str = FileUrlResolver.resolve(value.name)
+        request = self.context.get("request", None)
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
+
+
+class StorageFileMapField(serializers.Field):
+    """
+    {이름: storage key} 형식의 JSON 필드 (ex. 파생 이미지 key 목록)를 {이름: URL}로 반환
+    serializer context에 raw_file_keys=True가 넘어온 경우 storage key를 그대로 반환합니다.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if not value:
+            return {}
+        if self.context.get("raw_file_keys"):
+            return dict(value)
+        return FileUrlResolver.resolve_many(value)
@@ -0,0 +1,73 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+class FileUrlResolver:
+    """
+    storage key를 URL로 변환하는 클래스
+    S3 presigned URL은 만들 때마다 서명(HMAC)을 계산하므로, 같은 key의 URL은 프로세스 메모리에 캐시해서 재사용합니다.
+    - 캐시 유지 시간은 STORAGE_URL_CACHE_TTL이며, 서명 만료 시간(AWS_QUERYSTRING_EXPIRE)의 절반을 넘지 않습니다.
+      따라서 응답한 URL은 최소 만료 시간의 절반 동안 유효합니다.
+    - 캐시는 최근에 사용한 STORAGE_URL_CACHE_MAX_SIZE개의 key만 보관합니다.
+    - STORAGE_CDN_URL을 지정하면 storage URL 대신 CDN 주소 + key를 반환합니다.
+    """
+
+    _cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_ttl() -> float:
+        return max(
+            0, min(settings.STORAGE_URL_CACHE_TTL, settings.AWS_QUERYSTRING_EXPIRE / 2)
+        )
+
+    @classmethod
+    def resolve(cls, key: Optional[str]) -> Optional[str]:
+        if not key:
+            return None
+
+        cdn_url: Optional[str] = settings.STORAGE_CDN_URL
+        if cdn_url:
+            return f"{cdn_url.rstrip('/')}/{quote(key)}"
+
+        now: float = time.monotonic()
+        with cls._lock:
+            cached: Optional[Tuple[str, float]] = cls._cache.get(key)
+            if cached is not None and cached[1] > now:
+                cls._cache.move_to_end(key)
+                return cached[0]
+
+        url: str = default_storage.url(key)
+        ttl: float = cls.get_ttl()
+        if ttl > 0:
+            with cls._lock:
+                cls._cache[key] = (url, now + ttl)
+                cls._cache.move_to_end(key)
+                while len(cls._cache) > settings.STORAGE_URL_CACHE_MAX_SIZE:
+                    cls._cache.popitem(last=False)
+        return url
+
+    @classmethod
+    def resolve_many(cls, keys: Optional[Mapping[str, str]]) -> Dict[str, str]:
+        # 파생 이미지 {이름: storage key} -> {이름: URL}
+        return {name: cls.resolve(key) for name, key in (keys or {}).items()}
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._cache.clear()
+
+
+@receiver(setting_changed)
+def reset_file_url_cache(setting: str, **kwargs) -> None:
+    # 테스트에서 override_settings로 storage 설정이 바뀌면 캐시 삭제
+    if setting.startswith("STORAGE") or setting.startswith("AWS_"):
+        FileUrlResolver.clear()
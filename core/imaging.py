@@ -0,0 +1,268 @@
+import math
+import struct
+from io import BytesIO
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from PIL import Image, ImageOps
+
+# 이 모듈은 별도 프로세스(ProcessPoolExecutor)에서 실행되므로 Django 모듈을 import하지 않음
+
+# format 이름 : (Pillow format, 파일 확장자, 저장 옵션)
+DERIVATIVE_FORMATS = {
+    "webp": ("WEBP", "webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", "jpg", {"quality": 80, "optimize": True, "progressive": True}),
+}
+
+
+def get_derivative_extension(derivative_format: str) -> str:
+    return DERIVATIVE_FORMATS[derivative_format][1]
+
+
+def _convert_mode(image: Image.Image, derivative_format: str) -> Image.Image:
+    # JPEG는 투명도를 지원하지 않으므로 RGB로 변환, WebP는 투명도 유지
+    has_alpha: bool = image.mode in ("RGBA", "LA") or (
+        image.mode == "P" and "transparency" in image.info
+    )
+    if derivative_format == "webp" and has_alpha:
+        return image.convert("RGBA") if image.mode != "RGBA" else image
+    return image.convert("RGB") if image.mode != "RGB" else image
+
+
+def process_image(
+    data: bytes, sizes: Mapping[str, int], formats: Iterable[str]
+) -> Tuple[Dict[str, bytes], Dict[str, Any]]:
+    """
+    원본 이미지로 크기별, format별 파생 이미지와 이미지 정보(metadata)를 만들어서 반환
+    sizes : 크기 이름 : 긴 변의 최대 길이(px) ex) {"small": 320}
+    반환값 : (파생 이미지, 이미지 정보)
+    - 파생 이미지 : "{크기 이름}_{format}" : 이미지 bytes ex) {"small_webp": b"..."}
+    - 이미지 정보 : width, height, size(byte), dominant_color, blurhash
+    """
+    formats = list(formats)
+    derivatives: Dict[str, bytes] = {}
+    with Image.open(BytesIO(data)) as original:
+        # 카메라 회전 정보(EXIF)를 반영한 후 EXIF는 저장하지 않음
+        image: Image.Image = ImageOps.exif_transpose(original)
+        for size_name, max_length in sizes.items():
+            resized: Image.Image = image.copy()
+            # 원본보다 크게 늘리지 않고, 비율을 유지하면서 축소
+            resized.thumbnail((max_length, max_length), Image.Resampling.LANCZOS)
+            for derivative_format in formats:
+                pillow_format, _, save_options = DERIVATIVE_FORMATS[derivative_format]
+                buffer = BytesIO()
+                _convert_mode(resized, derivative_format).save(
+                    buffer, pillow_format, **save_options
+                )
+                derivatives[f"{size_name}_{derivative_format}"] = buffer.getvalue()
+        metadata: Dict[str, Any] = get_image_metadata(image)
+    metadata["size"] = len(data)
+    return derivatives, metadata
+
+
+# 이미지 로딩 전에 보여줄 placeholder 정보 (blurhash, 대표 색상)
+# 작은 이미지로 줄여서 계산하므로 원본 크기와 관계없이 계산 시간이 일정함
+
+PLACEHOLDER_MAX_LENGTH = 32
+_BLURHASH_CHARACTERS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+
+def get_image_metadata(image: Image.Image) -> Dict[str, Any]:
+    """
+    화면에 보이는 방향(EXIF 반영) 기준 width, height와 placeholder 정보 반환
+    """
+    small: Image.Image = _convert_mode(image, "jpeg").copy()
+    small.thumbnail(
+        (PLACEHOLDER_MAX_LENGTH, PLACEHOLDER_MAX_LENGTH), Image.Resampling.BOX
+    )
+    width, height = image.size
+    # 가로가 긴 이미지는 가로 방향 성분을 더 많이 사용
+    components: Tuple[int, int] = (4, 3) if width >= height else (3, 4)
+    return {
+        "width": width,
+        "height": height,
+        "dominant_color": get_dominant_color(small),
+        "blurhash": encode_blurhash(small, *components),
+    }
+
+
+def get_dominant_color(image: Image.Image) -> str:
+    """
+    RGB 이미지에서 가장 많이 사용된 색상 ex) "#a1b2c3"
+    """
+    quantized: Image.Image = image.quantize(colors=8)
+    _, index = max(quantized.getcolors())
+    palette: List[int] = quantized.getpalette()
+    r, g, b = palette[index * 3 : index * 3 + 3]
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _encode_base83(value: int, length: int) -> str:
+    return "".join(
+        _BLURHASH_CHARACTERS[(value // 83 ** (length - i - 1)) % 83]
+        for i in range(length)
+    )
+
+
+def _srgb_to_linear(value: int) -> float:
+    value = value / 255
+    if value <= 0.04045:
+        return value / 12.92
+    return ((value + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value: float) -> int:
+    value = max(0.0, min(1.0, value))
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def encode_blurhash(image: Image.Image, x_components: int, y_components: int) -> str:
+    """
+    RGB 이미지의 blurhash 문자열 (https://blurha.sh 알고리즘)
+    """
+    width, height = image.size
+    pixels: List[Tuple[float, float, float]] = [
+        (_srgb_to_linear(r), _srgb_to_linear(g), _srgb_to_linear(b))
+        for r, g, b in image.getdata()
+    ]
+
+    factors: List[Tuple[float, float, float]] = []
+    for j in range(y_components):
+        cos_y: List[float] = [math.cos(math.pi * j * y / height) for y in range(height)]
+        for i in range(x_components):
+            cos_x: List[float] = [
+                math.cos(math.pi * i * x / width) for x in range(width)
+            ]
+            normalisation: float = 1 if i == 0 and j == 0 else 2
+            r = g = b = 0.0
+            for y in range(height):
+                for x in range(width):
+                    basis: float = cos_x[x] * cos_y[y]
+                    pixel = pixels[y * width + x]
+                    r += basis * pixel[0]
+                    g += basis * pixel[1]
+                    b += basis * pixel[2]
+            scale: float = normalisation / (width * height)
+            factors.append((r * scale, g * scale, b * scale))
+
+    dc, ac = factors[0], factors[1:]
+    blurhash: str = _encode_base83((x_components - 1) + (y_components - 1) * 9, 1)
+
+    max_value: float = 1.0
+    if ac:
+        actual_max: float = max(abs(value) for factor in ac for value in factor)
+        quantised_max: int = int(max(0, min(82, math.floor(actual_max * 166 - 0.5))))
+        max_value = (quantised_max + 1) / 166
+        blurhash += _encode_base83(quantised_max, 1)
+    else:
+        blurhash += _encode_base83(0, 1)
+
+    blurhash += _encode_base83(
+        (_linear_to_srgb(dc[0]) << 16)
+        + (_linear_to_srgb(dc[1]) << 8)
+        + _linear_to_srgb(dc[2]),
+        4,
+    )
+    for factor in ac:
+        quantised = [
+            int(
+                max(
+                    0,
+                    min(
+                        18,
+                        math.floor(
+                            math.copysign(abs(value / max_value) ** 0.5, value) * 9
+                            + 9.5
+                        ),
+                    ),
+                )
+            )
+            for value in factor
+        ]
+        blurhash += _encode_base83(
+            quantised[0] * 19 * 19 + quantised[1] * 19 + quantised[2], 2
+        )
+    return blurhash
+
+
+# 업로드 파일 앞부분(header)으로 이미지 형식과 크기를 확인하는 함수
+# 파일 전체를 받기 전에 검사하므로 Pillow 대신 header를 직접 읽음
+
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7}
+_JPEG_SOF_MARKERS |= {0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+_HEIC_BRANDS = {b"heic", b"heix", b"hevc", b"hevx", b"mif1", b"msf1"}
+
+# 형식을 판단하는 데 필요한 header 길이
+IMAGE_SIGNATURE_LENGTH = 12
+
+
+def detect_image_format(header: bytes) -> Optional[str]:
+    """
+    파일 시그니처(magic number)로 이미지 형식 판단 (jpeg, png, webp, heic)
+    header는 IMAGE_SIGNATURE_LENGTH 이상이어야 하며, 이미지가 아니면 None 반환
+    """
+    if header.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "webp"
+    if header[4:8] == b"ftyp" and header[8:12] in _HEIC_BRANDS:
+        return "heic"
+    return None
+
+
+def read_image_size(header: bytes, image_format: str) -> Optional[Tuple[int, int]]:
+    """
+    header에서 이미지 크기(width, height)를 읽음
+    아직 크기 정보까지 받지 못했다면 None, 형식에 맞지 않는 header는 ValueError
+    heic는 크기 정보가 파일 뒤쪽에 있을 수 있으므로 지원하지 않음 (ValueError)
+    """
+    if image_format == "png":
+        if len(header) < 24:
+            return None
+        if header[12:16] != b"IHDR":
+            raise ValueError("Invalid PNG header")
+        return struct.unpack(">II", header[16:24])
+
+    if image_format == "webp":
+        if len(header) < 30:
+            return None
+        chunk: bytes = header[12:16]
+        if chunk == b"VP8 " and header[23:26] == b"\x9d\x01\x2a":
+            width, height = struct.unpack("<HH", header[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b"VP8L" and header[20] == 0x2F:
+            bits: int = struct.unpack("<I", header[21:25])[0]
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b"VP8X":
+            width = int.from_bytes(header[24:27], "little") + 1
+            height = int.from_bytes(header[27:30], "little") + 1
+            return width, height
+        raise ValueError("Invalid WebP header")
+
+    if image_format == "jpeg":
+        # SOF segment가 나올 때까지 segment 길이만큼 건너뜀
+        offset: int = 2
+        while offset + 4 <= len(header):
+            if header[offset] != 0xFF:
+                raise ValueError("Invalid JPEG header")
+            marker: int = header[offset + 1]
+            if marker == 0xFF:  # 채우기(fill) 바이트
+                offset += 1
+                continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # 길이가 없는 marker
+                offset += 2
+                continue
+            if marker in _JPEG_SOF_MARKERS:
+                if offset + 9 > len(header):
+                    return None
+                height, width = struct.unpack(">HH", header[offset + 5 : offset + 9])
+                return width, height
+            if marker == 0xD9:  # 이미지 끝
+                raise ValueError("Invalid JPEG header")
+            offset += 2 + struct.unpack(">H", header[offset + 2 : offset + 4])[0]
+        return None
+
+    raise ValueError(f"Cannot read image size: {image_format}")
@@ -0,0 +1,66 @@
+import atexit
+import json
+import logging
+import queue
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+
+class JsonLineFormatter(logging.Formatter):
+    """
+    로그 1개를 JSON 1줄로 출력하는 formatter
+    record에 log_data(dict)가 있으면 그대로 출력하고, 없으면 message를 출력합니다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        log_data: Optional[Dict[str, Any]] = getattr(record, "log_data", None)
+        if log_data is not None:
+            data.update(log_data)
+        else:
+            data["message"] = record.getMessage()
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class BackgroundQueueHandler(QueueHandler):
+    """
+    로그를 queue에 넣기만 하고, writer thread가 JSON 변환과 출력(I/O)을 처리하는 handler
+    요청을 처리하는 thread는 로그 출력을 기다리지 않습니다.
+    queue가 가득 차면 요청 처리를 늦추지 않도록 로그를 버리고, 버린 개수를 dropped에 기록합니다.
+    """
+
+    def __init__(self, maxsize: int = 10000, stream=None):
+        super().__init__(queue.Queue(maxsize=maxsize))
+        target = logging.StreamHandler(stream)
+        target.setFormatter(JsonLineFormatter())
+        self.dropped: int = 0
+        self._lock = threading.Lock()
+        self.listener = QueueListener(self.queue, target)
+        self.listener.start()
+        atexit.register(self.stop)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 포맷은 writer thread에서 처리 (QueueHandler 기본 동작은 호출한 thread에서 포맷)
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def stop(self) -> None:
+        # 남은 로그를 모두 출력한 후 writer thread 종료
+        if self.listener._thread is not None:
+            self.listener.stop()
@@ -0,0 +1,65 @@
+from datetime import timedelta
+from typing import List
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.orphans import OrphanFileCollector
+from core.storage import LIST_OBJECTS_MAX_KEYS, ListedObject
+
+
+class Command(BaseCommand):
+    help = (
+        "어떤 row도 참조하지 않는 storage 파일(고아 파일)을 찾아서 삭제합니다. "
+        "storage 파일 목록은 page 단위로 조회하므로 파일 개수와 관계없이 일정한 메모리로 실행됩니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="삭제하지 않고 고아 파일 목록과 개수, 크기만 출력합니다.",
+        )
+        parser.add_argument(
+            "--prefix",
+            action="append",
+            default=None,
+            help="조회할 key prefix (여러 번 지정 가능, 기본값 : STORAGE_ORPHAN_PREFIXES)",
+        )
+        parser.add_argument(
+            "--min-age",
+            type=int,
+            default=24,
+            help="이 시간(시간 단위)보다 최근에 수정된 파일은 삭제하지 않습니다.",
+        )
+        parser.add_argument(
+            "--page-size",
+            type=int,
+            default=LIST_OBJECTS_MAX_KEYS,
+            help="storage 목록 조회 및 삭제 요청 1번에 처리할 파일 개수 (최대 1000)",
+        )
+
+    def handle(self, *args, **options):
+        dry_run: bool = options["dry_run"]
+
+        def report(orphans: List[ListedObject]) -> None:
+            # dry-run에서는 고아 파일 목록을 출력
+            if dry_run or options["verbosity"] > 1:
+                for item in orphans:
+                    self.stdout.write(f"{item.key}\t{item.size}\t{item.last_modified}")
+
+        stats = OrphanFileCollector().collect(
+            prefixes=options["prefix"] or settings.STORAGE_ORPHAN_PREFIXES,
+            min_age=timedelta(hours=options["min_age"]),
+            dry_run=dry_run,
+            page_size=options["page_size"],
+            on_orphans=report,
+        )
+        self.stdout.write(
+            f"{stats['scanned']} files scanned, {stats['referenced']} keys referenced, "
+            f"{stats['orphaned']} orphaned ({stats['orphaned_bytes']} bytes)"
+        )
+        if dry_run:
+            self.stdout.write("dry run: nothing deleted")
+        else:
+            self.stdout.write(f"{stats['deleted']} deleted, {stats['failed']} failed")
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.profiling import RequestProfileService
+
+
+class Command(BaseCommand):
+    help = (
+        "요청 profiling 토큰을 생성합니다. "
+        "X-Profile-Token 헤더에 토큰을 넣어서 요청하면 해당 요청을 profiling하고, "
+        "응답의 X-Profile-Id 헤더로 결과 id를 반환합니다."
+    )
+
+    def handle(self, *args, **options):
+        self.stdout.write(RequestProfileService.create_token())
+        self.stderr.write(
+            f"토큰은 {settings.PROFILE_TOKEN_MAX_AGE}초 동안 유효합니다. "
+            "결과 다운로드 : GET /api/core/profiles/<id>?type=json|prof (X-Profile-Token 헤더 필요)"
+        )
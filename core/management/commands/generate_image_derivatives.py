@@ -0,0 +1,52 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.derivatives import DERIVATIVE_TARGETS, ImageDerivativeService
+
+
+class Command(BaseCommand):
+    help = "파생 이미지(썸네일, WebP)나 이미지 정보(크기, blurhash)가 없는 이미지를 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            type=str,
+            default=None,
+            help="지정한 모델의 이미지만 처리합니다. ex) market.ServiceImage",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.IMAGE_DERIVATIVE_WORKERS,
+            help="이미지 변환 process 개수 (0이면 현재 process에서 처리)",
+        )
+
+    def handle(self, *args, **options):
+        executor: Optional[ProcessPoolExecutor] = None
+        if options["workers"] > 0:
+            executor = ProcessPoolExecutor(
+                max_workers=options["workers"],
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        try:
+            for model_label, field_name in DERIVATIVE_TARGETS:
+                if options["model"] and options["model"] != model_label:
+                    continue
+                object_ids = ImageDerivativeService.get_missing(model_label, field_name)
+                generated: int = 0
+                for object_id in object_ids:
+                    if ImageDerivativeService.generate(
+                        model_label, object_id, field_name, executor=executor
+                    ):
+                        generated += 1
+                self.stdout.write(
+                    f"{model_label}: {generated} / {len(object_ids)} images processed"
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown()
@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.deletions import StorageDeletionWorker
+
+
+class Command(BaseCommand):
+    help = (
+        "삭제 대기 중인 storage 파일을 DeleteObjects 요청으로 한번에 삭제합니다. "
+        "worker thread가 처리하지 못한 작업(서버 재시작, 재시도 대기 등)을 처리할 때 사용합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 --interval 초마다 계속 처리합니다.",
+        )
+        parser.add_argument(
+            "--interval", type=int, default=10, help="--loop 사용 시 처리 간격 (초)"
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            processed: int = StorageDeletionWorker.process_pending()
+            self.stdout.write(f"{processed} storage deletions processed")
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.uploads import UploadWorker
+
+
+class Command(BaseCommand):
+    help = (
+        "업로드 대기 중인 이미지 파일을 storage로 업로드합니다. "
+        "worker thread가 처리하지 못한 작업(서버 재시작, 재시도 대기 등)을 처리할 때 사용합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=100, help="한번에 처리할 최대 작업 개수"
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 --interval 초마다 계속 처리합니다.",
+        )
+        parser.add_argument(
+            "--interval", type=int, default=10, help="--loop 사용 시 처리 간격 (초)"
+        )
+        parser.add_argument(
+            "--cleanup",
+            type=int,
+            default=None,
+            metavar="SECONDS",
+            help="업로드 작업이 없고 지정한 시간(초)보다 오래된 spool 파일을 삭제합니다.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            processed: int = UploadWorker.process_pending(limit=options["limit"])
+            self.stdout.write(f"{processed} upload tasks processed")
+
+            if options["cleanup"] is not None:
+                removed: int = UploadWorker.cleanup_spool(max_age=options["cleanup"])
+                self.stdout.write(f"{removed} spool files removed")
+
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,124 @@
+from typing import Any, Dict, List, Optional
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.benchmarks import BenchmarkBaseline, EndpointBenchmark
+from core.seeding import SEED_SCALES, MarketplaceSeeder, get_seed_email
+from users.models.user import User
+
+
+class Command(BaseCommand):
+    help = (
+        "벤치마크용 테스트 DB를 만들고 seed 데이터를 생성한 후, 주요 API의 응답 시간(p50, p95, p99), "
+        "요청당 SQL 개수, 메모리 할당량을 측정합니다. "
+        "실패한 요청이 있거나, --baseline을 지정한 경우 저장된 결과와 비교해서 성능이 저하된 경우 실패합니다. "
+        "요청 로그도 실제 설정대로 기록되므로, 필요하면 REQUEST_LOG_SAMPLE_RATE=0으로 실행하세요."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            choices=sorted(SEED_SCALES),
+            default="small",
+            help="seed 데이터 크기 (기본값 small)",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed")
+        parser.add_argument(
+            "--iterations", type=int, default=50, help="시나리오별 측정 요청 수"
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=5, help="측정 전에 보내는 요청 수"
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            default=None,
+            help="실행할 시나리오 이름 (여러 번 지정 가능, 기본값 : 전체)",
+        )
+        parser.add_argument(
+            "--baseline", default=None, help="비교할 baseline JSON 파일 경로"
+        )
+        parser.add_argument(
+            "--save-baseline", default=None, help="측정 결과를 저장할 JSON 파일 경로"
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.2,
+            help="baseline 대비 허용하는 시간, 메모리 증가 비율 (기본값 0.2)",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="벤치마크 DB를 삭제하지 않고, 다음 실행에서 seed 데이터를 다시 사용합니다.",
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be greater than 0")
+        baseline: Optional[Dict[str, Any]] = None
+        if options["baseline"]:
+            baseline = BenchmarkBaseline.load(options["baseline"])
+            if baseline.get("scale") != options["scale"]:
+                raise CommandError(
+                    f"Baseline was measured with --scale {baseline.get('scale')}"
+                )
+
+        verbosity: int = options["verbosity"]
+        old_name: str = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(
+            verbosity=verbosity, autoclobber=True, keepdb=options["keepdb"]
+        )
+        try:
+            if not User.objects.filter(email=get_seed_email("customer", 0)).exists():
+                counts: Dict[str, int] = MarketplaceSeeder(
+                    SEED_SCALES[options["scale"]],
+                    seed=options["seed"],
+                    log=self.stdout.write,
+                ).seed_all()
+                self.stdout.write(f"Seeded {sum(counts.values())} rows")
+
+            def report(name: str, result: Dict[str, Any]) -> None:
+                self.stdout.write(
+                    f"{name:<16} p50 {result['p50_ms']:>8.2f}ms  "
+                    f"p95 {result['p95_ms']:>8.2f}ms  p99 {result['p99_ms']:>8.2f}ms  "
+                    f"queries {result['queries']:>3}  "
+                    f"alloc {result['alloc_peak_kb'] or 0:>8.1f}KB  "
+                    f"errors {result['errors']}"
+                )
+
+            results = EndpointBenchmark(
+                iterations=options["iterations"],
+                warmup=options["warmup"],
+                seed=options["seed"],
+            ).run(names=options["scenario"], on_result=report)
+        finally:
+            if not options["keepdb"]:
+                connection.creation.destroy_test_db(old_name, verbosity=verbosity)
+
+        failed: List[str] = [
+            f"{name}: errors {result['errors']}"
+            for name, result in results.items()
+            if result["errors"]
+        ]
+        if failed:
+            raise CommandError("Benchmark requests failed:\n" + "\n".join(failed))
+
+        if options["save_baseline"]:
+            BenchmarkBaseline.save(
+                options["save_baseline"],
+                results,
+                scale=options["scale"],
+                seed=options["seed"],
+                iterations=options["iterations"],
+            )
+            self.stdout.write(f"Baseline saved: {options['save_baseline']}")
+
+        if baseline is not None:
+            regressions: List[str] = BenchmarkBaseline.compare(
+                results, baseline["results"], tolerance=options["tolerance"]
+            )
+            if regressions:
+                raise CommandError("Benchmark regressed:\n" + "\n".join(regressions))
+            self.stdout.write(self.style.SUCCESS("No regression from baseline"))
@@ -0,0 +1,142 @@
+import multiprocessing
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from core.seeding import (
+    SEED_PHASES,
+    SEED_SCALES,
+    MarketplaceSeeder,
+    SeedTask,
+    run_seed_task,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "현재 DB에 seed 데이터(리포머, 마켓, 서비스, 사용자, 주문)를 대량으로 생성합니다. "
+        "같은 --seed, --batch-size로 실행하면 --workers와 관계없이 같은 데이터가 만들어지며, "
+        "기존 데이터와 id가 겹치지 않도록 현재 가장 큰 id 다음부터 추가합니다. "
+        "이메일이 겹치므로 같은 DB에 두 번 실행할 수 없습니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            choices=sorted(SEED_SCALES),
+            default="small",
+            help="seed 데이터 크기 (기본값 small)",
+        )
+        for name, help_text in (
+            ("reformers", "리포머 수"),
+            ("customers", "일반 사용자 수"),
+            ("services-per-reformer", "리포머별 서비스 수"),
+            ("orders", "주문 수"),
+        ):
+            parser.add_argument(
+                f"--{name}",
+                type=int,
+                default=None,
+                help=f"{help_text} (--scale 값 대신 사용)",
+            )
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="한번에 추가하고 커밋하는 row 개수 (기본값 2000)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="데이터를 생성하는 process 개수 (0이면 현재 process에서 처리, SQLite는 항상 0)",
+        )
+        parser.add_argument(
+            "--copy",
+            action="store_true",
+            help="bulk_create 대신 COPY로 추가합니다. (PostgreSQL만 지원)",
+        )
+
+    def handle(self, *args, **options):
+        scale = SEED_SCALES[options["scale"]]._replace(
+            **{
+                field: options[field]
+                for field in (
+                    "reformers",
+                    "customers",
+                    "services_per_reformer",
+                    "orders",
+                )
+                if options[field] is not None
+            }
+        )
+        if min(scale) < 0:
+            raise CommandError("Counts must not be negative")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be greater than 0")
+
+        workers: int = options["workers"]
+        if connection.vendor == "sqlite":
+            # SQLite는 쓰기 lock이 DB 전체에 걸리므로 process를 나누어도 빨라지지 않음
+            workers = 0
+
+        try:
+            seeder = MarketplaceSeeder(
+                scale,
+                seed=options["seed"],
+                batch_size=options["batch_size"],
+                use_copy=options["copy"],
+                log=self.stdout.write,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        executor: Optional[ProcessPoolExecutor] = None
+        if workers > 0:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+
+        started: float = time.perf_counter()
+        counts: Counter = Counter()
+        try:
+            for phase in SEED_PHASES:
+                tasks: List[SeedTask] = [
+                    task for target in phase for task in seeder.get_tasks(target)
+                ]
+                self.stdout.write(f"Creating {', '.join(phase)} ({len(tasks)} batches)")
+                if executor is None:
+                    for task in tasks:
+                        counts.update(seeder.run_task(task))
+                    continue
+                seeder_args = seeder.get_args()
+                futures = [
+                    executor.submit(run_seed_task, seeder_args, task) for task in tasks
+                ]
+                for future in as_completed(futures):
+                    counts.update(future.result())
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+        seeder.finish()
+
+        elapsed: float = time.perf_counter() - started
+        result: Dict[str, int] = dict(counts)
+        for table, count in sorted(result.items()):
+            self.stdout.write(f"{table:<40} {count:>10}")
+        total: int = sum(result.values())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {total} rows in {elapsed:.1f}s "
+                f"({total / max(elapsed, 1e-9):.0f} rows/s)"
+            )
+        )
@@ -0,0 +1,289 @@
+import bisect
+import glob
+import json
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# 응답 시간 histogram 구간 (초), 마지막 구간은 +Inf
+# 구간을 바꾸면 기존 metrics 파일과 형식이 달라지므로 METRICS_DIR을 비운 후 배포해야 함
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# series 1개의 값 : 구간별 요청 개수(+Inf 포함) + 응답 시간 합계
+VALUE_COUNT: int = len(LATENCY_BUCKETS) + 2
+SUM_INDEX: int = len(LATENCY_BUCKETS) + 1
+
+INITIAL_FILE_SIZE: int = 64 * 1024
+HEADER = struct.Struct("<Q")  # 사용 중인 영역의 크기
+KEY_LENGTH = struct.Struct("<I")
+VALUES = struct.Struct(f"<{VALUE_COUNT}d")
+DOUBLE = struct.Struct("<d")
+
+
+def get_entry_size(key_size: int) -> int:
+    # key 길이(4byte) + key를 8byte 단위로 정렬 + 값
+    return (KEY_LENGTH.size + key_size + 7) // 8 * 8 + VALUES.size
+
+
+def iter_entries(data) -> Iterator[Tuple[str, int]]:
+    """
+    metrics 파일 내용에서 (key, 값 offset) 반환
+    """
+    used: int = HEADER.unpack_from(data, 0)[0]
+    offset: int = HEADER.size
+    while offset < used:
+        (key_size,) = KEY_LENGTH.unpack_from(data, offset)
+        key_start: int = offset + KEY_LENGTH.size
+        key: str = bytes(data[key_start : key_start + key_size]).decode()
+        entry_size: int = get_entry_size(key_size)
+        yield key, offset + entry_size - VALUES.size
+        offset += entry_size
+
+
+class MmapedSeries:
+    """
+    series(key : 값 VALUE_COUNT개)를 memory-mapped 파일에 저장하는 클래스
+    프로세스마다 자신의 파일에만 쓰고, 다른 프로세스는 파일을 읽어서 합산합니다.
+    path가 없으면 익명 mmap을 사용합니다. (현재 프로세스 값만 조회 가능)
+    파일 구조 : [사용 중인 크기 8byte][key 길이 4byte, key, 값 double VALUE_COUNT개]...
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path: Optional[str] = path
+        self.offsets: Dict[str, int] = {}
+        if path is None:
+            self.file = None
+            self.mmap = mmap.mmap(-1, INITIAL_FILE_SIZE)
+            HEADER.pack_into(self.mmap, 0, HEADER.size)
+            return
+
+        self.file = open(path, "a+b")
+        size: int = os.fstat(self.file.fileno()).st_size
+        if size < INITIAL_FILE_SIZE:
+            # 새 파일이거나, 같은 pid를 사용했던 종료된 프로세스의 파일 (값을 이어서 누적)
+            os.ftruncate(self.file.fileno(), INITIAL_FILE_SIZE)
+            size = INITIAL_FILE_SIZE
+        self.mmap = mmap.mmap(self.file.fileno(), size)
+        if HEADER.unpack_from(self.mmap, 0)[0] == 0:
+            HEADER.pack_into(self.mmap, 0, HEADER.size)
+        self.offsets = dict(iter_entries(self.mmap))
+
+    def get_offset(self, key: str) -> int:
+        offset: Optional[int] = self.offsets.get(key)
+        if offset is not None:
+            return offset
+
+        encoded: bytes = key.encode()
+        used: int = HEADER.unpack_from(self.mmap, 0)[0]
+        entry_size: int = get_entry_size(len(encoded))
+        if used + entry_size > len(self.mmap):
+            self.grow(used + entry_size)
+        KEY_LENGTH.pack_into(self.mmap, used, len(encoded))
+        self.mmap[used + KEY_LENGTH.size : used + KEY_LENGTH.size + len(encoded)] = (
+            encoded
+        )
+        offset = used + entry_size - VALUES.size
+        VALUES.pack_into(self.mmap, offset, *([0.0] * VALUE_COUNT))
+        # 값을 모두 쓴 후 사용 중인 크기를 변경 (다른 프로세스가 쓰는 중인 series를 읽지 않도록)
+        HEADER.pack_into(self.mmap, 0, used + entry_size)
+        self.offsets[key] = offset
+        return offset
+
+    def grow(self, min_size: int) -> None:
+        size: int = len(self.mmap)
+        while size < min_size:
+            size *= 2
+        if self.file is None:
+            grown = mmap.mmap(-1, size)
+            grown[: len(self.mmap)] = self.mmap[:]
+        else:
+            os.ftruncate(self.file.fileno(), size)
+            grown = mmap.mmap(self.file.fileno(), size)
+        self.mmap.close()
+        self.mmap = grown
+
+    def add(self, key: str, bucket_index: int, value: float) -> None:
+        offset: int = self.get_offset(key)
+        for value_offset, amount in (
+            (offset + bucket_index * DOUBLE.size, 1.0),
+            (offset + SUM_INDEX * DOUBLE.size, value),
+        ):
+            DOUBLE.pack_into(
+                self.mmap,
+                value_offset,
+                DOUBLE.unpack_from(self.mmap, value_offset)[0] + amount,
+            )
+
+    def read(self) -> Dict[str, Tuple[float, ...]]:
+        return {
+            key: VALUES.unpack_from(self.mmap, offset)
+            for key, offset in self.offsets.items()
+        }
+
+    def close(self) -> None:
+        self.mmap.close()
+        if self.file is not None:
+            self.file.close()
+
+
+class RequestMetrics:
+    """
+    URL 이름, 응답 상태(2xx, 4xx 등)별 요청 개수와 응답 시간 histogram
+    - 요청을 처리하는 thread는 lock 안에서 mmap의 값 2개만 변경합니다.
+    - METRICS_DIR을 지정하면 gunicorn worker 프로세스마다 metrics_{pid}.db 파일에 기록하고,
+      조회할 때 디렉토리의 모든 파일을 합산합니다. (종료된 worker의 값도 누적 값에 포함)
+      서버를 시작하기 전에 METRICS_DIR을 비워야 합니다.
+    """
+
+    _lock = threading.Lock()
+    _series: Optional[MmapedSeries] = None
+    _pid: Optional[int] = None
+
+    @classmethod
+    def get_series(cls) -> MmapedSeries:
+        # fork 이후에는 부모 프로세스의 파일을 사용하지 않도록 pid가 바뀌면 새로 생성
+        pid: int = os.getpid()
+        if cls._series is None or cls._pid != pid:
+            metrics_dir: Optional[str] = settings.METRICS_DIR
+            path: Optional[str] = None
+            if metrics_dir:
+                os.makedirs(metrics_dir, exist_ok=True)
+                path = os.path.join(metrics_dir, f"metrics_{pid}.db")
+            cls._series = MmapedSeries(path)
+            cls._pid = pid
+        return cls._series
+
+    @staticmethod
+    def get_key(route: str, status_code: int) -> str:
+        return json.dumps([route, f"{status_code // 100}xx"])
+
+    @classmethod
+    def observe(cls, route: str, status_code: int, duration: float) -> None:
+        key: str = cls.get_key(route, status_code)
+        bucket_index: int = bisect.bisect_left(LATENCY_BUCKETS, duration)
+        with cls._lock:
+            cls.get_series().add(key, bucket_index, duration)
+
+    @classmethod
+    def collect(cls) -> Dict[Tuple[str, str], List[float]]:
+        """
+        모든 프로세스의 값 합산
+        반환값 : {(URL 이름, 응답 상태): 값 리스트}
+        """
+        files: List[Dict[str, Tuple[float, ...]]] = []
+        metrics_dir: Optional[str] = settings.METRICS_DIR
+        if metrics_dir:
+            for path in glob.glob(os.path.join(metrics_dir, "metrics_*.db")):
+                with open(path, "rb") as f:
+                    data: bytes = f.read()
+                if len(data) >= HEADER.size:
+                    files.append(
+                        {
+                            key: VALUES.unpack_from(data, offset)
+                            for key, offset in iter_entries(data)
+                        }
+                    )
+        else:
+            with cls._lock:
+                files.append(cls.get_series().read())
+
+        totals: Dict[Tuple[str, str], List[float]] = {}
+        for values_by_key in files:
+            for key, values in values_by_key.items():
+                route, status_class = json.loads(key)
+                total = totals.setdefault((route, status_class), [0.0] * VALUE_COUNT)
+                for index, value in enumerate(values):
+                    total[index] += value
+        return totals
+
+    @staticmethod
+    def get_quantile(buckets: List[float], quantile: float) -> Optional[float]:
+        # 구간 안에서 선형 보간으로 추정 (+Inf 구간은 마지막 경계값 반환)
+        count: float = sum(buckets)
+        if count == 0:
+            return None
+        rank: float = quantile * count
+        cumulative: float = 0.0
+        for index, bucket_count in enumerate(buckets):
+            if cumulative + bucket_count >= rank and bucket_count > 0:
+                if index == len(LATENCY_BUCKETS):
+                    return LATENCY_BUCKETS[-1]
+                lower: float = LATENCY_BUCKETS[index - 1] if index > 0 else 0.0
+                upper: float = LATENCY_BUCKETS[index]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return LATENCY_BUCKETS[-1]
+
+    @classmethod
+    def render(cls) -> str:
+        """
+        Prometheus text 형식으로 변환
+        histogram 외에 URL 이름별(응답 상태 합산) p50, p99 추정값을 함께 반환합니다.
+        """
+        name: str = "upcy_http_request_duration_seconds"
+        totals = cls.collect()
+        lines: List[str] = [
+            f"# HELP {name} Request duration by URL name and status class.",
+            f"# TYPE {name} histogram",
+        ]
+        route_buckets: Dict[str, List[float]] = {}
+        for (route, status_class), values in sorted(totals.items()):
+            labels: str = f'route="{route}",status="{status_class}"'
+            cumulative: float = 0.0
+            for bound, bucket_count in zip(
+                (*LATENCY_BUCKETS, "+Inf"), values[:SUM_INDEX]
+            ):
+                cumulative += bucket_count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative:g}')
+            lines.append(f"{name}_sum{{{labels}}} {values[SUM_INDEX]:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {cumulative:g}")
+
+            merged = route_buckets.setdefault(route, [0.0] * SUM_INDEX)
+            for index, bucket_count in enumerate(values[:SUM_INDEX]):
+                merged[index] += bucket_count
+
+        quantile_name: str = f"{name}_estimate"
+        lines.append(f"# HELP {quantile_name} Estimated latency quantile by URL name.")
+        lines.append(f"# TYPE {quantile_name} gauge")
+        for route, buckets in sorted(route_buckets.items()):
+            for quantile in (0.5, 0.99):
+                value: Optional[float] = cls.get_quantile(buckets, quantile)
+                if value is not None:
+                    lines.append(
+                        f'{quantile_name}{{route="{route}",quantile="{quantile}"}} '
+                        f"{value:.6f}"
+                    )
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def reset(cls) -> None:
+        # 현재 프로세스의 파일을 닫음 (다음 요청부터 METRICS_DIR 설정으로 다시 생성)
+        with cls._lock:
+            if cls._series is not None:
+                cls._series.close()
+            cls._series = None
+            cls._pid = None
+
+
+@receiver(setting_changed)
+def reset_request_metrics(setting: str, **kwargs) -> None:
+    # 테스트에서 override_settings로 METRICS_DIR이 바뀌면 파일을 다시 생성
+    if setting == "METRICS_DIR":
+        RequestMetrics.reset()
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('model_label', models.CharField(max_length=100)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('field_name', models.CharField(default='image', max_length=50)),
+                ('storage_key', models.CharField(max_length=255)),
+                ('spool_path', models.CharField(max_length=500)),
+                ('status', models.CharField(choices=[('pending', '대기'), ('processing', '처리중'), ('failed', '실패')], default='pending', max_length=10)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField()),
+                ('last_error', models.TextField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'core_upload_task',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='core_upload_task_status_idx')],
+            },
+        ),
+    ]
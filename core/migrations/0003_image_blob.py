@@ -0,0 +1,31 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:44
+
+import core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_storage_deletion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('image', models.FileField(max_length=255, upload_to=core.models.get_image_blob_upload_path)),
+                ('size', models.PositiveBigIntegerField()),
+                ('ref_count', models.PositiveIntegerField(default=0)),
+                ('upload_status', models.CharField(choices=[('pending', '업로드 대기'), ('ready', '업로드 완료'), ('failed', '업로드 실패')], default='pending', max_length=10)),
+                ('image_derivatives', models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                'db_table': 'core_image_blob',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_image_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='imageblob',
+            name='image_metadata',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -1,6 +1,9 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from django.db.models import QuerySet
+from rest_framework.exceptions import ValidationError
+
+from core.upload_handlers import ImageUploadHandler
 
 
 class QueryParamMixin:
@@ -37,3 +40,25 @@ class QueryParamMixin:
             )  # 따로 안넘어왔다면 기본값으로 created 내림차순 정렬
 
         return queryset
+
+
+class ImageUploadViewMixin:
+    """
+    이미지 업로드 API View에 사용하는 mixin
+    multipart 요청 본문은 인증, 권한 검사가 끝난 후 ImageUploadHandler로 읽으며,
+    핸들러가 업로드를 중단한 경우 View 메서드를 실행하지 않고 400 응답을 반환합니다.
+    """
+
+    def initialize_request(self, request, *args, **kwargs):
+        request.upload_handlers = [ImageUploadHandler(request)]
+        return super().initialize_request(request, *args, **kwargs)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.content_type.startswith("multipart/form-data"):
+            request.data  # 요청 본문 읽기
+            rejection: Optional[str] = getattr(
+                request._request, "upload_rejection", None
+            )
+            if rejection:
+                raise ValidationError(rejection)
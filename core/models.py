@@ -1,3 +1,5 @@
+import os
+
 from django.db import models
 
 
@@ -10,3 +12,94 @@ class TimeStampedModel(models.Model):
 
     class Meta:
         abstract = True  # admin에서 안보이게
+
+
+class UploadStatus(models.TextChoices):
+    # 이미지 파일의 storage 업로드 상태
+    PENDING = "pending", "업로드 대기"
+    READY = "ready", "업로드 완료"
+    FAILED = "failed", "업로드 실패"
+
+
+class UploadTask(TimeStampedModel):
+    """
+    로컬 spool 디렉토리에 저장된 업로드 파일을 storage로 옮기는 작업 테이블
+    작업이 성공하면 row는 삭제되고, 대상 이미지 row의 upload_status가 ready로 변경됨
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "대기"
+        PROCESSING = "processing", "처리중"
+        FAILED = "failed", "실패"
+
+    model_label = models.CharField(max_length=100)  # 대상 모델 ex) market.ServiceImage
+    object_id = models.PositiveBigIntegerField()  # 대상 이미지 row pk
+    field_name = models.CharField(max_length=50, default="image")  # 대상 파일 필드
+    storage_key = models.CharField(max_length=255)  # storage에 저장할 key
+    spool_path = models.CharField(max_length=500)  # 로컬 spool 파일 경로
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)  # 업로드 시도 횟수
+    next_attempt_at = models.DateTimeField()  # 다음 업로드 시도 가능 시각
+    last_error = models.TextField(null=True, blank=True)
+
+    class Meta:
+        db_table = "core_upload_task"
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="core_upload_task_status_idx",
+            ),
+        ]
+
+
+class StorageDeletion(models.Model):
+    """
+    storage(S3) 파일 삭제 대기열 (outbox) 테이블
+    DB 변경과 같은 트랜잭션에서 row를 생성하므로, 트랜잭션이 롤백되면 파일도 삭제되지 않음
+    worker가 DeleteObjects 요청 1번에 최대 1000개씩 삭제하며, 삭제가 끝난 row는 삭제됨
+    """
+
+    key = models.CharField(max_length=500)  # 삭제할 storage key
+    attempts = models.PositiveIntegerField(default=0)  # 삭제 시도 횟수
+    next_attempt_at = models.DateTimeField()  # 다음 삭제 시도 가능 시각
+    last_error = models.TextField(null=True, blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "core_storage_deletion"
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at", "id"],
+                name="core_storage_deletion_idx",
+            ),
+        ]
+
+
+def get_image_blob_upload_path(instance, filename):
+    # 같은 내용의 이미지는 항상 같은 key에 저장 (content-addressed)
+    extension: str = os.path.splitext(filename)[1].lower()
+    content_hash: str = instance.content_hash
+    return f"images/{content_hash[:2]}/{content_hash}{extension}"
+
+
+class ImageBlob(TimeStampedModel):
+    """
+    내용(sha256)이 같은 이미지 파일을 storage에 1번만 저장하기 위한 테이블
+    ServiceImage, ServiceOptionImage, OrderImage row가 image_blob으로 참조하며,
+    ref_count는 참조하는 row 개수입니다. 참조하는 row가 없어지면 blob row와 storage 파일을 삭제합니다.
+    """
+
+    content_hash = models.CharField(max_length=64, unique=True)  # sha256 hex
+    image = models.FileField(upload_to=get_image_blob_upload_path, max_length=255)
+    size = models.PositiveBigIntegerField()  # 파일 크기 (byte)
+    ref_count = models.PositiveIntegerField(default=0)
+    upload_status = models.CharField(
+        max_length=10, choices=UploadStatus.choices, default=UploadStatus.PENDING
+    )
+    image_derivatives = models.JSONField(default=dict, blank=True)
+    image_metadata = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        db_table = "core_image_blob"
@@ -0,0 +1,140 @@
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from django.apps import apps
+from django.db import models
+from django.utils import timezone
+
+from core.derivatives import get_derivatives_field_name
+from core.models import UploadTask
+from core.storage import (
+    LIST_OBJECTS_MAX_KEYS,
+    ListedObject,
+    StorageGateway,
+    get_storage_gateway,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_key_digest(key: str) -> bytes:
+    # key 문자열 대신 8byte 해시를 보관해서 메모리 사용량을 줄임
+    # 해시가 충돌하면 고아 파일을 삭제하지 않을 뿐, 사용 중인 파일을 삭제하지는 않음
+    return hashlib.blake2b(key.encode(), digest_size=8).digest()
+
+
+class OrphanFileCollector:
+    """
+    어떤 row도 참조하지 않는 storage 파일(고아 파일)을 찾아서 삭제하는 클래스
+    1. 모든 모델의 FileField와 파생 이미지 JSONField 값을 iterator()로 읽어서, 참조 중인 key의 해시 집합을 만듦
+    2. storage 파일 목록을 page 단위로 조회하면서, 참조되지 않은 파일을 page마다 DeleteObjects 요청으로 삭제
+    storage 파일 목록은 page 1개만 메모리에 올리므로, 파일 개수와 관계없이 일정한 메모리로 실행됩니다.
+    업로드가 끝났지만 아직 row가 생성되지 않은 파일(presigned 업로드 등)을 삭제하지 않도록,
+    min_age보다 최근에 수정된 파일은 삭제하지 않습니다.
+    """
+
+    def __init__(self, gateway: Optional[StorageGateway] = None):
+        self.gateway: StorageGateway = gateway or get_storage_gateway()
+
+    @staticmethod
+    def get_file_fields() -> List[Tuple[type[models.Model], List[str], List[str]]]:
+        """
+        반환값 : [(모델, FileField 이름 리스트, 파생 이미지 JSONField 이름 리스트), ...]
+        """
+        targets: List[Tuple[type[models.Model], List[str], List[str]]] = []
+        for model in apps.get_models():
+            field_names = {field.name for field in model._meta.get_fields()}
+            file_fields: List[str] = [
+                field.name
+                for field in model._meta.concrete_fields
+                if isinstance(field, models.FileField)
+            ]
+            derivative_fields: List[str] = [
+                get_derivatives_field_name(name)
+                for name in file_fields
+                if get_derivatives_field_name(name) in field_names
+            ]
+            if file_fields:
+                targets.append((model, file_fields, derivative_fields))
+        return targets
+
+    @staticmethod
+    def iter_referenced_keys(chunk_size: int = 2000) -> Iterator[str]:
+        targets = OrphanFileCollector.get_file_fields()
+        for model, file_fields, derivative_fields in targets:
+            for row in model._base_manager.values_list(
+                *file_fields, *derivative_fields
+            ).iterator(chunk_size=chunk_size):
+                for key in row[: len(file_fields)]:
+                    if key:
+                        yield key
+                for derivatives in row[len(file_fields) :]:
+                    yield from (derivatives or {}).values()
+
+        # storage 업로드 중인 파일
+        yield from UploadTask.objects.values_list("storage_key", flat=True).iterator(
+            chunk_size=chunk_size
+        )
+
+    @staticmethod
+    def build_referenced_digests() -> Set[bytes]:
+        return {
+            get_key_digest(key) for key in OrphanFileCollector.iter_referenced_keys()
+        }
+
+    def collect(
+        self,
+        prefixes: Sequence[str],
+        min_age: timedelta,
+        dry_run: bool = False,
+        page_size: int = LIST_OBJECTS_MAX_KEYS,
+        on_orphans=None,
+    ) -> Dict[str, int]:
+        """
+        prefixes로 시작하는 storage 파일 중 고아 파일 삭제 (dry_run이면 삭제하지 않음)
+        on_orphans : page마다 찾은 고아 파일 리스트를 받는 함수 (dry-run 보고서 출력 등)
+        반환값 : scanned(조회한 파일), orphaned(고아 파일), orphaned_bytes, deleted, failed 개수
+        """
+        referenced: Set[bytes] = self.build_referenced_digests()
+        modified_before: datetime = timezone.now() - min_age
+
+        stats: Dict[str, int] = {
+            "referenced": len(referenced),
+            "scanned": 0,
+            "orphaned": 0,
+            "orphaned_bytes": 0,
+            "deleted": 0,
+            "failed": 0,
+        }
+        for prefix in prefixes:
+            for page in self.gateway.list_pages(prefix, page_size=page_size):
+                stats["scanned"] += len(page)
+                orphans: List[ListedObject] = [
+                    item
+                    for item in page
+                    if item.last_modified < modified_before
+                    and get_key_digest(item.key) not in referenced
+                ]
+                if not orphans:
+                    continue
+
+                stats["orphaned"] += len(orphans)
+                stats["orphaned_bytes"] += sum(item.size for item in orphans)
+                if on_orphans is not None:
+                    on_orphans(orphans)
+                if dry_run:
+                    continue
+
+                failed: Dict[str, str] = self.gateway.delete_many(
+                    [item.key for item in orphans]
+                )
+                if failed:
+                    logger.warning(
+                        f"Orphan file deletion failed ({len(failed)} keys): "
+                        f"{next(iter(failed.values()))}"
+                    )
+                stats["failed"] += len(failed)
+                stats["deleted"] += len(orphans) - len(failed)
+        return stats
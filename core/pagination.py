@@ -0,0 +1,209 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q, QuerySet
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    정렬 컬럼 값을 커서로 사용하는 keyset(cursor) 페이지네이션 클래스.
+
+    LimitOffsetPagination은 매 페이지마다 COUNT(*)를 실행하고, offset이 커질수록
+    앞쪽 row를 모두 읽고 버려야 하기 때문에 뒤 페이지로 갈수록 느려집니다.
+    KeysetPagination은 마지막으로 받은 row의 정렬 컬럼 값 이후의 row만 조회하므로
+    몇 번째 페이지든 동일한 비용으로 조회할 수 있습니다.
+
+    - 정렬 기준은 쿼리셋에 적용된 order_by를 그대로 사용하고, 마지막에 pk를 tiebreaker로 붙입니다.
+    - 정렬 컬럼은 NULL이 될 수 없는 모델 필드여야 합니다.
+    - count=true 쿼리 파라미터를 넘긴 경우에만 전체 개수를 계산합니다.
+    """
+
+    cursor_query_param = "cursor"
+    limit_query_param = "limit"
+    count_query_param = "count"
+    mode_query_param = "pagination"
+    default_limit = 10
+    max_limit = 100
+    default_ordering: Tuple[str, ...] = ("-created",)
+    tiebreaker_field = "pk"
+
+    @classmethod
+    def is_requested(cls, request) -> bool:
+        """
+        pagination=cursor 또는 cursor 쿼리 파라미터가 넘어온 경우 keyset 페이지네이션을 사용합니다.
+        """
+        return (
+            request.query_params.get(cls.mode_query_param) == "cursor"
+            or cls.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Any, view: Any = None
+    ) -> List[Any]:
+        self.request = request
+        self.limit: int = self.get_limit(request)
+        self.ordering: List[Tuple[str, bool]] = self.get_ordering(queryset)
+        self.count: Optional[int] = None
+
+        cursor = self.decode_cursor(request)
+        reverse: bool = bool(cursor and cursor["r"])
+
+        if self.should_count(request):
+            self.count = queryset.order_by().count()
+
+        queryset = queryset.order_by(*self.get_order_by(reverse))
+        if cursor:
+            queryset = queryset.filter(self.get_keyset_filter(cursor["v"], reverse))
+
+        # limit + 1개를 가져와서 다음 페이지가 존재하는지 판단합니다 (COUNT 쿼리 X)
+        rows: List[Any] = list(queryset[: self.limit + 1])
+        has_more: bool = len(rows) > self.limit
+        rows = rows[: self.limit]
+
+        if reverse:
+            rows.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = cursor is not None
+
+        self.page: List[Any] = rows
+        return rows
+
+    def get_paginated_response(self, data) -> Response:
+        response_data: Dict[str, Any] = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if self.count is not None:
+            response_data = {"count": self.count, **response_data}
+        return Response(response_data)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "count": {"type": "integer"},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_limit(self, request) -> int:
+        try:
+            return _positive_int(
+                request.query_params[self.limit_query_param],
+                strict=True,
+                cutoff=self.max_limit,
+            )
+        except (KeyError, ValueError):
+            return self.default_limit
+
+    def should_count(self, request) -> bool:
+        return request.query_params.get(self.count_query_param, "false") == "true"
+
+    def get_ordering(self, queryset: QuerySet) -> List[Tuple[str, bool]]:
+        """
+        쿼리셋의 order_by를 (필드 이름, 내림차순 여부) 리스트로 변환하고 tiebreaker를 붙입니다.
+        """
+        order_by = queryset.query.order_by or self.default_ordering
+        opts = queryset.model._meta
+
+        ordering: List[Tuple[str, bool]] = []
+        for expression in order_by:
+            if not isinstance(expression, str) or "__" in expression:
+                raise ValueError("Cursor pagination supports only model field ordering")
+            descending: bool = expression.startswith("-")
+            field_name: str = expression.lstrip("-")
+            if field_name == "pk":
+                field_name = opts.pk.name
+            try:
+                opts.get_field(field_name)
+            except FieldDoesNotExist:
+                raise ValueError(f"Invalid ordering field: {field_name}")
+            ordering.append((field_name, descending))
+
+        pk_name: str = opts.pk.name
+        if not any(name == pk_name for name, _ in ordering):
+            # 마지막 정렬 방향을 따라가도록 해서 인덱스 스캔 방향이 한 방향으로 유지되게 합니다.
+            ordering.append((pk_name, ordering[-1][1] if ordering else False))
+        return ordering
+
+    def get_order_by(self, reverse: bool) -> List[str]:
+        return [
+            f"-{name}" if descending != reverse else name
+            for name, descending in self.ordering
+        ]
+
+    def get_keyset_filter(self, values: List[str], reverse: bool) -> Q:
+        """
+        (a, b, pk) > (va, vb, vpk) 형태의 row 비교를 OR 조건으로 풀어서 만듭니다.
+        a > va OR (a = va AND b > vb) OR (a = va AND b = vb AND pk > vpk)
+        """
+        keyset_filter = Q()
+        equal_filter = Q()
+        for (name, descending), value in zip(self.ordering, values):
+            lookup = "lt" if descending != reverse else "gt"
+            keyset_filter |= equal_filter & Q(**{f"{name}__{lookup}": value})
+            equal_filter &= Q(**{name: value})
+        return keyset_filter
+
+    def get_position(self, row: Any) -> List[str]:
+        opts = row._meta
+        return [opts.get_field(name).value_to_string(row) for name, _ in self.ordering]
+
+    def get_signature(self) -> str:
+        return ",".join(
+            f"-{name}" if descending else name for name, descending in self.ordering
+        )
+
+    def encode_cursor(self, row: Any, reverse: bool) -> str:
+        payload = {"o": self.get_signature(), "v": self.get_position(row), "r": reverse}
+        encoded = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        ).decode("ascii")
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, "offset")
+        url = remove_query_param(url, self.count_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request) -> Optional[Dict[str, Any]]:
+        encoded: str = request.query_params.get(self.cursor_query_param, "")
+        if not encoded:
+            return None
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError):
+            raise ValueError("Invalid cursor")
+
+        if (
+            not isinstance(payload, dict)
+            or payload.get("o") != self.get_signature()
+            or not isinstance(payload.get("v"), list)
+            or len(payload["v"]) != len(self.ordering)
+        ):
+            # 커서를 발급받을 때와 정렬 조건이 달라진 경우
+            raise ValueError("Invalid cursor")
+
+        return {"v": payload["v"], "r": bool(payload.get("r"))}
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
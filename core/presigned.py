@@ -0,0 +1,113 @@
+import os
+import re
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+from django.conf import settings
+from django.db import models
+
+from core.storage import StorageGateway, StorageObject, get_storage_gateway
+
+# 업로드를 허용하는 이미지 Content-Type : 파일 확장자
+ALLOWED_IMAGE_CONTENT_TYPES: Dict[str, str] = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "image/heic": ".heic",
+}
+
+# 발급한 key의 파일 이름 형식 (uuid4 hex + 확장자)
+_ISSUED_FILENAME_PATTERN = re.compile(r"^[0-9a-f]{32}\.(jpg|png|webp|heic)$")
+
+
+class PresignedUploadService:
+    """
+    클라이언트가 이미지를 storage(S3)에 직접 업로드하는 2단계 업로드 서비스
+    1. create_uploads : 이미지 모델의 upload_to 경로로 key를 만들고, presigned POST(url, fields)를 발급
+    2. verify_uploads : 클라이언트가 업로드를 마친 key의 위치, 크기, Content-Type을 HEAD 요청으로 검증
+    서버는 이미지 파일을 전달받지 않으며, 검증이 끝난 key로 이미지 row를 만드는 것은 각 서비스에서 처리합니다.
+    """
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def get_upload_directory(instance: models.Model, field_name: str) -> str:
+        # upload_to 함수가 만드는 경로에서 파일 이름을 제외한 부분
+        field = instance._meta.get_field(field_name)
+        return os.path.dirname(field.generate_filename(instance, "file"))
+
+    @staticmethod
+    def create_uploads(
+        instance: models.Model, field_name: str, content_types: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        instance : 업로드한 이미지를 저장할 모델 인스턴스 (upload_to 경로 계산에 사용, 저장하지 않음)
+        반환값 : [{"key": storage key, "url": 업로드 url, "fields": form 필드}, ...]
+        """
+        if not content_types:
+            raise ValueError("content_types is required")
+        if len(content_types) > settings.PRESIGNED_UPLOAD_MAX_FILES:
+            raise ValueError(
+                f"Cannot upload more than {settings.PRESIGNED_UPLOAD_MAX_FILES} images at once"
+            )
+
+        gateway: StorageGateway = get_storage_gateway()
+        field = instance._meta.get_field(field_name)
+        uploads: List[Dict[str, Any]] = []
+        for content_type in content_types:
+            extension: Optional[str] = ALLOWED_IMAGE_CONTENT_TYPES.get(content_type)
+            if extension is None:
+                raise ValueError(f"Unsupported image content type: {content_type}")
+
+            key: str = field.generate_filename(instance, uuid.uuid4().hex + extension)
+            presigned_post: Dict[str, Any] = gateway.create_presigned_post(
+                key,
+                content_type,
+                max_size=settings.IMAGE_UPLOAD_MAX_SIZE,
+                expires_in=settings.PRESIGNED_UPLOAD_EXPIRES,
+            )
+            uploads.append({"key": key, **presigned_post})
+        return uploads
+
+    @staticmethod
+    def verify_uploads(
+        instance: models.Model, field_name: str, keys: Sequence[str]
+    ) -> List[str]:
+        """
+        클라이언트가 업로드를 마쳤다고 알려준 key 검증
+        - instance의 upload_to 경로에 create_uploads가 발급한 형식의 key인지
+        - storage에 파일이 있고, 크기와 Content-Type이 허용 범위인지
+        """
+        if not keys:
+            raise ValueError("keys is required")
+        if len(keys) > settings.PRESIGNED_UPLOAD_MAX_FILES:
+            raise ValueError(
+                f"Cannot upload more than {settings.PRESIGNED_UPLOAD_MAX_FILES} images at once"
+            )
+        if len(set(keys)) != len(keys):
+            raise ValueError("Duplicated upload keys")
+
+        directory: str = PresignedUploadService.get_upload_directory(
+            instance, field_name
+        )
+        for key in keys:
+            key_directory, filename = os.path.split(str(key))
+            if key_directory != directory or not _ISSUED_FILENAME_PATTERN.match(
+                filename
+            ):
+                raise ValueError(f"Invalid upload key: {key}")
+
+        # 파일 정보는 HEAD 요청을 동시에 보내서 한번에 조회
+        heads: Dict[str, Optional[StorageObject]] = get_storage_gateway().head_many(
+            keys
+        )
+        for key in keys:
+            head: Optional[StorageObject] = heads[key]
+            if head is None:
+                raise ValueError(f"Image is not uploaded yet: {key}")
+            if not 0 < head.size <= settings.IMAGE_UPLOAD_MAX_SIZE:
+                raise ValueError(f"Invalid image file size: {key}")
+            if head.content_type not in ALLOWED_IMAGE_CONTENT_TYPES:
+                raise ValueError(f"Invalid image content type: {key}")
+        return list(keys)
@@ -0,0 +1,140 @@
+import atexit
+import cProfile
+import io
+import json
+import marshal
+import pstats
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.core import signing
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+PROFILE_TOKEN_SALT = "core.profiling"
+PROFILE_TOKEN_VALUE = "profile"
+PROFILE_FORMATS = ("json", "prof")
+
+
+class RequestProfileService:
+    """
+    요청 profiling 결과 저장, 조회
+    - json : 요청 정보, cProfile 통계(누적 시간 상위 PROFILE_STATS_LIMIT개 함수), 실행한 SQL 순서대로
+    - prof : pstats 파일 (python -m pstats, snakeviz 등으로 열 수 있음)
+    결과는 storage의 profiles/ 아래에 저장하며, 고아 파일 정리 대상이 아닙니다. (bucket lifecycle로 삭제)
+    """
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def create_token() -> str:
+        # PROFILE_TOKEN_MAX_AGE 동안 유효한 서명 토큰
+        return signing.TimestampSigner(salt=PROFILE_TOKEN_SALT).sign(
+            PROFILE_TOKEN_VALUE
+        )
+
+    @staticmethod
+    def is_valid_token(token: str) -> bool:
+        try:
+            value: str = signing.TimestampSigner(salt=PROFILE_TOKEN_SALT).unsign(
+                token, max_age=settings.PROFILE_TOKEN_MAX_AGE
+            )
+        except signing.BadSignature:
+            return False
+        return value == PROFILE_TOKEN_VALUE
+
+    @staticmethod
+    def get_storage_key(profile_id: str, format: str) -> str:
+        if format not in PROFILE_FORMATS:
+            raise ValueError(f"Invalid profile format: {format}")
+        return f"profiles/{profile_id}.{format}"
+
+    @staticmethod
+    def get_stats_text(profiler: cProfile.Profile) -> str:
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+            settings.PROFILE_STATS_LIMIT
+        )
+        return stream.getvalue()
+
+    @staticmethod
+    def save(
+        profile_id: str,
+        profiler: cProfile.Profile,
+        request_data: Dict[str, Any],
+    ) -> None:
+        """
+        request_data : 요청 정보와 SQL 기록 (queries)
+        """
+        data: Dict[str, Any] = {
+            "profile_id": profile_id,
+            "created_at": timezone.now().isoformat(),
+            **request_data,
+            "stats": RequestProfileService.get_stats_text(profiler),
+        }
+        default_storage.save(
+            RequestProfileService.get_storage_key(profile_id, "json"),
+            ContentFile(json.dumps(data, ensure_ascii=False).encode()),
+        )
+        default_storage.save(
+            RequestProfileService.get_storage_key(profile_id, "prof"),
+            ContentFile(marshal.dumps(pstats.Stats(profiler).stats)),
+        )
+
+    @staticmethod
+    def open(profile_id: str, format: str):
+        key: str = RequestProfileService.get_storage_key(profile_id, format)
+        if not default_storage.exists(key):
+            raise ObjectDoesNotExist(f"Profile not found: {profile_id}")
+        return default_storage.open(key, "rb")
+
+
+class ProfileUploadPool:
+    """
+    샘플링된 요청의 profiling 결과를 응답 이후에 저장하는 프로세스별 thread
+    storage 업로드 시간이 사용자 요청의 응답 시간에 포함되지 않도록 합니다.
+    저장 대기 중인 결과가 MAX_PENDING개 이상이면 새 결과는 저장하지 않습니다. (storage 장애 시 메모리 사용량 제한)
+    """
+
+    MAX_PENDING: int = 10
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _pending: int = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def submit(cls, func: Callable[..., None], *args: Any) -> Optional[Future]:
+        # 반환값 : 저장 작업 (대기 중인 결과가 너무 많으면 None)
+        with cls._lock:
+            if cls._pending >= cls.MAX_PENDING:
+                return None
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="profile-upload-worker"
+                )
+                atexit.register(cls.shutdown)
+            cls._pending += 1
+            return cls._executor.submit(cls.run, func, *args)
+
+    @classmethod
+    def run(cls, func: Callable[..., None], *args: Any) -> None:
+        try:
+            func(*args)
+        finally:
+            with cls._lock:
+                cls._pending -= 1
+
+    @classmethod
+    def shutdown(cls) -> None:
+        # 대기 중인 결과를 모두 저장할 때까지 기다림 (프로세스 종료 시)
+        with cls._lock:
+            executor: Optional[ThreadPoolExecutor] = cls._executor
+            cls._executor = None
+        if executor is not None:
+            executor.shutdown(wait=True)
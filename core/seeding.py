@@ -0,0 +1,758 @@
+import io
+import json
+import logging
+import random
+import uuid
+from collections import Counter
+from datetime import date, datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import faker
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, models, transaction
+from django.db.models import Max
+
+from core.models import UploadStatus
+from market.cache import ServiceResponseCache
+from market.models import (
+    Market,
+    Service,
+    ServiceCard,
+    ServiceImage,
+    ServiceMaterial,
+    ServiceOption,
+    ServiceOptionImage,
+    ServiceStyle,
+)
+from market.services import ServiceCardService
+from order.models import (
+    DeliveryInformation,
+    Order,
+    OrdererInformation,
+    OrderStatus,
+    Transaction,
+    _OrderStatus,
+)
+from users.models.reformer import (
+    Reformer,
+    ReformerAwards,
+    ReformerCareer,
+    ReformerCertification,
+    ReformerEducation,
+    ReformerFreelancer,
+)
+from users.models.user import User
+
+logger = logging.getLogger(__name__)
+
+SEED_PASSWORD = "upcy-seed-password"  # 생성한 모든 사용자의 비밀번호
+SEED_EMAIL_DOMAIN = "seed.upcy.co.kr"
+
+SERVICE_CATEGORIES = ("상의", "하의", "아우터", "가방", "모자", "잡화")
+MATERIAL_NAMES = ("면", "데님", "가죽", "니트", "린넨", "폴리에스터")
+STYLE_NAMES = ("빈티지", "캐주얼", "미니멀", "스트릿", "페미닌")
+
+# 서비스 1개에 생성하는 하위 row 개수
+MATERIALS_PER_SERVICE = 3
+STYLES_PER_SERVICE = 2
+OPTIONS_PER_SERVICE = 3
+IMAGES_PER_SERVICE = 2
+
+# 주문의 최종 상태 : (상태 변경 이력, 비율)
+ORDER_STATUS_PATHS: Tuple[Tuple[Tuple[str, ...], float], ...] = (
+    ((_OrderStatus.PENDING,), 0.3),
+    ((_OrderStatus.PENDING, _OrderStatus.REJECTED), 0.1),
+    ((_OrderStatus.PENDING, _OrderStatus.ACCEPTED), 0.15),
+    ((_OrderStatus.PENDING, _OrderStatus.ACCEPTED, _OrderStatus.RECEIVED), 0.1),
+    (
+        (
+            _OrderStatus.PENDING,
+            _OrderStatus.ACCEPTED,
+            _OrderStatus.RECEIVED,
+            _OrderStatus.PRODUCED,
+        ),
+        0.1,
+    ),
+    (
+        (
+            _OrderStatus.PENDING,
+            _OrderStatus.ACCEPTED,
+            _OrderStatus.RECEIVED,
+            _OrderStatus.PRODUCED,
+            _OrderStatus.DELIVER,
+        ),
+        0.1,
+    ),
+    (
+        (
+            _OrderStatus.PENDING,
+            _OrderStatus.ACCEPTED,
+            _OrderStatus.RECEIVED,
+            _OrderStatus.PRODUCED,
+            _OrderStatus.DELIVER,
+            _OrderStatus.END,
+        ),
+        0.15,
+    ),
+)
+
+# 다른 테이블이 참조하는 모델 : id를 미리 정해서 추가
+# (bulk_create 결과의 id를 기다리지 않아도 되므로 batch를 여러 process에서 나누어 처리할 수 있음)
+ID_MODELS: Dict[str, type[models.Model]] = {
+    "user": User,
+    "reformer": Reformer,
+    "market": Market,
+    "service": Service,
+    "material": ServiceMaterial,
+    "option": ServiceOption,
+    "transaction": Transaction,
+}
+
+# 실행 단계 : 같은 단계의 작업끼리는 순서와 관계없이 동시에 실행할 수 있음
+SEED_PHASES: Tuple[Tuple[str, ...], ...] = (
+    ("customers", "reformers"),
+    ("cards", "orders"),
+)
+
+
+class SeedScale(NamedTuple):
+    reformers: int
+    customers: int
+    services_per_reformer: int
+    orders: int
+
+
+SEED_SCALES: Dict[str, SeedScale] = {
+    # 테스트용
+    "tiny": SeedScale(reformers=4, customers=10, services_per_reformer=3, orders=60),
+    "small": SeedScale(
+        reformers=200, customers=2000, services_per_reformer=5, orders=10_000
+    ),
+    # 벤치마크용 : 리포머 수천명, 서비스 수만개, 주문 수십만개
+    "benchmark": SeedScale(
+        reformers=3000, customers=30_000, services_per_reformer=10, orders=300_000
+    ),
+    # 부하 테스트용 : 전체 약 천만 row
+    "large": SeedScale(
+        reformers=20_000,
+        customers=200_000,
+        services_per_reformer=10,
+        orders=1_000_000,
+    ),
+}
+
+
+class SeedTask(NamedTuple):
+    # target(customers, reformers, cards, orders)의 [start, stop) 번째 row를 생성하는 작업
+    target: str
+    start: int
+    stop: int
+
+
+class SeededService(NamedTuple):
+    # 주문 생성에 필요한 서비스 정보
+    id: int
+    basic_price: int
+    material_ids: Tuple[int, ...]
+    options: Tuple[Tuple[int, int], ...]  # (option id, option_price)
+
+
+def get_seed_email(role: str, index: int) -> str:
+    return f"{role}{index}@{SEED_EMAIL_DOMAIN}"
+
+
+def get_copy_value(field: models.Field, obj: models.Model) -> str:
+    # COPY text 형식의 값 1개 (NULL은 \N, 구분자와 줄바꿈은 escape)
+    value = field.pre_save(obj, add=True)
+    if value is not None:
+        if isinstance(field, models.JSONField):
+            value = json.dumps(value, cls=field.encoder, ensure_ascii=False)
+        else:
+            value = field.get_prep_value(value)
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_insert(model: type[models.Model], objs: Sequence[models.Model]) -> None:
+    """
+    PostgreSQL COPY FROM STDIN으로 row 추가 (INSERT보다 SQL 파싱, 왕복이 적어 빠름)
+    id가 없는 row는 id 컬럼을 제외해서 sequence 값을 사용합니다.
+    """
+    if not objs:
+        return
+    fields: List[models.Field] = [
+        field
+        for field in model._meta.concrete_fields
+        if not (field.primary_key and objs[0].pk is None)
+    ]
+    data = io.StringIO()
+    for obj in objs:
+        data.write("\t".join(get_copy_value(field, obj) for field in fields))
+        data.write("\n")
+    data.seek(0)
+
+    quote = connection.ops.quote_name
+    sql: str = (
+        f"COPY {quote(model._meta.db_table)} "
+        f"({', '.join(quote(field.column) for field in fields)}) FROM STDIN"
+    )
+    with connection.cursor() as cursor:
+        raw_cursor = cursor.cursor
+        if hasattr(raw_cursor, "copy_expert"):  # psycopg2
+            raw_cursor.copy_expert(sql, data)
+        else:  # psycopg 3
+            with raw_cursor.copy(sql) as copy:
+                copy.write(data.getvalue())
+
+
+class MarketplaceSeeder:
+    """
+    벤치마크용 데이터(사용자, 리포머 프로필, 마켓, 서비스와 하위 row, 주문)를 생성하는 클래스
+    - row는 batch_size개씩 bulk_create(use_copy이면 PostgreSQL COPY)로 추가하고, batch마다 커밋합니다.
+      signal이 실행되지 않으므로 서비스 카드는 cards 작업에서 따로 생성합니다.
+    - ID_MODELS의 row는 id_bases부터 순서대로 id를 미리 정하므로, 같은 단계(SEED_PHASES)의 batch는
+      서로의 결과를 기다리지 않고 여러 process에서 나누어 처리할 수 있습니다. (seed_marketplace 명령어)
+    - 난수는 (seed, 대상, batch 번호)마다 따로 만들기 때문에, process 개수와 관계없이 같은 seed로 실행하면 같은 데이터가 만들어집니다.
+    - 비밀번호 해시는 한번만 계산해서 모든 사용자가 같은 비밀번호(SEED_PASSWORD)를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        scale: SeedScale,
+        seed: int = 0,
+        batch_size: int = 1000,
+        id_bases: Optional[Dict[str, int]] = None,
+        password: Optional[str] = None,
+        use_copy: bool = False,
+        log: Optional[Callable[[str], None]] = None,
+    ):
+        if use_copy and connection.vendor != "postgresql":
+            raise ValueError("COPY is only supported on PostgreSQL")
+        self.scale: SeedScale = scale
+        self.seed: int = seed
+        self.batch_size: int = batch_size
+        self.id_bases: Dict[str, int] = id_bases or self.get_id_bases()
+        self.password: str = password or make_password(SEED_PASSWORD)
+        self.use_copy: bool = use_copy
+        self.log: Callable[[str], None] = log or logger.info
+        self.counts: Counter = Counter()
+        self._services: Optional[List[SeededService]] = None
+
+        fake = faker.Faker("ko_KR")
+        fake.seed_instance(seed)
+        # 문자열은 faker로 미리 만든 값 중에서 선택 (row마다 faker를 호출하면 느림)
+        self.names: List[str] = [fake.name() for _ in range(200)]
+        self.addresses: List[str] = [fake.address()[:50] for _ in range(200)]
+        self.sentences: List[str] = [fake.sentence() for _ in range(200)]
+        self.words: List[str] = [fake.word() for _ in range(200)]
+        self.companies: List[str] = [fake.company() for _ in range(100)]
+        self.phone_numbers: List[str] = [fake.phone_number()[:15] for _ in range(100)]
+
+    def get_args(self) -> Dict[str, Any]:
+        # 다른 process에서 같은 seeder를 만들 때 사용하는 인자
+        return {
+            "scale": self.scale,
+            "seed": self.seed,
+            "batch_size": self.batch_size,
+            "id_bases": self.id_bases,
+            "password": self.password,
+            "use_copy": self.use_copy,
+        }
+
+    @staticmethod
+    def get_id_bases() -> Dict[str, int]:
+        # 기존 row와 겹치지 않도록 현재 가장 큰 id 다음부터 사용
+        return {
+            name: (model.objects.aggregate(max_id=Max("pk"))["max_id"] or 0) + 1
+            for name, model in ID_MODELS.items()
+        }
+
+    @staticmethod
+    def reset_sequences() -> None:
+        # id를 직접 정해서 추가했으므로, 이후에 추가되는 row가 같은 id를 받지 않도록 sequence 변경 (PostgreSQL)
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(
+                no_style(), list(ID_MODELS.values())
+            ):
+                cursor.execute(sql)
+
+    def get_id(self, name: str, index: int) -> int:
+        return self.id_bases[name] + index
+
+    def get_customer_id(self, index: int) -> int:
+        # 사용자 id는 리포머 사용자 다음부터 일반 사용자
+        return self.get_id("user", self.scale.reformers + index)
+
+    def get_totals(self) -> Dict[str, int]:
+        return {
+            "customers": self.scale.customers,
+            "reformers": self.scale.reformers,
+            "cards": self.scale.reformers * self.scale.services_per_reformer,
+            "orders": self.scale.orders,
+        }
+
+    def get_tasks(self, target: str, batches_per_task: int = 1) -> List[SeedTask]:
+        # 작업은 batch 단위로 나눔 (batch마다 난수를 따로 만들기 때문에 나누는 방법과 관계없이 같은 데이터)
+        total: int = self.get_totals()[target]
+        step: int = self.batch_size * batches_per_task
+        return [
+            SeedTask(target, start, min(start + step, total))
+            for start in range(0, total, step)
+        ]
+
+    def get_random(self, *keys) -> random.Random:
+        return random.Random(":".join(str(key) for key in (self.seed, *keys)))
+
+    @staticmethod
+    def make_uuid(rng: random.Random) -> uuid.UUID:
+        return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+    def insert(self, model: type[models.Model], objs: Sequence[models.Model]) -> None:
+        if self.use_copy:
+            copy_insert(model, objs)
+        else:
+            model.objects.bulk_create(objs, batch_size=self.batch_size)
+        self.counts[model._meta.db_table] += len(objs)
+
+    def iter_batches(self, start: int, stop: int) -> Iterator[Tuple[int, range]]:
+        for batch_start in range(start, stop, self.batch_size):
+            yield batch_start // self.batch_size, range(
+                batch_start, min(batch_start + self.batch_size, stop)
+            )
+
+    def run_task(self, task: SeedTask) -> Dict[str, int]:
+        """
+        반환값 : {테이블 이름: 추가한 row 개수}
+        """
+        self.counts = Counter()
+        create: Callable[[int, range], None] = {
+            "customers": self.create_customers,
+            "reformers": self.create_reformers,
+            "cards": self.create_cards,
+            "orders": self.create_orders,
+        }[task.target]
+        for batch, indexes in self.iter_batches(task.start, task.stop):
+            with transaction.atomic():
+                create(batch, indexes)
+        return dict(self.counts)
+
+    def finish(self) -> None:
+        # 모든 작업이 끝난 후 한번 실행
+        self.reset_sequences()
+        ServiceResponseCache.invalidate()
+
+    def seed_all(self) -> Dict[str, int]:
+        """
+        현재 process에서 모든 작업 실행
+        반환값 : {테이블 이름: 추가한 row 개수}
+        """
+        counts: Counter = Counter()
+        for phase in SEED_PHASES:
+            for target in phase:
+                self.log(f"Creating {self.get_totals()[target]} {target}")
+                for task in self.get_tasks(target):
+                    counts.update(self.run_task(task))
+        self.finish()
+        return dict(counts)
+
+    def make_user(self, rng: random.Random, role: str, index: int, user_id: int):
+        return User(
+            id=user_id,
+            email=get_seed_email(role, index),
+            password=self.password,
+            nickname=f"{role}{index}",
+            full_name=rng.choice(self.names),
+            phone=rng.choice(self.phone_numbers),
+            address=rng.choice(self.addresses),
+            introduce=rng.choice(self.sentences),
+            role=role,
+            agreement_terms=True,
+        )
+
+    def create_customers(self, batch: int, indexes: range) -> None:
+        rng = self.get_random("customer", batch)
+        self.insert(
+            User,
+            [
+                self.make_user(rng, "customer", index, self.get_customer_id(index))
+                for index in indexes
+            ],
+        )
+
+    def create_reformers(self, batch: int, indexes: range) -> None:
+        """
+        리포머 사용자, 리포머 프로필과 프로필 항목, 마켓(리포머마다 1개), 서비스와 하위 row 생성
+        """
+        rng = self.get_random("reformer", batch)
+        self.insert(
+            User,
+            [
+                self.make_user(rng, "reformer", index, self.get_id("user", index))
+                for index in indexes
+            ],
+        )
+        self.insert(
+            Reformer,
+            [
+                Reformer(
+                    id=self.get_id("reformer", index),
+                    user_id=self.get_id("user", index),
+                    reformer_link=f"https://open.kakao.com/o/seed{index}",
+                    reformer_area=rng.choice(self.addresses),
+                )
+                for index in indexes
+            ],
+        )
+        self.create_profile_sections(rng, indexes)
+
+        markets: List[Market] = []
+        for index in indexes:
+            market_uuid: uuid.UUID = self.make_uuid(rng)
+            markets.append(
+                Market(
+                    id=self.get_id("market", index),
+                    reformer_id=self.get_id("reformer", index),
+                    market_uuid=market_uuid,
+                    market_name=f"{rng.choice(self.words)} 마켓 {index}"[:50],
+                    market_introduce=rng.choice(self.sentences),
+                    market_address=rng.choice(self.addresses),
+                    market_thumbnail=f"users/seed/market/{market_uuid}/thumbnail.jpg",
+                )
+            )
+        self.insert(Market, markets)
+
+        per_market: int = self.scale.services_per_reformer
+        self.create_services(
+            rng, range(indexes.start * per_market, indexes.stop * per_market)
+        )
+
+    def create_profile_sections(self, rng: random.Random, indexes: range) -> None:
+        # 프로필 항목(학력, 자격증, 수상, 경력, 프리랜서)은 리포머마다 1~2개
+        sections: Dict[type[models.Model], List[models.Model]] = {
+            ReformerEducation: [],
+            ReformerCertification: [],
+            ReformerAwards: [],
+            ReformerCareer: [],
+            ReformerFreelancer: [],
+        }
+        for index in indexes:
+            reformer_id: int = self.get_id("reformer", index)
+            for _ in range(rng.randint(1, 2)):
+                sections[ReformerEducation].append(
+                    ReformerEducation(
+                        reformer_id=reformer_id,
+                        education_uuid=self.make_uuid(rng),
+                        school=rng.choice(self.companies),
+                        major=rng.choice(self.words),
+                        academic_status=rng.choice(("졸업", "재학", "휴학")),
+                    )
+                )
+                sections[ReformerCertification].append(
+                    ReformerCertification(
+                        reformer_id=reformer_id,
+                        certification_uuid=self.make_uuid(rng),
+                        name=rng.choice(self.words),
+                        issuing_authority=rng.choice(self.companies),
+                    )
+                )
+                sections[ReformerAwards].append(
+                    ReformerAwards(
+                        reformer_id=reformer_id,
+                        award_uuid=self.make_uuid(rng),
+                        competition=rng.choice(self.sentences)[:100],
+                        prize=rng.choice(("대상", "금상", "은상", "동상")),
+                    )
+                )
+                sections[ReformerCareer].append(
+                    ReformerCareer(
+                        reformer_id=reformer_id,
+                        career_uuid=self.make_uuid(rng),
+                        company_name=rng.choice(self.companies),
+                        department=rng.choice(self.words),
+                        period=f"{rng.randint(1, 10)}년",
+                    )
+                )
+                sections[ReformerFreelancer].append(
+                    ReformerFreelancer(
+                        reformer_id=reformer_id,
+                        freelancer_uuid=self.make_uuid(rng),
+                        project_name=rng.choice(self.words),
+                        description=rng.choice(self.sentences),
+                    )
+                )
+        for model, objs in sections.items():
+            self.insert(model, objs)
+
+    def create_services(self, rng: random.Random, indexes: range) -> None:
+        per_market: int = self.scale.services_per_reformer
+        services: List[Service] = []
+        for index in indexes:
+            basic_price: int = rng.randint(10, 100) * 1000
+            services.append(
+                Service(
+                    id=self.get_id("service", index),
+                    market_id=self.get_id("market", index // per_market),
+                    service_uuid=self.make_uuid(rng),
+                    service_title=f"{rng.choice(self.words)} 리폼 {index}"[:50],
+                    service_content=" ".join(rng.sample(self.sentences, 3)),
+                    service_category=rng.choice(SERVICE_CATEGORIES),
+                    service_period=rng.randint(1, 30),
+                    basic_price=basic_price,
+                    max_price=basic_price + rng.randint(0, 50) * 1000,
+                    suspended=rng.random() < 0.03,
+                    temporary=rng.random() < 0.05,
+                )
+            )
+        self.insert(Service, services)
+
+        materials: List[ServiceMaterial] = []
+        styles: List[ServiceStyle] = []
+        options: List[ServiceOption] = []
+        images: List[ServiceImage] = []
+        option_images: List[ServiceOptionImage] = []
+        for index, service in zip(indexes, services):
+            for number, name in enumerate(
+                rng.sample(MATERIAL_NAMES, MATERIALS_PER_SERVICE)
+            ):
+                materials.append(
+                    ServiceMaterial(
+                        id=self.get_id(
+                            "material", index * MATERIALS_PER_SERVICE + number
+                        ),
+                        market_service_id=service.id,
+                        material_uuid=self.make_uuid(rng),
+                        material_name=name,
+                    )
+                )
+            for name in rng.sample(STYLE_NAMES, STYLES_PER_SERVICE):
+                styles.append(
+                    ServiceStyle(
+                        market_service_id=service.id,
+                        style_uuid=self.make_uuid(rng),
+                        style_name=name,
+                    )
+                )
+            for number in range(OPTIONS_PER_SERVICE):
+                option = ServiceOption(
+                    id=self.get_id("option", index * OPTIONS_PER_SERVICE + number),
+                    market_service_id=service.id,
+                    option_uuid=self.make_uuid(rng),
+                    option_name=f"옵션 {number + 1}",
+                    option_content=rng.choice(self.sentences),
+                    option_price=rng.randint(1, 20) * 1000,
+                )
+                options.append(option)
+                option_images.append(
+                    ServiceOptionImage(
+                        service_option_id=option.id,
+                        image=f"users/seed/option/{option.option_uuid}.jpg",
+                        upload_status=UploadStatus.READY,
+                        image_metadata=self.get_image_metadata(rng),
+                    )
+                )
+            for number in range(IMAGES_PER_SERVICE):
+                images.append(
+                    ServiceImage(
+                        market_service_id=service.id,
+                        image=f"users/seed/service/{service.service_uuid}/{number}.jpg",
+                        upload_status=UploadStatus.READY,
+                        image_metadata=self.get_image_metadata(rng),
+                    )
+                )
+        self.insert(ServiceMaterial, materials)
+        self.insert(ServiceStyle, styles)
+        self.insert(ServiceOption, options)
+        self.insert(ServiceImage, images)
+        self.insert(ServiceOptionImage, option_images)
+
+    @staticmethod
+    def get_image_metadata(rng: random.Random) -> Dict[str, object]:
+        return {
+            "width": rng.choice((720, 1080, 1440)),
+            "height": rng.choice((720, 960, 1440)),
+            "dominant_color": f"#{rng.getrandbits(24):06x}",
+            "blurhash": "LEHV6nWB2yk8pyo0adR*.7kCMdnj",
+        }
+
+    def create_cards(self, batch: int, indexes: range) -> None:
+        ServiceCardService.refresh_cards(
+            [self.get_id("service", index) for index in indexes]
+        )
+        self.counts[ServiceCard._meta.db_table] += len(indexes)
+
+    def get_services(self) -> List[SeededService]:
+        """
+        주문할 수 있는 서비스 (임시 저장 서비스 제외)
+        가격은 reformers 작업에서 추가한 row를 조회하고, 재료 id는 미리 정한 id로 계산합니다.
+        """
+        if self._services is not None:
+            return self._services
+        first_id: int = self.get_id("service", 0)
+        id_range: Tuple[int, int] = (
+            first_id,
+            first_id + self.get_totals()["cards"] - 1,
+        )
+
+        options: Dict[int, List[Tuple[int, int]]] = {}
+        for option_id, service_id, option_price in (
+            ServiceOption.objects.filter(
+                market_service__gte=id_range[0], market_service__lte=id_range[1]
+            )
+            .order_by("id")
+            .values_list("id", "market_service_id", "option_price")
+        ):
+            options.setdefault(service_id, []).append((option_id, option_price))
+
+        self._services = [
+            SeededService(
+                id=service_id,
+                basic_price=basic_price,
+                material_ids=tuple(
+                    self.get_id(
+                        "material",
+                        (service_id - first_id) * MATERIALS_PER_SERVICE + number,
+                    )
+                    for number in range(MATERIALS_PER_SERVICE)
+                ),
+                options=tuple(options.get(service_id, ())),
+            )
+            for service_id, basic_price in Service.objects.filter(
+                id__range=id_range, temporary=False
+            )
+            .order_by("id")
+            .values_list("id", "basic_price")
+        ]
+        return self._services
+
+    def create_orders(self, batch: int, indexes: range) -> None:
+        services: List[SeededService] = self.get_services()
+        if not services or not self.scale.customers:
+            return
+        rng = self.get_random("order", batch)
+        paths: List[Tuple[str, ...]] = [path for path, _ in ORDER_STATUS_PATHS]
+        weights: List[float] = [weight for _, weight in ORDER_STATUS_PATHS]
+        material_through = Order.materials.through
+        option_through = Order.additional_options.through
+
+        orders: List[Order] = []
+        order_materials: List[models.Model] = []
+        order_options: List[models.Model] = []
+        histories: List[OrderStatus] = []
+        transactions: List[Transaction] = []
+        orderer_informations: List[OrdererInformation] = []
+        for index in indexes:
+            service: SeededService = rng.choice(services)
+            customer_index: int = rng.randrange(self.scale.customers)
+            orderer_id: int = self.get_customer_id(customer_index)
+            path: Tuple[str, ...] = rng.choices(paths, weights)[0]
+            material_ids = rng.sample(
+                service.material_ids, rng.randint(0, len(service.material_ids))
+            )
+            selected_options = rng.sample(
+                service.options, rng.randint(0, len(service.options))
+            )
+            option_price: int = sum(price for _, price in selected_options)
+            order = Order(
+                order_uuid=self.make_uuid(rng),
+                service_id=service.id,
+                orderer_id=orderer_id,
+                extra_material=rng.choice((None, rng.choice(self.words))),
+                additional_request=rng.choice(self.sentences),
+                service_price=service.basic_price,
+                option_price=option_price,
+                total_price=service.basic_price + option_price,
+                current_status=path[-1],
+                rejected_reason=(
+                    rng.choice(self.sentences)
+                    if path[-1] == _OrderStatus.REJECTED
+                    else None
+                ),
+            )
+            orders.append(order)
+            order_materials.extend(
+                material_through(order_id=order.pk, servicematerial_id=material_id)
+                for material_id in material_ids
+            )
+            order_options.extend(
+                option_through(order_id=order.pk, serviceoption_id=option_id)
+                for option_id, _ in selected_options
+            )
+            histories.extend(
+                OrderStatus(order_id=order.pk, from_status=from_status, status=to)
+                for from_status, to in zip((None, *path[:-1]), path)
+            )
+            transactions.append(
+                Transaction(
+                    id=self.get_id("transaction", index),
+                    order_id=order.pk,
+                    transaction_uuid=self.make_uuid(rng),
+                    transaction_option=rng.choice(("pickup", "delivery")),
+                )
+            )
+            orderer_informations.append(
+                OrdererInformation(
+                    user_id=orderer_id,
+                    order_id=order.pk,
+                    orderer_name=rng.choice(self.names),
+                    orderer_phone_number=rng.choice(self.phone_numbers),
+                    orderer_email=get_seed_email("customer", customer_index),
+                    orderer_address=rng.choice(self.addresses),
+                )
+            )
+        self.insert(Order, orders)
+        self.insert(material_through, order_materials)
+        self.insert(option_through, order_options)
+        self.insert(OrderStatus, histories)
+        self.insert(OrdererInformation, orderer_informations)
+        self.insert(Transaction, transactions)
+        self.insert(
+            DeliveryInformation,
+            [
+                DeliveryInformation(
+                    transaction_id=transaction.id,
+                    delivery_company=rng.choice(("CJ대한통운", "우체국택배")),
+                    delivery_tracking_number=str(rng.randint(10**11, 10**12)),
+                    delivery_address=rng.choice(self.addresses),
+                    delivery_name=rng.choice(self.names),
+                    delivery_phone_number=rng.choice(self.phone_numbers),
+                )
+                for transaction in transactions
+                if transaction.transaction_option == "delivery"
+            ],
+        )
+
+
+_worker_seeder: Optional[MarketplaceSeeder] = None
+
+
+def run_seed_task(seeder_args: Dict[str, Any], task: SeedTask) -> Dict[str, int]:
+    """
+    seed_marketplace 명령어의 process pool에서 실행하는 함수
+    seeder는 process마다 한번만 만들어서 재사용합니다. (faker 문자열, 주문할 서비스 목록)
+    """
+    global _worker_seeder
+    if _worker_seeder is None or _worker_seeder.get_args() != seeder_args:
+        _worker_seeder = MarketplaceSeeder(**seeder_args)
+    return _worker_seeder.run_task(task)
@@ -0,0 +1,71 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from core.blobs import ImageBlobService, uses_image_blob
+from core.derivatives import (
+    DERIVATIVE_TARGETS,
+    ImageDerivativePool,
+    derivatives_generated,
+)
+from core.models import ImageBlob, UploadStatus
+from core.uploads import upload_completed, upload_failed
+
+
+@receiver(upload_completed)
+def image_uploaded(sender, object_ids, **kwargs) -> None:
+    # storage 업로드가 끝난 이미지의 파생 이미지 생성
+    if uses_image_blob(sender):
+        # ImageBlob을 참조하는 row는 blob의 파생 이미지를 사용
+        object_ids = list(
+            sender.objects.filter(
+                pk__in=object_ids, image_blob__isnull=True
+            ).values_list("pk", flat=True)
+        )
+    for model_label, field_name in DERIVATIVE_TARGETS:
+        if sender._meta.label == model_label and object_ids:
+            ImageDerivativePool.submit(model_label, object_ids, field_name)
+
+
+@receiver(upload_completed, sender=ImageBlob)
+def image_blob_uploaded(sender, object_ids, **kwargs) -> None:
+    # blob을 참조하는 이미지 row도 업로드 완료 상태로 변경 (서비스 카드 갱신 등은 각 모델의 signal에서 처리)
+    for blob_id, image in ImageBlob.objects.filter(pk__in=object_ids).values_list(
+        "pk", "image"
+    ):
+        updated = ImageBlobService.update_references(
+            blob_id, image=image, upload_status=UploadStatus.READY
+        )
+        for model, ids in updated.items():
+            upload_completed.send(sender=model, object_ids=ids)
+
+
+@receiver(upload_failed, sender=ImageBlob)
+def image_blob_upload_failed(sender, object_ids, **kwargs) -> None:
+    for blob_id in object_ids:
+        updated = ImageBlobService.update_references(
+            blob_id, upload_status=UploadStatus.FAILED
+        )
+        for model, ids in updated.items():
+            upload_failed.send(sender=model, object_ids=ids)
+
+
+@receiver(derivatives_generated, sender=ImageBlob)
+def image_blob_derivatives_generated(sender, object_ids, **kwargs) -> None:
+    # blob의 파생 이미지 key와 이미지 정보를 참조하는 이미지 row에 복사
+    for blob_id, derivatives, metadata in ImageBlob.objects.filter(
+        pk__in=object_ids
+    ).values_list("pk", "image_derivatives", "image_metadata"):
+        updated = ImageBlobService.update_references(
+            blob_id, image_derivatives=derivatives, image_metadata=metadata
+        )
+        for model, ids in updated.items():
+            derivatives_generated.send(sender=model, object_ids=ids)
+
+
+@receiver(post_delete, sender="market.ServiceImage")
+@receiver(post_delete, sender="market.ServiceOptionImage")
+@receiver(post_delete, sender="order.OrderImage")
+def image_blob_reference_deleted(sender, instance, **kwargs) -> None:
+    # 참조가 없어진 blob은 파일과 함께 삭제
+    if instance.image_blob_id is not None:
+        ImageBlobService.release(instance.image_blob_id)
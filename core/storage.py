@@ -0,0 +1,327 @@
+import mimetypes
+import os
+import shutil
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+# DeleteObjects 요청 1번에 삭제할 수 있는 최대 key 개수 (S3 제한)
+DELETE_OBJECTS_MAX_KEYS = 1000
+# ListObjectsV2 요청 1번에 조회할 수 있는 최대 key 개수 (S3 제한)
+LIST_OBJECTS_MAX_KEYS = 1000
+
+
+class StorageObject(NamedTuple):
+    size: int
+    content_type: Optional[str]
+
+
+class ListedObject(NamedTuple):
+    key: str
+    size: int
+    last_modified: datetime
+
+
+class StorageGateway(ABC):
+    """
+    storage 파일을 key 단위로 한번에 처리하는 기본 클래스
+    파일 저장, 조회는 default_storage(django-storages)를 사용하고,
+    여러 파일의 삭제, 조회, 복사와 presigned 업로드처럼 storage API를 직접 사용하는 작업은 이 클래스를 사용합니다.
+    """
+
+    @abstractmethod
+    def delete_many(self, keys: Sequence[str]) -> Dict[str, str]:
+        """
+        key 목록을 삭제하고, 삭제하지 못한 key : 에러 메시지를 반환
+        """
+
+    @abstractmethod
+    def head_many(self, keys: Sequence[str]) -> Dict[str, Optional[StorageObject]]:
+        """
+        key 목록의 파일 정보를 반환 (없는 파일은 None)
+        """
+
+    @abstractmethod
+    def copy_many(self, pairs: Sequence[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        (원본 key, 대상 key) 목록을 복사하고, 복사하지 못한 대상 key : 에러 메시지를 반환
+        """
+
+    @abstractmethod
+    def create_presigned_post(
+        self, key: str, content_type: str, max_size: int, expires_in: int
+    ) -> Dict[str, Any]:
+        """
+        클라이언트가 key에 파일을 직접 업로드할 수 있는 {"url", "fields"} 반환
+        """
+
+    @abstractmethod
+    def list_pages(
+        self, prefix: str, page_size: int = LIST_OBJECTS_MAX_KEYS
+    ) -> Iterator[List[ListedObject]]:
+        """
+        prefix로 시작하는 파일 목록을 page_size개씩 반환 (전체 목록을 메모리에 올리지 않음)
+        """
+
+
+class S3StorageGateway(StorageGateway):
+    """
+    프로세스에서 공유하는 S3 client를 사용하는 gateway
+    boto3 client는 thread-safe하므로 요청마다 새로 만들지 않고 재사용하며,
+    HTTP connection pool 크기는 STORAGE_MAX_POOL_CONNECTIONS로 지정합니다.
+    AWS_S3_ENDPOINT_URL을 지정하면 MinIO 등 S3 호환 storage를 사용할 수 있습니다.
+    """
+
+    def __init__(self, client=None, bucket: Optional[str] = None):
+        self.max_workers: int = settings.STORAGE_MAX_POOL_CONNECTIONS
+        self.client = client or boto3.client(
+            "s3",
+            region_name=settings.AWS_S3_REGION_NAME,
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            config=Config(
+                signature_version=settings.AWS_S3_SIGNATURE_VERSION or "s3v4",
+                max_pool_connections=self.max_workers,
+                retries={"mode": "standard", "max_attempts": 3},
+            ),
+        )
+        self.bucket: str = bucket or settings.AWS_STORAGE_BUCKET_NAME
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _map(self, func: Callable, items: Sequence) -> List:
+        # key별 요청(HEAD, COPY)은 connection pool 크기만큼 동시에 보냄
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="storage-gateway"
+                )
+        return list(self._executor.map(func, items))
+
+    def delete_many(self, keys: Sequence[str]) -> Dict[str, str]:
+        keys = list(dict.fromkeys(keys))
+        failed: Dict[str, str] = {}
+        for start in range(0, len(keys), DELETE_OBJECTS_MAX_KEYS):
+            chunk: List[str] = keys[start : start + DELETE_OBJECTS_MAX_KEYS]
+            try:
+                response = self.client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={
+                        "Objects": [{"Key": key} for key in chunk],
+                        "Quiet": True,  # 실패한 key만 응답
+                    },
+                )
+            except Exception as e:
+                failed.update({key: str(e) for key in chunk})
+                continue
+            for error in response.get("Errors", []):
+                failed[error.get("Key")] = error.get("Message") or error.get("Code")
+        return failed
+
+    def _head(self, key: str) -> Optional[StorageObject]:
+        try:
+            head: Dict[str, Any] = self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise e
+        return StorageObject(
+            size=head["ContentLength"], content_type=head.get("ContentType")
+        )
+
+    def head_many(self, keys: Sequence[str]) -> Dict[str, Optional[StorageObject]]:
+        keys = list(dict.fromkeys(keys))
+        return dict(zip(keys, self._map(self._head, keys)))
+
+    def _copy(self, pair: Tuple[str, str]) -> Optional[str]:
+        source, destination = pair
+        try:
+            self.client.copy_object(
+                Bucket=self.bucket,
+                Key=destination,
+                CopySource={"Bucket": self.bucket, "Key": source},
+            )
+        except ClientError as e:
+            return str(e)
+        return None
+
+    def copy_many(self, pairs: Sequence[Tuple[str, str]]) -> Dict[str, str]:
+        pairs = list(pairs)
+        return {
+            destination: error
+            for (_, destination), error in zip(pairs, self._map(self._copy, pairs))
+            if error is not None
+        }
+
+    def create_presigned_post(
+        self, key: str, content_type: str, max_size: int, expires_in: int
+    ) -> Dict[str, Any]:
+        # 파일 크기, Content-Type 제한은 S3가 업로드 요청을 받을 때 검사
+        presigned_post: Dict[str, Any] = self.client.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, max_size],
+            ],
+            ExpiresIn=expires_in,
+        )
+        return {"url": presigned_post["url"], "fields": presigned_post["fields"]}
+
+    def list_pages(
+        self, prefix: str, page_size: int = LIST_OBJECTS_MAX_KEYS
+    ) -> Iterator[List[ListedObject]]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": min(page_size, LIST_OBJECTS_MAX_KEYS)},
+        ):
+            contents: List[Dict[str, Any]] = page.get("Contents", [])
+            if contents:
+                yield [
+                    ListedObject(
+                        key=item["Key"],
+                        size=item["Size"],
+                        last_modified=item["LastModified"],
+                    )
+                    for item in contents
+                ]
+
+
+class LocalStorageGateway(StorageGateway):
+    """
+    로컬 디렉토리를 storage로 사용하는 gateway (테스트, 로컬 개발용)
+    Content-Type은 파일 확장자로 판단합니다.
+    """
+
+    def __init__(self, location: Optional[str] = None):
+        self.location: str = os.path.abspath(
+            location or settings.STORAGE_GATEWAY_LOCAL_ROOT
+        )
+
+    def path(self, key: str) -> str:
+        path: str = os.path.abspath(os.path.join(self.location, key))
+        if os.path.commonpath([self.location, path]) != self.location:
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    def delete_many(self, keys: Sequence[str]) -> Dict[str, str]:
+        failed: Dict[str, str] = {}
+        for key in dict.fromkeys(keys):
+            try:
+                os.remove(self.path(key))
+            except FileNotFoundError:
+                pass  # S3와 같이 없는 파일 삭제는 성공으로 처리
+            except (OSError, ValueError) as e:
+                failed[key] = str(e)
+        return failed
+
+    def head_many(self, keys: Sequence[str]) -> Dict[str, Optional[StorageObject]]:
+        result: Dict[str, Optional[StorageObject]] = {}
+        for key in keys:
+            path: str = self.path(key)
+            result[key] = (
+                StorageObject(
+                    size=os.path.getsize(path),
+                    content_type=mimetypes.guess_type(path)[0],
+                )
+                if os.path.isfile(path)
+                else None
+            )
+        return result
+
+    def copy_many(self, pairs: Sequence[Tuple[str, str]]) -> Dict[str, str]:
+        failed: Dict[str, str] = {}
+        for source, destination in pairs:
+            try:
+                destination_path: str = self.path(destination)
+                os.makedirs(os.path.dirname(destination_path), exist_ok=True)
+                shutil.copyfile(self.path(source), destination_path)
+            except (OSError, ValueError) as e:
+                failed[destination] = str(e)
+        return failed
+
+    def create_presigned_post(
+        self, key: str, content_type: str, max_size: int, expires_in: int
+    ) -> Dict[str, Any]:
+        # 로컬 storage는 업로드 URL이 없으므로 파일 경로를 반환
+        return {
+            "url": f"file://{self.path(key)}",
+            "fields": {"key": key, "Content-Type": content_type},
+        }
+
+    def list_pages(
+        self, prefix: str, page_size: int = LIST_OBJECTS_MAX_KEYS
+    ) -> Iterator[List[ListedObject]]:
+        page: List[ListedObject] = []
+        for directory, _, filenames in os.walk(self.location):
+            for filename in sorted(filenames):
+                path: str = os.path.join(directory, filename)
+                key: str = os.path.relpath(path, self.location).replace(os.sep, "/")
+                if not key.startswith(prefix):
+                    continue
+                stat = os.stat(path)
+                page.append(
+                    ListedObject(
+                        key=key,
+                        size=stat.st_size,
+                        last_modified=datetime.fromtimestamp(
+                            stat.st_mtime, tz=timezone.utc
+                        ),
+                    )
+                )
+                if len(page) >= page_size:
+                    yield page
+                    page = []
+        if page:
+            yield page
+
+
+_gateway: Optional[StorageGateway] = None
+_lock = threading.Lock()
+
+
+def get_storage_gateway() -> StorageGateway:
+    """
+    프로세스에서 공유하는 storage gateway (STORAGE_GATEWAY_BACKEND 설정으로 구현 클래스 지정)
+    """
+    global _gateway
+    with _lock:
+        if _gateway is None:
+            gateway_class = import_string(settings.STORAGE_GATEWAY_BACKEND)
+            _gateway = gateway_class()
+        return _gateway
+
+
+@receiver(setting_changed)
+def reset_storage_gateway(setting: str, **kwargs) -> None:
+    # 테스트에서 override_settings로 설정이 바뀌면 gateway를 다시 생성
+    global _gateway
+    if setting.startswith("STORAGE_") or setting.startswith("AWS_"):
+        with _lock:
+            _gateway = None
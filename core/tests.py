@@ -0,0 +1,371 @@
+import json
+import logging
+import marshal
+import os
+import shutil
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.http import HttpResponse, JsonResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from config.middleware.query_timing_middleware import QueryTimingMiddleware
+from config.middleware.request_logging_middleware import (
+    RequestLoggingMiddleware,
+    RequestLogStats,
+)
+from core.benchmarks import BenchmarkBaseline, EndpointBenchmark
+from core.log_handlers import BackgroundQueueHandler
+from core.metrics import MmapedSeries, RequestMetrics
+from core.profiling import ProfileUploadPool, RequestProfileService
+from core.seeding import SEED_PHASES, SEED_SCALES, MarketplaceSeeder
+from market.models import Service, ServiceCard
+from order.models import Order
+from users.models.user import User
+
+
+class RequestLoggingTestCase(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        RequestLogStats.reset()
+
+    def get_logged(self, middleware, request):
+        with patch(
+            "config.middleware.request_logging_middleware.logger.log"
+        ) as mock_log:
+            middleware(request)
+        return [call.kwargs["extra"]["log_data"] for call in mock_log.call_args_list]
+
+    @override_settings(
+        REQUEST_LOG_BODY_SIZE=100,
+        REQUEST_LOG_SAMPLE_RATE=1.0,
+        REQUEST_LOG_ROUTE_SAMPLE_RATES={"/api/market/services": 0.0},
+    )
+    def test_request_logging(self):
+        # 본문은 앞부분만 기록하고, Authorization 헤더는 가려야 함
+        large = {"results": [{"service_title": "x" * 50}] * 100}
+        middleware = RequestLoggingMiddleware(lambda request: JsonResponse(large))
+        request = self.factory.post(
+            "/api/market",
+            data=json.dumps({"market_name": "a" * 200}),
+            content_type="application/json",
+            HTTP_AUTHORIZATION="Bearer secret-token",
+        )
+        [log_data] = self.get_logged(middleware, request)
+        self.assertEqual(log_data["request"]["headers"]["Authorization"], "[REDACTED]")
+        self.assertNotIn("secret-token", json.dumps(log_data))
+        self.assertTrue(log_data["request"]["body"].startswith('{"market_name": "aaa'))
+        self.assertTrue(log_data["response"]["body"].endswith("... [Truncated]"))
+        self.assertEqual(
+            len(log_data["response"]["body"]), 100 + len("... [Truncated]")
+        )
+        self.assertEqual(log_data["response"]["size"], len(json.dumps(large)))
+
+        # 샘플링 비율이 0인 경로는 오류 응답만 기록
+        middleware = RequestLoggingMiddleware(lambda request: HttpResponse("ok"))
+        self.assertEqual(
+            self.get_logged(middleware, self.factory.get("/api/market/services")), []
+        )
+        middleware = RequestLoggingMiddleware(
+            lambda request: HttpResponse("error", status=500)
+        )
+        [log_data] = self.get_logged(
+            middleware, self.factory.get("/api/market/services")
+        )
+        self.assertEqual(log_data["status_code"], 500)
+
+        # middleware가 사용한 시간 측정
+        stats = RequestLogStats.get_stats()
+        self.assertEqual(stats["requests"], 3)
+        self.assertEqual(stats["logged"], 2)
+        self.assertGreater(stats["overhead_seconds"], 0)
+
+    def test_background_queue_handler(self):
+        # writer thread가 JSON 1줄씩 출력하고, queue가 가득 차면 로그를 버려야 함
+        stream = StringIO()
+        handler = BackgroundQueueHandler(maxsize=10, stream=stream)
+        test_logger = logging.getLogger("core.tests.request_log")
+        test_logger.propagate = False
+        test_logger.addHandler(handler)
+        self.addCleanup(test_logger.removeHandler, handler)
+
+        test_logger.warning("request", extra={"log_data": {"path": "/api/orders"}})
+        handler.stop()
+        line = json.loads(stream.getvalue())
+        self.assertEqual(line["path"], "/api/orders")
+        self.assertEqual(line["level"], "WARNING")
+
+        # writer thread가 멈춘 상태에서는 queue 크기만큼만 보관
+        for _ in range(15):
+            test_logger.warning("request")
+        self.assertEqual(handler.dropped, 5)
+
+
+class QueryTimingTestCase(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def run_middleware(self, query_count: int):
+        def view(request):
+            for _ in range(query_count):
+                User.objects.exists()
+            return HttpResponse("ok")
+
+        request = self.factory.get("/api/orders")
+        with patch(
+            "config.middleware.query_timing_middleware.logger.warning"
+        ) as mock_warning:
+            response = QueryTimingMiddleware(view)(request)
+        return request, response, mock_warning
+
+    @override_settings(
+        QUERY_TIMING_TOP_N=2,
+        QUERY_TIMING_MAX_QUERIES=3,
+        QUERY_TIMING_MAX_DURATION_MS=1000,
+    )
+    def test_query_timing(self):
+        # SQL 개수와 시간을 Server-Timing 헤더로 반환
+        request, response, mock_warning = self.run_middleware(3)
+        self.assertEqual(request.query_stats["count"], 3)
+        self.assertRegex(
+            response.headers["Server-Timing"],
+            r'^db;dur=[\d.]+;desc="3 queries", app;dur=[\d.]+$',
+        )
+        mock_warning.assert_not_called()
+
+        # SQL 개수가 기준을 넘으면 가장 느린 SQL과 함께 경고 로그
+        request, response, mock_warning = self.run_middleware(4)
+        log_data = mock_warning.call_args.kwargs["extra"]["log_data"]
+        self.assertEqual(log_data["queries"]["count"], 4)
+        self.assertEqual(len(log_data["queries"]["slowest"]), 2)
+        self.assertIn('FROM "users"', log_data["queries"]["slowest"][0]["sql"])
+
+
+class RequestMetricsTestCase(SimpleTestCase):
+    def setUp(self):
+        self.metrics_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.metrics_dir, ignore_errors=True)
+
+    def test_request_metrics(self):
+        with override_settings(METRICS_DIR=self.metrics_dir, METRICS_TOKEN="token"):
+            # middleware가 URL 이름, 응답 상태별로 기록
+            self.client.get("/api/core/health-check")
+            self.client.get("/api/core/health-check")
+            self.client.get("/api/not-found")
+            RequestMetrics.observe("order", 201, 0.3)
+            RequestMetrics.observe("order", 201, 20)
+
+            # 다른 worker 프로세스의 파일도 합산
+            other = MmapedSeries(os.path.join(self.metrics_dir, "metrics_1.db"))
+            other.add(RequestMetrics.get_key("order", 201), 0, 0.001)
+            other.close()
+
+            totals = RequestMetrics.collect()
+            self.assertEqual(sum(totals[("health_check", "2xx")][:-1]), 2)
+            self.assertEqual(sum(totals[("unmatched", "4xx")][:-1]), 1)
+            self.assertEqual(sum(totals[("order", "2xx")][:-1]), 3)
+            self.assertAlmostEqual(totals[("order", "2xx")][-1], 20.301)
+
+            response = self.client.get("/api/core/metrics")
+            self.assertEqual(response.status_code, 403)
+            response = self.client.get(
+                "/api/core/metrics", HTTP_AUTHORIZATION="Bearer wrong"
+            )
+            self.assertEqual(response.status_code, 403)
+            response = self.client.get(
+                "/api/core/metrics", HTTP_AUTHORIZATION="Bearer token"
+            )
+            self.assertEqual(response.status_code, 200)
+            text = response.content.decode()
+            self.assertIn(
+                'upcy_http_request_duration_seconds_bucket{route="order",status="2xx",le="0.5"} 2',
+                text,
+            )
+            self.assertIn(
+                'upcy_http_request_duration_seconds_bucket{route="order",status="2xx",le="+Inf"} 3',
+                text,
+            )
+            self.assertIn(
+                'upcy_http_request_duration_seconds_count{route="health_check",status="2xx"} 2',
+                text,
+            )
+            self.assertIn(
+                'upcy_http_request_duration_seconds_estimate{route="order",quantile="0.99"} 10.000000',
+                text,
+            )
+
+    def test_request_metrics_without_token(self):
+        # METRICS_TOKEN이 없으면 DEBUG 환경에서만 조회 가능
+        with override_settings(METRICS_DIR=self.metrics_dir, METRICS_TOKEN=None):
+            response = self.client.get("/api/core/metrics")
+            self.assertEqual(response.status_code, 403)
+            with override_settings(DEBUG=True):
+                response = self.client.get("/api/core/metrics")
+            self.assertEqual(response.status_code, 200)
+
+
+class RequestProfilingTestCase(TestCase):
+    def setUp(self):
+        storage_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, storage_dir, ignore_errors=True)
+        storage_patcher = patch(
+            "core.profiling.default_storage", FileSystemStorage(location=storage_dir)
+        )
+        storage_patcher.start()
+        self.addCleanup(storage_patcher.stop)
+        self.token = RequestProfileService.create_token()
+
+    def test_request_profiling(self):
+        # 유효한 토큰이 있는 요청만 profiling
+        response = self.client.get(
+            "/api/market/services", HTTP_X_PROFILE_TOKEN="invalid"
+        )
+        self.assertNotIn("X-Profile-Id", response.headers)
+        response = self.client.get(
+            "/api/market/services", HTTP_X_PROFILE_TOKEN=self.token
+        )
+        profile_id = response.headers["X-Profile-Id"]
+
+        # 다운로드에도 토큰 필요
+        url = f"/api/core/profiles/{profile_id}"
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        # 함수별 통계와 SQL 기록을 함께 저장
+        response = self.client.get(url, HTTP_X_PROFILE_TOKEN=self.token)
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(data["route"], "service_list_without_market_uuid")
+        self.assertGreater(data["queries"]["count"], 0)
+        self.assertEqual(len(data["queries"]["statements"]), data["queries"]["count"])
+        self.assertIn("cumulative", data["stats"])
+
+        # pstats 파일
+        response = self.client.get(
+            url, {"type": "prof"}, HTTP_X_PROFILE_TOKEN=self.token
+        )
+        stats = marshal.loads(b"".join(response.streaming_content))
+        self.assertTrue(any(func[2] == "get" for func in stats))
+
+        response = self.client.get(
+            f"/api/core/profiles/{'0' * 32}", HTTP_X_PROFILE_TOKEN=self.token
+        )
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(PROFILE_SAMPLE_RATE=1.0)
+    def test_sampled_request_profiling(self):
+        # 샘플링된 요청은 응답 이후에 결과를 저장하고, 결과 id를 응답하지 않음
+        with patch.object(RequestProfileService, "save") as mock_save:
+            response = self.client.get("/api/market/services")
+            self.assertNotIn("X-Profile-Id", response.headers)
+            ProfileUploadPool.shutdown()
+        mock_save.assert_called_once()
+        profile_id, _, request_data = mock_save.call_args.args
+        self.assertEqual(request_data["route"], "service_list_without_market_uuid")
+
+        # 저장 대기 중인 결과가 너무 많으면 저장하지 않음
+        with patch.object(ProfileUploadPool, "_pending", ProfileUploadPool.MAX_PENDING):
+            self.assertIsNone(ProfileUploadPool.submit(mock_save))
+
+
+class BenchmarkTestCase(TestCase):
+    def test_benchmark(self):
+        # seed 데이터 생성 (서비스 카드도 함께 생성)
+        scale = SEED_SCALES["tiny"]
+        counts = MarketplaceSeeder(
+            scale, seed=1, batch_size=7, log=lambda message: None
+        ).seed_all()
+        services = scale.reformers * scale.services_per_reformer
+        self.assertEqual(counts["users"], scale.reformers + scale.customers)
+        self.assertEqual(Service.objects.count(), services)
+        self.assertEqual(ServiceCard.objects.filter(is_stale=False).count(), services)
+        self.assertEqual(Order.objects.count(), scale.orders)
+
+        results = EndpointBenchmark(
+            iterations=3, warmup=1, allocation_iterations=1
+        ).run(names=["catalog", "orders_customer", "order_create"])
+        self.assertEqual(set(results), {"catalog", "orders_customer", "order_create"})
+        for result in results.values():
+            self.assertEqual(result["errors"], 0)
+            self.assertEqual(result["requests"], 3)
+            self.assertLessEqual(result["p50_ms"], result["p99_ms"])
+        self.assertGreater(results["orders_customer"]["queries"], 0)
+
+        # baseline 저장 후 비교
+        baseline_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, baseline_dir, ignore_errors=True)
+        path = os.path.join(baseline_dir, "baseline.json")
+        BenchmarkBaseline.save(path, results)
+        baseline = BenchmarkBaseline.load(path)["results"]
+        self.assertEqual(BenchmarkBaseline.compare(results, baseline), [])
+
+        # DB를 변경하는 요청은 rollback되어야 하고, 대기 중인 주문이 적어도 실패하지 않아야 함
+        statuses = list(
+            Order.objects.order_by("pk").values_list("pk", "current_status")
+        )
+        mutating_results = EndpointBenchmark(
+            iterations=10, warmup=1, allocation_iterations=1
+        ).run(names=["order_create", "order_status"])
+        self.assertEqual(
+            [result["errors"] for result in mutating_results.values()], [0, 0]
+        )
+        self.assertEqual(Order.objects.count(), scale.orders)
+        self.assertEqual(
+            list(Order.objects.order_by("pk").values_list("pk", "current_status")),
+            statuses,
+        )
+
+        regressed = {
+            "order_create": {
+                **results["order_create"],
+                "queries": results["order_create"]["queries"] + 1,
+                "p95_ms": results["order_create"]["p95_ms"] * 2 + 10,
+            }
+        }
+        self.assertEqual(len(BenchmarkBaseline.compare(regressed, baseline)), 2)
+
+
+class SeedMarketplaceTestCase(TestCase):
+    def get_snapshot(self):
+        return (
+            list(
+                Service.objects.order_by("service_uuid").values_list(
+                    "service_uuid", "service_title", "basic_price"
+                )
+            ),
+            list(
+                Order.objects.order_by("order_uuid").values_list(
+                    "order_uuid",
+                    "service__service_uuid",
+                    "orderer__email",
+                    "total_price",
+                    "current_status",
+                )
+            ),
+        )
+
+    def test_seed_marketplace(self):
+        scale = SEED_SCALES["tiny"]
+        call_command(
+            "seed_marketplace", scale="tiny", seed=3, batch_size=4, stdout=StringIO()
+        )
+        self.assertEqual(User.objects.count(), scale.reformers + scale.customers)
+        self.assertEqual(Order.objects.count(), scale.orders)
+        self.assertEqual(
+            ServiceCard.objects.filter(is_stale=False).count(),
+            scale.reformers * scale.services_per_reformer,
+        )
+        snapshot = self.get_snapshot()
+
+        # 작업 순서가 달라도(여러 process에서 실행) 같은 seed면 같은 데이터
+        User.objects.all().delete()
+        self.assertEqual(Service.objects.count(), 0)
+        seeder = MarketplaceSeeder(scale, seed=3, batch_size=4)
+        for phase in SEED_PHASES:
+            tasks = [task for target in phase for task in seeder.get_tasks(target)]
+            for task in reversed(tasks):
+                seeder.run_task(task)
+        seeder.finish()
+        self.assertEqual(self.get_snapshot(), snapshot)
@@ -0,0 +1,164 @@
+import hashlib
+import os
+import tempfile
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
+
+from core.imaging import IMAGE_SIGNATURE_LENGTH, detect_image_format, read_image_size
+
+# 이미지 크기 정보를 찾을 때까지 보관하는 header 최대 길이
+IMAGE_HEADER_MAX_SIZE = 256 * 1024
+
+
+class ImageTemporaryUploadedFile(UploadedFile):
+    """
+    ImageUploadHandler가 받은 업로드 파일
+    spool 디렉토리의 임시 파일에 저장되며, 업로드 받는 동안 계산한 정보를 함께 가지고 있습니다.
+    - content_hash : 파일 내용의 sha256 hex
+    - image_format : jpeg, png, webp, heic
+    - image_size : (width, height), heic는 None
+    """
+
+    def __init__(self, name, content_type, size, charset, content_type_extra=None):
+        spool_dir: str = str(settings.UPLOAD_SPOOL_DIR)
+        os.makedirs(spool_dir, exist_ok=True)
+        file = tempfile.NamedTemporaryFile(
+            prefix="incoming-", suffix=".upload", dir=spool_dir
+        )
+        super().__init__(file, name, content_type, size, charset, content_type_extra)
+        self.content_hash: Optional[str] = None
+        self.image_format: Optional[str] = None
+        self.image_size: Optional[Tuple[int, int]] = None
+
+    def temporary_file_path(self) -> str:
+        return self.file.name
+
+    def close(self):
+        try:
+            return self.file.close()
+        except FileNotFoundError:
+            # spool_files가 파일을 옮긴 경우
+            pass
+
+
+class ImageUploadHandler(FileUploadHandler):
+    """
+    이미지 업로드 전용 파일 업로드 핸들러
+    요청 본문을 읽는 동안 파일을 spool 디렉토리의 임시 파일에 저장하고 sha256 해시를 계산합니다.
+    다음과 같은 경우 요청 본문을 끝까지 읽지 않고 업로드를 중단합니다.
+    - 요청 전체 크기가 IMAGE_UPLOAD_MAX_FILES * IMAGE_UPLOAD_MAX_SIZE를 넘는 경우 (본문을 읽기 전)
+    - 파일 개수가 IMAGE_UPLOAD_MAX_FILES를 넘는 경우
+    - 파일 크기가 IMAGE_UPLOAD_MAX_SIZE를 넘는 순간
+    - 파일 시그니처가 jpeg, png, webp, heic가 아니거나, header의 이미지 크기가 IMAGE_UPLOAD_MAX_PIXELS를 넘는 경우
+    중단한 이유는 request.upload_rejection에 저장됩니다. (ImageUploadViewMixin이 400 응답으로 변환)
+    """
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.max_size: int = settings.IMAGE_UPLOAD_MAX_SIZE
+        self.max_pixels: int = settings.IMAGE_UPLOAD_MAX_PIXELS
+        self.file_count: int = 0
+        self.upload_file: Optional[ImageTemporaryUploadedFile] = None
+
+    def reject(self, message: str) -> None:
+        if self.request is not None:
+            self.request.upload_rejection = message
+        if self.upload_file is not None:
+            self.upload_file.close()  # 임시 파일 삭제
+            self.upload_file = None
+        raise StopUpload(connection_reset=True)
+
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary, encoding=None
+    ):
+        max_request_size: int = settings.IMAGE_UPLOAD_MAX_FILES * self.max_size + (
+            settings.DATA_UPLOAD_MAX_MEMORY_SIZE or 0
+        )
+        if content_length > max_request_size:
+            # 본문을 읽지 않고 빈 데이터로 처리
+            if self.request is not None:
+                self.request.upload_rejection = "Request body is too large"
+            return QueryDict(encoding=encoding), MultiValueDict()
+        return None
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.file_count += 1
+        if self.file_count > settings.IMAGE_UPLOAD_MAX_FILES:
+            self.reject(
+                f"Cannot upload more than {settings.IMAGE_UPLOAD_MAX_FILES} images at once"
+            )
+
+        self.upload_file = ImageTemporaryUploadedFile(
+            self.file_name, self.content_type, 0, self.charset, self.content_type_extra
+        )
+        self.hash = hashlib.sha256()
+        self.size: int = 0
+        self.header: bytearray = bytearray()
+        self.header_checked: bool = False
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> None:
+        self.size += len(raw_data)
+        if self.size > self.max_size:
+            self.reject(
+                f"Image file size must be less than {self.max_size // (1024 * 1024)}MB"
+            )
+
+        if not self.header_checked:
+            self.header += raw_data
+            self.check_header(complete=False)
+
+        self.hash.update(raw_data)
+        self.upload_file.write(raw_data)
+        return None
+
+    def check_header(self, complete: bool) -> None:
+        """
+        header로 이미지 형식과 크기 검사, 검사가 끝나면 header를 더 이상 보관하지 않음
+        complete : 파일을 모두 받았는지 여부 (더 받을 데이터가 없으면 바로 판단)
+        """
+        header = bytes(self.header)
+        if len(header) < IMAGE_SIGNATURE_LENGTH and not complete:
+            return
+
+        image_format: Optional[str] = detect_image_format(header)
+        if image_format is None:
+            self.reject("Uploaded file is not a supported image")
+        self.upload_file.image_format = image_format
+
+        if image_format != "heic":
+            try:
+                image_size = read_image_size(header, image_format)
+            except ValueError:
+                image_size = None
+                complete = True
+            if image_size is None:
+                if complete or len(header) >= IMAGE_HEADER_MAX_SIZE:
+                    self.reject("Uploaded file is not a valid image")
+                return
+
+            width, height = image_size
+            if width <= 0 or height <= 0:
+                self.reject("Uploaded file is not a valid image")
+            if width * height > self.max_pixels:
+                self.reject("Image dimensions are too large")
+            self.upload_file.image_size = image_size
+
+        self.header_checked = True
+        self.header = bytearray()
+
+    def file_complete(self, file_size: int) -> ImageTemporaryUploadedFile:
+        if not self.header_checked:
+            self.check_header(complete=True)
+
+        self.upload_file.flush()
+        self.upload_file.seek(0)
+        self.upload_file.size = file_size
+        self.upload_file.content_hash = self.hash.hexdigest()
+        file, self.upload_file = self.upload_file, None
+        return file
@@ -0,0 +1,372 @@
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import List, Optional, Sequence
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import Storage, default_storage
+from django.db import connections, models, transaction
+from django.db.models import F
+from django.dispatch import Signal
+from django.utils import timezone
+
+from core.blobs import ImageBlobService, uses_image_blob
+from core.deletions import StorageDeletionService
+from core.derivatives import get_derivatives_field_name, get_metadata_field_name
+from core.models import ImageBlob, UploadStatus, UploadTask
+
+logger = logging.getLogger(__name__)
+
+# storage 업로드가 끝난 이미지 row가 있을 때 발생하는 signal
+# sender : 이미지 모델 클래스, object_ids : 업로드가 끝난 row pk 리스트
+upload_completed = Signal()
+
+# 재시도 횟수를 넘겨 업로드에 실패한 이미지 row가 있을 때 발생하는 signal
+# sender : 이미지 모델 클래스, object_ids : 업로드에 실패한 row pk 리스트
+upload_failed = Signal()
+
+
+def spool_files(uploaded_files: Sequence) -> List[str]:
+    """
+    업로드된 파일을 로컬 spool 디렉토리에 저장하고 경로를 반환
+    fsync까지 끝난 뒤 반환하므로, 응답 이후 서버가 종료되더라도 worker가 다시 업로드할 수 있음
+    """
+    spool_dir: str = str(settings.UPLOAD_SPOOL_DIR)
+    os.makedirs(spool_dir, exist_ok=True)
+
+    paths: List[str] = []
+    for uploaded_file in uploaded_files:
+        path: str = os.path.join(spool_dir, uuid.uuid4().hex)
+        if not _link_temporary_file(uploaded_file, path):
+            with open(path, "wb") as spool:
+                for chunk in uploaded_file.chunks():
+                    spool.write(chunk)
+                spool.flush()
+                os.fsync(spool.fileno())
+        paths.append(path)
+
+    # 새로 만든 파일의 디렉토리 엔트리까지 디스크에 기록
+    dir_fd: int = os.open(spool_dir, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+    return paths
+
+
+def _link_temporary_file(uploaded_file, path: str) -> bool:
+    """
+    업로드 핸들러가 같은 파일 시스템에 저장한 임시 파일은 복사하지 않고 hard link 생성
+    """
+    try:
+        os.link(uploaded_file.temporary_file_path(), path)
+    except (AttributeError, OSError):
+        return False
+
+    fd: int = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return True
+
+
+def remove_spool_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class ImageUploadService:
+    """
+    이미지 업로드 요청 처리 서비스
+    요청 처리 중에는 파일을 로컬 spool 디렉토리에 저장하고 이미지 row를 업로드 대기(pending) 상태로 생성합니다.
+    storage(S3) 업로드는 트랜잭션이 커밋된 후 백그라운드 worker가 처리합니다.
+    """
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def enqueue(
+        instances: Sequence[models.Model],
+        uploaded_files: Sequence,
+        field_name: str = "image",
+    ) -> List[models.Model]:
+        """
+        instances : 아직 저장되지 않은 이미지 모델 인스턴스 (uploaded_files와 같은 순서)
+        IMAGE_BLOB_TARGETS 모델은 내용이 같은 이미지를 storage에 1번만 업로드합니다.
+        """
+        if not instances:
+            return []
+        model = type(instances[0])
+        if uses_image_blob(model):
+            return ImageUploadService.enqueue_blobs(
+                instances, uploaded_files, field_name
+            )
+
+        spool_paths: List[str] = spool_files(uploaded_files)
+        for instance, uploaded_file in zip(instances, uploaded_files):
+            # storage key를 미리 계산해서 저장 (파일은 worker가 업로드)
+            field = instance._meta.get_field(field_name)
+            setattr(
+                instance,
+                field_name,
+                field.generate_filename(instance, uploaded_file.name),
+            )
+            instance.upload_status = UploadStatus.PENDING
+        # storage는 같은 key의 파일을 덮어쓰므로, 같은 key의 삭제 요청은 취소
+        StorageDeletionService.cancel(
+            [getattr(instance, field_name).name for instance in instances]
+        )
+        created: List[models.Model] = model.objects.bulk_create(instances)
+        ImageUploadService.create_tasks(created, spool_paths, field_name)
+        return created
+
+    @staticmethod
+    def enqueue_blobs(
+        instances: Sequence[models.Model],
+        uploaded_files: Sequence,
+        field_name: str = "image",
+    ) -> List[models.Model]:
+        """
+        내용이 같은 이미지는 ImageBlob 1개를 함께 참조하도록 이미지 row 생성
+        storage에 없는 이미지만 spool 후 업로드하고, 이미 업로드된 이미지는 업로드 완료(ready) 상태로 바로 생성합니다.
+        """
+        model = type(instances[0])
+        blobs, uploads = ImageBlobService.acquire(uploaded_files)
+        if uploads:
+            spool_paths: List[str] = spool_files([file for _, file in uploads])
+            upload_blobs: List[ImageBlob] = [blob for blob, _ in uploads]
+            # 업로드에 실패했던 blob은 다시 업로드
+            ImageBlob.objects.filter(pk__in=[blob.pk for blob in upload_blobs]).update(
+                upload_status=UploadStatus.PENDING
+            )
+            for blob in upload_blobs:
+                blob.upload_status = UploadStatus.PENDING
+            StorageDeletionService.cancel([blob.image.name for blob in upload_blobs])
+            ImageUploadService.create_tasks(upload_blobs, spool_paths, "image")
+
+        for instance, blob in zip(instances, blobs):
+            setattr(instance, field_name, blob.image.name)
+            setattr(
+                instance, get_derivatives_field_name(field_name), blob.image_derivatives
+            )
+            setattr(instance, get_metadata_field_name(field_name), blob.image_metadata)
+            instance.image_blob = blob
+            instance.upload_status = blob.upload_status
+        return model.objects.bulk_create(instances)
+
+    @staticmethod
+    def create_tasks(
+        instances: Sequence[models.Model], spool_paths: Sequence[str], field_name: str
+    ) -> None:
+        """
+        spool 파일을 storage에 업로드하는 작업 생성 (트랜잭션이 커밋된 후 worker가 처리)
+        """
+        now = timezone.now()
+        tasks: List[UploadTask] = UploadTask.objects.bulk_create(
+            [
+                UploadTask(
+                    model_label=instance._meta.label,
+                    object_id=instance.pk,
+                    field_name=field_name,
+                    storage_key=getattr(instance, field_name).name,
+                    spool_path=spool_path,
+                    next_attempt_at=now,
+                )
+                for instance, spool_path in zip(instances, spool_paths)
+            ]
+        )
+        task_ids: List[int] = [task.pk for task in tasks]
+        transaction.on_commit(lambda: UploadWorkerPool.submit(task_ids))
+
+
+class UploadWorker:
+    """
+    업로드 작업 처리 클래스
+    storage 인자로 로컬 파일 시스템 storage 등을 넘겨서 테스트할 수 있습니다.
+    """
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def process_task(
+        task_id: int, storage: Optional[Storage] = None
+    ) -> Optional[float]:
+        """
+        업로드 작업 1개를 처리하고, 재시도가 필요하다면 다음 시도까지 기다릴 시간(초)을 반환
+        """
+        storage = storage or default_storage
+        now = timezone.now()
+
+        # 다른 worker가 먼저 가져간 작업은 처리하지 않음 (compare-and-set)
+        claimed: int = UploadTask.objects.filter(
+            pk=task_id,
+            status=UploadTask.Status.PENDING,
+            next_attempt_at__lte=now,
+        ).update(
+            status=UploadTask.Status.PROCESSING,
+            attempts=F("attempts") + 1,
+            updated=now,
+        )
+        if not claimed:
+            return None
+
+        task: UploadTask = UploadTask.objects.get(pk=task_id)
+        model = apps.get_model(task.model_label)
+        try:
+            with open(task.spool_path, "rb") as spool:
+                name: str = storage.save(task.storage_key, File(spool))
+        except Exception as e:
+            return UploadWorker.handle_failure(task, model, e)
+
+        with transaction.atomic():
+            updated: int = model.objects.filter(pk=task.object_id).update(
+                **{task.field_name: name, "upload_status": UploadStatus.READY}
+            )
+            task.delete()
+
+        if updated:
+            upload_completed.send(sender=model, object_ids=[task.object_id])
+        else:
+            # 업로드 도중 이미지 row가 삭제된 경우, 업로드한 파일도 삭제
+            storage.delete(name)
+        remove_spool_file(task.spool_path)
+        return None
+
+    @staticmethod
+    def handle_failure(
+        task: UploadTask, model: type, error: Exception
+    ) -> Optional[float]:
+        now = timezone.now()
+        if task.attempts >= settings.UPLOAD_MAX_ATTEMPTS:
+            logger.error(
+                f"Upload failed after {task.attempts} attempts: {task.storage_key} ({error})"
+            )
+            with transaction.atomic():
+                UploadTask.objects.filter(pk=task.pk).update(
+                    status=UploadTask.Status.FAILED, last_error=str(error), updated=now
+                )
+                model.objects.filter(pk=task.object_id).update(
+                    upload_status=UploadStatus.FAILED
+                )
+            upload_failed.send(sender=model, object_ids=[task.object_id])
+            return None
+
+        # 재시도 간격은 시도 횟수마다 2배씩 증가
+        delay: float = settings.UPLOAD_RETRY_DELAY * 2 ** (task.attempts - 1)
+        logger.warning(
+            f"Upload failed ({task.attempts} attempts), retry in {delay}s: "
+            f"{task.storage_key} ({error})"
+        )
+        UploadTask.objects.filter(pk=task.pk).update(
+            status=UploadTask.Status.PENDING,
+            next_attempt_at=now + timedelta(seconds=delay),
+            last_error=str(error),
+            updated=now,
+        )
+        return delay
+
+    @staticmethod
+    def process_pending(limit: int = 100, storage: Optional[Storage] = None) -> int:
+        """
+        다시 시도할 시각이 지난 업로드 작업을 처리하고, 처리를 시도한 작업 개수를 반환
+        worker가 처리 도중 종료되어 processing 상태로 남은 작업도 다시 처리합니다.
+        """
+        now = timezone.now()
+        UploadTask.objects.filter(
+            status=UploadTask.Status.PROCESSING,
+            updated__lt=now - timedelta(seconds=settings.UPLOAD_TASK_TIMEOUT),
+        ).update(status=UploadTask.Status.PENDING, updated=now)
+
+        task_ids: List[int] = list(
+            UploadTask.objects.filter(
+                status=UploadTask.Status.PENDING, next_attempt_at__lte=now
+            )
+            .order_by("next_attempt_at", "id")
+            .values_list("id", flat=True)[:limit]
+        )
+        for task_id in task_ids:
+            UploadWorker.process_task(task_id, storage=storage)
+        return len(task_ids)
+
+    @staticmethod
+    def cleanup_spool(max_age: int) -> int:
+        """
+        업로드 작업이 없는 오래된 spool 파일 삭제 (요청 트랜잭션이 롤백된 경우 등)
+        """
+        spool_dir: str = str(settings.UPLOAD_SPOOL_DIR)
+        if not os.path.isdir(spool_dir):
+            return 0
+
+        expired_before: float = time.time() - max_age
+        paths: List[str] = [
+            entry.path
+            for entry in os.scandir(spool_dir)
+            if entry.is_file() and entry.stat().st_mtime < expired_before
+        ]
+        in_use = set(
+            UploadTask.objects.filter(spool_path__in=paths).values_list(
+                "spool_path", flat=True
+            )
+        )
+        removed: int = 0
+        for path in paths:
+            if path not in in_use:
+                remove_spool_file(path)
+                removed += 1
+        return removed
+
+
+class UploadWorkerPool:
+    """
+    프로세스별 업로드 worker thread pool
+    트랜잭션 커밋 이후 작업을 넘겨받아 처리하며, 실패한 작업은 대기 시간 이후 다시 처리합니다.
+    UPLOAD_WORKER_THREADS가 0이면 thread를 사용하지 않고 process_uploads 명령어로만 처리합니다.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=settings.UPLOAD_WORKER_THREADS,
+                    thread_name_prefix="upload-worker",
+                )
+            return cls._executor
+
+    @classmethod
+    def submit(cls, task_ids: List[int]) -> None:
+        if settings.UPLOAD_WORKER_THREADS <= 0:
+            return
+        executor: ThreadPoolExecutor = cls.get_executor()
+        for task_id in task_ids:
+            executor.submit(cls.run, task_id)
+
+    @classmethod
+    def run(cls, task_id: int) -> None:
+        delay: Optional[float] = None
+        try:
+            delay = UploadWorker.process_task(task_id)
+        except Exception:
+            logger.exception(f"Upload worker error (task id: {task_id})")
+        finally:
+            # worker thread에서 사용한 DB connection 정리
+            connections.close_all()
+
+        if delay is not None:
+            timer = threading.Timer(delay, cls.submit, args=([task_id],))
+            timer.daemon = True
+            timer.start()
@@ -1,7 +1,13 @@
 from django.urls import path
 
-from core.views import HealthCheckView
+from core.views import HealthCheckView, MetricsView, ProfileDownloadView
 
 urlpatterns = [
     path("/health-check", HealthCheckView.as_view(), name="health_check"),
+    path("/metrics", MetricsView.as_view(), name="metrics"),
+    path(
+        "/profiles/<str:profile_id>",
+        ProfileDownloadView.as_view(),
+        name="profile_download",
+    ),
 ]
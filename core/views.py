@@ -1,9 +1,18 @@
+import re
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
 from django.shortcuts import render
+from django.utils.crypto import constant_time_compare
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.exceptions import view_exception_handler
+from core.metrics import RequestMetrics
+from core.profiling import RequestProfileService
+
 
 def get_paginated_response(
     *, pagination_class, serializer_class, queryset, request, view
@@ -36,3 +45,57 @@ class HealthCheckView(APIView):
             },
             status=status.HTTP_200_OK,
         )
+
+
+class MetricsView(APIView):
+    """
+    요청 개수, 응답 시간 histogram (Prometheus text 형식)
+    Authorization: Bearer <METRICS_TOKEN> 헤더가 있는 요청만 허용합니다.
+    METRICS_TOKEN을 지정하지 않으면 DEBUG 환경에서만 토큰 없이 조회할 수 있습니다.
+    """
+
+    permission_classes = (AllowAny,)
+    authentication_classes = ()
+
+    @view_exception_handler
+    def get(self, request):
+        token = settings.METRICS_TOKEN
+        if not token:
+            if not settings.DEBUG:
+                raise PermissionError("METRICS_TOKEN is not configured")
+        elif not constant_time_compare(
+            request.headers.get("Authorization", ""), f"Bearer {token}"
+        ):
+            raise PermissionError("Invalid metrics token")
+        return HttpResponse(
+            RequestMetrics.render(), content_type="text/plain; version=0.0.4"
+        )
+
+
+class ProfileDownloadView(APIView):
+    """
+    요청 profiling 결과 다운로드 (X-Profile-Token 헤더 필요)
+    type : json (요청 정보, 함수별 통계, SQL 기록) | prof (pstats 파일)
+    """
+
+    permission_classes = (AllowAny,)
+    authentication_classes = ()
+
+    @view_exception_handler
+    def get(self, request, profile_id):
+        token = request.headers.get("X-Profile-Token")
+        if not token or not RequestProfileService.is_valid_token(token):
+            raise PermissionError("Invalid profile token")
+        if not re.fullmatch(r"[0-9a-f]{32}", profile_id):
+            raise ValueError("Invalid profile id")
+
+        format = request.query_params.get("type", "json")
+        file = RequestProfileService.open(profile_id, format)
+        return FileResponse(
+            file,
+            as_attachment=True,
+            filename=f"{profile_id}.{format}",
+            content_type=(
+                "application/json" if format == "json" else "application/octet-stream"
+            ),
+        )
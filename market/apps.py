@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class MarketConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "market"
+
+    def ready(self):
+        # 서비스 카드 갱신용 signal 등록
+        from market import signals  # noqa: F401
@@ -0,0 +1,168 @@
+import hashlib
+import uuid
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+
+class ServiceResponseCache:
+    """
+    서비스 조회 API(전체 서비스, 마켓별 서비스, 서비스 상세) 응답 캐시
+
+    - 캐시 key는 [버전 토큰 + 요청 경로(market/service uuid) + 정규화된 쿼리 파라미터]로 만듭니다.
+    - 서비스 관련 데이터가 변경되면 버전 토큰을 새로 발급해서 이전 캐시를 모두 무효화합니다.
+      (버전 토큰이 LRU로 삭제되더라도 새 토큰이 발급되므로 오래된 캐시를 다시 사용하지 않음)
+    - 캐시 hit / miss 횟수를 기록하며, 응답의 X-Cache 헤더로도 확인할 수 있습니다.
+    """
+
+    KEY_PREFIX = "market:service_response"
+    VERSION_KEY = f"{KEY_PREFIX}:version"
+    HIT_COUNT_KEY = f"{KEY_PREFIX}:stats:hit"
+    MISS_COUNT_KEY = f"{KEY_PREFIX}:stats:miss"
+
+    # 쿼리 파라미터가 없을 때의 기본값, 기본값과 같은 값이 넘어온 경우 같은 캐시를 사용
+    DEFAULT_QUERY_PARAMS = {"sort": "-created", "temporary": "false"}
+    # true / false 값을 받는 파라미터는 대소문자 구분 없이 사용
+    BOOLEAN_QUERY_PARAMS = ("suspended", "temporary", "count")
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def get_version() -> str:
+        version: Optional[str] = cache.get(ServiceResponseCache.VERSION_KEY)
+        if version is None:
+            version = uuid.uuid4().hex
+            # 다른 요청이 먼저 버전을 만든 경우 그 버전을 사용
+            if not cache.add(ServiceResponseCache.VERSION_KEY, version, timeout=None):
+                version = cache.get(ServiceResponseCache.VERSION_KEY, version)
+        return version
+
+    @staticmethod
+    def invalidate() -> None:
+        """
+        버전 토큰을 새로 발급해서 서비스 응답 캐시를 모두 무효화
+        커밋 이전에 다른 요청이 이전 데이터를 다시 캐시할 수 있으므로, 커밋 이후에 한번 더 무효화합니다.
+        """
+        ServiceResponseCache._bump_version()
+        transaction.on_commit(ServiceResponseCache._bump_version)
+
+    @staticmethod
+    def _bump_version() -> None:
+        cache.set(ServiceResponseCache.VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+    @staticmethod
+    def normalize_query_params(
+        request, allowed_params: Iterable[str]
+    ) -> Tuple[Tuple[str, str], ...]:
+        normalized: Dict[str, str] = {}
+        for param in allowed_params:
+            value: str = request.query_params.get(param, "").strip()
+            if param in ServiceResponseCache.BOOLEAN_QUERY_PARAMS:
+                value = value.lower()
+            if not value or value == ServiceResponseCache.DEFAULT_QUERY_PARAMS.get(
+                param
+            ):
+                continue
+            normalized[param] = value
+        return tuple(sorted(normalized.items()))
+
+    @staticmethod
+    def get_key(request, allowed_params: Iterable[str]) -> str:
+        params = ServiceResponseCache.normalize_query_params(request, allowed_params)
+        # 페이지네이션 링크에 host가 포함되므로 host도 key에 포함
+        raw_key: str = f"{request.get_host()}|{request.path}|{params}"
+        digest: str = hashlib.md5(raw_key.encode("utf-8")).hexdigest()
+        return f"{ServiceResponseCache.KEY_PREFIX}:{ServiceResponseCache.get_version()}:{digest}"
+
+    @staticmethod
+    def get_or_build_facets(
+        request, allowed_params: Iterable[str], build: Callable[[], Any]
+    ) -> Any:
+        """
+        필터 조건별 facet count를 카탈로그 버전 단위로 캐시
+        정렬, 페이지네이션 파라미터는 key에 포함하지 않으므로 페이지를 넘겨도 다시 계산하지 않습니다.
+        """
+        params = ServiceResponseCache.normalize_query_params(request, allowed_params)
+        digest: str = hashlib.md5(str(params).encode("utf-8")).hexdigest()
+        key: str = (
+            f"{ServiceResponseCache.KEY_PREFIX}:facets:"
+            f"{ServiceResponseCache.get_version()}:{digest}"
+        )
+        facets = cache.get(key)
+        if facets is None:
+            facets = build()
+            cache.set(key, facets, timeout=settings.SERVICE_RESPONSE_CACHE_TIMEOUT)
+        return facets
+
+    @staticmethod
+    def get(key: str) -> Any:
+        data = cache.get(key)
+        ServiceResponseCache._count(
+            ServiceResponseCache.MISS_COUNT_KEY
+            if data is None
+            else ServiceResponseCache.HIT_COUNT_KEY
+        )
+        return data
+
+    @staticmethod
+    def set(key: str, data: Any) -> None:
+        cache.set(key, data, timeout=settings.SERVICE_RESPONSE_CACHE_TIMEOUT)
+
+    @staticmethod
+    def _count(key: str) -> None:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 아직 key가 없는 경우
+            if not cache.add(key, 1, timeout=None):
+                cache.incr(key)
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        hit: int = cache.get(ServiceResponseCache.HIT_COUNT_KEY, 0)
+        miss: int = cache.get(ServiceResponseCache.MISS_COUNT_KEY, 0)
+        total: int = hit + miss
+        return {
+            "hit": hit,
+            "miss": miss,
+            "hit_ratio": round(hit / total, 4) if total else 0.0,
+        }
+
+    @staticmethod
+    def reset_stats() -> None:
+        cache.delete_many(
+            [ServiceResponseCache.HIT_COUNT_KEY, ServiceResponseCache.MISS_COUNT_KEY]
+        )
+
+
+def cache_service_response(view_method: Callable) -> Callable:
+    """
+    서비스 조회 View의 GET 메서드에 사용하는 응답 캐시 데코레이터
+    View 클래스의 cache_query_params에 지정된 쿼리 파라미터만 캐시 key에 포함되며,
+    200 응답만 캐시합니다. view_exception_handler 안쪽에 사용해주세요.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs) -> Response:
+        key: str = ServiceResponseCache.get_key(request, self.cache_query_params)
+        cached_data = ServiceResponseCache.get(key)
+        if cached_data is not None:
+            return Response(
+                data=cached_data,
+                status=status.HTTP_200_OK,
+                headers={"X-Cache": "HIT"},
+            )
+
+        response: Response = view_method(self, request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            ServiceResponseCache.set(key, response.data)
+        response["X-Cache"] = "MISS"
+        return response
+
+    return wrapper
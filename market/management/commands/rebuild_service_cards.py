@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from market.services import ServiceCardService
+
+
+class Command(BaseCommand):
+    help = "전체 서비스 조회에 사용하는 서비스 카드를 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale",
+            action="store_true",
+            help="stale 상태인 서비스 카드만 다시 만듭니다.",
+        )
+
+    def handle(self, *args, **options):
+        if options["stale"]:
+            ServiceCardService.refresh_stale_cards()
+            self.stdout.write(self.style.SUCCESS("Stale service cards rebuilt"))
+            return
+
+        built: int = ServiceCardService.refresh_cards()
+        self.stdout.write(self.style.SUCCESS(f"{built} service cards rebuilt"))
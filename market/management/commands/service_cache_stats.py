@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from market.cache import ServiceResponseCache
+
+
+class Command(BaseCommand):
+    help = "서비스 조회 API 응답 캐시의 hit / miss 횟수와 hit ratio를 출력합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="출력 후 hit / miss 횟수를 초기화합니다.",
+        )
+
+    def handle(self, *args, **options):
+        stats = ServiceResponseCache.get_stats()
+        self.stdout.write(
+            f"hit: {stats['hit']}, miss: {stats['miss']}, hit ratio: {stats['hit_ratio']}"
+        )
+        if options["reset"]:
+            ServiceResponseCache.reset_stats()
+            self.stdout.write(self.style.SUCCESS("Service response cache stats reset"))
@@ -1,8 +1,8 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
-from django.db.models import QuerySet
+from django.db.models import F, OuterRef, QuerySet, Subquery
 
 if TYPE_CHECKING:
     from market.models import Market, Service, ServiceMaterial
@@ -55,25 +55,27 @@ class MarketManager(models.Manager):
 
 class ServiceManager(models.Manager):
 
-    def get_all_service_queryset(self) -> QuerySet:
-        queryset: QuerySet = (
-            self.model.objects.select_related(
-                "market", "market__reformer", "market__reformer__user"
-            )
-            .prefetch_related(
-                "service_style",
-                "service_image",
-                "service_material",
-                "service_option",
-                "service_option__service_option_image",
-                "market__reformer__reformer_education",
-                "market__reformer__reformer_certification",
-                "market__reformer__reformer_awards",
-                "market__reformer__reformer_career",
-                "market__reformer__reformer_freelancer",
-            )
-            .all()
+    def get_service_queryset_with_relations(self) -> QuerySet:
+        """
+        ServiceRetrieveSerializer에서 사용하는 모든 연관 데이터를 미리 가져오는 쿼리셋
+        """
+        return self.model.objects.select_related(
+            "market", "market__reformer", "market__reformer__user"
+        ).prefetch_related(
+            "service_style",
+            "service_image",
+            "service_material",
+            "service_option",
+            "service_option__service_option_image",
+            "market__reformer__reformer_education",
+            "market__reformer__reformer_certification",
+            "market__reformer__reformer_awards",
+            "market__reformer__reformer_career",
+            "market__reformer__reformer_freelancer",
         )
+
+    def get_all_service_queryset(self) -> QuerySet:
+        queryset: QuerySet = self.get_service_queryset_with_relations().all()
         if not queryset.exists():
             raise ObjectDoesNotExist("There are no services in the database")
         return queryset
@@ -115,3 +117,69 @@ class ServiceMaterialManager(models.Manager):
             raise ObjectDoesNotExist("Service material not found")
 
         return service_material
+
+
+# 서비스 카드의 정렬, 필터링 컬럼 (Service 테이블에서 복사)
+# payload와 달리 서비스가 변경된 트랜잭션 안에서 바로 복사해서, stale 카드도 올바른 순서와 조건으로 조회되도록 함
+SERVICE_CARD_COLUMNS: Tuple[str, ...] = (
+    "created",
+    "updated",
+    "service_title",
+    "service_category",
+    "basic_price",
+    "max_price",
+    "service_period",
+    "suspended",
+    "temporary",
+)
+
+
+class ServiceCardManager(models.Manager):
+
+    def get_stale_card_versions(
+        self, service_ids: Optional[Iterable[int]] = None
+    ) -> Dict[int, int]:
+        """
+        다시 만들어야 하는 서비스 카드의 {service_id: version} 딕셔너리를 반환
+        service_ids가 없으면 모든 stale 카드를 반환
+        """
+        queryset: QuerySet = self.model.objects.filter(is_stale=True)
+        if service_ids is not None:
+            queryset = queryset.filter(pk__in=list(service_ids))
+        return dict(queryset.values_list("pk", "version"))
+
+    @staticmethod
+    def get_service_columns(service: "Service") -> Dict[str, Any]:
+        return {column: getattr(service, column) for column in SERVICE_CARD_COLUMNS}
+
+    def get_card_versions(self, service_ids: Iterable[int]) -> Dict[int, int]:
+        return dict(
+            self.model.objects.filter(pk__in=list(service_ids)).values_list(
+                "pk", "version"
+            )
+        )
+
+    def mark_stale(self, **filters: Any) -> List[int]:
+        """
+        조건에 해당하는 서비스 카드를 stale 상태로 변경하고 version을 증가시킴
+        정렬, 필터링 컬럼은 Service 테이블에서 바로 복사합니다.
+        ex) mark_stale(service_id=1), mark_stale(service__market__reformer_id=1)
+        반환값 : stale 상태로 변경한 카드의 service id 리스트
+        """
+        from market.models import Service
+
+        service_ids: List[int] = list(
+            self.model.objects.filter(**filters).values_list("pk", flat=True)
+        )
+        if not service_ids:
+            return service_ids
+        service = Service.objects.filter(pk=OuterRef("pk"))
+        self.model.objects.filter(pk__in=service_ids).update(
+            is_stale=True,
+            version=F("version") + 1,
+            **{
+                column: Subquery(service.values(column)[:1])
+                for column in SERVICE_CARD_COLUMNS
+            },
+        )
+        return service_ids
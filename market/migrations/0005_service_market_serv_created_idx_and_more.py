@@ -0,0 +1,33 @@
+# Generated by Django 5.1.15 on 2026-10-18 09:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0004_remove_serviceimage_image_size_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['created', 'id'], name='market_serv_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['updated', 'id'], name='market_serv_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['basic_price', 'id'], name='market_serv_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['service_title', 'id'], name='market_serv_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['service_category', 'id'], name='market_serv_category_idx'),
+        ),
+    ]
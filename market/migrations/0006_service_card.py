@@ -0,0 +1,59 @@
+# Generated by Django 5.1.15 on 2026-10-18 09:52
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def create_service_cards(apps, schema_editor):
+    # 기존 서비스에 대해 stale 상태의 서비스 카드를 만들어둠
+    # 정렬, 필터링 컬럼은 바로 복사하고, payload는 rebuild_service_cards 커맨드로 생성
+    Service = apps.get_model("market", "Service")
+    ServiceCard = apps.get_model("market", "ServiceCard")
+    columns = (
+        "created",
+        "updated",
+        "service_title",
+        "service_category",
+        "basic_price",
+        "suspended",
+        "temporary",
+    )
+    ServiceCard.objects.bulk_create(
+        (
+            ServiceCard(service_id=row.pop("pk"), is_stale=True, **row)
+            for row in Service.objects.values("pk", *columns).iterator()
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0005_service_market_serv_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ServiceCard',
+            fields=[
+                ('service', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='service_card', serialize=False, to='market.service')),
+                ('payload', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('is_stale', models.BooleanField(default=True)),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('created', models.DateTimeField(null=True)),
+                ('updated', models.DateTimeField(null=True)),
+                ('service_title', models.CharField(default='', max_length=50)),
+                ('service_category', models.CharField(default='None', max_length=50)),
+                ('basic_price', models.PositiveIntegerField(default=0)),
+                ('suspended', models.BooleanField(default=False)),
+                ('temporary', models.BooleanField(default=False)),
+            ],
+            options={
+                'db_table': 'market_service_card',
+                'indexes': [models.Index(fields=['created', 'service'], name='market_card_created_idx'), models.Index(fields=['updated', 'service'], name='market_card_updated_idx'), models.Index(fields=['basic_price', 'service'], name='market_card_price_idx'), models.Index(fields=['service_title', 'service'], name='market_card_title_idx'), models.Index(fields=['service_category', 'service'], name='market_card_category_idx'), models.Index(condition=models.Q(('is_stale', True)), fields=['is_stale'], name='market_card_stale_idx')],
+            },
+        ),
+        migrations.RunPython(create_service_cards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+from django.db import migrations
+from django.db.models import F
+
+SQLITE_CREATE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS market_service_search USING fts5(
+    service_title,
+    service_content,
+    service_category,
+    material_names,
+    style_names,
+    tokenize = 'unicode61'
+)
+"""
+
+POSTGRESQL_CREATE = [
+    """
+    CREATE TABLE IF NOT EXISTS market_service_search (
+        service_id bigint PRIMARY KEY REFERENCES market_service (id) ON DELETE CASCADE,
+        document tsvector NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS market_service_search_document_idx
+    ON market_service_search USING GIN (document)
+    """,
+]
+
+
+def create_search_index(apps, schema_editor):
+    # 서비스 전문 검색 인덱스 생성 (SQLite: FTS5, PostgreSQL: tsvector + GIN)
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        schema_editor.execute(SQLITE_CREATE)
+    elif vendor == "postgresql":
+        for sql in POSTGRESQL_CREATE:
+            schema_editor.execute(sql)
+
+    # 기존 서비스는 서비스 카드를 다시 만들 때 검색 인덱스에 추가됨
+    ServiceCard = apps.get_model("market", "ServiceCard")
+    ServiceCard.objects.update(is_stale=True, version=F("version") + 1)
+
+
+def drop_search_index(apps, schema_editor):
+    schema_editor.execute("DROP TABLE IF EXISTS market_service_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("market", "0006_service_card"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
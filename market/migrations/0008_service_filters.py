@@ -0,0 +1,44 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:02
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_service_card_filters(apps, schema_editor):
+    # 새로 추가된 max_price, service_period 컬럼을 서비스 테이블에서 복사 (payload는 변경되지 않음)
+    Service = apps.get_model("market", "Service")
+    ServiceCard = apps.get_model("market", "ServiceCard")
+    service = Service.objects.filter(pk=OuterRef("pk"))
+    ServiceCard.objects.update(
+        max_price=Subquery(service.values("max_price")[:1]),
+        service_period=Subquery(service.values("service_period")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0007_service_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='servicecard',
+            name='max_price',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='servicecard',
+            name='service_period',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='servicematerial',
+            index=models.Index(fields=['material_name', 'market_service'], name='market_material_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicestyle',
+            index=models.Index(fields=['style_name', 'market_service'], name='market_style_name_idx'),
+        ),
+        migrations.RunPython(fill_service_card_filters, migrations.RunPython.noop),
+    ]
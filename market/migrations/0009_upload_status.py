@@ -0,0 +1,31 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:18
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_service_cards_stale(apps, schema_editor):
+    # 서비스 카드 payload에 이미지 업로드 상태를 추가하기 위해 서비스 카드를 다시 만들도록 표시
+    ServiceCard = apps.get_model("market", "ServiceCard")
+    ServiceCard.objects.update(is_stale=True, version=F("version") + 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0008_service_filters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='serviceimage',
+            name='upload_status',
+            field=models.CharField(choices=[('pending', '업로드 대기'), ('ready', '업로드 완료'), ('failed', '업로드 실패')], default='ready', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='serviceoptionimage',
+            name='upload_status',
+            field=models.CharField(choices=[('pending', '업로드 대기'), ('ready', '업로드 완료'), ('failed', '업로드 실패')], default='ready', max_length=10),
+        ),
+        migrations.RunPython(mark_service_cards_stale, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_image_blob'),
+        ('market', '0010_image_derivatives'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='serviceimage',
+            name='image_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.imageblob'),
+        ),
+        migrations.AddField(
+            model_name='serviceoptionimage',
+            name='image_blob',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='core.imageblob'),
+        ),
+    ]
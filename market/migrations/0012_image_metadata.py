@@ -0,0 +1,36 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:49
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_service_cards_stale(apps, schema_editor):
+    # 서비스 카드 payload에 이미지 정보(metadata)를 추가하기 위해 서비스 카드를 다시 만들도록 표시
+    ServiceCard = apps.get_model("market", "ServiceCard")
+    ServiceCard.objects.update(is_stale=True, version=F("version") + 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0011_image_blob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='market',
+            name='market_thumbnail_metadata',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='serviceimage',
+            name='image_metadata',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.AddField(
+            model_name='serviceoptionimage',
+            name='image_metadata',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(mark_service_cards_stale, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,9 @@
-from typing import Any, override
+from typing import Any, List, Optional, override
 
-from django.db.models import QuerySet
+from django.db.models import Exists, OuterRef, QuerySet
 
 from core.mixins import QueryParamMixin
+from market.models import ServiceMaterial, ServiceStyle
 
 
 class ServiceQueryParamMixin(QueryParamMixin):
@@ -19,12 +20,29 @@ class ServiceQueryParamMixin(QueryParamMixin):
                 "-basic_price": "-basic_price",  # 기본 가격 내림차순
             }
         )
+        self.ALLOWED_FILTER_ARRAY += [
+            "suspended",  # true / false
+            "category",  # 카테고리 이름 (쉼표로 여러개 지정 가능)
+            "min_price",  # 기본 가격(basic_price)이 min_price 이상
+            "max_price",  # 최대 가격(max_price)이 max_price 이하
+            "max_period",  # 제작 예상 기간(service_period)이 max_period 이하
+            "material",  # 재료 이름 (쉼표로 여러개 지정 가능, 하나라도 일치하면 포함)
+            "style",  # 스타일 이름 (쉼표로 여러개 지정 가능, 하나라도 일치하면 포함)
+        ]
 
     @override
     def apply_filters_and_sorting(self, queryset: QuerySet, request: Any) -> QuerySet:
 
         queryset: QuerySet = super().apply_filters_and_sorting(queryset, request)
+        queryset = self.apply_filters(queryset, request)
 
+        return queryset
+
+    def apply_filters(self, queryset: QuerySet, request: Any) -> QuerySet:
+        """
+        Service, ServiceCard 쿼리셋 모두에 사용할 수 있는 필터링 메서드
+        (두 모델 모두 pk가 서비스 id이고, 필터링에 사용하는 컬럼 이름이 같음)
+        """
         suspended_param: str = request.GET.get("suspended")
         if suspended_param:
             if suspended_param == "true":
@@ -36,4 +54,55 @@ class ServiceQueryParamMixin(QueryParamMixin):
             else:
                 raise ValueError("suspended는 true와 false값만 사용할 수 있습니다")
 
+        categories: List[str] = self.get_list_param(request, "category")
+        if categories:
+            queryset = queryset.filter(service_category__in=categories)
+
+        min_price: Optional[int] = self.get_positive_int_param(request, "min_price")
+        if min_price is not None:
+            queryset = queryset.filter(basic_price__gte=min_price)
+
+        max_price: Optional[int] = self.get_positive_int_param(request, "max_price")
+        if max_price is not None:
+            queryset = queryset.filter(max_price__lte=max_price)
+
+        max_period: Optional[int] = self.get_positive_int_param(request, "max_period")
+        if max_period is not None:
+            queryset = queryset.filter(service_period__lte=max_period)
+
+        # 재료, 스타일은 JOIN 대신 EXISTS 서브쿼리로 필터링 (중복 row 발생 X)
+        materials: List[str] = self.get_list_param(request, "material")
+        if materials:
+            queryset = queryset.filter(
+                Exists(
+                    ServiceMaterial.objects.filter(
+                        market_service=OuterRef("pk"), material_name__in=materials
+                    )
+                )
+            )
+
+        styles: List[str] = self.get_list_param(request, "style")
+        if styles:
+            queryset = queryset.filter(
+                Exists(
+                    ServiceStyle.objects.filter(
+                        market_service=OuterRef("pk"), style_name__in=styles
+                    )
+                )
+            )
+
         return queryset
+
+    @staticmethod
+    def get_list_param(request: Any, name: str) -> List[str]:
+        value: str = request.GET.get(name, "")
+        return [item.strip() for item in value.split(",") if item.strip()]
+
+    @staticmethod
+    def get_positive_int_param(request: Any, name: str) -> Optional[int]:
+        value: str = request.GET.get(name)
+        if value is None or value == "":
+            return None
+        if not value.isdigit():
+            raise ValueError(f"{name}는 0 이상의 정수만 사용할 수 있습니다")
+        return int(value)
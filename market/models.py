@@ -2,10 +2,16 @@ import uuid
 
 from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 
-from core.models import TimeStampedModel
-from market.managers import MarketManager, ServiceManager, ServiceMaterialManager
+from core.models import TimeStampedModel, UploadStatus
+from market.managers import (
+    MarketManager,
+    ServiceCardManager,
+    ServiceManager,
+    ServiceMaterialManager,
+)
 from users.models.reformer import Reformer
 
 
@@ -48,6 +54,12 @@ class Market(TimeStampedModel):
     market_thumbnail = models.FileField(
         upload_to=get_market_thumbnail_upload_path, null=False
     )  # 마켓 썸네일
+    market_thumbnail_derivatives = models.JSONField(
+        default=dict, blank=True
+    )  # 마켓 썸네일 파생 이미지(썸네일, WebP) storage key
+    market_thumbnail_metadata = models.JSONField(
+        default=dict, blank=True
+    )  # 마켓 썸네일 크기, placeholder(blurhash, 대표 색상) 정보
     # market_rate = models.DecimalField(max_digits=2, decimal_places=1, default=0.0) # 마켓 평점 -> 추후 리뷰기능 개발 시 추가
 
     objects = MarketManager()
@@ -84,6 +96,16 @@ class Service(TimeStampedModel):
 
     class Meta:
         db_table = "market_service"
+        indexes = [
+            # keyset 페이지네이션용 인덱스 (정렬 컬럼 + tiebreaker)
+            models.Index(fields=["created", "id"], name="market_serv_created_idx"),
+            models.Index(fields=["updated", "id"], name="market_serv_updated_idx"),
+            models.Index(fields=["basic_price", "id"], name="market_serv_price_idx"),
+            models.Index(fields=["service_title", "id"], name="market_serv_title_idx"),
+            models.Index(
+                fields=["service_category", "id"], name="market_serv_category_idx"
+            ),
+        ]
 
 
 class ServiceMaterial(TimeStampedModel):
@@ -99,6 +121,13 @@ class ServiceMaterial(TimeStampedModel):
 
     class Meta:
         db_table = "market_service_material"
+        indexes = [
+            # 재료 이름으로 서비스 필터링 시 사용
+            models.Index(
+                fields=["material_name", "market_service"],
+                name="market_material_name_idx",
+            ),
+        ]
 
 
 class ServiceStyle(TimeStampedModel):
@@ -112,6 +141,12 @@ class ServiceStyle(TimeStampedModel):
 
     class Meta:
         db_table = "market_service_style"
+        indexes = [
+            # 스타일 이름으로 서비스 필터링 시 사용
+            models.Index(
+                fields=["style_name", "market_service"], name="market_style_name_idx"
+            ),
+        ]
 
 
 class ServiceOption(TimeStampedModel):
@@ -137,6 +172,22 @@ class ServiceImage(TimeStampedModel):
     image = models.FileField(
         upload_to=get_service_image_upload_path, null=False, max_length=255
     )
+    upload_status = models.CharField(
+        max_length=10, choices=UploadStatus.choices, default=UploadStatus.READY
+    )  # storage 업로드 상태
+    image_derivatives = models.JSONField(
+        default=dict, blank=True
+    )  # 파생 이미지(썸네일, WebP) storage key
+    image_metadata = models.JSONField(
+        default=dict, blank=True
+    )  # 이미지 크기, placeholder(blurhash, 대표 색상) 정보
+    image_blob = models.ForeignKey(
+        "core.ImageBlob",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="+",
+    )  # 중복 제거된 이미지 파일 (없으면 row마다 파일을 따로 저장한 이미지)
 
     class Meta:
         db_table = "market_service_image"
@@ -152,11 +203,81 @@ class ServiceOptionImage(TimeStampedModel):
     image = models.FileField(
         upload_to=get_service_option_image_upload_path, null=False, max_length=255
     )
+    upload_status = models.CharField(
+        max_length=10, choices=UploadStatus.choices, default=UploadStatus.READY
+    )  # storage 업로드 상태
+    image_derivatives = models.JSONField(
+        default=dict, blank=True
+    )  # 파생 이미지(썸네일, WebP) storage key
+    image_metadata = models.JSONField(
+        default=dict, blank=True
+    )  # 이미지 크기, placeholder(blurhash, 대표 색상) 정보
+    image_blob = models.ForeignKey(
+        "core.ImageBlob",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="+",
+    )  # 중복 제거된 이미지 파일 (없으면 row마다 파일을 따로 저장한 이미지)
 
     class Meta:
         db_table = "market_service_option_image"
 
 
+class ServiceCard(models.Model):
+    # 전체 서비스 조회(GetAllServiceView)용으로 미리 직렬화해둔 서비스 카드 테이블
+    # payload에는 ServiceRetrieveSerializer 결과가 그대로 저장되며, 파일 필드는 URL 대신 storage key로 저장됨
+    service = models.OneToOneField(
+        "market.Service",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="service_card",
+    )
+    payload = models.JSONField(
+        default=dict, encoder=DjangoJSONEncoder
+    )  # 직렬화된 서비스 정보
+    is_stale = models.BooleanField(
+        default=True
+    )  # 원본 데이터가 변경되어 payload를 다시 만들어야 하는지 표시하는 필드
+    version = models.PositiveIntegerField(
+        default=0
+    )  # 변경될 때마다 증가, 재생성 도중에 발생한 변경을 덮어쓰지 않기 위해 사용
+
+    # 정렬 및 필터링에 사용하는 컬럼 (Service 테이블에서 복사)
+    created = models.DateTimeField(null=True)
+    updated = models.DateTimeField(null=True)
+    service_title = models.CharField(max_length=50, default="")
+    service_category = models.CharField(max_length=50, default="None")
+    basic_price = models.PositiveIntegerField(default=0)
+    max_price = models.PositiveIntegerField(default=0)
+    service_period = models.PositiveIntegerField(default=0)
+    suspended = models.BooleanField(default=False)
+    temporary = models.BooleanField(default=False)
+
+    objects = ServiceCardManager()
+
+    class Meta:
+        db_table = "market_service_card"
+        indexes = [
+            models.Index(fields=["created", "service"], name="market_card_created_idx"),
+            models.Index(fields=["updated", "service"], name="market_card_updated_idx"),
+            models.Index(
+                fields=["basic_price", "service"], name="market_card_price_idx"
+            ),
+            models.Index(
+                fields=["service_title", "service"], name="market_card_title_idx"
+            ),
+            models.Index(
+                fields=["service_category", "service"], name="market_card_category_idx"
+            ),
+            models.Index(
+                fields=["is_stale"],
+                condition=models.Q(is_stale=True),
+                name="market_card_stale_idx",
+            ),
+        ]
+
+
 class Report(models.Model):
     reported_user = models.ForeignKey(
         "users.User",
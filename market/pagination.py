@@ -1,5 +1,10 @@
+from typing import List
+
 from rest_framework.pagination import LimitOffsetPagination
 
+from core.pagination import KeysetPagination
+from market.search import ServiceSearchBackend
+
 
 class ServiceListPagination(LimitOffsetPagination):
     """
@@ -10,3 +15,35 @@ class ServiceListPagination(LimitOffsetPagination):
 
     default_limit = 10
     max_limit = 100
+
+
+class ServiceListCursorPagination(KeysetPagination):
+    """
+    서비스 목록 keyset(cursor) 페이지네이션 설정 클래스.
+    pagination=cursor 또는 cursor 쿼리 파라미터가 넘어온 경우 사용됩니다.
+    """
+
+    default_limit = 10
+    max_limit = 100
+    default_ordering = ("-created",)
+
+
+class ServiceSearchPagination(LimitOffsetPagination):
+    """
+    서비스 검색 결과 페이지네이션 클래스.
+    검색 인덱스에서 관련도 순으로 현재 페이지에 해당하는 서비스 id만 가져옵니다.
+    """
+
+    default_limit = 10
+    max_limit = 100
+
+    def paginate_search(
+        self, backend: ServiceSearchBackend, query: str, request
+    ) -> List[int]:
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.offset = self.get_offset(request)
+        self.count = backend.count(query)
+        if self.count == 0 or self.offset >= self.count:
+            return []
+        return backend.search(query, limit=self.limit, offset=self.offset)
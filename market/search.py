@@ -0,0 +1,231 @@
+import re
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, Iterable, List, Type
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+
+if TYPE_CHECKING:
+    from market.models import Service
+
+SEARCH_TABLE = "market_service_search"
+MAX_SEARCH_TERMS = 10
+
+
+def tokenize_search_query(query: str) -> List[str]:
+    """
+    검색어에서 단어만 추출 (검색 엔진 문법에 사용되는 특수문자는 모두 제거)
+    """
+    terms: List[str] = re.findall(r"\w+", query or "")
+    if not terms:
+        raise ValueError("검색어를 입력해주세요")
+    return terms[:MAX_SEARCH_TERMS]
+
+
+class ServiceSearchBackend(ABC):
+    """
+    서비스 전문 검색(full-text search) 인덱스 기본 클래스
+    서비스 카드가 다시 만들어질 때 index()가 호출되어 검색 인덱스도 함께 갱신됩니다.
+    임시 저장된 서비스는 검색 결과에 노출되지 않도록 인덱스에서 제거합니다.
+    """
+
+    def index(self, services: Iterable["Service"]) -> None:
+        indexed: List["Service"] = []
+        removed: List[int] = []
+        for service in services:
+            if service.temporary:
+                removed.append(service.pk)
+            else:
+                indexed.append(service)
+
+        if removed:
+            self.remove(removed)
+        if indexed:
+            self.upsert(indexed)
+
+    @staticmethod
+    def get_document(service: "Service") -> Dict[str, str]:
+        # service_material, service_style은 prefetch된 데이터를 사용
+        return {
+            "service_title": service.service_title,
+            "service_content": service.service_content,
+            "service_category": service.service_category,
+            "material_names": " ".join(
+                material.material_name for material in service.service_material.all()
+            ),
+            "style_names": " ".join(
+                style.style_name for style in service.service_style.all()
+            ),
+        }
+
+    @abstractmethod
+    def upsert(self, services: List["Service"]) -> None:
+        """
+        서비스의 검색 문서를 추가하거나 갱신
+        """
+
+    @abstractmethod
+    def remove(self, service_ids: List[int]) -> None:
+        """
+        서비스를 검색 인덱스에서 제거
+        """
+
+    @abstractmethod
+    def search(self, query: str, limit: int, offset: int) -> List[int]:
+        """
+        검색어와 일치하는 서비스 id를 관련도 순서로 반환
+        """
+
+    @abstractmethod
+    def count(self, query: str) -> int:
+        """
+        검색어와 일치하는 서비스 개수를 반환
+        """
+
+
+class SQLiteServiceSearchBackend(ServiceSearchBackend):
+    """
+    SQLite FTS5 가상 테이블을 사용하는 검색 인덱스 (DEBUG 환경)
+    rowid = service id, bm25로 관련도 계산 (컬럼별 가중치: 제목 > 카테고리 > 재료/스타일 > 설명)
+    """
+
+    BM25_WEIGHTS = "10.0, 1.0, 5.0, 3.0, 3.0"
+
+    def upsert(self, services: List["Service"]) -> None:
+        # FTS5는 UPSERT를 지원하지 않으므로 삭제 후 추가
+        self.remove([service.pk for service in services])
+        rows = []
+        for service in services:
+            document = self.get_document(service)
+            rows.append(
+                (
+                    service.pk,
+                    document["service_title"],
+                    document["service_content"],
+                    document["service_category"],
+                    document["material_names"],
+                    document["style_names"],
+                )
+            )
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {SEARCH_TABLE} (rowid, service_title, service_content, "
+                "service_category, material_names, style_names) "
+                "VALUES (%s, %s, %s, %s, %s, %s)",
+                rows,
+            )
+
+    def remove(self, service_ids: List[int]) -> None:
+        placeholders: str = ", ".join(["%s"] * len(service_ids))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({placeholders})",
+                service_ids,
+            )
+
+    @staticmethod
+    def get_match_expression(query: str) -> str:
+        # 각 단어를 prefix 검색으로 변환하고 AND 조건으로 연결 ex) "청바지"* "리폼"*
+        return " ".join(f'"{term}"*' for term in tokenize_search_query(query))
+
+    def search(self, query: str, limit: int, offset: int) -> List[int]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s "
+                f"ORDER BY bm25({SEARCH_TABLE}, {self.BM25_WEIGHTS}), rowid DESC "
+                "LIMIT %s OFFSET %s",
+                [self.get_match_expression(query), limit, offset],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def count(self, query: str) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s",
+                [self.get_match_expression(query)],
+            )
+            return cursor.fetchone()[0]
+
+
+class PostgreSQLServiceSearchBackend(ServiceSearchBackend):
+    """
+    tsvector 컬럼과 GIN 인덱스를 사용하는 검색 인덱스 (운영 환경)
+    한국어 형태소 분석기가 없으므로 simple 설정을 사용하고, 제목(A) > 카테고리/재료/스타일(B) > 설명(C) 가중치 적용
+    """
+
+    def upsert(self, services: List["Service"]) -> None:
+        rows = []
+        for service in services:
+            document = self.get_document(service)
+            rows.append(
+                (
+                    service.pk,
+                    document["service_title"],
+                    " ".join(
+                        [
+                            document["service_category"],
+                            document["material_names"],
+                            document["style_names"],
+                        ]
+                    ),
+                    document["service_content"],
+                )
+            )
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {SEARCH_TABLE} (service_id, document) VALUES ("
+                "%s, "
+                "setweight(to_tsvector('simple', %s), 'A') || "
+                "setweight(to_tsvector('simple', %s), 'B') || "
+                "setweight(to_tsvector('simple', %s), 'C')"
+                ") ON CONFLICT (service_id) DO UPDATE SET document = EXCLUDED.document",
+                rows,
+            )
+
+    def remove(self, service_ids: List[int]) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE service_id = ANY(%s)",
+                [list(service_ids)],
+            )
+
+    @staticmethod
+    def get_tsquery(query: str) -> str:
+        # 각 단어를 prefix 검색으로 변환하고 AND 조건으로 연결 ex) 청바지:* & 리폼:*
+        return " & ".join(f"{term}:*" for term in tokenize_search_query(query))
+
+    def search(self, query: str, limit: int, offset: int) -> List[int]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT service_id FROM {SEARCH_TABLE}, "
+                "to_tsquery('simple', %s) AS query "
+                "WHERE document @@ query "
+                "ORDER BY ts_rank(document, query) DESC, service_id DESC "
+                "LIMIT %s OFFSET %s",
+                [self.get_tsquery(query), limit, offset],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def count(self, query: str) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {SEARCH_TABLE} "
+                "WHERE document @@ to_tsquery('simple', %s)",
+                [self.get_tsquery(query)],
+            )
+            return cursor.fetchone()[0]
+
+
+SEARCH_BACKENDS: Dict[str, Type[ServiceSearchBackend]] = {
+    "sqlite": SQLiteServiceSearchBackend,
+    "postgresql": PostgreSQLServiceSearchBackend,
+}
+
+
+def get_search_backend() -> ServiceSearchBackend:
+    backend_class = SEARCH_BACKENDS.get(connection.vendor)
+    if backend_class is None:
+        raise ImproperlyConfigured(
+            f"Service search is not supported on {connection.vendor}"
+        )
+    return backend_class()
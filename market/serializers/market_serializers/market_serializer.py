@@ -1,11 +1,14 @@
 from rest_framework import serializers
 
+from core.fields import StorageFileField, StorageFileMapField
 from market.models import Market
 
 
 class MarketSerializer(serializers.ModelSerializer):
     market_uuid = serializers.UUIDField(read_only=True)
-    market_thumbnail = serializers.FileField(use_url=True, read_only=True)
+    market_thumbnail = StorageFileField(read_only=True)
+    market_thumbnail_derivatives = StorageFileMapField()
+    market_thumbnail_metadata = serializers.JSONField(read_only=True)
 
     class Meta:
         model = Market
@@ -15,6 +18,8 @@ class MarketSerializer(serializers.ModelSerializer):
             "market_introduce",
             "market_address",
             "market_thumbnail",
+            "market_thumbnail_derivatives",
+            "market_thumbnail_metadata",
         ]
 
     def create(self, validated_data):
@@ -3,6 +3,8 @@ from typing import Any, List
 from django.db import transaction
 from rest_framework import serializers
 
+from core.fields import StorageFileField, StorageFileMapField
+from core.file_urls import FileUrlResolver
 from market.models import (
     Service,
     ServiceImage,
@@ -31,9 +33,13 @@ class ServiceMaterialSerializer(serializers.ModelSerializer):
 
 
 class ServiceImageSerializer(serializers.ModelSerializer):
+    image = StorageFileField(read_only=True)
+    image_derivatives = StorageFileMapField()
+    image_metadata = serializers.JSONField(read_only=True)
+
     class Meta:
         model = ServiceImage
-        fields = ["image"]
+        fields = ["image", "image_derivatives", "image_metadata", "upload_status"]
 
 
 class ServiceCreateSerializer(serializers.ModelSerializer):
@@ -123,13 +129,15 @@ class ServiceRetrieveSerializer(serializers.ModelSerializer):
     )  # https://www.django-rest-framework.org/api-guide/fields/#readonlyfield
 
     def get_reformer_info(self, obj):
-        return ReformerProfileSerializer(obj.market.reformer).data
+        return ReformerProfileSerializer(obj.market.reformer, context=self.context).data
 
     def get_service_option_images(self, obj) -> List[Any]:
         images = []
         for service_option in obj.service_option.all():
             for service_option_image in service_option.service_option_image.all():
-                images.append({"image": service_option_image.image.url})
+                images.append(
+                    {"image": FileUrlResolver.resolve(service_option_image.image.name)}
+                )
         return images
 
     class Meta:
@@ -1,13 +1,18 @@
 from django.db.models.query import QuerySet
 from rest_framework import serializers
 
+from core.fields import StorageFileField, StorageFileMapField
 from market.models import ServiceOption, ServiceOptionImage
 
 
 class ServiceOptionImageSerializer(serializers.ModelSerializer):
+    image = StorageFileField(read_only=True)
+    image_derivatives = StorageFileMapField()
+    image_metadata = serializers.JSONField(read_only=True)
+
     class Meta:
         model = ServiceOptionImage
-        fields = ["image"]
+        fields = ["image", "image_derivatives", "image_metadata", "upload_status"]
 
 
 class ServiceOptionRetrieveSerializer(serializers.ModelSerializer):
@@ -15,7 +20,9 @@ class ServiceOptionRetrieveSerializer(serializers.ModelSerializer):
 
     def get_service_option_images(self, obj):
         queryset: QuerySet = obj.service_option_image.all()
-        return ServiceOptionImageSerializer(instance=queryset, many=True).data
+        return ServiceOptionImageSerializer(
+            instance=queryset, many=True, context=self.context
+        ).data
 
     class Meta:
         model = ServiceOption
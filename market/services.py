@@ -1,16 +1,28 @@
-import os
-from typing import Any, List
+from typing import Any, Dict, Iterable, List, Optional
 
-from boto3 import client
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import Count, QuerySet
 
+from core.deletions import StorageDeletionService
+from core.derivatives import ImageDerivativePool
+from core.file_urls import FileUrlResolver
+from core.presigned import PresignedUploadService
+from core.uploads import ImageUploadService
+from market.cache import ServiceResponseCache
 from market.models import (
     Market,
     Service,
+    ServiceCard,
     ServiceImage,
+    ServiceMaterial,
     ServiceOption,
     ServiceOptionImage,
+    ServiceStyle,
+)
+from market.search import get_search_backend
+from market.serializers.service_serializers.service_create_retrieve_serializer import (
+    ServiceRetrieveSerializer,
 )
 
 
@@ -49,18 +61,23 @@ class MarketImageUploadService:
         try:
             validate_image_files([image_file])
 
-            # 마켓 썸네일 이미지는 딱 하나이므로, 기존 이미지 먼저 삭제
+            # 마켓 썸네일 이미지는 딱 하나이므로, 기존 이미지와 파생 이미지는 커밋 이후 삭제
             with transaction.atomic():
-                if market.market_thumbnail:
-                    s3 = client("s3")
-                    s3.delete_object(
-                        Bucket=os.getenv("AWS_STORAGE_BUCKET_NAME"),
-                        Key=market.market_thumbnail.name,
-                    )
-                    market.market_thumbnail.delete()
+                StorageDeletionService.enqueue_files(
+                    Market.objects.filter(pk=market.pk), "market_thumbnail"
+                )
 
                 market.market_thumbnail = image_file
+                market.market_thumbnail_derivatives = {}
+                market.market_thumbnail_metadata = {}
                 market.save()
+                # 같은 key로 다시 저장한 경우 삭제하지 않음
+                StorageDeletionService.cancel([market.market_thumbnail.name])
+                transaction.on_commit(
+                    lambda: ImageDerivativePool.submit(
+                        "market.Market", [market.pk], "market_thumbnail"
+                    )
+                )
         except ValidationError as e:
             raise ValidationError(f"Validation Error: {str(e)}")
         except Exception as e:
@@ -70,19 +87,20 @@ class MarketImageUploadService:
     @transaction.atomic
     def upload_service_images(entity: Any, image_files) -> None:
         """
-        서비스 소개 이미지를 S3에 업로드 및 데이터베이스에 저장하는 함수
+        서비스 소개 이미지를 업로드 대기 상태로 데이터베이스에 저장하는 함수
         """
         try:
             # 파일 유효성 검증
             validate_image_files(image_files)
 
             if isinstance(entity, Service):
-                bulk_images: List[ServiceImage] = []
-                for image_file in image_files:
-                    bulk_images.append(
-                        ServiceImage(market_service=entity, image=image_file)
-                    )
-                ServiceImage.objects.bulk_create(bulk_images)
+                # 파일은 spool 후 worker가 S3에 업로드 (요청 처리 중에는 업로드하지 않음)
+                ImageUploadService.enqueue(
+                    [ServiceImage(market_service=entity) for _ in image_files],
+                    image_files,
+                )
+                # bulk_create는 signal을 발생시키지 않으므로 직접 서비스 카드 갱신
+                ServiceCardService.mark_stale(pk=entity.pk)
 
         except ValidationError as e:
             raise ValidationError(f"Validation Error: {str(e)}")
@@ -93,7 +111,7 @@ class MarketImageUploadService:
     @transaction.atomic
     def upload_service_option_images(entity: Any, image_files) -> None:
         """
-        서비스 옵션 이미지를 S3에 업로드 및 데이터베이스에 저장하는 함수
+        서비스 옵션 이미지를 업로드 대기 상태로 데이터베이스에 저장하는 함수
         """
         try:
             # 파일 유효성 검증
@@ -101,14 +119,364 @@ class MarketImageUploadService:
 
             # 엔티티 타입 별 쿼리 생성
             if isinstance(entity, ServiceOption):
-                bulk_images: List[ServiceOptionImage] = []
-                for image_file in image_files:
-                    bulk_images.append(
-                        ServiceOptionImage(service_option=entity, image=image_file)
-                    )
-                ServiceOptionImage.objects.bulk_create(bulk_images)
+                # 파일은 spool 후 worker가 S3에 업로드 (요청 처리 중에는 업로드하지 않음)
+                ImageUploadService.enqueue(
+                    [ServiceOptionImage(service_option=entity) for _ in image_files],
+                    image_files,
+                )
+                # bulk_create는 signal을 발생시키지 않으므로 직접 서비스 카드 갱신
+                ServiceCardService.mark_stale(pk=entity.market_service_id)
 
         except ValidationError as e:
             raise ValidationError(f"Validation Error: {str(e)}")
         except Exception as e:
             raise e
+
+    @staticmethod
+    @transaction.atomic
+    def confirm_market_image(market: Market, key: str) -> None:
+        """
+        클라이언트가 presigned URL로 업로드를 마친 마켓 썸네일 이미지를 저장하는 함수
+        """
+        PresignedUploadService.verify_uploads(market, "market_thumbnail", [key])
+        market = Market.objects.select_for_update().get(pk=market.pk)
+        if market.market_thumbnail.name == key:
+            raise ValueError("This image is already registered")
+
+        # 기존 썸네일과 파생 이미지는 커밋 이후 삭제
+        StorageDeletionService.enqueue_files(
+            Market.objects.filter(pk=market.pk), "market_thumbnail"
+        )
+
+        market.market_thumbnail = key
+        market.market_thumbnail_derivatives = {}
+        market.market_thumbnail_metadata = {}
+        market.save(
+            update_fields=[
+                "market_thumbnail",
+                "market_thumbnail_derivatives",
+                "market_thumbnail_metadata",
+                "updated",
+            ]
+        )
+        transaction.on_commit(
+            lambda: ImageDerivativePool.submit(
+                "market.Market", [market.pk], "market_thumbnail"
+            )
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def confirm_service_images(service: Service, keys: List[str]) -> List[ServiceImage]:
+        """
+        클라이언트가 presigned URL로 업로드를 마친 서비스 이미지 row를 한번에 생성하는 함수
+        """
+        PresignedUploadService.verify_uploads(
+            ServiceImage(market_service=service), "image", keys
+        )
+        # 같은 key를 동시에 등록하지 않도록 서비스 row 잠금
+        Service.objects.select_for_update().filter(pk=service.pk).first()
+        if ServiceImage.objects.filter(image__in=keys).exists():
+            raise ValueError("This image is already registered")
+
+        images: List[ServiceImage] = ServiceImage.objects.bulk_create(
+            [ServiceImage(market_service=service, image=key) for key in keys]
+        )
+        # bulk_create는 signal을 발생시키지 않으므로 직접 서비스 카드 갱신
+        ServiceCardService.mark_stale(pk=service.pk)
+        image_ids: List[int] = [image.pk for image in images]
+        transaction.on_commit(
+            lambda: ImageDerivativePool.submit(
+                "market.ServiceImage", image_ids, "image"
+            )
+        )
+        return images
+
+    @staticmethod
+    @transaction.atomic
+    def confirm_service_option_images(
+        option: ServiceOption, keys: List[str]
+    ) -> List[ServiceOptionImage]:
+        """
+        클라이언트가 presigned URL로 업로드를 마친 서비스 옵션 이미지 row를 한번에 생성하는 함수
+        """
+        PresignedUploadService.verify_uploads(
+            ServiceOptionImage(service_option=option), "image", keys
+        )
+        # 같은 key를 동시에 등록하지 않도록 옵션 row 잠금
+        ServiceOption.objects.select_for_update().filter(pk=option.pk).first()
+        if ServiceOptionImage.objects.filter(image__in=keys).exists():
+            raise ValueError("This image is already registered")
+
+        images: List[ServiceOptionImage] = ServiceOptionImage.objects.bulk_create(
+            [ServiceOptionImage(service_option=option, image=key) for key in keys]
+        )
+        # bulk_create는 signal을 발생시키지 않으므로 직접 서비스 카드 갱신
+        ServiceCardService.mark_stale(pk=option.market_service_id)
+        image_ids: List[int] = [image.pk for image in images]
+        transaction.on_commit(
+            lambda: ImageDerivativePool.submit(
+                "market.ServiceOptionImage", image_ids, "image"
+            )
+        )
+        return images
+
+
+class ServiceCardService:
+    """
+    전체 서비스 조회에 사용하는 서비스 카드(ServiceCard)를 관리하는 클래스
+    원본 데이터가 변경되면 카드를 stale 상태로 표시하고, 커밋 이후(on_commit) 또는 rebuild_service_cards 명령어로 다시 만듭니다.
+    조회 API에서는 응답하는 페이지의 stale 카드만 다시 만듭니다.
+    """
+
+    REFRESH_BATCH_SIZE = 500
+    REFORMER_PROFILE_SECTIONS = (
+        "education",
+        "certification",
+        "awards",
+        "career",
+        "freelancer",
+    )
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def mark_stale(**filters: Any) -> None:
+        """
+        조건에 해당하는 서비스 카드를 stale 상태로 바꾸고, 트랜잭션이 커밋된 후 해당 카드만 다시 만들도록 예약
+        정렬, 필터링 컬럼은 바로 갱신되고 payload만 커밋 이후에 만들어집니다.
+        서비스 조회 API 응답 캐시도 함께 무효화합니다.
+        """
+        ServiceResponseCache.invalidate()
+        service_ids: List[int] = ServiceCard.objects.mark_stale(**filters)
+        if service_ids:
+            transaction.on_commit(
+                lambda: ServiceCardService.refresh_stale_cards(service_ids)
+            )
+
+    @staticmethod
+    def create_card(service: Service) -> None:
+        """
+        새로 생성된 서비스의 카드를 stale 상태로 추가 (정렬, 필터링 컬럼은 바로 저장하고 payload는 커밋 이후 생성)
+        """
+        ServiceCard.objects.create(
+            service=service, **ServiceCard.objects.get_service_columns(service)
+        )
+        ServiceResponseCache.invalidate()
+        transaction.on_commit(
+            lambda: ServiceCardService.refresh_stale_cards([service.pk])
+        )
+
+    @staticmethod
+    def refresh_stale_cards(service_ids: Optional[Iterable[int]] = None) -> None:
+        """
+        stale 상태인 서비스 카드를 다시 만든다. service_ids가 없으면 모든 stale 카드를 다시 만든다.
+        커밋 이후 갱신은 변경된 카드만 넘기고, 남은 stale 카드는 rebuild_service_cards --stale 명령으로 처리합니다.
+        """
+        versions: Dict[int, int] = ServiceCard.objects.get_stale_card_versions(
+            service_ids
+        )
+        if versions:
+            ServiceCardService.build_cards(versions)
+
+    @staticmethod
+    def refresh_page_cards(cards: List[ServiceCard]) -> List[ServiceCard]:
+        """
+        조회한 페이지의 카드 중 stale 상태인 카드만 다시 만들어서 반환 (커밋 이후 갱신에 실패한 경우)
+        페이지에 포함된 카드만 다시 만들기 때문에, stale 카드가 많아도 요청 하나의 작업량은 페이지 크기로 제한됩니다.
+        """
+        versions: Dict[int, int] = {
+            card.pk: card.version for card in cards if card.is_stale
+        }
+        if not versions:
+            return cards
+        ServiceCardService.build_cards(versions)
+        rebuilt: Dict[int, ServiceCard] = ServiceCard.objects.in_bulk(list(versions))
+        return [rebuilt.get(card.pk, card) for card in cards]
+
+    @staticmethod
+    def refresh_related_cards(services: Iterable[Service]) -> None:
+        """
+        서비스와 함께 조회(select_related)한 카드 중 stale 상태이거나 없는 카드를 한번에 다시 만들어서 서비스 객체에 설정
+        주문 목록처럼 서비스 카드를 포함하는 목록을 직렬화하기 전에 사용합니다. (서비스별 fallback 쿼리 방지)
+        """
+        services = list(services)
+        versions: Dict[int, int] = {}
+        missing: List[int] = []
+        for service in services:
+            card: Optional[ServiceCard] = getattr(service, "service_card", None)
+            if card is None:
+                missing.append(service.pk)
+            elif card.is_stale:
+                versions[service.pk] = card.version
+        if not versions and not missing:
+            return
+
+        if missing:
+            ServiceCardService.refresh_cards(set(missing))
+        if versions:
+            ServiceCardService.build_cards(versions)
+        rebuilt: Dict[int, ServiceCard] = ServiceCard.objects.in_bulk(
+            list(versions) + missing
+        )
+        for service in services:
+            if service.pk in rebuilt:
+                service.service_card = rebuilt[service.pk]
+
+    @staticmethod
+    def refresh_cards(service_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        서비스 카드를 다시 만드는 함수, service_ids가 없으면 모든 서비스에 대해 카드를 다시 만든다.
+        카드가 없는 서비스(bulk_create 등으로 생성된 서비스)는 카드를 새로 추가합니다.
+        """
+        queryset = Service.objects.all()
+        if service_ids is not None:
+            queryset = queryset.filter(pk__in=list(service_ids))
+        ids: List[int] = list(queryset.values_list("pk", flat=True))
+
+        ServiceCard.objects.bulk_create(
+            [ServiceCard(service_id=service_id) for service_id in ids],
+            ignore_conflicts=True,
+            batch_size=ServiceCardService.REFRESH_BATCH_SIZE,
+        )
+        ServiceCard.objects.mark_stale(pk__in=ids)
+        return ServiceCardService.build_cards(
+            ServiceCard.objects.get_card_versions(ids)
+        )
+
+    @staticmethod
+    def build_cards(versions: Dict[int, int]) -> int:
+        """
+        {service_id: version}에 해당하는 서비스 카드의 payload를 만들어 저장하고, 검색 인덱스도 함께 갱신
+        카드를 만드는 도중 원본 데이터가 변경되어 version이 바뀐 경우에는 덮어쓰지 않고 stale 상태로 남겨둡니다.
+        """
+        built: int = 0
+        service_ids: List[int] = list(versions)
+        batch_size: int = ServiceCardService.REFRESH_BATCH_SIZE
+        search_backend = get_search_backend()
+        for start in range(0, len(service_ids), batch_size):
+            services = Service.objects.get_service_queryset_with_relations().filter(
+                pk__in=service_ids[start : start + batch_size]
+            )
+            with transaction.atomic():
+                built_services: List[Service] = []
+                for service in services:
+                    updated: int = ServiceCard.objects.filter(
+                        pk=service.pk, version=versions[service.pk]
+                    ).update(
+                        payload=ServiceCardService.build_payload(service),
+                        is_stale=False,
+                        **ServiceCard.objects.get_service_columns(service),
+                    )
+                    if updated:
+                        built_services.append(service)
+                if built_services:
+                    search_backend.index(built_services)
+                built += len(built_services)
+        return built
+
+    @staticmethod
+    def build_payload(service: Service) -> Dict[str, Any]:
+        # presigned URL은 만료되므로, 파일 필드는 storage key로 저장
+        return ServiceRetrieveSerializer(service, context={"raw_file_keys": True}).data
+
+    @staticmethod
+    def to_representation(card: ServiceCard) -> Dict[str, Any]:
+        """
+        서비스 카드 payload의 storage key를 URL로 변환해서 반환
+        """
+        payload: Dict[str, Any] = card.payload
+
+        for image in payload.get("service_image", []):
+            image["image"] = ServiceCardService.get_file_url(image.get("image"))
+            image["image_derivatives"] = ServiceCardService.get_file_urls(
+                image.get("image_derivatives")
+            )
+
+        for option in payload.get("service_option", []):
+            for image in option.get("service_option_images", []):
+                image["image"] = ServiceCardService.get_file_url(image.get("image"))
+                image["image_derivatives"] = ServiceCardService.get_file_urls(
+                    image.get("image_derivatives")
+                )
+
+        reformer_info: Dict[str, Any] = payload.get("reformer_info") or {}
+        user_info: Dict[str, Any] = reformer_info.get("user_info") or {}
+        if "profile_image_url" in user_info:
+            user_info["profile_image_url"] = ServiceCardService.get_file_url(
+                user_info["profile_image_url"]
+            )
+        if "profile_image_derivatives" in user_info:
+            user_info["profile_image_derivatives"] = ServiceCardService.get_file_urls(
+                user_info["profile_image_derivatives"]
+            )
+        for section in ServiceCardService.REFORMER_PROFILE_SECTIONS:
+            for item in reformer_info.get(section, []):
+                if "proof_document" in item:
+                    item["proof_document"] = ServiceCardService.get_file_url(
+                        item["proof_document"]
+                    )
+
+        return payload
+
+    @staticmethod
+    def get_file_url(key: Optional[str]) -> Optional[str]:
+        return FileUrlResolver.resolve(key)
+
+    @staticmethod
+    def get_file_urls(keys: Optional[Dict[str, str]]) -> Dict[str, str]:
+        # 파생 이미지 {이름: storage key} -> {이름: URL}
+        return FileUrlResolver.resolve_many(keys)
+
+
+class ServiceFacetService:
+    """
+    전체 서비스 조회 화면의 필터 UI에서 사용하는 facet count (카테고리, 재료, 스타일별 서비스 개수)
+    """
+
+    FACET_LIMIT = 50  # facet 별 최대 항목 수
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def build_facets(queryset: QuerySet) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        필터가 적용된 서비스(카드) 쿼리셋에 대한 facet count 계산
+        """
+        limit: int = ServiceFacetService.FACET_LIMIT
+        service_ids: QuerySet = queryset.order_by().values("pk")
+
+        categories = (
+            queryset.order_by()
+            .values("service_category")
+            .annotate(count=Count("pk"))
+            .order_by("-count", "service_category")[:limit]
+        )
+        materials = (
+            ServiceMaterial.objects.filter(market_service__in=service_ids)
+            .values("material_name")
+            .annotate(count=Count("market_service", distinct=True))
+            .order_by("-count", "material_name")[:limit]
+        )
+        styles = (
+            ServiceStyle.objects.filter(market_service__in=service_ids)
+            .values("style_name")
+            .annotate(count=Count("market_service", distinct=True))
+            .order_by("-count", "style_name")[:limit]
+        )
+
+        return {
+            "category": [
+                {"value": row["service_category"], "count": row["count"]}
+                for row in categories
+            ],
+            "material": [
+                {"value": row["material_name"], "count": row["count"]}
+                for row in materials
+            ],
+            "style": [
+                {"value": row["style_name"], "count": row["count"]} for row in styles
+            ],
+        }
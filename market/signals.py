@@ -0,0 +1,129 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.derivatives import derivatives_generated
+from core.uploads import upload_completed, upload_failed
+from market.cache import ServiceResponseCache
+from market.models import (
+    Service,
+    ServiceImage,
+    ServiceMaterial,
+    ServiceOption,
+    ServiceOptionImage,
+    ServiceStyle,
+)
+from market.search import get_search_backend
+from market.services import ServiceCardService
+from users.models.reformer import (
+    Reformer,
+    ReformerAwards,
+    ReformerCareer,
+    ReformerCertification,
+    ReformerEducation,
+    ReformerFreelancer,
+)
+from users.models.user import User
+
+# 서비스 카드에 포함되는 사용자 정보 필드 (UserInformationSerializer 필드)
+SERVICE_CARD_USER_FIELDS = {
+    "email",
+    "phone",
+    "full_name",
+    "nickname",
+    "agreement_terms",
+    "address",
+    "profile_image",
+    "profile_image_derivatives",
+    "profile_image_metadata",
+    "introduce",
+    "is_active",
+    "role",
+}
+
+
+@receiver(post_save, sender=Service)
+def service_saved(sender, instance: Service, created: bool, **kwargs) -> None:
+    if created:
+        ServiceCardService.create_card(instance)
+    else:
+        ServiceCardService.mark_stale(pk=instance.pk)
+
+
+@receiver(post_delete, sender=Service)
+def service_deleted(sender, instance: Service, **kwargs) -> None:
+    # 서비스 카드는 CASCADE로 함께 삭제되므로 응답 캐시와 검색 인덱스만 정리
+    ServiceResponseCache.invalidate()
+    get_search_backend().remove([instance.pk])
+
+
+@receiver(post_save, sender=ServiceMaterial)
+@receiver(post_delete, sender=ServiceMaterial)
+@receiver(post_save, sender=ServiceStyle)
+@receiver(post_delete, sender=ServiceStyle)
+@receiver(post_save, sender=ServiceOption)
+@receiver(post_delete, sender=ServiceOption)
+@receiver(post_save, sender=ServiceImage)
+@receiver(post_delete, sender=ServiceImage)
+def service_child_changed(sender, instance, **kwargs) -> None:
+    ServiceCardService.mark_stale(pk=instance.market_service_id)
+
+
+@receiver(post_save, sender=ServiceOptionImage)
+@receiver(post_delete, sender=ServiceOptionImage)
+def service_option_image_changed(
+    sender, instance: ServiceOptionImage, **kwargs
+) -> None:
+    ServiceCardService.mark_stale(service__service_option=instance.service_option_id)
+
+
+@receiver(upload_completed, sender=ServiceImage)
+@receiver(upload_failed, sender=ServiceImage)
+@receiver(derivatives_generated, sender=ServiceImage)
+def service_image_uploaded(sender, object_ids, **kwargs) -> None:
+    # 서비스 카드에 저장된 이미지 업로드 상태, 파생 이미지 key 갱신
+    ServiceCardService.mark_stale(service__service_image__in=object_ids)
+
+
+@receiver(upload_completed, sender=ServiceOptionImage)
+@receiver(upload_failed, sender=ServiceOptionImage)
+@receiver(derivatives_generated, sender=ServiceOptionImage)
+def service_option_image_uploaded(sender, object_ids, **kwargs) -> None:
+    ServiceCardService.mark_stale(
+        service__service_option__service_option_image__in=object_ids
+    )
+
+
+@receiver(derivatives_generated, sender=User)
+def profile_image_derivatives_generated(sender, object_ids, **kwargs) -> None:
+    ServiceCardService.mark_stale(service__market__reformer__user__in=object_ids)
+
+
+@receiver(post_save, sender=Reformer)
+def reformer_saved(sender, instance: Reformer, **kwargs) -> None:
+    ServiceCardService.mark_stale(service__market__reformer=instance.pk)
+
+
+@receiver(post_save, sender=ReformerEducation)
+@receiver(post_delete, sender=ReformerEducation)
+@receiver(post_save, sender=ReformerCertification)
+@receiver(post_delete, sender=ReformerCertification)
+@receiver(post_save, sender=ReformerAwards)
+@receiver(post_delete, sender=ReformerAwards)
+@receiver(post_save, sender=ReformerCareer)
+@receiver(post_delete, sender=ReformerCareer)
+@receiver(post_save, sender=ReformerFreelancer)
+@receiver(post_delete, sender=ReformerFreelancer)
+def reformer_profile_changed(sender, instance, **kwargs) -> None:
+    ServiceCardService.mark_stale(service__market__reformer=instance.reformer_id)
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance: User, update_fields=None, **kwargs) -> None:
+    # 서비스 카드는 리포머의 서비스에만 존재하고, 로그인 시각 갱신 같은 변경은 카드에 영향을 주지 않음
+    if instance.role != "reformer":
+        return
+    if update_fields is not None and not (
+        set(update_fields) & SERVICE_CARD_USER_FIELDS
+    ):
+        return
+    ServiceCardService.mark_stale(service__market__reformer__user=instance.pk)
@@ -1,10 +1,33 @@
+import json
 import os
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from io import StringIO
 from unittest.mock import MagicMock, patch
 
+import boto3
+from botocore.stub import Stubber
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework.test import APIClient, APITestCase
 
-from market.models import Market, Service
+from core.deletions import StorageDeletionService, StorageDeletionWorker
+from core.file_urls import FileUrlResolver
+from core.models import StorageDeletion
+from core.orphans import OrphanFileCollector
+from core.storage import LocalStorageGateway, S3StorageGateway
+from market.cache import ServiceResponseCache
+from market.models import Market, Service, ServiceCard, ServiceImage, ServiceStyle
+from market.serializers.service_serializers.service_create_retrieve_serializer import (
+    ServiceRetrieveSerializer,
+)
+from market.services import ServiceCardService
 from users.models.reformer import Reformer
 from users.models.user import User
 
@@ -74,6 +97,7 @@ class MarketTestCase(APITestCase):
         )
 
     def setUp(self):
+        cache.clear()  # 테스트마다 서비스 응답 캐시 초기화
         self.client = APIClient()
         self.test_user = User.objects.create_user(
             email=self.TEST_EMAIL,
@@ -242,13 +266,9 @@ class MarketTestCase(APITestCase):
         self.assertEqual(market.market_name, update_data["market_name"])
         self.assertEqual(market.market_introduce, update_data["market_introduce"])
 
-    @patch("market.views.market_view.market_crud_view.client")
-    def test_delete_market_info(self, mock_boto3_client: MagicMock):
+    def test_delete_market_info(self):
         # 마켓 삭제 시도 테스트
 
-        mock_s3 = MagicMock()
-        mock_boto3_client.return_value = mock_s3
-
         # 1. 마켓 생성
         create_response = self.client.post(
             path="/api/market",
@@ -265,6 +285,7 @@ class MarketTestCase(APITestCase):
         # 1-2. 마켓 썸네일 이미지 있다고 가정
         market = Market.objects.filter(market_uuid=market_uuid).first()
         market.market_thumbnail = "README.md"
+        market.market_thumbnail_derivatives = {"small_webp": "README_small.webp"}
         market.save()
 
         # 2. 마켓 삭제 요청
@@ -275,14 +296,164 @@ class MarketTestCase(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data["message"], "market deleted")
 
-        # S3 delete_object 호출 검증
-        mock_s3.delete_object.assert_called_once_with(
-            Bucket=os.getenv("AWS_STORAGE_BUCKET_NAME"), Key="README.md"
-        )
-
         # 마켓 정보가 삭제 되었는지 확인
         self.assertEqual(Market.objects.filter(market_uuid=market_uuid).count(), 0)
 
+        # 3. 썸네일 파일은 삭제 대기열에 기록되고, worker가 한번에 삭제
+        self.assertEqual(
+            sorted(StorageDeletion.objects.values_list("key", flat=True)),
+            ["README.md", "README_small.webp"],
+        )
+        s3 = boto3.client(
+            "s3",
+            region_name="ap-northeast-2",
+            aws_access_key_id="testing",
+            aws_secret_access_key="testing",
+        )
+        with Stubber(s3) as stubber:
+            stubber.add_response(
+                "delete_objects",
+                {"Deleted": []},
+                {
+                    "Bucket": os.getenv("AWS_STORAGE_BUCKET_NAME"),
+                    "Delete": {
+                        "Objects": [
+                            {"Key": key}
+                            for key in StorageDeletion.objects.order_by(
+                                "id"
+                            ).values_list("key", flat=True)
+                        ],
+                        "Quiet": True,
+                    },
+                },
+            )
+            self.assertEqual(
+                StorageDeletionWorker.process_pending(
+                    gateway=S3StorageGateway(client=s3)
+                ),
+                2,
+            )
+            stubber.assert_no_pending_responses()
+        self.assertFalse(StorageDeletion.objects.exists())
+
+    def test_storage_deletion_batches(self):
+        # 삭제 요청은 DeleteObjects 1번에 최대 1000개씩 처리하고, 실패한 key는 나중에 다시 시도
+        with transaction.atomic():
+            StorageDeletionService.enqueue([f"key-{i}" for i in range(1001)])
+
+        s3 = MagicMock()
+        s3.delete_objects.side_effect = [
+            {
+                "Errors": [
+                    {"Key": "key-0", "Code": "InternalError", "Message": "fail"},
+                    {"Key": "key-1", "Code": "AccessDenied", "Message": "denied"},
+                ]
+            },
+            {},
+        ]
+        self.assertEqual(
+            StorageDeletionWorker.process_pending(gateway=S3StorageGateway(client=s3)),
+            1001,
+        )
+        self.assertEqual(
+            [
+                len(call.kwargs["Delete"]["Objects"])
+                for call in s3.delete_objects.call_args_list
+            ],
+            [1000, 1],
+        )
+        # 실패한 key마다 자신의 에러 메시지를 기록
+        failed = list(StorageDeletion.objects.order_by("key"))
+        self.assertEqual(
+            [(deletion.key, deletion.last_error) for deletion in failed],
+            [("key-0", "fail"), ("key-1", "denied")],
+        )
+        for deletion in failed:
+            self.assertEqual(deletion.attempts, 1)
+            self.assertGreater(deletion.next_attempt_at, timezone.now())
+
+        # claim 이후 취소된 삭제 요청은 storage에서 삭제하지 않음 (같은 key로 다시 저장된 파일)
+        with transaction.atomic():
+            StorageDeletionService.enqueue(["resaved-key", "deleted-key"])
+        claim = StorageDeletionWorker.claim
+
+        def claim_then_cancel(limit):
+            rows = claim(limit)
+            StorageDeletionService.cancel(["resaved-key"])
+            return rows
+
+        s3 = MagicMock()
+        s3.delete_objects.return_value = {}
+        with patch.object(
+            StorageDeletionWorker, "claim", side_effect=claim_then_cancel
+        ):
+            StorageDeletionWorker.process_batch(gateway=S3StorageGateway(client=s3))
+        self.assertEqual(
+            s3.delete_objects.call_args.kwargs["Delete"]["Objects"],
+            [{"Key": "deleted-key"}],
+        )
+        self.assertFalse(
+            StorageDeletion.objects.filter(
+                key__in=["resaved-key", "deleted-key"]
+            ).exists()
+        )
+
+        # 트랜잭션이 롤백되면 삭제 요청도 기록되지 않음
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            StorageDeletionService.enqueue(["rollback-key"])
+            raise RuntimeError()
+        self.assertFalse(StorageDeletion.objects.filter(key="rollback-key").exists())
+
+    def test_collect_orphan_files(self):
+        # 어떤 row도 참조하지 않고 오래된 업로드 파일만 삭제해야 함
+        storage_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, storage_dir, ignore_errors=True)
+        profile_key = "users/test/profile-image/profile.jpg"
+        derivative_key = "users/test/profile-image/derivatives/profile_small.webp"
+        User.objects.filter(pk=self.test_user.pk).update(
+            profile_image=profile_key,
+            profile_image_derivatives={"small_webp": derivative_key},
+        )
+        orphan_keys = [f"users/test/market/orphan-{i}.jpg" for i in range(3)]
+        recent_key = "users/test/market/recent.jpg"  # 업로드 직후 row 생성 전인 파일
+        static_key = "static/app.css"  # 업로드 파일 경로가 아닌 파일
+        old = time.time() - 2 * 24 * 3600
+        for key in [profile_key, derivative_key, *orphan_keys, recent_key, static_key]:
+            path = os.path.join(storage_dir, key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(b"data")
+            if key != recent_key:
+                os.utime(path, (old, old))
+
+        with override_settings(
+            STORAGE_GATEWAY_BACKEND="core.storage.LocalStorageGateway",
+            STORAGE_GATEWAY_LOCAL_ROOT=storage_dir,
+        ):
+            # dry-run은 삭제하지 않고 고아 파일 목록만 출력
+            out = StringIO()
+            call_command("collect_orphan_files", "--dry-run", stdout=out)
+            for key in orphan_keys:
+                self.assertIn(key, out.getvalue())
+            self.assertIn("3 orphaned (12 bytes)", out.getvalue())
+            self.assertTrue(os.path.exists(os.path.join(storage_dir, orphan_keys[0])))
+
+            # list 요청 1번에 2개씩 조회하고, page마다 삭제
+            stats = OrphanFileCollector().collect(
+                ["users/"], min_age=timedelta(hours=24), page_size=2
+            )
+
+        self.assertEqual(stats["scanned"], 6)
+        self.assertEqual(stats["deleted"], 3)
+        remaining = {
+            os.path.relpath(os.path.join(directory, name), storage_dir)
+            for directory, _, names in os.walk(storage_dir)
+            for name in names
+        }
+        self.assertEqual(
+            remaining, {profile_key, derivative_key, recent_key, static_key}
+        )
+
     def test_report_market(self):
         # 마켓 신고가 정상적으로 작동하는지 확인
         for i in range(3):
@@ -378,19 +549,25 @@ class MarketTestCase(APITestCase):
         # 이 부분에서 쿼리가 210개가 넘게 발생해서 수정 필요
         # 1차 수정 시도 1회의 loop에 대해 -> 21개의 쿼리 발생
         # -> 적절한 수정을 통해 13개로 줄임
+        # -> 서비스 카드(ServiceCard) 생성 쿼리 1개 추가되어 14개
+        # 서비스 카드 payload는 트랜잭션 커밋 이후에 만들어지므로 on_commit 콜백을 실행시킴
         for i in range(10):
-            with self.assertNumQueries(13):
-                response = self.client.post(
-                    path=f"/api/market/{market_uuid}/service",
-                    data=self.TEST_SERVICE_CREATE_DATA,
-                    format="json",
-                )
-                self.assertEqual(response.status_code, 201)
+            with self.captureOnCommitCallbacks(execute=True):
+                with self.assertNumQueries(14):
+                    response = self.client.post(
+                        path=f"/api/market/{market_uuid}/service",
+                        data=self.TEST_SERVICE_CREATE_DATA,
+                        format="json",
+                    )
+                    self.assertEqual(response.status_code, 201)
 
         # 3. 서비스 생성된 날짜 오름차순으로 데이터 가져오기
         # 수정 전 : 한번 조회 시 59개의 쿼리 발생
         # 1차 수정 -> prefetch_related, select_related 수정하여 14개로 줄임
-        with self.assertNumQueries(14):
+        # 2차 수정 -> 미리 직렬화된 서비스 카드를 조회하도록 수정하여 3개로 줄임
+        # (사용자 인증, count, 페이지 조회)
+        # + 카탈로그 버전별로 처음 한번만 facet count 계산 (카테고리, 재료, 스타일 3개)
+        with self.assertNumQueries(6):
             response = self.client.get(
                 path=f"/api/market/services?sort=created", format="json"
             )
@@ -402,7 +579,8 @@ class MarketTestCase(APITestCase):
             )
 
         # 서비스 업데이트 된 날짜 내림차순으로 데이터 가져오기
-        with self.assertNumQueries(14):
+        # 정렬 조건만 바뀐 경우 캐시된 facet count 사용
+        with self.assertNumQueries(3):
             response = self.client.get(
                 path=f"/api/market/services?sort=-updated", format="json"
             )
@@ -424,6 +602,527 @@ class MarketTestCase(APITestCase):
             self.assertEqual(response.status_code, 200)
             self.assertEqual(len(response.data), 10)
 
+    def test_get_service_list_refreshes_only_page_cards(self):
+        # 커밋 이후 갱신에 실패한 stale 카드는 조회한 페이지의 카드만 다시 만들어야 함
+        response = self.client.post(
+            path="/api/market",
+            data={
+                "market_name": self.TEST_MARKET_NAME,
+                "market_introduce": self.TEST_MARKET_INTRODUCE,
+                "market_address": self.TEST_MARKET_ADDRESS,
+            },
+            format="json",
+        )
+        market_uuid = response.data.get("market_uuid", None)
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(5):
+                response = self.client.post(
+                    path=f"/api/market/{market_uuid}/service",
+                    data=self.TEST_SERVICE_CREATE_DATA,
+                    format="json",
+                )
+                self.assertEqual(response.status_code, 201)
+
+        # 마이그레이션 등으로 모든 카드가 stale 상태가 된 경우
+        ServiceCard.objects.mark_stale()
+        response = self.client.get(
+            path="/api/market/services?sort=created&limit=2", format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertEqual(ServiceCard.objects.filter(is_stale=True).count(), 3)
+
+    def test_stale_cards_keep_sort_columns(self):
+        # payload가 만들어지기 전의 카드도 정렬, 필터링 컬럼은 바로 채워져 있어야 함
+        response = self.client.post(
+            path="/api/market",
+            data={
+                "market_name": self.TEST_MARKET_NAME,
+                "market_introduce": self.TEST_MARKET_INTRODUCE,
+                "market_address": self.TEST_MARKET_ADDRESS,
+            },
+            format="json",
+        )
+        market_uuid = response.data.get("market_uuid", None)
+
+        # 1. on_commit 콜백을 실행하지 않음 -> payload가 없는 stale 카드만 존재
+        for i in range(5):
+            response = self.client.post(
+                path=f"/api/market/{market_uuid}/service",
+                data=self.TEST_SERVICE_CREATE_DATA,
+                format="json",
+            )
+            self.assertEqual(response.status_code, 201)
+        self.assertEqual(ServiceCard.objects.filter(is_stale=True).count(), 5)
+        self.assertFalse(ServiceCard.objects.filter(created__isnull=True).exists())
+        for card in ServiceCard.objects.select_related("service"):
+            self.assertEqual(card.created, card.service.created)
+            self.assertEqual(card.service_title, card.service.service_title)
+            self.assertEqual(card.basic_price, card.service.basic_price)
+
+        # 2. keyset 페이지네이션으로 stale 카드를 포함한 전체 서비스를 순회
+        service_uuids = []
+        next_link = "/api/market/services?pagination=cursor&sort=created&limit=2"
+        while next_link:
+            response = self.client.get(path=next_link, format="json")
+            self.assertEqual(response.status_code, 200)
+            service_uuids += [
+                result["service_uuid"] for result in response.data["results"]
+            ]
+            next_link = response.data["next"]
+        self.assertEqual(len(set(service_uuids)), 5)
+
+        # 3. 서비스를 수정하면 컬럼은 바로 갱신되고, 커밋 이후에는 수정된 카드만 다시 만들어짐
+        service = Service.objects.order_by("pk").first()
+        ServiceCard.objects.mark_stale()
+        Service.objects.filter(pk=service.pk).update(basic_price=99999)
+        with self.captureOnCommitCallbacks(execute=True):
+            ServiceCardService.mark_stale(pk=service.pk)
+        card = ServiceCard.objects.get(pk=service.pk)
+        self.assertEqual(card.basic_price, 99999)
+        self.assertFalse(card.is_stale)
+        self.assertEqual(ServiceCard.objects.filter(is_stale=True).count(), 4)
+
+    def test_get_service_list_with_cursor_pagination(self):
+        # keyset(cursor) 페이지네이션으로 전체 서비스 목록을 순회하는 테스트
+
+        # 1. 테스트 마켓 생성
+        response = self.client.post(
+            path="/api/market",
+            data={
+                "market_name": self.TEST_MARKET_NAME,
+                "market_introduce": self.TEST_MARKET_INTRODUCE,
+                "market_address": self.TEST_MARKET_ADDRESS,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        market_uuid = response.data.get("market_uuid", None)
+
+        # 2. 기본 가격이 모두 같은 서비스 7개 생성 -> tiebreaker(pk) 동작 확인
+        # 서비스 카드 payload는 트랜잭션 커밋 이후에 만들어지므로 on_commit 콜백을 실행시킴
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(7):
+                response = self.client.post(
+                    path=f"/api/market/{market_uuid}/service",
+                    data=self.TEST_SERVICE_CREATE_DATA,
+                    format="json",
+                )
+                self.assertEqual(response.status_code, 201)
+
+        # 3. 첫 페이지 조회 (count는 요청한 경우에만 포함)
+        response = self.client.get(
+            path="/api/market/services?pagination=cursor&sort=basic_price&limit=3",
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("count", response.data)
+        self.assertIsNone(response.data["previous"])
+        self.assertEqual(len(response.data["results"]), 3)
+
+        # 4. next 링크를 따라가면서 중복/누락 없이 전체 서비스를 가져오는지 확인
+        service_uuids = [result["service_uuid"] for result in response.data["results"]]
+        next_link = response.data["next"]
+        pages = [response.data]
+        query_counts = []
+        while next_link:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(path=next_link, format="json")
+            query_counts.append(len(context.captured_queries))
+            self.assertEqual(response.status_code, 200)
+            service_uuids += [
+                result["service_uuid"] for result in response.data["results"]
+            ]
+            next_link = response.data["next"]
+            pages.append(response.data)
+
+        self.assertEqual(len(pages), 3)
+        # 몇 번째 페이지든 같은 개수의 쿼리로 조회되어야 함 (COUNT, OFFSET X)
+        self.assertEqual(len(set(query_counts)), 1)
+        self.assertEqual(len(service_uuids), 7)
+        self.assertEqual(len(set(service_uuids)), 7)
+
+        # 5. 마지막 페이지에서 previous 링크를 따라가면 바로 앞 페이지가 나와야 함
+        response = self.client.get(path=pages[-1]["previous"], format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [result["service_uuid"] for result in response.data["results"]],
+            service_uuids[3:6],
+        )
+
+        # 6. count=true인 경우에만 전체 개수 포함
+        response = self.client.get(
+            path="/api/market/services?pagination=cursor&count=true", format="json"
+        )
+        self.assertEqual(response.data["count"], 7)
+
+    def test_get_service_list_with_invalid_cursor(self):
+        response = self.client.post(
+            path="/api/market",
+            data={
+                "market_name": self.TEST_MARKET_NAME,
+                "market_introduce": self.TEST_MARKET_INTRODUCE,
+                "market_address": self.TEST_MARKET_ADDRESS,
+            },
+            format="json",
+        )
+        market_uuid = response.data.get("market_uuid", None)
+        for i in range(3):
+            self.client.post(
+                path=f"/api/market/{market_uuid}/service",
+                data=self.TEST_SERVICE_CREATE_DATA,
+                format="json",
+            )
+
+        # 잘못된 커서 문자열
+        response = self.client.get(
+            path="/api/market/services?cursor=invalid-cursor", format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+        # 정렬 조건을 바꿔서 기존 커서를 사용하는 경우
+        response = self.client.get(
+            path="/api/market/services?pagination=cursor&sort=created&limit=1",
+            format="json",
+        )
+        next_link = response.data["next"]
+        response = self.client.get(path=f"{next_link}&sort=-title", format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_service_card_is_refreshed_after_update(self):
+        # 서비스 및 리포머 정보가 변경되면 전체 서비스 조회 결과에도 반영되어야 함
+        response = self.client.post(
+            path="/api/market",
+            data={
+                "market_name": self.TEST_MARKET_NAME,
+                "market_introduce": self.TEST_MARKET_INTRODUCE,
+                "market_address": self.TEST_MARKET_ADDRESS,
+            },
+            format="json",
+        )
+        market_uuid = response.data.get("market_uuid", None)
+        response = self.client.post(
+            path=f"/api/market/{market_uuid}/service",
+            data=self.TEST_SERVICE_CREATE_DATA,
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        service = Service.objects.get(service_uuid=response.data["service_uuid"])
+
+        # 1. 서비스 카드 내용은 ServiceRetrieveSerializer 결과와 같아야 함
+        response = self.client.get(path="/api/market/services", format="json")
+        self.assertEqual(response.status_code, 200)
+        expected = ServiceRetrieveSerializer(
+            Service.objects.get_service_queryset_with_relations().get(pk=service.pk)
+        ).data
+        self.assertEqual(
+            response.data["results"][0], json.loads(json.dumps(expected, default=str))
+        )
+
+        # 2. 서비스, 스타일, 리포머 정보 변경
+        service.service_title = "변경된 서비스 제목"
+        service.save()
+        ServiceStyle.objects.create(market_service=service, style_name="새로운 스타일")
+        self.reformer.reformer_link = "https://changed.example.com"
+        self.reformer.save()
+
+        response = self.client.get(path="/api/market/services", format="json")
+        self.assertEqual(response.status_code, 200)
+        result = response.data["results"][0]
+        self.assertEqual(result["service_title"], "변경된 서비스 제목")
+        self.assertIn(
+            "새로운 스타일",
+            [style["style_name"] for style in result["service_style"]],
+        )
+        self.assertEqual(
+            result["reformer_info"]["reformer_link"], "https://changed.example.com"
+        )
+
+        # 3. 변경 사항이 없으면 stale 카드가 없어야 함
+        self.assertFalse(ServiceCard.objects.filter(is_stale=True).exists())
+
+    def test_service_response_cache(self):
+        # 서비스 조회 API 응답 캐시 테스트
+        response = self.client.post(
+            path="/api/market",
+            data={
+                "market_name": self.TEST_MARKET_NAME,
+                "market_introduce": self.TEST_MARKET_INTRODUCE,
+                "market_address": self.TEST_MARKET_ADDRESS,
+            },
+            format="json",
+        )
+        market_uuid = response.data.get("market_uuid", None)
+        response = self.client.post(
+            path=f"/api/market/{market_uuid}/service",
+            data=self.TEST_SERVICE_CREATE_DATA,
+            format="json",
+        )
+        service_uuid = response.data.get("service_uuid", None)
+        detail_path = f"/api/market/{market_uuid}/service/{service_uuid}"
+
+        # 1. 처음 조회하면 MISS, 이후에는 쿼리 없이 캐시된 응답 반환 (사용자 인증 쿼리만 발생)
+        response = self.client.get(path=detail_path, format="json")
+        self.assertEqual(response["X-Cache"], "MISS")
+        with self.assertNumQueries(1):
+            response = self.client.get(path=detail_path, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+        # 2. 기본값과 같은 쿼리 파라미터, 캐시 key에 포함되지 않는 쿼리 파라미터는 같은 캐시 사용
+        response = self.client.get(
+            path=f"{detail_path}?temporary=FALSE&utm_source=test", format="json"
+        )
+        self.assertEqual(response["X-Cache"], "HIT")
+        response = self.client.get(
+            path=f"/api/market/{market_uuid}/service", format="json"
+        )
+        self.assertEqual(response["X-Cache"], "MISS")
+        response = self.client.get(
+            path=f"/api/market/{market_uuid}/service?sort=-created", format="json"
+        )
+        self.assertEqual(response["X-Cache"], "HIT")
+
+        # 3. 서비스 스타일이 추가되면 캐시가 무효화되어야 함
+        response = self.client.post(
+            path=f"{detail_path}/style",
+            data={"style_name": "캐시 무효화 스타일"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        response = self.client.get(path=detail_path, format="json")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertIn(
+            "캐시 무효화 스타일",
+            [style["style_name"] for style in response.data["service_style"]],
+        )
+
+        # 4. 리포머 정보가 변경되어도 캐시가 무효화되어야 함
+        self.reformer.reformer_area = "Busan"
+        self.reformer.save()
+        response = self.client.get(path=detail_path, format="json")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["reformer_info"]["reformer_area"], "Busan")
+
+        # 5. hit / miss 횟수 확인
+        self.assertEqual(
+            ServiceResponseCache.get_stats(),
+            {"hit": 3, "miss": 4, "hit_ratio": round(3 / 7, 4)},
+        )
+
+    def test_get_service_list_with_filters_and_facets(self):
+        # 서비스 필터링 및 facet count 테스트
+        response = self.client.post(
+            path="/api/market",
+            data={
+                "market_name": self.TEST_MARKET_NAME,
+                "market_introduce": self.TEST_MARKET_INTRODUCE,
+                "market_address": self.TEST_MARKET_ADDRESS,
+            },
+            format="json",
+        )
+        market_uuid = response.data.get("market_uuid", None)
+
+        services = [
+            # (제목, 카테고리, 기본 가격, 최대 가격, 기간, 재료, 스타일)
+            ("A", "상의", 10000, 30000, 7, ["면", "데님"], ["캐주얼"]),
+            ("B", "상의", 20000, 50000, 14, ["면"], ["빈티지"]),
+            ("C", "하의", 15000, 40000, 3, ["데님"], ["빈티지", "캐주얼"]),
+            ("D", "가방", 50000, 90000, 30, ["가죽"], ["미니멀"]),
+        ]
+        # 서비스 카드 payload는 트랜잭션 커밋 이후에 만들어지므로 on_commit 콜백을 실행시킴
+        with self.captureOnCommitCallbacks(execute=True):
+            for title, category, basic, maximum, period, materials, styles in services:
+                response = self.client.post(
+                    path=f"/api/market/{market_uuid}/service",
+                    data={
+                        **self.TEST_SERVICE_CREATE_DATA,
+                        "service_title": title,
+                        "service_category": category,
+                        "basic_price": basic,
+                        "max_price": maximum,
+                        "service_period": period,
+                        "service_material": [
+                            {"material_name": material} for material in materials
+                        ],
+                        "service_style": [{"style_name": style} for style in styles],
+                    },
+                    format="json",
+                )
+                self.assertEqual(response.status_code, 201)
+
+        def get_titles(query: str):
+            response = self.client.get(
+                path=f"/api/market/services?sort=title&{query}", format="json"
+            )
+            self.assertEqual(response.status_code, 200)
+            return [result["service_title"] for result in response.data["results"]]
+
+        # 1. 필터링
+        self.assertEqual(get_titles("category=상의"), ["A", "B"])
+        self.assertEqual(get_titles("category=상의,하의"), ["A", "B", "C"])
+        self.assertEqual(get_titles("min_price=15000&max_price=50000"), ["B", "C"])
+        self.assertEqual(get_titles("max_period=7"), ["A", "C"])
+        self.assertEqual(get_titles("material=데님"), ["A", "C"])
+        self.assertEqual(get_titles("style=빈티지,미니멀"), ["B", "C", "D"])
+        self.assertEqual(get_titles("material=면&style=빈티지"), ["B"])
+
+        # 2. facet count는 현재 필터 조건에 해당하는 서비스 기준으로 계산
+        response = self.client.get(path="/api/market/services", format="json")
+        facets = response.data["facets"]
+        self.assertEqual(
+            facets["category"],
+            [
+                {"value": "상의", "count": 2},
+                {"value": "가방", "count": 1},
+                {"value": "하의", "count": 1},
+            ],
+        )
+        self.assertEqual(
+            facets["material"],
+            [
+                {"value": "데님", "count": 2},
+                {"value": "면", "count": 2},
+                {"value": "가죽", "count": 1},
+            ],
+        )
+
+        response = self.client.get(
+            path="/api/market/services?material=데님", format="json"
+        )
+        self.assertEqual(
+            response.data["facets"]["style"],
+            [{"value": "캐주얼", "count": 2}, {"value": "빈티지", "count": 1}],
+        )
+
+        # 3. 서비스가 변경되면 facet count도 다시 계산
+        Service.objects.filter(service_title="D").first().delete()
+        response = self.client.get(path="/api/market/services", format="json")
+        self.assertNotIn(
+            "가방", [facet["value"] for facet in response.data["facets"]["category"]]
+        )
+
+        # 4. 잘못된 필터 값
+        response = self.client.get(
+            path="/api/market/services?min_price=-1", format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_search_services(self):
+        # 서비스 검색 테스트
+        response = self.client.post(
+            path="/api/market",
+            data={
+                "market_name": self.TEST_MARKET_NAME,
+                "market_introduce": self.TEST_MARKET_INTRODUCE,
+                "market_address": self.TEST_MARKET_ADDRESS,
+            },
+            format="json",
+        )
+        market_uuid = response.data.get("market_uuid", None)
+
+        services = [
+            (
+                "청바지 리폼",
+                "오래된 청바지를 가방으로 만들어 드립니다",
+                ["데님"],
+                False,
+            ),
+            ("가방 제작", "청바지 원단으로 가방을 만듭니다", ["가죽"], False),
+            ("셔츠 수선", "셔츠 길이 수선", ["데님", "면"], False),
+            ("청바지 임시 저장", "임시 저장된 서비스", ["데님"], True),
+        ]
+        service_uuids = {}
+        # 서비스 카드 payload는 트랜잭션 커밋 이후에 만들어지므로 on_commit 콜백을 실행시킴
+        with self.captureOnCommitCallbacks(execute=True):
+            for title, content, materials, temporary in services:
+                response = self.client.post(
+                    path=f"/api/market/{market_uuid}/service",
+                    data={
+                        **self.TEST_SERVICE_CREATE_DATA,
+                        "service_title": title,
+                        "service_content": content,
+                        "service_material": [
+                            {"material_name": material} for material in materials
+                        ],
+                        "temporary": temporary,
+                    },
+                    format="json",
+                )
+                self.assertEqual(response.status_code, 201)
+                service_uuids[title] = response.data["service_uuid"]
+
+        # 1. 제목에 검색어가 포함된 서비스가 설명에만 포함된 서비스보다 먼저 나와야 함
+        # 임시 저장된 서비스는 검색되지 않음
+        response = self.client.get(
+            path="/api/market/services/search?q=청바지", format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(
+            [result["service_uuid"] for result in response.data["results"]],
+            [service_uuids["청바지 리폼"], service_uuids["가방 제작"]],
+        )
+
+        # 2. 재료 이름, prefix, 여러 단어(AND) 검색
+        response = self.client.get(
+            path="/api/market/services/search?q=데님", format="json"
+        )
+        self.assertEqual(response.data["count"], 2)
+        response = self.client.get(
+            path="/api/market/services/search?q=셔", format="json"
+        )
+        self.assertEqual(response.data["count"], 1)
+        response = self.client.get(
+            path="/api/market/services/search?q=데님 셔츠", format="json"
+        )
+        self.assertEqual(
+            [result["service_uuid"] for result in response.data["results"]],
+            [service_uuids["셔츠 수선"]],
+        )
+
+        # 3. 페이지네이션
+        response = self.client.get(
+            path="/api/market/services/search?q=청바지&limit=1", format="json"
+        )
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNotNone(response.data["next"])
+
+        # 4. 커밋 이후 갱신되지 못한 stale 카드는 검색 결과 페이지에서 다시 만들어야 함
+        service = Service.objects.get(service_uuid=service_uuids["청바지 리폼"])
+        Service.objects.filter(pk=service.pk).update(basic_price=54321)
+        ServiceCardService.mark_stale(pk=service.pk)
+        response = self.client.get(
+            path="/api/market/services/search?q=청바지", format="json"
+        )
+        self.assertEqual(response.data["results"][0]["basic_price"], 54321)
+        self.assertFalse(ServiceCard.objects.get(pk=service.pk).is_stale)
+
+        # 5. 스타일이 추가되거나 서비스가 삭제되면 검색 인덱스에도 반영되어야 함
+        service = Service.objects.get(service_uuid=service_uuids["셔츠 수선"])
+        with self.captureOnCommitCallbacks(execute=True):
+            ServiceStyle.objects.create(market_service=service, style_name="빈티지")
+        response = self.client.get(
+            path="/api/market/services/search?q=빈티지", format="json"
+        )
+        self.assertEqual(response.data["count"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            service.delete()
+        response = self.client.get(
+            path="/api/market/services/search?q=빈티지", format="json"
+        )
+        self.assertEqual(response.data["count"], 0)
+        self.assertEqual(response.data["results"], [])
+
+        # 6. 검색어가 없거나 특수문자만 있는 경우
+        response = self.client.get(path="/api/market/services/search", format="json")
+        self.assertEqual(response.status_code, 400)
+        response = self.client.get(
+            path='/api/market/services/search?q="*', format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+
     def test_service_update_suspend_field(self):
         # 1. 테스트 마켓 생성
         response = self.client.post(
@@ -504,6 +1203,161 @@ class MarketTestCase(APITestCase):
         ).first()
         self.assertNotEqual(service.temporary, updated_service.temporary)
 
+    def test_service_image_presigned_upload(self):
+        # presigned URL 발급 후 업로드 완료 확인으로 서비스 이미지 생성
+        response = self.client.post(
+            path="/api/market",
+            data={
+                "market_name": self.TEST_MARKET_NAME,
+                "market_introduce": self.TEST_MARKET_INTRODUCE,
+                "market_address": self.TEST_MARKET_ADDRESS,
+            },
+            format="json",
+        )
+        market_uuid = response.data.get("market_uuid", None)
+        response = self.client.post(
+            path=f"/api/market/{market_uuid}/service",
+            data=self.TEST_SERVICE_CREATE_DATA,
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        service_uuid = response.data["service_uuid"]
+        image_url = f"/api/market/{market_uuid}/service/{service_uuid}/image"
+
+        # 로컬 디렉토리를 S3 대신 사용 (클라이언트 업로드는 파일 쓰기로 대체)
+        storage_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, storage_root, ignore_errors=True)
+        gateway = LocalStorageGateway(storage_root)
+
+        def upload(key: str, size: int) -> None:
+            path = gateway.path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(b"0" * size)
+
+        with override_settings(
+            STORAGE_GATEWAY_BACKEND="core.storage.LocalStorageGateway",
+            STORAGE_GATEWAY_LOCAL_ROOT=storage_root,
+        ):
+            # 1. presigned URL 발급
+            response = self.client.post(
+                path=f"{image_url}/presigned",
+                data={"content_types": ["image/jpeg", "image/png"]},
+                format="json",
+            )
+            self.assertEqual(response.status_code, 200)
+            uploads = response.data["uploads"]
+            self.assertEqual(len(uploads), 2)
+            self.assertTrue(
+                uploads[0]["key"].startswith(
+                    f"users/test/market/{market_uuid}/service/{service_uuid}/"
+                )
+            )
+            self.assertTrue(uploads[0]["key"].endswith(".jpg"))
+            self.assertEqual(uploads[0]["fields"]["Content-Type"], "image/jpeg")
+
+            # 지원하지 않는 파일 형식, 리포머가 아닌 사용자
+            response = self.client.post(
+                path=f"{image_url}/presigned",
+                data={"content_types": ["application/pdf"]},
+                format="json",
+            )
+            self.assertEqual(response.status_code, 400)
+            response = self.customer_client.post(
+                path=f"{image_url}/presigned",
+                data={"content_types": ["image/jpeg"]},
+                format="json",
+            )
+            self.assertEqual(response.status_code, 403)
+
+            # 2. 발급하지 않은 경로의 key는 거절
+            keys = [upload["key"] for upload in uploads]
+            response = self.client.post(
+                path=f"{image_url}/confirm",
+                data={"keys": [f"users/test/market/{market_uuid}/other.jpg"]},
+                format="json",
+            )
+            self.assertEqual(response.status_code, 400)
+
+            # 3. 업로드되지 않은 파일이나 크기 제한을 넘는 파일이 있으면 이미지를 생성하지 않음
+            upload(keys[0], 1024)
+            response = self.client.post(
+                path=f"{image_url}/confirm", data={"keys": keys}, format="json"
+            )
+            self.assertEqual(response.status_code, 400)
+            with override_settings(IMAGE_UPLOAD_MAX_SIZE=512):
+                response = self.client.post(
+                    path=f"{image_url}/confirm", data={"keys": keys[:1]}, format="json"
+                )
+            self.assertEqual(response.status_code, 400)
+            self.assertFalse(
+                ServiceImage.objects.filter(
+                    market_service__service_uuid=service_uuid
+                ).exists()
+            )
+
+            # 4. 업로드 확인 후 이미지 생성
+            upload(keys[1], 2048)
+            response = self.client.post(
+                path=f"{image_url}/confirm", data={"keys": keys}, format="json"
+            )
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(
+                sorted(
+                    ServiceImage.objects.filter(
+                        market_service__service_uuid=service_uuid
+                    ).values_list("image", flat=True)
+                ),
+                sorted(keys),
+            )
+
+            # 5. 이미 등록된 key는 다시 등록할 수 없음
+            response = self.client.post(
+                path=f"{image_url}/confirm", data={"keys": keys[:1]}, format="json"
+            )
+            self.assertEqual(response.status_code, 400)
+
+    def test_file_url_cache(self):
+        # storage URL은 key마다 1번만 만들고, 서명 만료 시간의 절반이 지나면 다시 만들어야 함
+        signatures = iter(range(100))
+        with override_settings(
+            STORAGE_URL_CACHE_TTL=1800, AWS_QUERYSTRING_EXPIRE=600
+        ), patch(
+            "core.file_urls.default_storage.url",
+            side_effect=lambda key: f"https://s3.test/{key}?sig={next(signatures)}",
+        ) as mock_url, patch(
+            "core.file_urls.time.monotonic", return_value=1000
+        ) as mock_time:
+            url = FileUrlResolver.resolve("a.jpg")
+            self.assertEqual(FileUrlResolver.resolve("a.jpg"), url)
+            self.assertEqual(
+                FileUrlResolver.resolve_many({"small": "a.jpg", "medium": "b.jpg"}),
+                {"small": url, "medium": "https://s3.test/b.jpg?sig=1"},
+            )
+            self.assertEqual(mock_url.call_count, 2)
+
+            mock_time.return_value = 1299
+            self.assertEqual(FileUrlResolver.resolve("a.jpg"), url)
+            mock_time.return_value = 1301
+            self.assertEqual(
+                FileUrlResolver.resolve("a.jpg"), "https://s3.test/a.jpg?sig=2"
+            )
+
+            # 최근에 사용한 key만 보관
+            with override_settings(STORAGE_URL_CACHE_MAX_SIZE=1):
+                FileUrlResolver.resolve("a.jpg")
+                FileUrlResolver.resolve("b.jpg")
+                FileUrlResolver.resolve("a.jpg")
+            self.assertEqual(mock_url.call_count, 6)
+
+            # CDN 주소를 지정하면 storage URL을 만들지 않음
+            with override_settings(STORAGE_CDN_URL="https://cdn.test/"):
+                self.assertEqual(
+                    FileUrlResolver.resolve("images/a b.jpg"),
+                    "https://cdn.test/images/a%20b.jpg",
+                )
+            self.assertEqual(mock_url.call_count, 6)
+
     def tearDown(self):
         Service.objects.all().delete()
         Market.objects.all().delete()
@@ -1,8 +1,11 @@
 from django.urls import path
 
 from market.views.image_upload_view import (
+    MarketImagePresignedUploadView,
     MarketImageUploadView,
+    MarketServiceImagePresignedUploadView,
     MarketServiceImageUploadView,
+    ServiceOptionImagePresignedUploadView,
     ServiceOptionImageUploadView,
 )
 from market.views.market_view.market_create_list_view import MarketCreateListView
@@ -21,6 +24,7 @@ from market.views.service_view.service_option.service_option_view import (
     ServiceOptionCreateListView,
     ServiceOptionView,
 )
+from market.views.service_view.service_search_view import ServiceSearchView
 from market.views.service_view.service_style.service_style_view import (
     ServiceStyleCreateListView,
     ServiceStyleView,
@@ -33,12 +37,23 @@ urlpatterns = [
         GetAllServiceView.as_view(),
         name="service_list_without_market_uuid",
     ),
+    path("/services/search", ServiceSearchView.as_view(), name="service_search"),
     path("/<uuid:market_uuid>", MarketCrudView.as_view(), name="market_crud"),
     path(
         "/<uuid:market_uuid>/image",
         MarketImageUploadView.as_view(),
         name="market_image_upload",
     ),
+    path(
+        "/<uuid:market_uuid>/image/presigned",
+        MarketImagePresignedUploadView.as_view(),
+        name="market_image_upload_presigned",
+    ),
+    path(
+        "/<uuid:market_uuid>/image/confirm",
+        MarketImagePresignedUploadView.as_view(confirm=True),
+        name="market_image_upload_confirm",
+    ),
     path(
         "/<uuid:market_uuid>/service",
         MarketServiceCreateListView.as_view(),
@@ -54,6 +69,16 @@ urlpatterns = [
         MarketServiceImageUploadView.as_view(),
         name="market_service_image_upload",
     ),
+    path(
+        "/<uuid:market_uuid>/service/<uuid:service_uuid>/image/presigned",
+        MarketServiceImagePresignedUploadView.as_view(),
+        name="market_service_image_upload_presigned",
+    ),
+    path(
+        "/<uuid:market_uuid>/service/<uuid:service_uuid>/image/confirm",
+        MarketServiceImagePresignedUploadView.as_view(confirm=True),
+        name="market_service_image_upload_confirm",
+    ),
     path(
         "/<uuid:market_uuid>/service/<uuid:service_uuid>/material",
         ServiceMaterialCreateListView.as_view(),
@@ -89,5 +114,15 @@ urlpatterns = [
         ServiceOptionImageUploadView.as_view(),
         name="market_service_option_image_upload",
     ),
+    path(
+        "/<uuid:market_uuid>/service/<uuid:service_uuid>/option/<uuid:option_uuid>/image/presigned",
+        ServiceOptionImagePresignedUploadView.as_view(),
+        name="market_service_option_image_upload_presigned",
+    ),
+    path(
+        "/<uuid:market_uuid>/service/<uuid:service_uuid>/option/<uuid:option_uuid>/image/confirm",
+        ServiceOptionImagePresignedUploadView.as_view(confirm=True),
+        name="market_service_option_image_upload_confirm",
+    ),
     path("/report", ReportUserView.as_view(), name="report_user"),
 ]
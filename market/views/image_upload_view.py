@@ -1,5 +1,6 @@
 from typing import Any, List
 
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
@@ -7,12 +8,26 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from core.exceptions import view_exception_handler
+from core.mixins import ImageUploadViewMixin
 from core.permissions import IsReformer
-from market.models import Market, Service, ServiceOption
+from core.presigned import PresignedUploadService
+from market.models import (
+    Market,
+    Service,
+    ServiceImage,
+    ServiceOption,
+    ServiceOptionImage,
+)
+from market.serializers.service_serializers.service_create_retrieve_serializer import (
+    ServiceImageSerializer,
+)
+from market.serializers.service_serializers.service_option.service_option_retrieve_serializer import (
+    ServiceOptionImageSerializer,
+)
 from market.services import MarketImageUploadService
 
 
-class MarketImageUploadView(APIView):
+class MarketImageUploadView(ImageUploadViewMixin, APIView):
     permission_classes = [IsReformer]
     service = MarketImageUploadService()
 
@@ -41,7 +56,7 @@ class MarketImageUploadView(APIView):
         )
 
 
-class MarketServiceImageUploadView(APIView):
+class MarketServiceImageUploadView(ImageUploadViewMixin, APIView):
     permission_classes = [IsReformer]
     service = MarketImageUploadService()
 
@@ -73,7 +88,7 @@ class MarketServiceImageUploadView(APIView):
         )
 
 
-class ServiceOptionImageUploadView(APIView):
+class ServiceOptionImageUploadView(ImageUploadViewMixin, APIView):
     permission_classes = [IsReformer]
     service = MarketImageUploadService()
 
@@ -105,3 +120,148 @@ class ServiceOptionImageUploadView(APIView):
             data={"message": "Successfully uploaded service option image"},
             status=status.HTTP_200_OK,
         )
+
+
+class MarketImagePresignedUploadView(APIView):
+    """
+    마켓 썸네일 이미지 직접 업로드
+    confirm=False : presigned URL 발급 (request body : content_type)
+    confirm=True : 업로드 완료 확인 및 저장 (request body : key)
+    """
+
+    permission_classes = [IsReformer]
+    service = MarketImageUploadService()
+    confirm = False
+
+    @view_exception_handler
+    def post(self, request, **kwargs):
+        market = (
+            Market.objects.filter(
+                reformer__user=request.user, market_uuid=kwargs.get("market_uuid")
+            )
+            .select_related("reformer__user")
+            .first()
+        )
+        if not market:
+            raise ObjectDoesNotExist("Cannot found market with this uuid")
+
+        if not self.confirm:
+            uploads = PresignedUploadService.create_uploads(
+                market, "market_thumbnail", [request.data.get("content_type")]
+            )
+            return Response(
+                data={
+                    "expires_in": settings.PRESIGNED_UPLOAD_EXPIRES,
+                    "upload": uploads[0],
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        self.service.confirm_market_image(market, request.data.get("key"))
+        return Response(
+            data={"message": "Successfully uploaded market thumbnail image"},
+            status=status.HTTP_200_OK,
+        )
+
+
+class MarketServiceImagePresignedUploadView(APIView):
+    """
+    서비스 이미지 직접 업로드
+    confirm=False : presigned URL 발급 (request body : content_types 리스트)
+    confirm=True : 업로드 완료 확인 및 이미지 생성 (request body : keys 리스트)
+    """
+
+    permission_classes = [IsReformer]
+    service = MarketImageUploadService()
+    confirm = False
+
+    @view_exception_handler
+    def post(self, request, **kwargs):
+        market_service = (
+            Service.objects.filter(
+                market__reformer__user=request.user,
+                market__market_uuid=kwargs.get("market_uuid"),
+                service_uuid=kwargs.get("service_uuid"),
+            )
+            .select_related("market__reformer__user")
+            .first()
+        )
+        if not market_service:
+            raise ObjectDoesNotExist("Cannot found service object with these uuids")
+
+        if not self.confirm:
+            uploads = PresignedUploadService.create_uploads(
+                ServiceImage(market_service=market_service),
+                "image",
+                request.data.get("content_types", []),
+            )
+            return Response(
+                data={
+                    "expires_in": settings.PRESIGNED_UPLOAD_EXPIRES,
+                    "uploads": uploads,
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        images = self.service.confirm_service_images(
+            market_service, request.data.get("keys", [])
+        )
+        return Response(
+            data={
+                "message": "Successfully uploaded service image",
+                "images": ServiceImageSerializer(images, many=True).data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class ServiceOptionImagePresignedUploadView(APIView):
+    """
+    서비스 옵션 이미지 직접 업로드
+    confirm=False : presigned URL 발급 (request body : content_types 리스트)
+    confirm=True : 업로드 완료 확인 및 이미지 생성 (request body : keys 리스트)
+    """
+
+    permission_classes = [IsReformer]
+    service = MarketImageUploadService()
+    confirm = False
+
+    @view_exception_handler
+    def post(self, request, **kwargs):
+        market_service_option: ServiceOption = (
+            ServiceOption.objects.filter(
+                market_service__market__reformer__user=request.user,
+                market_service__market__market_uuid=kwargs.get("market_uuid"),
+                market_service__service_uuid=kwargs.get("service_uuid"),
+                option_uuid=kwargs.get("option_uuid"),
+            )
+            .select_related("market_service__market__reformer__user")
+            .first()
+        )
+        if not market_service_option:
+            raise ObjectDoesNotExist("Cannot found service option with these uuids")
+
+        if not self.confirm:
+            uploads = PresignedUploadService.create_uploads(
+                ServiceOptionImage(service_option=market_service_option),
+                "image",
+                request.data.get("content_types", []),
+            )
+            return Response(
+                data={
+                    "expires_in": settings.PRESIGNED_UPLOAD_EXPIRES,
+                    "uploads": uploads,
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        images = self.service.confirm_service_option_images(
+            market_service_option, request.data.get("keys", [])
+        )
+        return Response(
+            data={
+                "message": "Successfully uploaded service option image",
+                "images": ServiceOptionImageSerializer(images, many=True).data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
@@ -1,16 +1,13 @@
-import os
-
-from boto3 import client
-from botocore.client import BaseClient
 from django.db import transaction
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.deletions import StorageDeletionService
 from core.exceptions import view_exception_handler
 from core.permissions import IsReformer
-from market.models import Market
+from market.models import Market, ServiceImage, ServiceOptionImage
 from market.serializers.market_serializers.market_serializer import MarketSerializer
 from market.serializers.market_serializers.market_update_serializer import (
     MarketUpdateSerializer,
@@ -58,12 +55,19 @@ class MarketCrudView(APIView):
         )
 
         with transaction.atomic():
-            if market.market_thumbnail:
-                s3: BaseClient = client("s3")
-                s3.delete_object(
-                    Bucket=os.getenv("AWS_STORAGE_BUCKET_NAME"),
-                    Key=market.market_thumbnail.name,
-                )
+            # 마켓과 함께 삭제되는 이미지 파일은 커밋 이후 worker가 삭제
+            StorageDeletionService.enqueue_files(
+                Market.objects.filter(pk=market.pk), "market_thumbnail"
+            )
+            StorageDeletionService.enqueue_files(
+                ServiceImage.objects.filter(market_service__market=market), "image"
+            )
+            StorageDeletionService.enqueue_files(
+                ServiceOptionImage.objects.filter(
+                    service_option__market_service__market=market
+                ),
+                "image",
+            )
 
             market.delete()
             return Response(
@@ -1,3 +1,4 @@
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from django.db.models import QuerySet
 from rest_framework import status
@@ -8,14 +9,19 @@ from rest_framework.views import APIView
 
 from core.exceptions import view_exception_handler
 from core.permissions import IsReformer
+from market.cache import ServiceResponseCache, cache_service_response
 from market.mixins import ServiceQueryParamMixin
-from market.models import Market, Service
-from market.pagination import ServiceListPagination
+from market.models import Market, Service, ServiceCard
+from market.pagination import ServiceListCursorPagination, ServiceListPagination
 from market.serializers.service_serializers.service_create_retrieve_serializer import (
     ServiceCreateSerializer,
     ServiceRetrieveSerializer,
 )
-from market.services import temporary_status_check
+from market.services import (
+    ServiceCardService,
+    ServiceFacetService,
+    temporary_status_check,
+)
 
 
 class MarketServiceCreateListView(ServiceQueryParamMixin, APIView):
@@ -35,6 +41,11 @@ class MarketServiceCreateListView(ServiceQueryParamMixin, APIView):
 
         return queryset
 
+    @property
+    def cache_query_params(self):
+        # 응답 캐시 key에 포함되는 쿼리 파라미터
+        return ("sort", "temporary", *self.ALLOWED_FILTER_ARRAY)
+
     def get_permissions(self):
         if self.request.method == "GET":
             return [AllowAny()]
@@ -43,6 +54,7 @@ class MarketServiceCreateListView(ServiceQueryParamMixin, APIView):
         return super().get_permissions()
 
     @view_exception_handler
+    @cache_service_response
     def get(self, request, **kwargs):
         """
         마켓에 생성된 서비스 리스트를 반환하는 로직을 처리하는 View
@@ -95,26 +107,69 @@ class GetAllServiceView(ServiceQueryParamMixin, ListAPIView):
     permission_classes = [AllowAny]
     serializer_class = ServiceRetrieveSerializer  # 시리얼라이저 지정
     pagination_class = ServiceListPagination  # 페이지네이션 클래스 지정
+    cursor_pagination_class = ServiceListCursorPagination  # keyset 페이지네이션
+
+    @property
+    def cache_query_params(self):
+        # 응답 캐시 key에 포함되는 쿼리 파라미터
+        return (
+            "sort",
+            "limit",
+            "offset",
+            "pagination",
+            "cursor",
+            "count",
+            *self.ALLOWED_FILTER_ARRAY,
+        )
+
+    @property
+    def paginator(self):
+        """
+        pagination=cursor 또는 cursor 쿼리 파라미터가 있으면 keyset 페이지네이션을 사용합니다.
+        """
+        if not hasattr(self, "_paginator"):
+            if self.cursor_pagination_class.is_requested(self.request):
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     def get_queryset(self) -> QuerySet:
         """
-        쿼리셋 반환 및 정렬 적용
+        서비스 카드 쿼리셋 반환 및 정렬 적용
+        서비스 카드에는 직렬화 결과가 미리 저장되어 있으므로, 연관 테이블을 조회하지 않습니다.
         """
-        queryset: QuerySet = Service.objects.get_all_service_queryset()
+        queryset: QuerySet = ServiceCard.objects.all()
         queryset = self.apply_filters_and_sorting(queryset, self.request)
 
         return queryset
 
     @view_exception_handler
+    @cache_service_response
     def list(self, request, **kwargs) -> Response:
         queryset: QuerySet = self.get_queryset()
 
         # 페이지네이션 적용
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-
-        # 페이지네이션이 없는 경우 전체 데이터 반환
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(data=serializer.data, status=status.HTTP_200_OK)
+            # 커밋 이후 갱신되지 못한 카드가 있다면 현재 페이지의 카드만 갱신
+            page = ServiceCardService.refresh_page_cards(page)
+        cards = page if page is not None else list(queryset)
+        if not cards and not ServiceCard.objects.exists():
+            raise ObjectDoesNotExist("There are no services in the database")
+
+        data = [ServiceCardService.to_representation(card) for card in cards]
+        if page is None:
+            # 페이지네이션이 없는 경우 전체 데이터 반환
+            return Response(data=data, status=status.HTTP_200_OK)
+
+        response: Response = self.get_paginated_response(data)
+        # 필터 UI에서 사용하는 facet count (카탈로그 버전, 필터 조건별로 캐시됨)
+        response.data["facets"] = ServiceResponseCache.get_or_build_facets(
+            request,
+            self.ALLOWED_FILTER_ARRAY,
+            lambda: ServiceFacetService.build_facets(
+                self.apply_filters(ServiceCard.objects.all(), request)
+            ),
+        )
+        return response
@@ -1,6 +1,3 @@
-import os
-
-from boto3 import client
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from rest_framework import status
@@ -9,9 +6,11 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.deletions import StorageDeletionService
 from core.exceptions import view_exception_handler
 from core.permissions import IsReformer
-from market.models import Service, ServiceImage
+from market.cache import cache_service_response
+from market.models import Service, ServiceImage, ServiceOptionImage
 from market.serializers.service_serializers.service_create_retrieve_serializer import (
     ServiceRetrieveSerializer,
 )
@@ -26,6 +25,8 @@ class MarketServiceCrudView(APIView):
     uuid값을 사용하여 Service CRUD를 수행하는 View
     """
 
+    cache_query_params = ("temporary",)
+
     def get_permissions(self):
         if self.request.method == "GET":
             return [AllowAny()]
@@ -34,6 +35,7 @@ class MarketServiceCrudView(APIView):
         return super().get_permissions()
 
     @view_exception_handler
+    @cache_service_response
     def get(self, request, **kwargs) -> Response:
         temporary_status = temporary_status_check(request)
         market_service = (
@@ -88,22 +90,17 @@ class MarketServiceCrudView(APIView):
         if not market_service:
             raise ObjectDoesNotExist("market service not found")
 
-        market_service_images = ServiceImage.objects.filter(
-            market_service=market_service
-        )
-
         with transaction.atomic():
-            s3 = client("s3")
-            if market_service_images:
-                s3.delete_objects(
-                    Bucket=os.getenv("AWS_STORAGE_BUCKET_NAME"),
-                    Delete={
-                        "Objects": [
-                            {"Key": service_image.image.name}
-                            for service_image in market_service_images
-                        ]
-                    },
-                )
+            # 서비스와 함께 삭제되는 이미지 파일은 커밋 이후 worker가 삭제
+            StorageDeletionService.enqueue_files(
+                ServiceImage.objects.filter(market_service=market_service), "image"
+            )
+            StorageDeletionService.enqueue_files(
+                ServiceOptionImage.objects.filter(
+                    service_option__market_service=market_service
+                ),
+                "image",
+            )
             market_service.delete()
 
         return Response(
@@ -1,7 +1,5 @@
-import os
 from typing import List
 
-from boto3 import client
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from rest_framework import status
@@ -9,6 +7,7 @@ from rest_framework.permissions import AllowAny, BasePermission
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.deletions import StorageDeletionService
 from core.exceptions import view_exception_handler
 from core.permissions import IsReformer
 from market.models import Service, ServiceOption, ServiceOptionImage
@@ -124,20 +123,11 @@ class ServiceOptionView(APIView):
             raise ObjectDoesNotExist("Service option not found")
 
         with transaction.atomic():
-            s3 = client("s3")
             service_option_images = ServiceOptionImage.objects.filter(
                 service_option=service_option
             )
-
-            s3.delete_objects(
-                Bucket=os.getenv("AWS_STORAGE_BUCKET_NAME"),
-                Delete={
-                    "Objects": [
-                        {"Key": service_option_image.image.name}
-                        for service_option_image in service_option_images
-                    ]
-                },
-            )
+            # 이미지 파일은 커밋 이후 worker가 삭제
+            StorageDeletionService.enqueue_files(service_option_images, "image")
             service_option_images.delete()  # 연관된 이미지 먼저 삭제
             service_option.delete()  # Service option 삭제
 
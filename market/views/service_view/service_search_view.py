@@ -0,0 +1,41 @@
+from typing import Dict, List
+
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.exceptions import view_exception_handler
+from market.cache import cache_service_response
+from market.models import ServiceCard
+from market.pagination import ServiceSearchPagination
+from market.search import get_search_backend
+from market.services import ServiceCardService
+
+
+class ServiceSearchView(APIView):
+    """
+    서비스 제목, 설명, 카테고리, 재료 이름, 스타일 이름으로 서비스를 검색하는 View
+    검색 인덱스(SQLite FTS5 / PostgreSQL tsvector)를 사용하며, 관련도 순으로 정렬된 결과를 반환합니다.
+    임시 저장된 서비스는 검색되지 않습니다.
+    """
+
+    permission_classes = [AllowAny]
+    pagination_class = ServiceSearchPagination
+    cache_query_params = ("q", "limit", "offset")
+
+    @view_exception_handler
+    @cache_service_response
+    def get(self, request, **kwargs) -> Response:
+        query: str = request.GET.get("q", "")
+
+        paginator = self.pagination_class()
+        service_ids: List[int] = paginator.paginate_search(
+            get_search_backend(), query, request
+        )
+        cards: Dict[int, ServiceCard] = ServiceCard.objects.in_bulk(service_ids)
+        # 목록 조회와 같이 커밋 이후 갱신되지 못한 카드가 있다면 현재 페이지의 카드만 갱신
+        page: List[ServiceCard] = ServiceCardService.refresh_page_cards(
+            [cards[service_id] for service_id in service_ids if service_id in cards]
+        )
+        data = [ServiceCardService.to_representation(card) for card in page]
+        return paginator.get_paginated_response(data)
@@ -0,0 +1,97 @@
+import math
+import statistics
+import time
+from typing import List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from market.models import Service
+from order.services import OrderCreateService
+from users.models.user import User
+
+
+class Command(BaseCommand):
+    help = (
+        "주문 생성 파이프라인의 주문당 쿼리 수와 소요 시간을 측정합니다. "
+        "측정에 사용한 주문은 모두 롤백됩니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--orders", type=int, default=50, help="생성할 주문 개수 (기본값 50)"
+        )
+        parser.add_argument(
+            "--service",
+            type=str,
+            default=None,
+            help="주문할 서비스 uuid (기본값: 옵션이 있는 가장 최근 서비스)",
+        )
+        parser.add_argument(
+            "--user",
+            type=str,
+            default=None,
+            help="주문자 이메일 (기본값: 첫번째 사용자)",
+        )
+
+    def handle(self, *args, **options):
+        if options["orders"] < 1:
+            raise CommandError("--orders must be greater than 0")
+
+        services = Service.objects.filter(temporary=False, service_option__isnull=False)
+        if options["service"]:
+            services = services.filter(service_uuid=options["service"])
+        service = services.order_by("-created").first()
+        if service is None:
+            raise CommandError("Cannot find service with options to benchmark")
+
+        users = User.objects.all()
+        if options["user"]:
+            users = users.filter(email=options["user"])
+        orderer = users.order_by("id").first()
+        if orderer is None:
+            raise CommandError("Cannot find orderer to benchmark")
+
+        # 서비스의 모든 재료, 옵션을 선택한 주문 (이미지는 S3 업로드가 필요하므로 제외)
+        material_uuids = list(
+            service.service_material.values_list("material_uuid", flat=True)
+        )
+        options_queryset = service.service_option.all()
+        option_uuids = list(options_queryset.values_list("option_uuid", flat=True))
+        option_price: int = sum(options_queryset.values_list("option_price", flat=True))
+
+        query_counts: List[int] = []
+        latencies: List[float] = []
+        with transaction.atomic():
+            for _ in range(options["orders"]):
+                with CaptureQueriesContext(connection) as context:
+                    started: float = time.perf_counter()
+                    OrderCreateService.create_order(
+                        orderer=orderer,
+                        service_uuid=str(service.service_uuid),
+                        material_uuids=material_uuids,
+                        option_uuids=option_uuids,
+                        transaction_option="delivery",
+                        service_price=service.basic_price,
+                        option_price=option_price,
+                    )
+                    latencies.append((time.perf_counter() - started) * 1000)
+                query_counts.append(len(context.captured_queries))
+            transaction.set_rollback(True)
+
+        latencies.sort()
+        self.stdout.write(
+            f"service: {service.service_uuid} "
+            f"(materials: {len(material_uuids)}, options: {len(option_uuids)})"
+        )
+        self.stdout.write(
+            f"orders: {len(query_counts)}, "
+            f"queries per order: min {min(query_counts)} / max {max(query_counts)}"
+        )
+        self.stdout.write(
+            f"latency(ms): mean {statistics.mean(latencies):.2f}, "
+            f"p50 {latencies[len(latencies) // 2]:.2f}, "
+            f"p95 {latencies[math.ceil(len(latencies) * 0.95) - 1]:.2f}, "
+            f"max {latencies[-1]:.2f}"
+        )
@@ -1,21 +1,43 @@
 from django.db import models
+from django.db.models import QuerySet
 
 from users.models import User
 
 
 class OrderManager(models.Manager):
+    # 주문 목록 조회(OrderRetrieveSerializer)에서 사용하는 쿼리 계획
+    # - select_related : 주문 1건당 최대 1개인 관계 -> 목록 조회 쿼리에 JOIN
+    #   (서비스 정보는 리포머 정보까지 미리 직렬화된 서비스 카드를 사용)
+    # - prefetch_related : 주문 1건당 여러개인 관계 -> 관계마다 IN 쿼리 1번
+    RETRIEVE_SELECT_RELATED = (
+        "orderer",
+        "orderer_information",
+        "transaction",
+        "service__service_card",
+    )
+    RETRIEVE_PREFETCH_RELATED = (
+        "materials",
+        "additional_options__service_option_image",
+        "order_status",
+        "order_image",
+        "transaction__delivery_information",
+    )
+
+    def with_retrieve_relations(self, queryset: QuerySet = None) -> QuerySet:
+        if queryset is None:
+            queryset = super().get_queryset()
+        return queryset.select_related(*self.RETRIEVE_SELECT_RELATED).prefetch_related(
+            *self.RETRIEVE_PREFETCH_RELATED
+        )
 
     def get_orders_by_orderer(self, user: User):
         # user 정보를 사용해서 orderer에 관한 order 목록을 가져오기
-        return super().get_queryset().filter(orderer=user)
+        return self.with_retrieve_relations().filter(orderer=user)
 
     def get_orders_by_reformer(self, user: User = None):
         # user 정보를 사용해서, reformer가 처리해야할 모든 order 목록을 가져오기
-        return (
-            super()
-            .get_queryset()
-            .select_related("service", "service__market", "service__market__reformer")
-            .filter(service__market__reformer__user=user)
+        return self.with_retrieve_relations().filter(
+            service__market__reformer__user=user
         )
 
 
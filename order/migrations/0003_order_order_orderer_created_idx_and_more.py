@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-18 09:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0005_service_market_serv_created_idx_and_more'),
+        ('order', '0002_order_rejected_reason'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['orderer', 'created', 'order_uuid'], name='order_orderer_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['orderer', 'total_price', 'order_uuid'], name='order_orderer_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['service', 'created', 'order_uuid'], name='order_service_created_idx'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:07
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_current_status(apps, schema_editor):
+    # 기존 주문의 현재 상태를 가장 최근 상태 이력으로 채움
+    Order = apps.get_model('order', 'Order')
+    OrderStatus = apps.get_model('order', 'OrderStatus')
+    latest_status = (
+        OrderStatus.objects.filter(order=OuterRef('pk'))
+        .order_by('-created', '-id')
+        .values('status')[:1]
+    )
+    Order.objects.update(
+        current_status=Coalesce(Subquery(latest_status), Value('pending'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('market', '0008_service_filters'),
+        ('order', '0003_order_order_orderer_created_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='orderstatus',
+            options={'ordering': ['-created', '-id']},
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='current_status',
+            field=models.CharField(choices=[('accepted', '수락'), ('rejected', '거절'), ('pending', '대기'), ('received', '재료 수령'), ('produced', '제작 완료'), ('deliver', '배송중'), ('end', '거래 완료')], db_index=True, default='pending', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='orderstatus',
+            name='from_status',
+            field=models.CharField(choices=[('accepted', '수락'), ('rejected', '거절'), ('pending', '대기'), ('received', '재료 수령'), ('produced', '제작 완료'), ('deliver', '배송중'), ('end', '거래 완료')], max_length=10, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['orderer', 'current_status', 'created'], name='order_orderer_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['service', 'current_status', 'created'], name='order_service_status_idx'),
+        ),
+        migrations.RunPython(backfill_current_status, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0004_order_current_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderimage',
+            name='upload_status',
+            field=models.CharField(choices=[('pending', '업로드 대기'), ('ready', '업로드 완료'), ('failed', '업로드 실패')], default='ready', max_length=10),
+        ),
+    ]
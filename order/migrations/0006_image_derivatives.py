@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0005_upload_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderimage',
+            name='image_derivatives',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -36,6 +36,8 @@ class OrderQueryParamMinxin(QueryParamMixin):
                 "-totalprice": "-total_price",
                 "date": "created",
                 "-date": "-created",
+                "status": "current_status",
+                "-status": "-current_status",
             }
         )
         self.ORDER_STATUS = [
@@ -64,7 +66,7 @@ class OrderQueryParamMinxin(QueryParamMixin):
         if status:
             if status not in self.ORDER_STATUS:
                 raise ValueError("Invalid status query parameter")
-            queryset = queryset.filter(order_status__status=status)
+            queryset = queryset.filter(current_status=status)
 
         transaction = request.GET.get("transaction")
         if transaction:
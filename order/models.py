@@ -2,7 +2,7 @@ import uuid
 
 from django.db import models
 
-from core.models import TimeStampedModel
+from core.models import TimeStampedModel, UploadStatus
 from order.managers import OrderManager, OrderStatusManager
 
 
@@ -57,6 +57,12 @@ class Order(TimeStampedModel):
     total_price = models.PositiveIntegerField(null=True)  # 저장된 필드로 변경
     rejected_reason = models.TextField(null=True)  # 거절 사유
     order_date = models.DateField(auto_now_add=True)  # 주문 시간
+    current_status = models.CharField(
+        max_length=10,
+        choices=_OrderStatus.choices,
+        default=_OrderStatus.PENDING,
+        db_index=True,
+    )  # 현재 주문 상태 (변경 이력은 OrderStatus 테이블에 저장)
 
     objects = OrderManager()
 
@@ -66,6 +72,30 @@ class Order(TimeStampedModel):
 
     class Meta:
         db_table = "order"
+        indexes = [
+            # keyset 페이지네이션용 인덱스 (목록 조건 + 정렬 컬럼 + tiebreaker)
+            models.Index(
+                fields=["orderer", "created", "order_uuid"],
+                name="order_orderer_created_idx",
+            ),
+            models.Index(
+                fields=["orderer", "total_price", "order_uuid"],
+                name="order_orderer_price_idx",
+            ),
+            models.Index(
+                fields=["service", "created", "order_uuid"],
+                name="order_service_created_idx",
+            ),
+            # 주문 상태별 목록 조회용 인덱스
+            models.Index(
+                fields=["orderer", "current_status", "created"],
+                name="order_orderer_status_idx",
+            ),
+            models.Index(
+                fields=["service", "current_status", "created"],
+                name="order_service_status_idx",
+            ),
+        ]
 
 
 class OrdererInformation(TimeStampedModel):
@@ -86,20 +116,27 @@ class OrdererInformation(TimeStampedModel):
 
 
 class OrderStatus(TimeStampedModel):
-    # 주문 상태를 관리하는 테이블
+    # 주문 상태 변경 이력 테이블 (추가만 하고 수정하지 않음)
+    # 현재 주문 상태는 Order.current_status에 저장됨
     order = models.ForeignKey(
         "order.Order", on_delete=models.CASCADE, related_name="order_status"
     )
+    from_status = models.CharField(
+        max_length=10,
+        choices=_OrderStatus.choices,
+        null=True,
+    )  # 변경 전 상태 (주문 생성 시에는 null)
     status = models.CharField(
         max_length=10,
         choices=_OrderStatus.choices,
         default="pending",
-    )
+    )  # 변경 후 상태
 
     objects = OrderStatusManager()
 
     class Meta:
         db_table = "order_status"
+        ordering = ["-created", "-id"]  # 최신 이력이 먼저 오도록 정렬
 
 
 class OrderImage(TimeStampedModel):
@@ -113,6 +150,22 @@ class OrderImage(TimeStampedModel):
     )
     image_uuid = models.UUIDField(default=uuid.uuid4, unique=True)
     image = models.FileField(upload_to=get_order_image_upload_path)
+    upload_status = models.CharField(
+        max_length=10, choices=UploadStatus.choices, default=UploadStatus.READY
+    )  # storage 업로드 상태
+    image_derivatives = models.JSONField(
+        default=dict, blank=True
+    )  # 파생 이미지(썸네일, WebP) storage key
+    image_metadata = models.JSONField(
+        default=dict, blank=True
+    )  # 이미지 크기, placeholder(blurhash, 대표 색상) 정보
+    image_blob = models.ForeignKey(
+        "core.ImageBlob",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="+",
+    )  # 중복 제거된 이미지 파일 (없으면 row마다 파일을 따로 저장한 이미지)
 
 
 class Transaction(TimeStampedModel):
@@ -1,5 +1,7 @@
 from rest_framework.pagination import LimitOffsetPagination
 
+from core.pagination import KeysetPagination
+
 
 class OrderListPagination(LimitOffsetPagination):
     """
@@ -10,3 +12,14 @@ class OrderListPagination(LimitOffsetPagination):
 
     default_limit = 10
     max_limit = 100
+
+
+class OrderListCursorPagination(KeysetPagination):
+    """
+    주문 목록 keyset(cursor) 페이지네이션 설정 클래스.
+    pagination=cursor 또는 cursor 쿼리 파라미터가 넘어온 경우 사용됩니다.
+    """
+
+    default_limit = 10
+    max_limit = 100
+    default_ordering = ("-created",)
@@ -1,19 +1,10 @@
 import logging
-from typing import List, Optional
 
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import transaction
 from rest_framework import serializers
 
-from market.models import Service, ServiceMaterial, ServiceOption
-from order.models import (
-    DeliveryInformation,
-    Order,
-    OrdererInformation,
-    OrderImage,
-    OrderStatus,
-    Transaction,
-)
+from core.fields import StorageFileField, StorageFileMapField
+from order.models import Order, OrderImage
+from order.services import OrderCreateService
 from users.serializers.user_serializer.user_information_serializer import (
     UserInformationSerializer,
 )
@@ -24,6 +15,10 @@ logger = logging.getLogger(__name__)
 class OrderImageSerializer(serializers.ModelSerializer):
     image_uuid = serializers.UUIDField(read_only=True)
     image_type = serializers.CharField(read_only=True)
+    image = StorageFileField(required=False)
+    upload_status = serializers.CharField(read_only=True)
+    image_derivatives = StorageFileMapField()
+    image_metadata = serializers.JSONField(read_only=True)
 
     class Meta:
         model = OrderImage
@@ -31,18 +26,18 @@ class OrderImageSerializer(serializers.ModelSerializer):
             "image_uuid",
             "image_type",
             "image",
+            "image_derivatives",
+            "image_metadata",
+            "upload_status",
         ]
-        extra_kwargs = {
-            "image": {"required": False},
-        }
 
 
 class OrderCreateSerializer(serializers.ModelSerializer):
     order_uuid = serializers.UUIDField(read_only=True)
     transaction_option = serializers.CharField(required=True)
     service_uuid = serializers.UUIDField(write_only=True)
-    materials = serializers.ListField(write_only=True)
-    options = serializers.ListField(write_only=True)
+    materials = serializers.ListField(child=serializers.UUIDField(), write_only=True)
+    options = serializers.ListField(child=serializers.UUIDField(), write_only=True)
     orderer_name = serializers.CharField(write_only=True, required=False)
     orderer_phone_number = serializers.CharField(write_only=True, required=False)
     orderer_email = serializers.EmailField(write_only=True, required=False)
@@ -108,20 +103,7 @@ class OrderCreateSerializer(serializers.ModelSerializer):
 
         return attrs
 
-    @transaction.atomic()
     def create(self, validated_data) -> Order:
-        logger.debug(f"1. OrderSerializer.create() 호출됨: {validated_data}")
-
-        ##############################################################################
-        # multipart data에서 images 따로 빼기
-        ##############################################################################
-        images = validated_data.pop("images", [])
-        additional_images = validated_data.pop("additional_request_images", [])
-        logger.debug(f"2-1. multipart data에서 images 따로 빼기 : {images}")
-        logger.debug(
-            f"2-2. multipart data에서 additional_request_images 따로 빼기 : {additional_images}"
-        )
-
         ##############################################################################
         # 주문자 정보가 주어졌다면 -> validated_data에서 빼기
         # 주문자 정보가 주어지지 않았다면 -> request.user로 찾으면 됨
@@ -141,101 +123,19 @@ class OrderCreateSerializer(serializers.ModelSerializer):
             if value:  # 값이 있다면 orderer_data에 저장
                 orderer_data[field] = value
 
-        logger.debug(f"3. orderer_data : {orderer_data}")
-
-        ##############################################################################
-        # materials, options로 넘어온 UUID에 대한 ServiceMaterial, ServiceOption 객체 가져오기
-        ##############################################################################
-        materials: list = validated_data.pop("materials", [])
-        logger.debug(f"materials : {materials}")
-        options: list = validated_data.pop("options", [])
-        logger.debug(f"options : {options}")
-
-        material_instances = ServiceMaterial.objects.filter(
-            material_uuid__in=materials
-        )  # in을 사용해서 리스트 안에 들어있는 모든 값에 대한 UUID에 해당하는 객체를 가져올 수 있음
-        option_instances = ServiceOption.objects.filter(option_uuid__in=options)
-        logger.debug(f"4. material_instances : {material_instances.count()}")
-        logger.debug(f"5. option_instances : {option_instances.count()}")
-
-        ##############################################################################
-        # Transaction option 추출
-        ##############################################################################
-        transaction_option: str = validated_data.pop("transaction_option")
-        logger.debug(f"6. transaction_option : {transaction_option}")
-
-        ##############################################################################
-        # 서비스UUID 사용해서 서비스 객체 찾아오기
-        ##############################################################################
-        service_uuid: Optional[str] = validated_data.pop("service_uuid", None)
-        if not service_uuid:
-            raise serializers.ValidationError("service_uuid is required")
-        service: Service = Service.objects.filter(service_uuid=service_uuid).first()
-        if not service:
-            raise ObjectDoesNotExist("Cannot find service object with this uuid")
-        validated_data["service"] = service
-
-        ##############################################################################
-        # 주문 생성
-        ##############################################################################
-        validated_data["orderer"] = self.context["request"].user
-        order: Order = Order.objects.create(**validated_data)
-        logger.debug(f"7. Order 생성 성공")
-
-        ##############################################################################
-        # 주문자 정보 생성 (만약 따로 orderer 정보가 들어왔다면)
-        ##############################################################################
-        if orderer_data:
-            logger.debug("7-1. There is orderer data")
-            OrdererInformation.objects.create(
-                user=self.context.get("request").user, order=order, **orderer_data
-            )
-            logger.debug(f"7-2. OrdererInformation 생성 성공")
-
-        order.materials.set(material_instances)
-        order.additional_options.set(option_instances)
-        order.save()
-        logger.debug(f"8. order : {order}")
-
-        ##############################################################################
-        # 이미지 저장 인스턴스 생성
-        ##############################################################################
-        if images:
-            queryset: List[OrderImage] = [
-                OrderImage(order=order, image=image) for image in images
-            ]
-            OrderImage.objects.bulk_create(queryset)
-        logger.debug(f"9-1. OrderImage에 이미지 저장 성공")
-        logger.debug(f"OrderImage 개수 : {len(OrderImage.objects.all())}")
-
-        if additional_images:
-            queryset: List[OrderImage] = [
-                OrderImage(order=order, image=image, image_type="additional")
-                for image in additional_images
-            ]
-            OrderImage.objects.bulk_create(queryset)
-        logger.debug(f"9-2. AdditionalOrderImage에 이미지 저장 성공")
-        logger.debug(
-            f"AdditionalOrderImage 개수 : {len(OrderImage.objects.filter(image_type='additional'))}"
-        )
-
-        ##############################################################################
-        # OrderStatus 생성
-        ##############################################################################
-        OrderStatus.objects.create(order=order)
-        logger.debug(f"10. OrderStatus 생성 성공")
-
-        ##############################################################################
-        # Transaction 생성
-        ##############################################################################
-        _transaction: Transaction = Transaction.objects.create(
-            order=order, transaction_option=transaction_option
+        # 재료 / 옵션 조회, 가격 검증, 주문 관련 테이블 생성은 OrderCreateService에서 처리
+        order: Order = OrderCreateService.create_order(
+            orderer=self.context["request"].user,
+            service_uuid=validated_data.pop("service_uuid"),
+            material_uuids=validated_data.pop("materials", []),
+            option_uuids=validated_data.pop("options", []),
+            transaction_option=validated_data.pop("transaction_option"),
+            orderer_data=orderer_data,
+            images=validated_data.pop("images", []),
+            additional_images=validated_data.pop("additional_request_images", []),
+            **validated_data,
         )
-        if _transaction.transaction_option == "delivery":
-            # DeliveryInformation에 들어가는 정보는 추후 Reformer가 업데이트 해야함
-            # 여기서는 단순히 인스턴스만 생성
-            DeliveryInformation.objects.create(transaction=_transaction)
-        logger.debug(f"11. TransactionOption 생성 성공")
+        logger.debug(f"Order 생성 성공 : {order.order_uuid}")
 
         return order
 
@@ -244,7 +144,7 @@ class OrderCreateResponseSerializer(serializers.ModelSerializer):
     order_status = serializers.SerializerMethodField()
 
     def get_order_status(self, obj):
-        return obj.order_status.order_by("created").first().status
+        return obj.current_status
 
     class Meta:
         model = Order
@@ -9,6 +9,7 @@ from market.serializers.service_serializers.service_material.service_material_re
 from market.serializers.service_serializers.service_option.service_option_retrieve_serializer import (
     ServiceOptionRetrieveSerializer,
 )
+from market.services import ServiceCardService
 from order.models import Order
 from order.serializers.delivery_status_serializer import DeliveryStatusSerializer
 from order.serializers.order_create_serializer import OrderImageSerializer
@@ -33,6 +34,13 @@ class OrderRetrieveSerializer(serializers.ModelSerializer):
     images = OrderImageSerializer(source="order_image", many=True, read_only=True)
 
     def get_service_info(self, obj):
+        if obj.service is None:
+            return None
+
+        # 미리 직렬화된 서비스 카드를 사용 (서비스, 리포머 관련 테이블 조회 X)
+        service_card = getattr(obj.service, "service_card", None)
+        if service_card is not None and not service_card.is_stale:
+            return ServiceCardService.to_representation(service_card)
         return ServiceRetrieveSerializer(obj.service).data
 
     def get_orderer_information(self, obj):
@@ -42,9 +50,14 @@ class OrderRetrieveSerializer(serializers.ModelSerializer):
         return UserOrderInformationSerializer(obj.orderer).data
 
     def get_delivery_status(self, obj):
-        delivery_information = obj.transaction.delivery_information
-        if delivery_information.exists():
-            return DeliveryStatusSerializer(delivery_information.first()).data
+        transaction = getattr(obj, "transaction", None)
+        if transaction is None:
+            return None
+
+        # prefetch된 데이터를 사용하기 위해 exists(), first() 대신 all() 사용
+        delivery_information = list(transaction.delivery_information.all())
+        if delivery_information:
+            return DeliveryStatusSerializer(delivery_information[0]).data
         return None
 
     class Meta:
@@ -61,6 +74,7 @@ class OrderRetrieveSerializer(serializers.ModelSerializer):
             "additional_options",
             "extra_material",
             "additional_request",
+            "current_status",
             "order_status",
             "transaction",
             "delivery_status",
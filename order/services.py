@@ -1,11 +1,196 @@
 import os
-from typing import Any, List
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
 
 from boto3 import client
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import transaction
+from django.db.models import Case, QuerySet, TextField, Value, When
+from django.utils import timezone
 
-from order.models import Order
+from core.uploads import ImageUploadService
+from market.models import Service, ServiceMaterial, ServiceOption
+from order.models import (
+    DeliveryInformation,
+    Order,
+    OrdererInformation,
+    OrderImage,
+    OrderStatus,
+    Transaction,
+    _OrderStatus,
+)
+from users.models.user import User
+
+# 한번에 상태를 변경할 수 있는 최대 주문 개수
+MAX_BULK_STATUS_ORDERS = 200
+
+# 주문 상태별로 변경 가능한 다음 상태 목록
+# 거절(rejected), 거래 완료(end) 상태의 주문은 더 이상 상태를 변경할 수 없음
+ORDER_STATUS_TRANSITIONS: Dict[str, Tuple[str, ...]] = {
+    _OrderStatus.PENDING: (_OrderStatus.ACCEPTED, _OrderStatus.REJECTED),
+    _OrderStatus.ACCEPTED: (_OrderStatus.RECEIVED, _OrderStatus.REJECTED),
+    _OrderStatus.RECEIVED: (_OrderStatus.PRODUCED,),
+    _OrderStatus.PRODUCED: (_OrderStatus.DELIVER, _OrderStatus.END),
+    _OrderStatus.DELIVER: (_OrderStatus.END,),
+    _OrderStatus.REJECTED: (),
+    _OrderStatus.END: (),
+}
+
+
+class OrderStatusService:
+    """
+    주문 상태 변경 서비스
+    현재 상태는 Order.current_status 컬럼 하나로 관리하고, 변경 이력은 OrderStatus 테이블에 추가합니다.
+    """
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def validate_transition(from_status: str, to_status: str) -> None:
+        if to_status not in _OrderStatus.values:
+            raise ValueError("invalid status query parameter")
+        if to_status not in ORDER_STATUS_TRANSITIONS[from_status]:
+            raise ValueError(
+                f"Cannot change order status from {from_status} to {to_status}"
+            )
+
+    @staticmethod
+    @transaction.atomic
+    def change_status(
+        order_uuid: str, to_status: str, rejected_reason: Optional[str] = None
+    ) -> OrderStatus:
+        from_status: Optional[str] = (
+            Order.objects.filter(order_uuid=order_uuid)
+            .values_list("current_status", flat=True)
+            .first()
+        )
+        if from_status is None:
+            raise ObjectDoesNotExist("order not found")
+        OrderStatusService.validate_transition(from_status, to_status)
+
+        fields: Dict[str, Any] = {
+            "current_status": to_status,
+            "updated": timezone.now(),
+        }
+        if to_status == _OrderStatus.REJECTED:
+            fields["rejected_reason"] = rejected_reason
+
+        # 조회한 상태 그대로일 때만 변경 (compare-and-set)
+        # 동시에 다른 요청이 먼저 상태를 변경했다면 변경된 row가 없음
+        updated: int = Order.objects.filter(
+            order_uuid=order_uuid, current_status=from_status
+        ).update(**fields)
+        if not updated:
+            raise ValueError("Order status has already been changed by another request")
+
+        return OrderStatus.objects.create(
+            order_id=order_uuid, from_status=from_status, status=to_status
+        )
+
+    @staticmethod
+    def parse_order_uuid(order_uuid: Any) -> str:
+        """
+        요청으로 받은 주문 uuid를 소문자 문자열 형식으로 변환
+        uuid 형식이 아닌 값은 DB 조회 전에 400 에러로 처리합니다.
+        """
+        try:
+            return str(uuid.UUID(str(order_uuid)))
+        except ValueError:
+            raise ValueError(f"Invalid order uuid: {order_uuid}")
+
+    @staticmethod
+    @transaction.atomic
+    def bulk_change_status(
+        queryset: QuerySet,
+        order_uuids: List[str],
+        to_status: str,
+        rejected_reasons: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 주문의 상태를 한번에 변경하고 주문별 처리 결과를 반환
+        주문 개수와 관계없이 [조회 1번 + UPDATE 1번 + 이력 bulk INSERT 1번]으로 처리합니다.
+        queryset : 상태를 변경할 수 있는 주문 쿼리셋 (ex. 리폼러 본인의 주문)
+        """
+        if to_status not in _OrderStatus.values:
+            raise ValueError("invalid status query parameter")
+        if not order_uuids:
+            raise ValueError("order_uuids is required")
+        if len(order_uuids) > MAX_BULK_STATUS_ORDERS:
+            raise ValueError(
+                f"Cannot change more than {MAX_BULK_STATUS_ORDERS} orders at once"
+            )
+        order_uuids = list(
+            dict.fromkeys(
+                OrderStatusService.parse_order_uuid(order_uuid)
+                for order_uuid in order_uuids
+            )
+        )
+        rejected_reasons = {
+            OrderStatusService.parse_order_uuid(order_uuid): reason
+            for order_uuid, reason in (rejected_reasons or {}).items()
+        }
+
+        # 트랜잭션이 끝날 때까지 row lock을 걸어 다른 요청이 상태를 변경하지 못하도록 함
+        # 권한 확인을 위해 join한 서비스, 마켓, 리폼러 row는 lock을 걸지 않음
+        current_statuses: Dict[str, str] = {
+            str(order_uuid): current_status
+            for order_uuid, current_status in queryset.select_for_update(of=("self",))
+            .filter(order_uuid__in=order_uuids)
+            .values_list("order_uuid", "current_status")
+        }
+
+        results: List[Dict[str, Any]] = []
+        changed: Dict[str, str] = {}  # order_uuid : 변경 전 상태
+        for order_uuid in order_uuids:
+            from_status: Optional[str] = current_statuses.get(order_uuid)
+            if from_status is None:
+                result = "not_found"
+            elif to_status not in ORDER_STATUS_TRANSITIONS[from_status]:
+                result = "invalid_transition"
+            else:
+                result = "updated"
+                changed[order_uuid] = from_status
+            results.append(
+                {
+                    "order_uuid": order_uuid,
+                    "from_status": from_status,
+                    "result": result,
+                }
+            )
+
+        if not changed:
+            return results
+
+        fields: Dict[str, Any] = {
+            "current_status": to_status,
+            "updated": timezone.now(),
+        }
+        if to_status == _OrderStatus.REJECTED:
+            # 주문별 거절 사유를 하나의 UPDATE로 저장
+            fields["rejected_reason"] = Case(
+                *[
+                    When(order_uuid=order_uuid, then=Value(reason))
+                    for order_uuid, reason in rejected_reasons.items()
+                    if order_uuid in changed
+                ],
+                default=Value(None),
+                output_field=TextField(),
+            )
+        Order.objects.filter(
+            order_uuid__in=list(changed),
+            current_status__in=set(changed.values()),
+        ).update(**fields)
+
+        OrderStatus.objects.bulk_create(
+            [
+                OrderStatus(
+                    order_id=order_uuid, from_status=from_status, status=to_status
+                )
+                for order_uuid, from_status in changed.items()
+            ]
+        )
+        return results
 
 
 def validate_image_files(image_files: List) -> None:
@@ -15,6 +200,135 @@ def validate_image_files(image_files: List) -> None:
             raise ValidationError("Image file size must be less than 10MB")
 
 
+class OrderCreateService:
+    """
+    주문 생성 파이프라인
+    선택한 재료, 옵션, 이미지 개수와 관계없이 일정한 쿼리 수로 주문을 생성합니다.
+    1. 서비스, 선택한 재료 / 옵션 조회 (각 1번)
+    2. 제출된 가격을 조회한 옵션 / 서비스 정보로 검증 (추가 쿼리 X)
+    3. 주문, 주문자 정보, 재료 / 옵션 연결, 이미지, 상태 이력, 거래 방식 INSERT (각 최대 1번)
+       (이미지 파일은 로컬에 spool만 하고, S3 업로드는 트랜잭션 커밋 이후 worker가 처리)
+    """
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def get_order_items(
+        service_uuid: str, material_uuids: List[str], option_uuids: List[str]
+    ) -> Tuple[Service, List[ServiceMaterial], List[ServiceOption]]:
+        service: Optional[Service] = Service.objects.filter(
+            service_uuid=service_uuid
+        ).first()
+        if not service:
+            raise ObjectDoesNotExist("Cannot find service object with this uuid")
+
+        # 선택한 재료, 옵션은 해당 서비스의 재료, 옵션이어야 함
+        material_uuids = list(dict.fromkeys(str(uuid) for uuid in material_uuids))
+        materials: List[ServiceMaterial] = list(
+            ServiceMaterial.objects.filter(
+                market_service=service, material_uuid__in=material_uuids
+            )
+        )
+        if len(materials) != len(material_uuids):
+            raise ValueError("Invalid material uuid for this service")
+
+        option_uuids = list(dict.fromkeys(str(uuid) for uuid in option_uuids))
+        options: List[ServiceOption] = list(
+            ServiceOption.objects.filter(
+                market_service=service, option_uuid__in=option_uuids
+            )
+        )
+        if len(options) != len(option_uuids):
+            raise ValueError("Invalid option uuid for this service")
+
+        return service, materials, options
+
+    @staticmethod
+    def validate_prices(
+        service: Service,
+        options: List[ServiceOption],
+        service_price: int,
+        option_price: int,
+    ) -> None:
+        if service_price < service.basic_price:
+            raise ValueError("Service price must be greater than basic price")
+        # 최대 가격이 설정되지 않은 서비스(0)는 최대 가격을 검사하지 않음
+        if service.max_price and service_price > service.max_price:
+            raise ValueError("Service price must be less than max price")
+        if option_price != sum(option.option_price for option in options):
+            raise ValueError("Option price must be equal to sum of selected options")
+
+    @staticmethod
+    @transaction.atomic
+    def create_order(
+        orderer: User,
+        service_uuid: str,
+        material_uuids: List[str],
+        option_uuids: List[str],
+        transaction_option: str,
+        orderer_data: Optional[Dict[str, str]] = None,
+        images: Optional[List] = None,
+        additional_images: Optional[List] = None,
+        **order_data: Any,
+    ) -> Order:
+        service, materials, options = OrderCreateService.get_order_items(
+            service_uuid, material_uuids, option_uuids
+        )
+        OrderCreateService.validate_prices(
+            service,
+            options,
+            order_data.get("service_price"),
+            order_data.get("option_price"),
+        )
+
+        # total_price는 Order.save()에서 계산됨
+        order: Order = Order.objects.create(
+            orderer=orderer, service=service, **order_data
+        )
+
+        if orderer_data:
+            OrdererInformation.objects.create(user=orderer, order=order, **orderer_data)
+
+        # set()은 기존 연결을 조회한 후 추가하므로, 새 주문에는 연결 테이블에 바로 INSERT
+        if materials:
+            Order.materials.through.objects.bulk_create(
+                [
+                    Order.materials.through(order=order, servicematerial=material)
+                    for material in materials
+                ]
+            )
+        if options:
+            Order.additional_options.through.objects.bulk_create(
+                [
+                    Order.additional_options.through(order=order, serviceoption=option)
+                    for option in options
+                ]
+            )
+
+        # 이미지 파일은 spool 후 worker가 S3에 업로드 (요청 처리 중에는 업로드하지 않음)
+        images, additional_images = images or [], additional_images or []
+        ImageUploadService.enqueue(
+            [OrderImage(order=order) for _ in images]
+            + [
+                OrderImage(order=order, image_type="additional")
+                for _ in additional_images
+            ],
+            images + additional_images,
+        )
+
+        OrderStatus.objects.create(order=order)
+
+        _transaction: Transaction = Transaction.objects.create(
+            order=order, transaction_option=transaction_option
+        )
+        if transaction_option == "delivery":
+            # DeliveryInformation에 들어가는 정보는 추후 Reformer가 업데이트 해야함
+            DeliveryInformation.objects.create(transaction=_transaction)
+
+        return order
+
+
 @transaction.atomic
 def upload_order_images(entity: Order, image_files: List) -> None:
     """
@@ -1,15 +1,39 @@
+import hashlib
+import os
 import random
+import shutil
+import tempfile
 from datetime import date, timedelta
+from io import StringIO
 from unittest.mock import patch
 
 import black
+from django.core.files.storage import FileSystemStorage
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from django.utils.datastructures import MultiValueDict
+from PIL import Image
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 
-from market.models import Market, Service, ServiceMaterial, ServiceOption
-from order.models import DeliveryInformation, Order, OrderStatus, Transaction
+from core.derivatives import ImageDerivativeService
+from core.models import ImageBlob, StorageDeletion, UploadStatus, UploadTask
+from core.upload_handlers import ImageUploadHandler
+from core.uploads import UploadWorker
+from market.models import Market, Service, ServiceCard, ServiceMaterial, ServiceOption
+from market.services import ServiceCardService
+from order.models import (
+    DeliveryInformation,
+    Order,
+    OrderImage,
+    OrderStatus,
+    Transaction,
+)
+from order.services import OrderStatusService
 from users.models.reformer import Reformer
 from users.models.user import User
 
@@ -23,6 +47,17 @@ class OrderTestCase(APITestCase):
         self.mock_s3 = patch("storages.backends.s3boto3.S3Boto3Storage.save").start()
         self.mock_s3.return_value = "mocked_file_path/test.jpg"
 
+        # 업로드 파일은 임시 디렉토리에 spool (worker thread는 사용하지 않음)
+        self.spool_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.spool_dir, ignore_errors=True)
+        upload_settings = override_settings(
+            UPLOAD_SPOOL_DIR=self.spool_dir,
+            UPLOAD_WORKER_THREADS=0,
+            IMAGE_DERIVATIVE_WORKERS=0,
+        )
+        upload_settings.enable()
+        self.addCleanup(upload_settings.disable)
+
         self.user = User.objects.create_user(
             email="user@test.com",
             password="asdf1234@@",
@@ -145,8 +180,10 @@ class OrderTestCase(APITestCase):
             elif kwargs.get("type", None) == "pickup":
                 data["transaction_option"] = "pickup"
 
-            data["service_price"] = 50000 + itr
-            data["option_price"] = 50000 + 2 * itr
+            data["service_price"] = self.temp_service.basic_price + itr
+            data["option_price"] = (
+                selected_options[0].option_price + selected_options[1].option_price
+            )
             data["total_price"] = data["service_price"] + data["option_price"]
             data["additional_request"] = "additional request 123"
             data["orderer_name"] = "new orderer"
@@ -200,9 +237,11 @@ class OrderTestCase(APITestCase):
         data = MultiValueDict()
         data["transaction_option"] = "pickup"
         data["service_uuid"] = self.temp_service.service_uuid
-        data["service_price"] = 50000
-        data["option_price"] = 50000
-        data["total_price"] = 100000
+        data["service_price"] = self.temp_service.basic_price
+        data["option_price"] = (
+            selected_options[0].option_price + selected_options[1].option_price
+        )
+        data["total_price"] = data["service_price"] + data["option_price"]
         data["additional_request"] = "additional request 123"
         data.appendlist(
             "materials",
@@ -277,9 +316,11 @@ class OrderTestCase(APITestCase):
         data = MultiValueDict()
         data["transaction_option"] = "pickup"
         data["service_uuid"] = self.temp_service.service_uuid
-        data["service_price"] = 50000
-        data["option_price"] = 50000
-        data["total_price"] = 100000
+        data["service_price"] = self.temp_service.basic_price
+        data["option_price"] = (
+            selected_options[0].option_price + selected_options[1].option_price
+        )
+        data["total_price"] = data["service_price"] + data["option_price"]
         data["additional_request"] = "additional request 123"
         data["orderer_name"] = "new orderer"
         data["orderer_phone_number"] = "010-1234-5678"
@@ -476,6 +517,33 @@ class OrderTestCase(APITestCase):
             response.data[2].get("created"), response.data[1].get("created")
         )
 
+    def test_get_order_list_with_cursor_pagination(self):
+        # Given
+        # 주문 5개 생성
+        self.generate_order(num=5)
+        self.assertEqual(Order.objects.all().count(), 5)
+
+        # When
+        # keyset(cursor) 페이지네이션으로 2개씩 조회
+        response = self.user_client.get(
+            path="/api/orders?type=customer&pagination=cursor&sort=-totalprice&limit=2",
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        next_link = response.data["next"]
+        while next_link:
+            response = self.user_client.get(path=next_link, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            results += response.data["results"]
+            next_link = response.data["next"]
+
+        # Then
+        # 중복 없이 전체 주문이 정렬된 순서대로 반환되어야 함
+        self.assertEqual(len({result["order_uuid"] for result in results}), 5)
+        total_prices = [result["total_price"] for result in results]
+        self.assertEqual(total_prices, sorted(total_prices, reverse=True))
+
     def test_get_order_list_filter_by_transaction_pickup(self):
         # Given
         # 주문 5개 생성
@@ -514,28 +582,33 @@ class OrderTestCase(APITestCase):
         order: Order = (
             Order.objects.all().first()
         )  # 이거 말고 나머지 주문은 전부 pending 상태
-        stats = ["accepted", "rejected", "received", "produced", "deliver", "end"]
-        for stat in stats:
-            OrderStatus.objects.create(order=order, status=stat)
-        self.assertEqual(
-            OrderStatus.objects.all().count(), 9
-        )  # 기존 Order에서 생성 된 상태 3개 + 여기서 생성한거 6개
-        self.assertEqual(OrderStatus.objects.filter(status="end").count(), 1)
-        self.assertEqual(OrderStatus.objects.filter(status="produced").count(), 1)
+        stats = ["accepted", "received", "produced", "deliver", "end"]
 
-        # When
         for stat in stats:
+            OrderStatusService.change_status(
+                order_uuid=order.order_uuid, to_status=stat
+            )
+
+            # When
             response = self.user_client.get(
                 path=f"/api/orders?type=customer&status={stat}", format="json"
             )
 
             # Then
+            # 현재 상태가 일치하는 주문만 반환되어야 함
             self.assertEqual(response.status_code, status.HTTP_200_OK)
-            order_statuses = response.data[0].get("order_status")
-            self.assertTrue(
-                any(order_status["status"] == stat for order_status in order_statuses),
-                "Failed",
-            )
+            self.assertEqual(len(response.data), 1)
+            self.assertEqual(response.data[0]["order_uuid"], str(order.order_uuid))
+            self.assertEqual(response.data[0]["current_status"], stat)
+            # 상태 변경 이력은 최신순으로 반환
+            self.assertEqual(response.data[0]["order_status"][0]["status"], stat)
+
+        response = self.user_client.get(
+            path="/api/orders?type=customer&status=pending", format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(OrderStatus.objects.filter(order=order).count(), 6)
 
     def test_get_order_list_filter_by_date(self):
         # Given
@@ -620,6 +693,60 @@ class OrderTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 5)
 
+    def test_get_order_list_query_budget(self):
+        # 주문 목록 조회 시 주문 개수와 관계 없이 일정한 개수의 쿼리만 발생해야 함
+        # count 1 + 주문 목록 1
+        # + prefetch 6 (materials, additional_options, service_option_image,
+        #               order_status, order_image, delivery_information)
+        ORDER_LIST_QUERY_BUDGET = 8
+
+        def get_query_counts():
+            query_counts = []
+            for client, _type in (
+                (self.user_client, "customer"),
+                (self.reformer_client, "reformer"),
+            ):
+                with CaptureQueriesContext(connection) as context:
+                    response = client.get(
+                        path=f"/api/orders?type={_type}&limit=100", format="json"
+                    )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                query_counts.append(len(context.captured_queries))
+            return query_counts
+
+        # Given
+        # 테스트에서는 on_commit 콜백이 실행되지 않으므로 서비스 카드를 직접 갱신
+        ServiceCardService.refresh_stale_cards()
+        self.generate_order(num=2, type="delivery")
+        self.assertEqual(get_query_counts(), [ORDER_LIST_QUERY_BUDGET] * 2)
+
+        # stale 카드는 첫 조회에서 한번만 다시 만들어짐
+        ServiceCard.objects.mark_stale()
+        stale_query_counts = get_query_counts()
+        self.assertEqual(stale_query_counts[1], ORDER_LIST_QUERY_BUDGET)
+        self.assertFalse(ServiceCard.objects.filter(is_stale=True).exists())
+
+        # When
+        self.generate_order(num=8)
+
+        # Then
+        self.assertEqual(get_query_counts(), [ORDER_LIST_QUERY_BUDGET] * 2)
+        # 카드를 다시 만드는 쿼리 수도 주문 개수와 관계 없이 일정해야 함
+        ServiceCard.objects.mark_stale()
+        self.assertEqual(get_query_counts(), stale_query_counts)
+        response = self.reformer_client.get(
+            path="/api/orders?type=reformer&limit=100", format="json"
+        )
+        self.assertEqual(len(response.data), 10)
+        self.assertEqual(
+            response.data[0]["service_info"]["service_uuid"],
+            str(self.temp_service.service_uuid),
+        )
+        self.assertEqual(
+            response.data[0]["service_info"]["reformer_info"]["reformer_link"],
+            "https://reformer.com",
+        )
+
     def test_get_service_order_list(self):
         # Given
         # 주문 5개 생성
@@ -747,6 +874,322 @@ class OrderTestCase(APITestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def get_order_create_data(self, materials, options, num_images=4):
+        data = MultiValueDict()
+        data["transaction_option"] = "delivery"
+        data["service_uuid"] = self.temp_service.service_uuid
+        data["service_price"] = self.temp_service.basic_price
+        data["option_price"] = sum(option.option_price for option in options)
+        data["total_price"] = data["service_price"] + data["option_price"]
+        data["orderer_name"] = "new orderer"
+        data["orderer_phone_number"] = "010-1234-5678"
+        data["orderer_address"] = "Yeongdeungpo-gu, Seoul"
+        data.appendlist(
+            "materials", [str(material.material_uuid) for material in materials]
+        )
+        data.appendlist("options", [str(option.option_uuid) for option in options])
+        data.appendlist("images", self.get_image_resources()[:num_images])
+        return data
+
+    def test_order_creation_query_count(self):
+        # 선택한 재료, 옵션, 이미지 개수와 관계없이 주문 생성 쿼리 수가 일정해야 함
+        materials = list(
+            ServiceMaterial.objects.filter(market_service=self.temp_service)
+        )
+        options = list(ServiceOption.objects.filter(market_service=self.temp_service))
+
+        # 같은 내용의 이미지를 먼저 업로드해서, 두 요청 모두 업로드 작업 없이 이미지 row만 생성
+        response = self.user_client.post(
+            path="/api/orders",
+            data=self.get_order_create_data(materials=materials, options=options),
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        query_counts = []
+        for selected in (1, 2):
+            data = self.get_order_create_data(
+                materials=materials[:selected],
+                options=options[: selected + 1],
+                num_images=selected * 2,
+            )
+            with CaptureQueriesContext(connection) as context:
+                response = self.user_client.post(
+                    path="/api/orders", data=data, format="multipart"
+                )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            query_counts.append(len(context.captured_queries))
+
+        self.assertEqual(query_counts[0], query_counts[1])
+        order = Order.objects.get(order_uuid=response.data["order_uuid"])
+        self.assertEqual(order.materials.count(), 2)
+        self.assertEqual(order.additional_options.count(), 3)
+        self.assertEqual(order.order_image.count(), 4)
+        self.assertEqual(order.current_status, "pending")
+        self.assertEqual(order.transaction.delivery_information.count(), 1)
+
+    def test_order_creation_with_invalid_prices(self):
+        # 제출된 가격이 서비스 / 옵션 가격과 맞지 않으면 주문이 생성되지 않아야 함
+        materials = list(
+            ServiceMaterial.objects.filter(market_service=self.temp_service)
+        )
+        options = list(ServiceOption.objects.filter(market_service=self.temp_service))
+
+        data = self.get_order_create_data(materials=materials, options=options)
+        data["option_price"] = data["option_price"] - 1
+        data["total_price"] = data["service_price"] + data["option_price"]
+        response = self.user_client.post(
+            path="/api/orders", data=data, format="multipart"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        data = self.get_order_create_data(materials=materials, options=options)
+        data["service_price"] = self.temp_service.max_price + 1
+        data["total_price"] = data["service_price"] + data["option_price"]
+        response = self.user_client.post(
+            path="/api/orders", data=data, format="multipart"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Order.objects.count(), 0)
+
+    def test_order_image_upload_rejected_while_streaming(self):
+        # 이미지가 아니거나 크기 제한을 넘는 파일은 업로드 도중 거절되어야 함
+        materials = list(
+            ServiceMaterial.objects.filter(market_service=self.temp_service)
+        )
+        options = list(ServiceOption.objects.filter(market_service=self.temp_service))
+
+        data = self.get_order_create_data(materials=materials, options=options)
+        data.setlist(
+            "images",
+            [
+                SimpleUploadedFile(
+                    "fake.jpg", b"this is not an image" * 10, content_type="image/jpeg"
+                )
+            ],
+        )
+        response = self.user_client.post(
+            path="/api/orders", data=data, format="multipart"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("not a supported image", str(response.data))
+
+        for limit in ({"IMAGE_UPLOAD_MAX_SIZE": 100}, {"IMAGE_UPLOAD_MAX_PIXELS": 100}):
+            with override_settings(**limit):
+                response = self.user_client.post(
+                    path="/api/orders",
+                    data=self.get_order_create_data(
+                        materials=materials, options=options
+                    ),
+                    format="multipart",
+                )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertEqual(Order.objects.count(), 0)
+        # 거절된 업로드의 임시 파일은 남지 않아야 함
+        self.assertEqual(os.listdir(self.spool_dir), [])
+
+        # 정상 이미지는 spool 파일로 옮겨지고, 업로드 받는 동안 해시와 크기를 계산
+        handler = ImageUploadHandler()
+        with open("./test_resources/test1.jpg", "rb") as f:
+            content = f.read()
+        handler.new_file("images", "test1.jpg", "image/jpeg", len(content), None)
+        for start in range(0, len(content), 100):
+            handler.receive_data_chunk(content[start : start + 100], start)
+        uploaded_file = handler.file_complete(len(content))
+        self.assertEqual(
+            uploaded_file.content_hash, hashlib.sha256(content).hexdigest()
+        )
+        self.assertEqual(uploaded_file.image_format, "jpeg")
+        self.assertEqual(uploaded_file.image_size, (50, 50))
+        self.assertEqual(uploaded_file.read(), content)
+        uploaded_file.close()
+
+    def test_order_images_uploaded_by_worker(self):
+        # 주문 이미지는 요청 처리 중에는 spool만 되고, worker가 storage에 업로드해야 함
+        self.generate_order(num=1)
+        order = Order.objects.first()
+        images = list(order.order_image.all())
+        self.assertEqual(len(images), 4)
+        self.assertTrue(
+            all(image.upload_status == UploadStatus.PENDING for image in images)
+        )
+        # 4개의 이미지 중 내용이 같은 이미지는 1번만 spool
+        self.assertEqual(UploadTask.objects.count(), 2)
+        self.assertEqual(len(os.listdir(self.spool_dir)), 2)
+        self.mock_s3.assert_not_called()
+
+        # When
+        storage_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, storage_dir, ignore_errors=True)
+        storage = FileSystemStorage(location=storage_dir)
+        processed = UploadWorker.process_pending(storage=storage)
+
+        # Then
+        self.assertEqual(processed, 2)
+        self.assertEqual(UploadTask.objects.count(), 0)
+        self.assertEqual(os.listdir(self.spool_dir), [])
+        for image in OrderImage.objects.filter(order=order).select_related(
+            "image_blob"
+        ):
+            self.assertEqual(image.upload_status, UploadStatus.READY)
+            self.assertEqual(image.image.name, image.image_blob.image.name)
+            self.assertTrue(image.image.name.startswith("images/"))
+            self.assertTrue(storage.exists(image.image.name))
+
+    def test_generate_image_derivatives(self):
+        # 업로드가 끝난 주문 이미지로 크기별 WebP, JPEG 파생 이미지를 만들어야 함
+        self.generate_order(num=1)
+        storage = FileSystemStorage(location=tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, storage.location, ignore_errors=True)
+        UploadWorker.process_pending(storage=storage)
+        image = OrderImage.objects.filter(image_type="order").first()
+
+        # When
+        keys = ImageDerivativeService.generate(
+            "core.ImageBlob", image.image_blob_id, "image", storage=storage
+        )
+
+        # Then
+        self.assertEqual(
+            set(keys), {"small_webp", "small_jpeg", "medium_webp", "medium_jpeg"}
+        )
+        # 같은 blob을 참조하는 이미지 row에 파생 이미지 key와 이미지 정보 복사
+        image.refresh_from_db()
+        self.assertEqual(image.image_derivatives, keys)
+        self.assertEqual(image.image_metadata["width"], 50)
+        self.assertEqual(image.image_metadata["height"], 50)
+        self.assertEqual(image.image_metadata["size"], storage.size(image.image.name))
+        self.assertRegex(image.image_metadata["dominant_color"], r"^#[0-9a-f]{6}$")
+        # 4x3 성분의 blurhash 길이 : 1 + 1 + 4 + 2 * 11
+        self.assertEqual(len(image.image_metadata["blurhash"]), 28)
+        self.assertEqual(
+            OrderImage.objects.filter(
+                image_blob=image.image_blob_id, image_derivatives=keys
+            ).count(),
+            2,
+        )
+        for name, key in keys.items():
+            self.assertIn("/derivatives/", key)
+            with storage.open(key, "rb") as derivative, Image.open(derivative) as img:
+                self.assertEqual(
+                    img.format, "WEBP" if name.endswith("webp") else "JPEG"
+                )
+                max_length = 320 if name.startswith("small") else 960
+                self.assertLessEqual(max(img.size), max_length)
+            self.assertLess(storage.size(key), storage.size(image.image.name))
+
+        # 파생 이미지가 없는 blob만 다시 처리 대상
+        missing = ImageDerivativeService.get_missing("core.ImageBlob", "image")
+        self.assertNotIn(image.image_blob_id, missing)
+        self.assertEqual(len(missing), 1)
+        self.assertEqual(
+            ImageDerivativeService.get_missing("order.OrderImage", "image"), []
+        )
+
+        # 주문 조회 응답에 파생 이미지 URL 포함
+        with override_settings(STORAGE_CDN_URL="https://cdn.test/"):
+            response = self.user_client.get(
+                path="/api/orders?type=customer", format="json"
+            )
+        images = {item["image_uuid"]: item for item in response.data[0]["images"]}
+        self.assertEqual(
+            images[str(image.image_uuid)]["image_derivatives"]["small_webp"],
+            f"https://cdn.test/{keys['small_webp']}",
+        )
+        self.assertEqual(
+            images[str(image.image_uuid)]["image_metadata"], image.image_metadata
+        )
+
+    def test_order_image_upload_retry(self):
+        # 업로드에 실패한 작업은 대기 시간 이후 다시 시도하고, 최대 횟수를 넘으면 실패 처리
+        self.generate_order(num=1)
+        task = UploadTask.objects.first()
+        storage = FileSystemStorage(location=tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, storage.location, ignore_errors=True)
+
+        with override_settings(UPLOAD_MAX_ATTEMPTS=2):
+            with patch.object(storage, "save", side_effect=OSError("storage down")):
+                delay = UploadWorker.process_task(task.pk, storage=storage)
+                task.refresh_from_db()
+                self.assertEqual(delay, 5)
+                self.assertEqual(task.status, UploadTask.Status.PENDING)
+                self.assertEqual(task.attempts, 1)
+                self.assertGreater(task.next_attempt_at, timezone.now())
+
+                # 재시도 시각 이전에는 처리하지 않음
+                self.assertIsNone(UploadWorker.process_task(task.pk, storage=storage))
+                task.refresh_from_db()
+                self.assertEqual(task.attempts, 1)
+
+                UploadTask.objects.filter(pk=task.pk).update(
+                    next_attempt_at=timezone.now()
+                )
+                self.assertIsNone(UploadWorker.process_task(task.pk, storage=storage))
+
+        task.refresh_from_db()
+        self.assertEqual(task.status, UploadTask.Status.FAILED)
+        self.assertEqual(task.last_error, "storage down")
+        # blob을 참조하는 이미지 row 모두 실패 처리
+        self.assertEqual(
+            set(
+                OrderImage.objects.filter(image_blob=task.object_id).values_list(
+                    "upload_status", flat=True
+                )
+            ),
+            {UploadStatus.FAILED},
+        )
+
+    def test_order_images_deduplicated(self):
+        # 내용이 같은 이미지는 storage에 1번만 업로드하고, 참조가 모두 없어지면 삭제해야 함
+        self.generate_order(num=2)
+        blobs = list(ImageBlob.objects.all())
+        self.assertEqual(len(blobs), 2)
+        self.assertEqual({blob.ref_count for blob in blobs}, {4})
+        self.assertEqual(UploadTask.objects.count(), 2)
+
+        storage = FileSystemStorage(location=tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, storage.location, ignore_errors=True)
+        self.assertEqual(UploadWorker.process_pending(storage=storage), 2)
+        self.assertFalse(
+            OrderImage.objects.exclude(upload_status=UploadStatus.READY).exists()
+        )
+
+        # 이미 업로드된 이미지는 spool, 업로드 작업 없이 업로드 완료 상태로 생성
+        self.generate_order(num=1)
+        self.assertEqual(UploadTask.objects.count(), 0)
+        self.assertEqual(os.listdir(self.spool_dir), [])
+        self.assertEqual(ImageBlob.objects.count(), 2)
+        self.assertFalse(
+            OrderImage.objects.exclude(upload_status=UploadStatus.READY).exists()
+        )
+
+        # When
+        orders = list(Order.objects.order_by("created"))
+        Order.objects.filter(pk__in=[order.pk for order in orders[:2]]).delete()
+
+        # Then
+        self.assertEqual(
+            set(ImageBlob.objects.values_list("ref_count", flat=True)), {2}
+        )
+        self.assertFalse(StorageDeletion.objects.exists())
+
+        orders[2].delete()
+        self.assertFalse(ImageBlob.objects.exists())
+        self.assertEqual(
+            set(StorageDeletion.objects.values_list("key", flat=True)),
+            {blob.image.name for blob in blobs},
+        )
+
+    def test_benchmark_order_create_command(self):
+        # 벤치마크로 생성한 주문은 모두 롤백되어야 함
+        out = StringIO()
+        call_command("benchmark_order_create", orders=3, stdout=out)
+
+        self.assertIn("orders: 3, queries per order", out.getvalue())
+        self.assertIn("latency(ms)", out.getvalue())
+        self.assertEqual(Order.objects.count(), 0)
+
     def test_order_creation_with_invalid_data(self):
         # 잘못된 데이터가 입력되었을 때 오류가 잘 반환되는지 확인
         data = MultiValueDict()
@@ -796,6 +1239,179 @@ class OrderTestCase(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_update_order_status_invalid_transition(self):
+        # 허용되지 않은 상태 변경 요청은 거절되고, 현재 상태와 이력이 변경되지 않아야 함
+        self.generate_order(num=1)
+        order = Order.objects.first()
+
+        response = self.reformer_client.patch(
+            path=f"/api/orders/{str(order.order_uuid)}/status",
+            data={"status": "end"},  # pending -> end 변경 불가
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        order.refresh_from_db()
+        self.assertEqual(order.current_status, "pending")
+        self.assertEqual(order.order_status.count(), 1)
+
+        # 거절된 주문은 더 이상 상태를 변경할 수 없음
+        OrderStatusService.change_status(
+            order_uuid=order.order_uuid, to_status="rejected"
+        )
+        response = self.reformer_client.patch(
+            path=f"/api/orders/{str(order.order_uuid)}/status",
+            data={"status": "accepted"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        order.refresh_from_db()
+        self.assertEqual(order.current_status, "rejected")
+
+    def test_update_order_status_history(self):
+        # 상태 변경 시 현재 상태 컬럼이 갱신되고, 변경 이력이 순서대로 쌓여야 함
+        self.generate_order(num=1)
+        order = Order.objects.first()
+
+        for stat in ["accepted", "received", "produced"]:
+            response = self.reformer_client.patch(
+                path=f"/api/orders/{str(order.order_uuid)}/status",
+                data={"status": stat},
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        order.refresh_from_db()
+        self.assertEqual(order.current_status, "produced")
+        self.assertEqual(
+            list(order.order_status.values_list("from_status", "status")),
+            [
+                ("received", "produced"),
+                ("accepted", "received"),
+                ("pending", "accepted"),
+                (None, "pending"),
+            ],
+        )
+
+    def test_bulk_update_order_status(self):
+        # Given
+        self.generate_order(num=4)
+        orders = list(Order.objects.order_by("created"))
+        OrderStatusService.change_status(
+            order_uuid=orders[0].order_uuid, to_status="accepted"
+        )
+        OrderStatusService.change_status(
+            order_uuid=orders[1].order_uuid, to_status="rejected"
+        )
+        unknown_uuid = "00000000-0000-0000-0000-000000000000"
+
+        # When
+        response = self.reformer_client.patch(
+            path="/api/orders/status",
+            data={
+                "order_uuids": [str(order.order_uuid) for order in orders]
+                + [unknown_uuid],
+                "status": "rejected",
+                "rejected_reasons": {str(orders[0].order_uuid): "sold out"},
+            },
+            format="json",
+        )
+
+        # Then
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["updated_count"], 3)
+        results = {
+            result["order_uuid"]: result["result"]
+            for result in response.data["results"]
+        }
+        self.assertEqual(results[str(orders[0].order_uuid)], "updated")
+        self.assertEqual(results[str(orders[1].order_uuid)], "invalid_transition")
+        self.assertEqual(results[str(orders[2].order_uuid)], "updated")
+        self.assertEqual(results[unknown_uuid], "not_found")
+
+        for order in orders:
+            order.refresh_from_db()
+            self.assertEqual(order.current_status, "rejected")
+            self.assertEqual(order.order_status.first().status, "rejected")
+        self.assertEqual(orders[0].rejected_reason, "sold out")
+        self.assertIsNone(orders[2].rejected_reason)
+        self.assertEqual(orders[0].order_status.first().from_status, "accepted")
+        self.assertEqual(orders[2].order_status.first().from_status, "pending")
+
+    def test_bulk_update_order_status_query_count(self):
+        # 변경할 주문 개수와 관계없이 쿼리 수가 일정해야 함
+        self.generate_order(num=6)
+        order_uuids = [
+            str(order_uuid)
+            for order_uuid in Order.objects.order_by("created").values_list(
+                "order_uuid", flat=True
+            )
+        ]
+
+        query_counts = []
+        for batch in (order_uuids[:2], order_uuids[2:]):
+            with CaptureQueriesContext(connection) as context:
+                response = self.reformer_client.patch(
+                    path="/api/orders/status",
+                    data={"order_uuids": batch, "status": "accepted"},
+                    format="json",
+                )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data["updated_count"], len(batch))
+            query_counts.append(len(context.captured_queries))
+
+        self.assertEqual(query_counts[0], query_counts[1])
+
+    def test_bulk_update_order_status_with_invalid_uuid(self):
+        # uuid 형식이 아닌 값이 포함되면 주문을 변경하지 않고 400 에러를 반환해야 함
+        self.generate_order(num=1)
+        order = Order.objects.first()
+
+        for data in (
+            {"order_uuids": [str(order.order_uuid), "not-a-uuid"]},
+            {"order_uuids": [str(order.order_uuid), {"order_uuid": 1}]},
+            {
+                "order_uuids": [str(order.order_uuid)],
+                "rejected_reasons": {"not-a-uuid": "sold out"},
+            },
+        ):
+            response = self.reformer_client.patch(
+                path="/api/orders/status",
+                data={"status": "rejected", **data},
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        order.refresh_from_db()
+        self.assertEqual(order.current_status, "pending")
+
+        # 대문자 uuid도 같은 주문으로 처리
+        response = self.reformer_client.patch(
+            path="/api/orders/status",
+            data={
+                "order_uuids": [str(order.order_uuid).upper()],
+                "status": "accepted",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["updated_count"], 1)
+
+    def test_bulk_update_order_status_permission(self):
+        # 일반 사용자는 주문 상태를 변경할 수 없음
+        self.generate_order(num=1)
+        order = Order.objects.first()
+
+        response = self.user_client.patch(
+            path="/api/orders/status",
+            data={"order_uuids": [str(order.order_uuid)], "status": "accepted"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        order.refresh_from_db()
+        self.assertEqual(order.current_status, "pending")
+
     def test_get_rejceted_order_status_with_order_uuid(self):
         # Given
         # 주문 1개 생성
@@ -835,7 +1451,10 @@ class OrderTestCase(APITestCase):
         self.assertEqual(Order.objects.all().count(), 1)
         order = Order.objects.all().first()
 
-        # update order status update to received
+        # update order status update to received (pending -> accepted -> received)
+        OrderStatusService.change_status(
+            order_uuid=order.order_uuid, to_status="accepted"
+        )
         response = self.reformer_client.patch(
             path=f"/api/orders/{str(order.order_uuid)}/status",
             data={"status": "received"},
@@ -9,6 +9,11 @@ urlpatterns = [
         ServiceOrderListView.as_view(),
         name="service_order_list",
     ),
+    path(
+        "/status",
+        OrderBulkStatusView.as_view(),
+        name="order_bulk_status_update",
+    ),
     path(
         "/<uuid:order_uuid>/status",
         OrderStatusView.as_view(),
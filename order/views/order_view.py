@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models.query import QuerySet
@@ -9,11 +9,13 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from core.exceptions import view_exception_handler
+from core.mixins import ImageUploadViewMixin
 from core.permissions import IsReformer
 from market.models import Service
+from market.services import ServiceCardService
 from order.mixins import OrderQueryParamMinxin, OrderStatusQueryParamMixin
 from order.models import DeliveryInformation, Order, OrderStatus, _OrderStatus
-from order.pagination import OrderListPagination
+from order.pagination import OrderListCursorPagination, OrderListPagination
 from order.serializers.delivery_status_serializer import DeliveryStatusSerializer
 from order.serializers.order_create_serializer import (
     OrderCreateResponseSerializer,
@@ -24,11 +26,12 @@ from order.serializers.order_status_serializer import (
     OrderStatusRejectedSerailzier,
     OrderStatusRetrieveSerializer,
 )
+from order.services import OrderStatusService
 
 logger = logging.getLogger(__name__)
 
 
-class OrderView(OrderQueryParamMinxin, APIView):
+class OrderView(ImageUploadViewMixin, OrderQueryParamMinxin, APIView):
     permission_classes = [IsAuthenticated]
     paginator = OrderListPagination()
 
@@ -44,6 +47,13 @@ class OrderView(OrderQueryParamMinxin, APIView):
 
         return queryset
 
+    @staticmethod
+    def refresh_service_cards(orders) -> None:
+        # 페이지에 포함된 서비스의 stale 카드를 직렬화 전에 한번에 다시 만듦
+        ServiceCardService.refresh_related_cards(
+            order.service for order in orders if order.service is not None
+        )
+
     @view_exception_handler
     def get(self, request):
         """
@@ -64,7 +74,18 @@ class OrderView(OrderQueryParamMinxin, APIView):
             case _:
                 raise ValueError("Invalid type query parameter")
 
+        if OrderListCursorPagination.is_requested(request):
+            # keyset 페이지네이션은 next/previous 커서를 함께 응답해야 하므로 요청마다 생성
+            cursor_paginator = OrderListCursorPagination()
+            page = cursor_paginator.paginate_queryset(queryset, request)
+            self.refresh_service_cards(page)
+            serializer: OrderRetrieveSerializer = OrderRetrieveSerializer(
+                instance=page, many=True
+            )
+            return cursor_paginator.get_paginated_response(serializer.data)
+
         paginated_queryset = self.paginator.paginate_queryset(queryset, request)
+        self.refresh_service_cards(paginated_queryset)
         serializer: OrderRetrieveSerializer = OrderRetrieveSerializer(
             instance=paginated_queryset, many=True
         )
@@ -97,11 +118,14 @@ class ServiceOrderListView(APIView):
         if not service:
             raise ObjectDoesNotExist("service not found")
 
-        queryset: QuerySet = Order.objects.filter(service=service)
-        if queryset.count() == 0:
+        orders: List[Order] = list(
+            Order.objects.with_retrieve_relations().filter(service=service)
+        )
+        if not orders:
             return Response(data=[], status=status.HTTP_204_NO_CONTENT)
 
-        serializer = OrderRetrieveSerializer(instance=queryset, many=True)
+        OrderView.refresh_service_cards(orders)
+        serializer = OrderRetrieveSerializer(instance=orders, many=True)
         return Response(data=serializer.data, status=status.HTTP_200_OK)
 
 
@@ -146,32 +170,53 @@ class OrderStatusView(OrderStatusQueryParamMixin, APIView):
         if _status is None:
             raise ValueError("status query parameter is required")
 
-        order: Order = Order.objects.filter(order_uuid=order_uuid).first()
-        if not order:
-            raise ObjectDoesNotExist("order not found")
-        order_status: OrderStatus = OrderStatus.objects.filter(order=order).first()
-
-        match _status:
-            case "accepted":
-                order_status.status = _OrderStatus.ACCEPTED
-            case "rejected":
-                order_status.status = _OrderStatus.REJECTED
-                order.rejected_reason = request.data.get("rejected_reason", None)
-            case "received":
-                order_status.status = _OrderStatus.RECEIVED
-            case "produced":
-                order_status.status = _OrderStatus.PRODUCED
-            case "deliver":
-                order_status.status = _OrderStatus.DELIVER
-            case "end":
-                order_status.status = _OrderStatus.END
-            case _:
-                raise ValueError("invalid status query parameter")
-        order.save()
-        order_status.save()
+        OrderStatusService.change_status(
+            order_uuid=order_uuid,
+            to_status=_status,
+            rejected_reason=request.data.get("rejected_reason", None),
+        )
         return Response(status=status.HTTP_200_OK)
 
 
+class OrderBulkStatusView(APIView):
+    """
+    리폼러가 처리해야 하는 여러 주문의 상태를 한번에 변경하는 API
+    """
+
+    permission_classes = [IsReformer]
+
+    @view_exception_handler
+    def patch(self, request) -> Response:
+        order_uuids = request.data.get("order_uuids")
+        if not isinstance(order_uuids, list):
+            raise ValueError("order_uuids must be a list")
+
+        _status: Optional[str] = request.data.get("status")
+        if _status is None:
+            raise ValueError("status is required")
+
+        rejected_reasons = request.data.get("rejected_reasons") or {}
+        if not isinstance(rejected_reasons, dict):
+            raise ValueError("rejected_reasons must be an object")
+
+        results = OrderStatusService.bulk_change_status(
+            queryset=Order.objects.filter(service__market__reformer__user=request.user),
+            order_uuids=order_uuids,
+            to_status=_status,
+            rejected_reasons=rejected_reasons,
+        )
+        return Response(
+            data={
+                "status": _status,
+                "updated_count": sum(
+                    1 for result in results if result["result"] == "updated"
+                ),
+                "results": results,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class DeliveryInformationUpdateView(APIView):
     permission_classes = [IsReformer]
 
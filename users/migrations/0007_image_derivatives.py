@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_user_report_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='profile_image_derivatives',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 10:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0007_image_derivatives'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='profile_image_metadata',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
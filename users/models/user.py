@@ -32,6 +32,12 @@ class User(AbstractBaseUser, PermissionsMixin):
     profile_image = models.FileField(
         upload_to=get_user_profile_image_upload_path, null=True, blank=True
     )  # 프로필 이미지 필드
+    profile_image_derivatives = models.JSONField(
+        default=dict, blank=True
+    )  # 프로필 이미지 파생 이미지(썸네일, WebP) storage key
+    profile_image_metadata = models.JSONField(
+        default=dict, blank=True
+    )  # 프로필 이미지 크기, placeholder(blurhash, 대표 색상) 정보
     introduce = models.TextField(null=True, blank=True)  # 사용자 소개글
     is_superuser = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
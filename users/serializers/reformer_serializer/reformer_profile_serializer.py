@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from core.fields import StorageFileField
 from users.models.reformer import (
     Reformer,
     ReformerAwards,
@@ -15,7 +16,7 @@ from users.serializers.user_serializer.user_information_serializer import (
 
 class ReformerCertificationSerializer(serializers.ModelSerializer):
     certification_uuid = serializers.UUIDField(read_only=True)
-    proof_document = serializers.FileField(read_only=True)
+    proof_document = StorageFileField(read_only=True)
 
     class Meta:
         model = ReformerCertification
@@ -41,7 +42,7 @@ class ReformerCertificationSerializer(serializers.ModelSerializer):
 
 class ReformerAwardsSerializer(serializers.ModelSerializer):
     award_uuid = serializers.UUIDField(read_only=True)
-    proof_document = serializers.FileField(read_only=True)
+    proof_document = StorageFileField(read_only=True)
 
     class Meta:
         model = ReformerAwards
@@ -67,7 +68,7 @@ class ReformerAwardsSerializer(serializers.ModelSerializer):
 
 class ReformerCareerSerializer(serializers.ModelSerializer):
     career_uuid = serializers.UUIDField(read_only=True)
-    proof_document = serializers.FileField(read_only=True)
+    proof_document = StorageFileField(read_only=True)
 
     class Meta:
         model = ReformerCareer
@@ -94,7 +95,7 @@ class ReformerCareerSerializer(serializers.ModelSerializer):
 
 class ReformerEducationSerializer(serializers.ModelSerializer):
     education_uuid = serializers.UUIDField(read_only=True)
-    proof_document = serializers.FileField(read_only=True)
+    proof_document = StorageFileField(read_only=True)
 
     class Meta:
         model = ReformerEducation
@@ -121,7 +122,7 @@ class ReformerEducationSerializer(serializers.ModelSerializer):
 
 class ReformerFreelancerSerializer(serializers.ModelSerializer):
     freelancer_uuid = serializers.UUIDField(read_only=True)
-    proof_document = serializers.FileField(read_only=True)
+    proof_document = StorageFileField(read_only=True)
 
     class Meta:
         model = ReformerFreelancer
@@ -156,7 +157,7 @@ class ReformerProfileSerializer(serializers.Serializer):
     reformer_area = serializers.CharField(required=True)
 
     def get_user_info(self, obj):
-        return UserInformationSerializer(obj.user).data
+        return UserInformationSerializer(obj.user, context=self.context).data
 
     def validate(self, attrs):
         # 1. 요청한 user가 이미 reformer 프로필을 생성했는가?
@@ -182,19 +183,19 @@ class ReformerProfileSerializer(serializers.Serializer):
         representation = super().to_representation(instance)
 
         representation["education"] = ReformerEducationSerializer(
-            instance.reformer_education.all(), many=True
+            instance.reformer_education.all(), many=True, context=self.context
         ).data
         representation["certification"] = ReformerCertificationSerializer(
-            instance.reformer_certification.all(), many=True
+            instance.reformer_certification.all(), many=True, context=self.context
         ).data
         representation["awards"] = ReformerAwardsSerializer(
-            instance.reformer_awards.all(), many=True
+            instance.reformer_awards.all(), many=True, context=self.context
         ).data
         representation["career"] = ReformerCareerSerializer(
-            instance.reformer_career.all(), many=True
+            instance.reformer_career.all(), many=True, context=self.context
         ).data
         representation["freelancer"] = ReformerFreelancerSerializer(
-            instance.reformer_freelancer.all(), many=True
+            instance.reformer_freelancer.all(), many=True, context=self.context
         ).data
 
         return representation
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from core.fields import StorageFileMapField
+from core.file_urls import FileUrlResolver
 from users.models.user import User
 
 
@@ -33,6 +35,8 @@ class UserOrderInformationSerializer(serializers.ModelSerializer):
 
 class UserInformationSerializer(serializers.ModelSerializer):
     profile_image_url = serializers.SerializerMethodField()
+    profile_image_derivatives = StorageFileMapField()
+    profile_image_metadata = serializers.JSONField(read_only=True)
 
     class Meta:
         model = User
@@ -45,16 +49,22 @@ class UserInformationSerializer(serializers.ModelSerializer):
             "agreement_terms",
             "address",
             "profile_image_url",
+            "profile_image_derivatives",
+            "profile_image_metadata",
             "introduce",
             "is_active",
             "role",
         ]
 
     def get_profile_image_url(self, obj):
-        request = self.context.get("request")
-        if request and obj.profile_image and hasattr(obj.profile_image, "url"):
-            return request.build_absolute_uri(obj.profile_image.url)
-        elif obj.profile_image and hasattr(obj.profile_image, "url"):
-            return obj.profile_image.url
-        else:
+        if self.context.get("raw_file_keys"):
+            # 미리 직렬화해서 저장하는 경우에는 URL 대신 storage key를 반환
+            return obj.profile_image.name if obj.profile_image else None
+
+        if not obj.profile_image:
             return None
+        url: str = FileUrlResolver.resolve(obj.profile_image.name)
+        request = self.context.get("request")
+        if request:
+            return request.build_absolute_uri(url)
+        return url
@@ -1,8 +1,6 @@
-import os
 from datetime import tzinfo
 from typing import Dict
 
-from boto3 import client
 from django.contrib.auth.hashers import check_password
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
@@ -12,6 +10,9 @@ from rest_framework.exceptions import ValidationError
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from core.deletions import StorageDeletionService
+from core.derivatives import ImageDerivativePool
+from core.presigned import PresignedUploadService
 from users.models.user import User
 
 
@@ -46,7 +47,7 @@ class UserService:
             raise ValidationError("아이디나 비밀번호가 올바르지 않습니다.")
 
         user.last_login = timezone.now()
-        user.save()
+        user.save(update_fields=["last_login"])
         token = RefreshToken.for_user(user=user)
 
         data = {"access": str(token.access_token), "refresh": str(token)}
@@ -78,12 +79,10 @@ class UserService:
 
             if check_password(password, user.password):
                 with transaction.atomic():
-                    s3 = client("s3")
-                    if user.profile_image and user.profile_image.name:
-                        s3.delete_object(
-                            Bucket=os.getenv("AWS_STORAGE_BUCKET_NAME"),
-                            Key=user.profile_image.name,
-                        )
+                    # 프로필 이미지와 파생 이미지는 커밋 이후 worker가 삭제
+                    StorageDeletionService.enqueue_files(
+                        User.objects.filter(pk=user.pk), "profile_image"
+                    )
                     user.delete()
                     return True
         except Exception as e:
@@ -110,13 +109,54 @@ class UserService:
             if image_file.size > 10 * 1024 * 1024:  # 10MB 이상의 프로필 이미지는 안됨!
                 raise ValidationError("Image file size must be less than 10MB")
 
-            if user.profile_image:  # 기존 프로필 이미지 제거 후 교체해줘야 함
-                user.profile_image.delete(save=False)
+            # 기존 프로필 이미지와 파생 이미지는 커밋 이후 삭제
+            StorageDeletionService.enqueue_files(
+                User.objects.filter(pk=user.pk), "profile_image"
+            )
 
             user.profile_image = image_file
+            user.profile_image_derivatives = {}
+            user.profile_image_metadata = {}
             user.save()
+            # 같은 key로 다시 저장한 경우 삭제하지 않음
+            StorageDeletionService.cancel([user.profile_image.name])
+            transaction.on_commit(
+                lambda: ImageDerivativePool.submit(
+                    "users.User", [user.pk], "profile_image"
+                )
+            )
             print("Successfully uploaded profile image")
         except ValidationError as e:
             raise ValidationError(f"Validation Error: {str(e)}")
         except Exception as e:
             raise e
+
+    @staticmethod
+    @transaction.atomic
+    def confirm_user_profile_image(user: User, key: str) -> None:
+        """
+        클라이언트가 presigned URL로 업로드를 마친 프로필 이미지를 저장하는 함수
+        """
+        PresignedUploadService.verify_uploads(user, "profile_image", [key])
+        user = User.objects.select_for_update().get(pk=user.pk)
+        if user.profile_image.name == key:
+            raise ValueError("This image is already registered")
+
+        # 기존 프로필 이미지와 파생 이미지는 커밋 이후 삭제
+        StorageDeletionService.enqueue_files(
+            User.objects.filter(pk=user.pk), "profile_image"
+        )
+
+        user.profile_image = key
+        user.profile_image_derivatives = {}
+        user.profile_image_metadata = {}
+        user.save(
+            update_fields=[
+                "profile_image",
+                "profile_image_derivatives",
+                "profile_image_metadata",
+            ]
+        )
+        transaction.on_commit(
+            lambda: ImageDerivativePool.submit("users.User", [user.pk], "profile_image")
+        )
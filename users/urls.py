@@ -136,4 +136,14 @@ urlpatterns = [
         name="reformer_freelancer_document",
     ),
     path("/profile-image", UserImageUploadView.as_view(), name="upload_profile_image"),
+    path(
+        "/profile-image/presigned",
+        UserImagePresignedUploadView.as_view(),
+        name="upload_profile_image_presigned",
+    ),
+    path(
+        "/profile-image/confirm",
+        UserImagePresignedUploadView.as_view(confirm=True),
+        name="upload_profile_image_confirm",
+    ),
 ]
@@ -1,6 +1,3 @@
-import os
-
-from boto3 import client
 from botocore import errorfactory
 from django.db import IntegrityError, transaction
 from rest_framework import status
@@ -8,6 +5,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.deletions import StorageDeletionService
 from users.models.reformer import ReformerAwards
 from users.serializers.reformer_serializer.reformer_profile_serializer import (
     ReformerAwardsSerializer,
@@ -77,15 +75,8 @@ class ReformerAwardsView(APIView):
                 raise ReformerAwards.DoesNotExist
 
             with transaction.atomic():
-                s3 = client("s3")
-                s3_key = reformer_awards.proof_document.name
-                if s3_key:  # 키가 비어있지 않을 때만 삭제 시도
-                    s3.delete_object(
-                        Bucket=os.getenv("AWS_STORAGE_BUCKET_NAME"),
-                        Key=s3_key,
-                    )
-                else:
-                    print("Warning: S3 Key가 비어 있어 삭제를 건너뜁니다.")
+                # 증명 서류는 커밋 이후 worker가 삭제
+                StorageDeletionService.enqueue([reformer_awards.proof_document.name])
 
                 reformer_awards.delete()
                 return Response(
@@ -1,6 +1,3 @@
-import os
-
-from boto3 import client
 from botocore import errorfactory
 from django.db import IntegrityError, transaction
 from rest_framework import status
@@ -8,6 +5,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.deletions import StorageDeletionService
 from users.models.reformer import ReformerEducation
 from users.serializers.reformer_serializer.reformer_profile_serializer import (
     ReformerEducationSerializer,
@@ -77,12 +75,8 @@ class ReformerEducationView(APIView):
                 raise ReformerEducation.DoesNotExist
 
             with transaction.atomic():
-                if reformer_education.proof_document:  # 증명 서류가 존재한다면, 삭제
-                    s3 = client("s3")
-                    s3.delete_object(
-                        Bucket=os.getenv("AWS_STORAGE_BUCKET_NAME"),
-                        Key=reformer_education.proof_document.name,
-                    )
+                # 증명 서류가 존재한다면, 커밋 이후 worker가 삭제
+                StorageDeletionService.enqueue([reformer_education.proof_document.name])
 
                 reformer_education.delete()
                 return Response(
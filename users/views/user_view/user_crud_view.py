@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
@@ -5,6 +6,9 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 
+from core.exceptions import view_exception_handler
+from core.mixins import ImageUploadViewMixin
+from core.presigned import PresignedUploadService
 from users.serializers.user_serializer.user_information_serializer import (
     UserInformationSerializer,
 )
@@ -82,7 +86,7 @@ class UserCrudApi(APIView):
             )
 
 
-class UserImageUploadView(APIView):
+class UserImageUploadView(ImageUploadViewMixin, APIView):
     permission_classes = [IsAuthenticated]
     service = UserService()
 
@@ -113,3 +117,37 @@ class UserImageUploadView(APIView):
                 data={"message": f"Exception: {str(e)}"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+
+class UserImagePresignedUploadView(APIView):
+    """
+    프로필 이미지 직접 업로드
+    confirm=False : presigned URL 발급 (request body : content_type)
+    confirm=True : 업로드 완료 확인 및 저장 (request body : key)
+    """
+
+    permission_classes = [IsAuthenticated]
+    service = UserService()
+    confirm = False
+
+    @view_exception_handler
+    def post(self, request) -> Response:
+        if not self.confirm:
+            uploads = PresignedUploadService.create_uploads(
+                request.user, "profile_image", [request.data.get("content_type")]
+            )
+            return Response(
+                data={
+                    "expires_in": settings.PRESIGNED_UPLOAD_EXPIRES,
+                    "upload": uploads[0],
+                },
+                status=status.HTTP_200_OK,
+            )
+
+        self.service.confirm_user_profile_image(
+            user=request.user, key=request.data.get("key")
+        )
+        return Response(
+            data={"message": "Successfully uploaded profile image"},
+            status=status.HTTP_201_CREATED,
+        )